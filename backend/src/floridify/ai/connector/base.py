@@ -23,6 +23,7 @@ from openai import (
 from pydantic import BaseModel, ValidationError
 
 from ...caching.decorators import cached_api_call
+from ...core.state_tracker import record_span
 from ...models.base import ModelInfo
 from ...utils.logging import get_logger, log_metrics
 from ..model_selection import ModelTier, get_model_for_task, get_temperature_for_model
@@ -141,7 +142,7 @@ class AIConnector(SynthesisMixin, GenerationMixin, AssessmentMixin, SuggestionsM
         for attempt in range(MAX_VALIDATION_RETRIES + 1):
             try:
                 async with self.semaphore:
-                    if self.provider == Provider.OPENAI:
+                    if self.provider in (Provider.OPENAI, Provider.LOCAL):
                         result, usage = await self._openai_call(
                             prompt=prompt,
                             response_model=response_model,
@@ -165,6 +166,7 @@ class AIConnector(SynthesisMixin, GenerationMixin, AssessmentMixin, SuggestionsM
 
                 # Track model info
                 api_duration = time.perf_counter() - start_time
+                record_span(f"ai:{task_name or response_model.__name__}", start_time)
                 self._last_model_info = ModelInfo(
                     name=active_model,
                     confidence=0.9,
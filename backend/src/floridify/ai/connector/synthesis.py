@@ -1,4 +1,4 @@
-"""Connector mixin for synthesis: definitions, etymology, synonyms, antonyms, dedup, WOTD."""
+"""Connector mixin for synthesis: definitions, etymology, synonyms, antonyms, enrichment, WOTD."""
 
 import time
 from typing import Any
@@ -9,6 +9,7 @@ from ..models import (
     AntonymResponse,
     ClusterMappingResponse,
     DeduplicationResponse,
+    DefinitionEnrichmentResponse,
     EtymologyResponse,
     SynonymGenerationResponse,
     SynthesisResponse,
@@ -162,6 +163,44 @@ class SynthesisMixin:
         logger.info(f"Generated {len(result.antonyms)} antonyms for '{word}'")
         return result
 
+    async def enrich_definitions(
+        self,
+        word: str,
+        items: list[dict[str, Any]],
+        language: str = "English",
+    ) -> DefinitionEnrichmentResponse:
+        """Generate several enrichment components for one or more definitions in one request.
+
+        Args:
+            word: The word
+            items: Definitions to enrich, each with ``index``, ``part_of_speech``, ``text``,
+                ``components`` (component name -> count) and the existing synonyms/antonyms
+                that new candidates must not repeat
+            language: Display name of the word's primary language
+
+        Returns:
+            DefinitionEnrichmentResponse with one entry per definition, matched by index
+
+        """
+        prompt = self.prompt_manager.render(
+            "synthesize/enrichment",
+            word=word,
+            items=items,
+            language=language,
+        )
+
+        result = await self._make_structured_request(
+            prompt,
+            DefinitionEnrichmentResponse,
+            task_name="enrich_definitions",
+        )
+        component_count = sum(len(item["components"]) for item in items)
+        logger.info(
+            f"Enriched {len(items)} definitions of '{word}' with {component_count} components "
+            "in one request"
+        )
+        return result
+
     async def deduplicate_definitions(
         self,
         word: str,
@@ -1,5 +1,6 @@
 """AI synthesis constants and defaults."""
 
+import os
 from enum import Enum
 
 
@@ -112,6 +113,19 @@ MAX_EXAMPLE_COUNT = 4
 MIN_FACT_COUNT = 1
 MAX_FACT_COUNT = 4
 
+# Fused enrichment (see synthesis/fused.py): several definition-level components, for one or
+# more definitions, in a single structured request instead of one request per component.
+FUSED_ENRICHMENT_ENABLED = os.getenv("FLORIDIFY_FUSED_ENRICHMENT", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+FUSED_MAX_DEFINITIONS_PER_REQUEST = int(os.getenv("FLORIDIFY_FUSED_MAX_DEFINITIONS", "4"))
+# Estimated prompt + completion tokens per fused request
+FUSED_MAX_REQUEST_TOKENS = int(os.getenv("FLORIDIFY_FUSED_MAX_REQUEST_TOKENS", "6000"))
+# Estimated completion tokens per fused request (kept under the connector's 4096 default)
+FUSED_MAX_OUTPUT_TOKENS = int(os.getenv("FLORIDIFY_FUSED_MAX_OUTPUT_TOKENS", "3000"))
+
 # Parameter ordering standard
 # Functions should follow this parameter order:
 # 1. word: str (the word being processed)
@@ -80,6 +80,7 @@ TASK_COMPLEXITY_MAP: dict[str, ModelComplexity] = {
     "generate_collocations": ModelComplexity.MEDIUM,
     "generate_word_forms": ModelComplexity.MEDIUM,
     "generate_antonyms": ModelComplexity.MEDIUM,
+    "enrich_definitions": ModelComplexity.MEDIUM,
     "generate_suggestions": ModelComplexity.MEDIUM,
     "lookup_word": ModelComplexity.MEDIUM,
     "deduplicate_definitions": ModelComplexity.MEDIUM,
@@ -20,6 +20,8 @@ from .prompts import (
     ComprehensiveSynthesisResponse,
     DeduplicatedDefinition,
     DeduplicationResponse,
+    DefinitionEnrichment,
+    DefinitionEnrichmentResponse,
     DefinitionResponse,
     DefinitionSynthesisResponse,
     DictionaryEntryResponse,
@@ -79,6 +81,8 @@ __all__ = [
     "ComprehensiveSynthesisResponse",
     "DeduplicatedDefinition",
     "DeduplicationResponse",
+    "DefinitionEnrichment",
+    "DefinitionEnrichmentResponse",
     "DefinitionResponse",
     "DefinitionSynthesisResponse",
     "DictionaryEntryResponse",
@@ -45,6 +45,8 @@ from .synthesize.models import (
     AntonymResponse,
     DeduplicatedDefinition,
     DeduplicationResponse,
+    DefinitionEnrichment,
+    DefinitionEnrichmentResponse,
     DefinitionResponse,
     DefinitionSynthesisResponse,
     DictionaryEntryResponse,
@@ -115,6 +117,8 @@ __all__ = [
     "AntonymResponse",
     "DeduplicatedDefinition",
     "DeduplicationResponse",
+    "DefinitionEnrichment",
+    "DefinitionEnrichmentResponse",
     "DefinitionResponse",
     "DefinitionSynthesisResponse",
     "DictionaryEntryResponse",
@@ -5,6 +5,8 @@ from .models import (
     AntonymResponse,
     DeduplicatedDefinition,
     DeduplicationResponse,
+    DefinitionEnrichment,
+    DefinitionEnrichmentResponse,
     DefinitionResponse,
     DefinitionSynthesisResponse,
     DictionaryEntryResponse,
@@ -20,6 +22,8 @@ __all__ = [
     "AntonymResponse",
     "DeduplicatedDefinition",
     "DeduplicationResponse",
+    "DefinitionEnrichment",
+    "DefinitionEnrichmentResponse",
     "DefinitionResponse",
     "DefinitionSynthesisResponse",
     "DictionaryEntryResponse",
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ....models.base import AIResponseBase
 from ....models.dictionary import DictionaryProvider
+from ..assess.models import Collocation, UsageNote
 
 
 class PronunciationResponse(AIResponseBase):
@@ -105,6 +106,42 @@ class AntonymResponse(AIResponseBase):
     )
 
 
+class DefinitionEnrichment(BaseModel):
+    """Fused enrichment for one definition. Components that were not requested stay null."""
+
+    model_config = ConfigDict(populate_by_field_name=True)
+
+    index: int = Field(description="Index of the definition as numbered in the request")
+    synonyms: list[SynonymCandidate] | None = Field(None, max_length=15)
+    antonyms: list[AntonymCandidate] | None = Field(None, max_length=10)
+    examples: list[str] | None = Field(None, max_length=5, description="Example sentences")
+    cefr_level: str | None = Field(None, description="CEFR level (A1-C2)")
+    frequency_band: int | None = Field(None, description="1 (most common) to 5 (least common)")
+    language_register: str | None = Field(
+        None,
+        alias="register",
+        description="Register level: formal, informal, neutral, slang, technical",
+    )
+    domain: str | None = Field(None, description="Domain/field, or null for general usage")
+    grammar_patterns: list[str] | None = Field(None, max_length=10)
+    grammar_descriptions: list[str] | None = Field(
+        None, max_length=10, description="One description per grammar pattern"
+    )
+    collocations: list[Collocation] | None = Field(None, max_length=10)
+    usage_notes: list[UsageNote] | None = Field(None, max_length=5)
+    regions: list[str] | None = Field(
+        None, max_length=10, description="Region codes (US, UK, ...), [] if universal"
+    )
+
+
+class DefinitionEnrichmentResponse(AIResponseBase):
+    """Response for fused multi-component enrichment of one or more definitions."""
+
+    definitions: list[DefinitionEnrichment] = Field(
+        description="One entry per requested definition, matched by index",
+    )
+
+
 class EtymologyResponse(AIResponseBase):
     """Response for etymology extraction."""
 
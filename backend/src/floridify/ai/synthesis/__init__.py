@@ -14,6 +14,7 @@ from .definition_level import (
     synthesize_synonyms,
     usage_note_generation,
 )
+from .fused import enrich_definitions_fused, plan_fused_requests
 from .orchestration import (
     SYNTHESIS_COMPONENTS,
     SynthesisFunc,
@@ -43,8 +44,10 @@ __all__ = [
     "cluster_definitions",
     "enhance_definitions_parallel",
     "enhance_synthesized_entry",
+    "enrich_definitions_fused",
     "generate_examples",
     "generate_facts",
+    "plan_fused_requests",
     "suggest_words",
     "synthesize_antonyms",
     "synthesize_definition_text",
@@ -33,11 +33,80 @@ from ..constants import (
     DEFAULT_EXAMPLE_COUNT,
     DEFAULT_SYNONYM_COUNT,
 )
+from ..models import AntonymCandidate, SynonymCandidate
 from .hybrid import compute_antonym_delta, compute_synonym_delta
 
 logger = get_logger(__name__)
 
 
+def merge_synonym_candidates(
+    word: str,
+    definition: Definition,
+    merged: list[str],
+    candidates: list[SynonymCandidate],
+    count: int,
+    language: str = "en",
+) -> list[str]:
+    """Append AI synonym candidates to the local ones, filtered by language.
+
+    Primary-language candidates are returned (up to ``count``); cross-language
+    cognates are stored on definition.cognates.
+    """
+    from .language_filter import is_primary_language
+
+    word_lower = word.lower()
+    all_synonyms = merged.copy()
+    cognates: list[str] = list(definition.cognates or [])
+
+    for candidate in candidates:
+        if candidate.word.lower() == word_lower:
+            continue
+        if candidate.word in all_synonyms:
+            continue
+
+        if is_primary_language(candidate.language, language):
+            all_synonyms.append(candidate.word)
+        else:
+            cognates.append(candidate.word)
+
+    # Store cognates on the definition
+    seen_cog: set[str] = set()
+    definition.cognates = [
+        c
+        for c in cognates
+        if c.lower() not in seen_cog and not seen_cog.add(c.lower())  # type: ignore[func-returns-value]
+    ][:20]
+
+    logger.info(
+        f"Synthesized {len(all_synonyms)} synonyms + {len(definition.cognates)} cognates "
+        f"for '{word}' (hybrid)"
+    )
+    return all_synonyms[:count]
+
+
+def merge_antonym_candidates(
+    word: str,
+    merged: list[str],
+    candidates: list[AntonymCandidate],
+    count: int,
+    language: str = "en",
+) -> list[str]:
+    """Append primary-language AI antonym candidates to the local ones; foreign ones are dropped."""
+    from .language_filter import is_primary_language
+
+    word_lower = word.lower()
+    all_antonyms = merged.copy()
+    for candidate in candidates:
+        if candidate.word.lower() == word_lower:
+            continue
+        if candidate.word in all_antonyms:
+            continue
+        if is_primary_language(candidate.language, language):
+            all_antonyms.append(candidate.word)
+
+    return all_antonyms[:count]
+
+
 async def synthesize_synonyms(
     word: str,
     definition: Definition,
@@ -52,8 +121,6 @@ async def synthesize_synonyms(
     Filters AI response by language — primary-language synonyms go to the
     return list, cross-language cognates are stored on definition.cognates.
     """
-    from .language_filter import is_primary_language
-
     count = count or DEFAULT_SYNONYM_COUNT
 
     if force_refresh:
@@ -87,35 +154,9 @@ async def synthesize_synonyms(
             language=lang_display,
         )
 
-        # Filter by language: primary → synonyms, foreign → cognates
-        word_lower = word.lower()
-        all_synonyms = merged.copy()
-        cognates: list[str] = list(definition.cognates or [])
-
-        for candidate in response.synonyms:
-            if candidate.word.lower() == word_lower:
-                continue
-            if candidate.word in all_synonyms:
-                continue
-
-            if is_primary_language(candidate.language, language):
-                all_synonyms.append(candidate.word)
-            else:
-                cognates.append(candidate.word)
-
-        # Store cognates on the definition
-        seen_cog: set[str] = set()
-        definition.cognates = [
-            c
-            for c in cognates
-            if c.lower() not in seen_cog and not seen_cog.add(c.lower())  # type: ignore[func-returns-value]
-        ][:20]
-
-        logger.info(
-            f"Synthesized {len(all_synonyms)} synonyms + {len(definition.cognates)} cognates "
-            f"for '{word}' (hybrid)"
+        return merge_synonym_candidates(
+            word, definition, merged, response.synonyms, count=count, language=language
         )
-        return all_synonyms[:count]
 
     except Exception as e:
         logger.error(f"Failed to synthesize synonyms: {e}")
@@ -138,8 +179,6 @@ async def synthesize_antonyms(
     Filters AI response by language — foreign antonyms are discarded
     (antonyms are less useful cross-linguistically than synonym cognates).
     """
-    from .language_filter import is_primary_language
-
     count = count or DEFAULT_ANTONYM_COUNT
 
     if force_refresh:
@@ -173,17 +212,9 @@ async def synthesize_antonyms(
         )
 
         # Filter: keep only primary-language antonyms (discard foreign ones)
-        word_lower = word.lower()
-        all_antonyms = merged.copy()
-        for candidate in response.antonyms:
-            if candidate.word.lower() == word_lower:
-                continue
-            if candidate.word in all_antonyms:
-                continue
-            if is_primary_language(candidate.language, language):
-                all_antonyms.append(candidate.word)
-
-        return all_antonyms[:count]
+        return merge_antonym_candidates(
+            word, merged, response.antonyms, count=count, language=language
+        )
 
     except Exception as e:
         logger.error(f"Failed to synthesize antonyms: {e}")
@@ -261,6 +292,37 @@ async def assess_definition_cefr(
         return None
 
 
+async def assess_definition_frequency_local(definition: Definition, word: str) -> int | None:
+    """Sense-adjusted frequency band from corpus data, or None if the word is unknown locally.
+
+    Also sets definition.frequency_score.
+    """
+    # Corpus-derived, deterministic, free
+    local_band = assess_frequency_local(word)
+    if local_band is None:
+        return None
+
+    # Adjust for sense-level prominence
+    sense_freq = await assess_sense_frequency(word, definition.part_of_speech, definition.text)
+    adjusted_band = adjust_band_for_sense(local_band, sense_freq)
+
+    # Also set the continuous frequency score for temperature visualization
+    local_score = assess_frequency_score_local(word)
+    if local_score is not None:
+        # Adjust score proportionally to sense frequency
+        if sense_freq is not None:
+            local_score = local_score * (0.5 + 0.5 * sense_freq)
+        definition.frequency_score = local_score
+
+    sense_str = f"{sense_freq:.2f}" if sense_freq is not None else "N/A"
+    logger.debug(
+        f"Frequency for '{word}' ({definition.part_of_speech}): "
+        f"word_band={local_band}, sense_freq={sense_str}, "
+        f"adjusted_band={adjusted_band} (local)"
+    )
+    return adjusted_band
+
+
 async def assess_definition_frequency(
     definition: Definition,
     word: str,
@@ -271,28 +333,9 @@ async def assess_definition_frequency(
 
     Also sets definition.frequency_score as a side effect when using local assessment.
     """
-    # Try local assessment first (corpus-derived, deterministic, free)
-    local_band = assess_frequency_local(word)
+    local_band = await assess_definition_frequency_local(definition, word)
     if local_band is not None:
-        # Adjust for sense-level prominence
-        sense_freq = await assess_sense_frequency(word, definition.part_of_speech, definition.text)
-        adjusted_band = adjust_band_for_sense(local_band, sense_freq)
-
-        # Also set the continuous frequency score for temperature visualization
-        local_score = assess_frequency_score_local(word)
-        if local_score is not None:
-            # Adjust score proportionally to sense frequency
-            if sense_freq is not None:
-                local_score = local_score * (0.5 + 0.5 * sense_freq)
-            definition.frequency_score = local_score
-
-        sense_str = f"{sense_freq:.2f}" if sense_freq is not None else "N/A"
-        logger.debug(
-            f"Frequency for '{word}' ({definition.part_of_speech}): "
-            f"word_band={local_band}, sense_freq={sense_str}, "
-            f"adjusted_band={adjusted_band} (local)"
-        )
-        return adjusted_band
+        return local_band
 
     # Fall back to AI
     try:
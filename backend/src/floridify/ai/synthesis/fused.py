@@ -0,0 +1,421 @@
+"""Fused enrichment: several definition-level components per structured AI request.
+
+The per-component path issues one request per definition per component, each
+re-sending the definition context. Here the components a definition still
+needs from AI (after local-first assessment and the Wiktionary/WordNet delta)
+are asked for together, and definitions are packed several to a request by
+``plan_fused_requests`` within the token budgets in ``ai.constants``.
+
+Anything the fused responses do not deliver — a failed request, a missing
+entry, an invalid field — is left out of the result so the caller falls back
+to the per-component functions for exactly those pairs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import ValidationError
+
+from ...core.state_tracker import Stages, StateTracker
+from ...models.dictionary import Definition
+from ...models.relationships import Collocation, GrammarPattern, UsageNote
+from ...utils.logging import get_logger
+from ..adaptive_counts import AdaptiveCounts
+from ..assessment.cefr import assess_cefr_local
+from ..assessment.domain import classify_domain_local
+from ..assessment.regional import detect_regional_local
+from ..assessment.register import classify_register_local
+from ..connector import AIConnector
+from ..constants import (
+    FUSED_MAX_DEFINITIONS_PER_REQUEST,
+    FUSED_MAX_OUTPUT_TOKENS,
+    FUSED_MAX_REQUEST_TOKENS,
+    SynthesisComponent,
+)
+from ..models import DefinitionEnrichment
+from .definition_level import (
+    assess_definition_frequency_local,
+    merge_antonym_candidates,
+    merge_synonym_candidates,
+)
+from .hybrid import compute_antonym_delta, compute_synonym_delta
+
+logger = get_logger(__name__)
+
+# Word forms depend on the part of speech, not the definition, so they stay per-component
+FUSABLE_COMPONENTS = SynthesisComponent.definition_level_components() - {
+    SynthesisComponent.WORD_FORMS
+}
+
+# Rough completion tokens per requested unit (one candidate, sentence, pattern, note...)
+_OUTPUT_TOKENS_PER_UNIT: dict[SynthesisComponent, int] = {
+    SynthesisComponent.SYNONYMS: 35,
+    SynthesisComponent.ANTONYMS: 35,
+    SynthesisComponent.EXAMPLES: 35,
+    SynthesisComponent.CEFR_LEVEL: 4,
+    SynthesisComponent.FREQUENCY_BAND: 3,
+    SynthesisComponent.REGISTER: 4,
+    SynthesisComponent.DOMAIN: 4,
+    SynthesisComponent.GRAMMAR_PATTERNS: 20,
+    SynthesisComponent.COLLOCATIONS: 18,
+    SynthesisComponent.USAGE_NOTES: 30,
+    SynthesisComponent.REGIONAL_VARIANTS: 12,
+}
+_ITEM_OUTPUT_OVERHEAD_TOKENS = 80  # Index plus the null fields of one entry
+_ITEM_INPUT_OVERHEAD_TOKENS = 15  # Heading and per-component bullets
+_PROMPT_OVERHEAD_TOKENS = 700  # synthesize/enrichment.md instructions, shared by all items
+
+_CEFR_LEVELS = {"A1", "A2", "B1", "B2", "C1", "C2"}
+_REGISTERS = {"formal", "informal", "neutral", "slang", "technical"}
+_LOCAL_FIRST = {
+    SynthesisComponent.CEFR_LEVEL,
+    SynthesisComponent.FREQUENCY_BAND,
+    SynthesisComponent.REGISTER,
+    SynthesisComponent.DOMAIN,
+    SynthesisComponent.REGIONAL_VARIANTS,
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+@dataclass
+class FusedItem:
+    """The components one definition still needs from AI, with their counts."""
+
+    index: int  # Position in the definitions list; echoed back by the model
+    part_of_speech: str
+    text: str
+    components: dict[SynthesisComponent, int] = field(default_factory=dict)
+    existing_synonyms: list[str] = field(default_factory=list)
+    existing_antonyms: list[str] = field(default_factory=list)
+    synonym_target: int = 0  # Final synonym count (local + AI)
+    antonym_target: int = 0
+
+    def estimate(self) -> tuple[int, int]:
+        """Estimated (prompt, completion) tokens this item adds to a request."""
+        prompt = (
+            estimate_tokens(self.text)
+            + _ITEM_INPUT_OVERHEAD_TOKENS
+            + estimate_tokens(", ".join(self.existing_synonyms + self.existing_antonyms))
+            + 5 * len(self.components)
+        )
+        completion = _ITEM_OUTPUT_OVERHEAD_TOKENS + sum(
+            _OUTPUT_TOKENS_PER_UNIT[component] * max(count, 1)
+            for component, count in self.components.items()
+        )
+        return prompt, completion
+
+    def split(self, max_completion_tokens: int) -> list[FusedItem]:
+        """Split the components across items so each fits ``max_completion_tokens``."""
+        pieces: list[FusedItem] = []
+        current = self._with_components({})
+        for component, count in self.components.items():
+            current.components[component] = count
+            if len(current.components) > 1 and current.estimate()[1] > max_completion_tokens:
+                del current.components[component]
+                pieces.append(current)
+                current = self._with_components({component: count})
+        pieces.append(current)
+        return pieces
+
+    def prompt_context(self) -> dict[str, Any]:
+        """Template context for synthesize/enrichment."""
+        return {
+            "index": self.index,
+            "part_of_speech": self.part_of_speech,
+            "text": self.text,
+            "components": {component.value: count for component, count in self.components.items()},
+            "existing_synonyms": self.existing_synonyms,
+            "existing_antonyms": self.existing_antonyms,
+        }
+
+    def _with_components(self, components: dict[SynthesisComponent, int]) -> FusedItem:
+        return FusedItem(
+            index=self.index,
+            part_of_speech=self.part_of_speech,
+            text=self.text,
+            components=components,
+            existing_synonyms=self.existing_synonyms,
+            existing_antonyms=self.existing_antonyms,
+            synonym_target=self.synonym_target,
+            antonym_target=self.antonym_target,
+        )
+
+
+def plan_fused_requests(
+    items: list[FusedItem],
+    max_definitions: int = FUSED_MAX_DEFINITIONS_PER_REQUEST,
+    max_request_tokens: int = FUSED_MAX_REQUEST_TOKENS,
+    max_output_tokens: int = FUSED_MAX_OUTPUT_TOKENS,
+) -> list[list[FusedItem]]:
+    """Pack items, in order, into requests that fit the definition and token budgets.
+
+    An item whose components alone exceed the budgets is split across requests
+    first. A single component that still exceeds a budget gets a request of its
+    own.
+    """
+    requests: list[list[FusedItem]] = []
+    current: list[FusedItem] = []
+    prompt_tokens = _PROMPT_OVERHEAD_TOKENS
+    completion_tokens = 0
+
+    for item in items:
+        completion_budget = min(
+            max_output_tokens,
+            max_request_tokens - _PROMPT_OVERHEAD_TOKENS - item.estimate()[0],
+        )
+        for piece in item.split(completion_budget):
+            piece_prompt, piece_completion = piece.estimate()
+            full = current and (
+                len(current) >= max_definitions
+                or completion_tokens + piece_completion > max_output_tokens
+                or prompt_tokens + piece_prompt + completion_tokens + piece_completion
+                > max_request_tokens
+                or any(queued.index == piece.index for queued in current)
+            )
+            if full:
+                requests.append(current)
+                current = []
+                prompt_tokens = _PROMPT_OVERHEAD_TOKENS
+                completion_tokens = 0
+            current.append(piece)
+            prompt_tokens += piece_prompt
+            completion_tokens += piece_completion
+
+    if current:
+        requests.append(current)
+    return requests
+
+
+def _component_count(counts: AdaptiveCounts, component: SynthesisComponent) -> int:
+    """Requested number of items for list components (1 for single-valued ones)."""
+    return {
+        SynthesisComponent.SYNONYMS: counts.synonyms,
+        SynthesisComponent.ANTONYMS: counts.antonyms,
+        SynthesisComponent.EXAMPLES: counts.examples,
+        SynthesisComponent.GRAMMAR_PATTERNS: counts.grammar_patterns,
+        SynthesisComponent.COLLOCATIONS: counts.collocations,
+        SynthesisComponent.USAGE_NOTES: counts.usage_notes,
+    }.get(component, 1)
+
+
+async def _assess_locally(
+    word: str, definition: Definition, component: SynthesisComponent
+) -> Any | None:
+    """Local-first assessment for one component, or None if it needs AI."""
+    if component == SynthesisComponent.CEFR_LEVEL:
+        return await assess_cefr_local(
+            word, definition_text=definition.text, part_of_speech=definition.part_of_speech
+        )
+    if component == SynthesisComponent.FREQUENCY_BAND:
+        return await assess_definition_frequency_local(definition, word)
+    if component == SynthesisComponent.REGISTER:
+        return classify_register_local(definition.text)
+    if component == SynthesisComponent.DOMAIN:
+        return await classify_domain_local(
+            definition.text, word=word, part_of_speech=definition.part_of_speech
+        )
+    if component == SynthesisComponent.REGIONAL_VARIANTS:
+        region = detect_regional_local(definition.text)
+        return [region] if region is not None else None
+    return None
+
+
+def _component_value(
+    word: str,
+    definition: Definition,
+    item: FusedItem,
+    entry: DefinitionEnrichment,
+    component: SynthesisComponent,
+    language: str,
+) -> Any:
+    """Convert one fused field to the per-component result shape.
+
+    Raises:
+        ValueError: If the field is missing or invalid (the caller falls back)
+
+    """
+    if component == SynthesisComponent.SYNONYMS and entry.synonyms is not None:
+        return merge_synonym_candidates(
+            word,
+            definition,
+            item.existing_synonyms,
+            entry.synonyms,
+            count=item.synonym_target,
+            language=language,
+        )
+    if component == SynthesisComponent.ANTONYMS and entry.antonyms is not None:
+        return merge_antonym_candidates(
+            word,
+            item.existing_antonyms,
+            entry.antonyms,
+            count=item.antonym_target,
+            language=language,
+        )
+    if component == SynthesisComponent.EXAMPLES and entry.examples:
+        return entry.examples[: item.components[component]]
+    if component == SynthesisComponent.CEFR_LEVEL and entry.cefr_level:
+        level = entry.cefr_level.strip().upper()
+        if level in _CEFR_LEVELS:
+            return level
+    if component == SynthesisComponent.FREQUENCY_BAND and entry.frequency_band is not None:
+        if 1 <= entry.frequency_band <= 5:
+            return entry.frequency_band
+    if component == SynthesisComponent.REGISTER and entry.language_register:
+        register = entry.language_register.strip().lower()
+        if register in _REGISTERS:
+            return register
+    if component == SynthesisComponent.DOMAIN:
+        return entry.domain  # null = general usage
+    if component == SynthesisComponent.GRAMMAR_PATTERNS and entry.grammar_patterns is not None:
+        return [
+            GrammarPattern(pattern=pattern, description=description)
+            for pattern, description in zip(
+                entry.grammar_patterns, entry.grammar_descriptions or [], strict=False
+            )
+        ]
+    if component == SynthesisComponent.COLLOCATIONS and entry.collocations is not None:
+        return [
+            Collocation(text=coll.phrase, type=coll.type, frequency=coll.frequency)
+            for coll in entry.collocations
+        ]
+    if component == SynthesisComponent.USAGE_NOTES and entry.usage_notes is not None:
+        try:
+            return [
+                UsageNote(type=note.type, text=note.text)  # type: ignore[arg-type]
+                for note in entry.usage_notes
+            ]
+        except ValidationError as e:
+            raise ValueError(f"invalid usage note type: {e}") from e
+    if component == SynthesisComponent.REGIONAL_VARIANTS and entry.regions is not None:
+        return entry.regions
+
+    raise ValueError(f"missing or invalid {component.value}")
+
+
+async def enrich_definitions_fused(
+    word: str,
+    definitions: list[Definition],
+    wanted: list[tuple[int, SynthesisComponent]],
+    counts: list[AdaptiveCounts],
+    ai: AIConnector,
+    language: str = "en",
+    force_refresh: bool = False,
+    state_tracker: StateTracker | None = None,
+) -> dict[tuple[int, SynthesisComponent], Any]:
+    """Resolve definition-level components locally first, then in fused AI requests.
+
+    Args:
+        word: The word being enriched
+        definitions: Definitions to enrich
+        wanted: (definition index, component) pairs to resolve
+        counts: Adaptive counts per definition, aligned with ``definitions``
+        ai: AI connector
+        language: ISO code of the word's primary language
+        force_refresh: Discard existing synonyms/antonyms before computing the delta
+        state_tracker: Optional state tracker
+
+    Returns:
+        Results keyed by (definition index, component), shaped like the
+        per-component functions' return values. Pairs that could not be
+        resolved are absent.
+
+    """
+    resolved: dict[tuple[int, SynthesisComponent], Any] = {}
+    items: dict[int, FusedItem] = {}
+
+    for index, component in wanted:
+        definition = definitions[index]
+        count = _component_count(counts[index], component)
+        item = items.setdefault(
+            index,
+            FusedItem(index=index, part_of_speech=definition.part_of_speech, text=definition.text),
+        )
+
+        if component == SynthesisComponent.SYNONYMS:
+            if force_refresh:
+                definition.synonyms = []
+            merged, needed = await compute_synonym_delta(definition, word, target_count=count)
+            if needed <= 0:
+                resolved[(index, component)] = merged[:count]
+                continue
+            item.existing_synonyms, item.synonym_target, count = merged, count, needed
+        elif component == SynthesisComponent.ANTONYMS:
+            if force_refresh:
+                definition.antonyms = []
+            merged, needed = await compute_antonym_delta(definition, word, target_count=count)
+            if needed <= 0:
+                resolved[(index, component)] = merged[:count]
+                continue
+            item.existing_antonyms, item.antonym_target, count = merged, count, needed
+        elif component in _LOCAL_FIRST:
+            local = await _assess_locally(word, definition, component)
+            if local is not None:
+                resolved[(index, component)] = local
+                continue
+
+        item.components[component] = count
+
+    pending = [item for item in items.values() if item.components]
+    if not pending:
+        return resolved
+
+    requests = plan_fused_requests(pending)
+    component_total = sum(len(item.components) for item in pending)
+    if state_tracker:
+        await state_tracker.update(
+            stage=Stages.AI_SYNTHESIS,
+            message=f"Enriching {len(pending)} definitions of {word} "
+            f"in {len(requests)} combined requests",
+        )
+
+    from ...models.base import Language as LangEnum
+
+    lang_display = {v.value: v.name.title() for v in LangEnum}.get(language, "English")
+
+    responses = await asyncio.gather(
+        *(
+            ai.enrich_definitions(
+                word, [item.prompt_context() for item in batch], language=lang_display
+            )
+            for batch in requests
+        ),
+        return_exceptions=True,
+    )
+
+    fallbacks = 0
+    for batch, response in zip(requests, responses, strict=True):
+        if isinstance(response, BaseException):
+            logger.warning(
+                f"Fused enrichment request for '{word}' failed ({response}); "
+                "falling back to per-component calls"
+            )
+            fallbacks += sum(len(item.components) for item in batch)
+            continue
+
+        entries = {entry.index: entry for entry in response.definitions}
+        for item in batch:
+            entry = entries.get(item.index)
+            for component in item.components:
+                if entry is None:
+                    fallbacks += 1
+                    continue
+                try:
+                    resolved[(item.index, component)] = _component_value(
+                        word, definitions[item.index], item, entry, component, language
+                    )
+                except ValueError as e:
+                    logger.debug(f"Fused {component.value} for '{word}' [{item.index}]: {e}")
+                    fallbacks += 1
+
+    logger.info(
+        f"Fused enrichment for '{word}': {component_total} AI components in "
+        f"{len(requests)} requests ({fallbacks} left to per-component calls)"
+    )
+    return resolved
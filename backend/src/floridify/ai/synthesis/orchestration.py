@@ -31,7 +31,7 @@ from ...utils.logging import get_logger
 from ..adaptive_counts import compute_counts
 from ..batch_processor import batch_synthesis
 from ..connector import AIConnector
-from ..constants import SynthesisComponent
+from ..constants import FUSED_ENRICHMENT_ENABLED, SynthesisComponent
 from ..models import QueryValidationResponse, WordSuggestionResponse
 from .definition_level import (
     assess_collocations,
@@ -47,6 +47,7 @@ from .definition_level import (
     synthesize_synonyms,
     usage_note_generation,
 )
+from .fused import FUSABLE_COMPONENTS, enrich_definitions_fused
 from .word_level import (
     generate_facts,
     synthesize_etymology,
@@ -171,6 +172,39 @@ async def cluster_definitions(
         return definitions
 
 
+def _needs_component(
+    definition: Definition, component: SynthesisComponent, force_refresh: bool
+) -> bool:
+    """Whether a definition-level component is missing (or being regenerated)."""
+    if force_refresh:
+        return True
+    if component == SynthesisComponent.SYNONYMS:
+        return not definition.synonyms
+    if component == SynthesisComponent.EXAMPLES:
+        return not definition.example_ids
+    if component == SynthesisComponent.ANTONYMS:
+        return not definition.antonyms
+    if component == SynthesisComponent.WORD_FORMS:
+        return not definition.word_forms
+    if component == SynthesisComponent.CEFR_LEVEL:
+        return definition.cefr_level is None
+    if component == SynthesisComponent.FREQUENCY_BAND:
+        return definition.frequency_band is None
+    if component == SynthesisComponent.REGISTER:
+        return not definition.language_register
+    if component == SynthesisComponent.DOMAIN:
+        return not definition.domain
+    if component == SynthesisComponent.GRAMMAR_PATTERNS:
+        return not definition.grammar_patterns
+    if component == SynthesisComponent.COLLOCATIONS:
+        return not definition.collocations
+    if component == SynthesisComponent.USAGE_NOTES:
+        return not definition.usage_notes
+    if component == SynthesisComponent.REGIONAL_VARIANTS:
+        return not definition.region
+    return False
+
+
 def _dedup_across_definitions(definitions: list[Definition]) -> None:
     """Remove synonym/antonym overlap across definitions. Higher-relevance definitions keep the word."""
     # Sort by meaning_cluster.relevance descending — high-relevance defs get priority
@@ -211,6 +245,7 @@ async def enhance_definitions_parallel(
     force_refresh: bool = False,
     state_tracker: StateTracker | None = None,
     batch_mode: bool = False,
+    fused: bool | None = None,
 ) -> None:
     """Enhance definitions with specified components in parallel.
 
@@ -222,29 +257,71 @@ async def enhance_definitions_parallel(
         force_refresh: Force regeneration even if data exists
         state_tracker: Optional state tracker
         batch_mode: Use batch processing for 50% cost reduction (for bulk operations)
+        fused: Ask for several components (and definitions) per AI request, falling back
+            to per-component calls for anything it does not deliver
+            (None = FLORIDIFY_FUSED_ENRICHMENT; ignored in batch mode)
 
     """
     # Default to all definition-level components
     if components is None:
         components = SynthesisComponent.default_components()
 
+    if fused is None:
+        fused = FUSED_ENRICHMENT_ENABLED
+
     # Compute adaptive counts based on word characteristics
     primary_language = word.languages[0] if word.languages else "en"
+    definition_counts = [
+        compute_counts(
+            language=primary_language,
+            definition_count=len(definitions),
+            part_of_speech=definition.part_of_speech,
+        )
+        for definition in definitions
+    ]
+
+    # Fused mode: resolve what it can up front; the loop below covers the rest
+    fused_results: dict[tuple[int, SynthesisComponent], Any] = {}
+    if fused and not batch_mode:
+        fusable = components & FUSABLE_COMPONENTS
+        wanted = [
+            (index, component)
+            for index, definition in enumerate(definitions)
+            for component in SynthesisComponent  # Stable order keeps prompts cacheable
+            if component in fusable and _needs_component(definition, component, force_refresh)
+        ]
+        if wanted:
+            fused_results = await enrich_definitions_fused(
+                word.text,
+                definitions,
+                wanted,
+                definition_counts,
+                ai,
+                language=primary_language,
+                force_refresh=force_refresh,
+                state_tracker=state_tracker,
+            )
 
     # Build tasks for each definition and component
     tasks: list[Coroutine[Any, Any, Any]] = []
     task_info: list[tuple[Definition, SynthesisComponent, int]] = []
 
-    for definition in definitions:
-        # Compute per-definition adaptive counts
-        counts = compute_counts(
-            language=primary_language,
-            definition_count=len(definitions),
-            part_of_speech=definition.part_of_speech,
-        )
+    for index, definition in enumerate(definitions):
+        counts = definition_counts[index]
+        pending = {
+            component
+            for component in components
+            if (index, component) not in fused_results
+            and _needs_component(definition, component, force_refresh)
+        }
+
+        # If force refreshing, clear old examples first to prevent accumulation
+        if SynthesisComponent.EXAMPLES in components and force_refresh and definition.example_ids:
+            await Example.find({"_id": {"$in": definition.example_ids}}).delete()
+            definition.example_ids = []
 
         # Synonyms
-        if SynthesisComponent.SYNONYMS in components and (not definition.synonyms or force_refresh):
+        if SynthesisComponent.SYNONYMS in pending:
             tasks.append(
                 synthesize_synonyms(
                     word.text,
@@ -259,13 +336,7 @@ async def enhance_definitions_parallel(
             task_info.append((definition, SynthesisComponent.SYNONYMS, len(tasks) - 1))
 
         # Examples
-        if SynthesisComponent.EXAMPLES in components and (
-            not definition.example_ids or force_refresh
-        ):
-            # If force refreshing, clear old examples first to prevent accumulation
-            if force_refresh and definition.example_ids:
-                await Example.find({"_id": {"$in": definition.example_ids}}).delete()
-                definition.example_ids = []
+        if SynthesisComponent.EXAMPLES in pending:
             tasks.append(
                 generate_examples(
                     word.text, definition, ai, count=counts.examples, state_tracker=state_tracker
@@ -274,7 +345,7 @@ async def enhance_definitions_parallel(
             task_info.append((definition, SynthesisComponent.EXAMPLES, len(tasks) - 1))
 
         # Antonyms
-        if SynthesisComponent.ANTONYMS in components and (not definition.antonyms or force_refresh):
+        if SynthesisComponent.ANTONYMS in pending:
             tasks.append(
                 synthesize_antonyms(
                     word.text,
@@ -289,43 +360,33 @@ async def enhance_definitions_parallel(
             task_info.append((definition, SynthesisComponent.ANTONYMS, len(tasks) - 1))
 
         # Word forms
-        if SynthesisComponent.WORD_FORMS in components and (
-            not definition.word_forms or force_refresh
-        ):
+        if SynthesisComponent.WORD_FORMS in pending:
             # Use the part of speech from the definition
             tasks.append(synthesize_word_forms(word, definition.part_of_speech, ai, state_tracker))
             task_info.append((definition, SynthesisComponent.WORD_FORMS, len(tasks) - 1))
 
         # CEFR Level
-        if SynthesisComponent.CEFR_LEVEL in components and (
-            definition.cefr_level is None or force_refresh
-        ):
+        if SynthesisComponent.CEFR_LEVEL in pending:
             tasks.append(assess_definition_cefr(definition, word.text, ai, state_tracker))
             task_info.append((definition, SynthesisComponent.CEFR_LEVEL, len(tasks) - 1))
 
         # Frequency Band
-        if SynthesisComponent.FREQUENCY_BAND in components and (
-            definition.frequency_band is None or force_refresh
-        ):
+        if SynthesisComponent.FREQUENCY_BAND in pending:
             tasks.append(assess_definition_frequency(definition, word.text, ai, state_tracker))
             task_info.append((definition, SynthesisComponent.FREQUENCY_BAND, len(tasks) - 1))
 
         # Register
-        if SynthesisComponent.REGISTER in components and (
-            not definition.language_register or force_refresh
-        ):
+        if SynthesisComponent.REGISTER in pending:
             tasks.append(classify_definition_register(definition, ai, state_tracker))
             task_info.append((definition, SynthesisComponent.REGISTER, len(tasks) - 1))
 
         # Domain
-        if SynthesisComponent.DOMAIN in components and (not definition.domain or force_refresh):
+        if SynthesisComponent.DOMAIN in pending:
             tasks.append(assess_definition_domain(definition, ai, state_tracker, word=word.text))
             task_info.append((definition, SynthesisComponent.DOMAIN, len(tasks) - 1))
 
         # Grammar Patterns
-        if SynthesisComponent.GRAMMAR_PATTERNS in components and (
-            not definition.grammar_patterns or force_refresh
-        ):
+        if SynthesisComponent.GRAMMAR_PATTERNS in pending:
             tasks.append(
                 assess_grammar_patterns(
                     definition, ai, count=counts.grammar_patterns, state_tracker=state_tracker
@@ -334,9 +395,7 @@ async def enhance_definitions_parallel(
             task_info.append((definition, SynthesisComponent.GRAMMAR_PATTERNS, len(tasks) - 1))
 
         # Collocations
-        if SynthesisComponent.COLLOCATIONS in components and (
-            not definition.collocations or force_refresh
-        ):
+        if SynthesisComponent.COLLOCATIONS in pending:
             tasks.append(
                 assess_collocations(
                     definition,
@@ -349,9 +408,7 @@ async def enhance_definitions_parallel(
             task_info.append((definition, SynthesisComponent.COLLOCATIONS, len(tasks) - 1))
 
         # Usage Notes
-        if SynthesisComponent.USAGE_NOTES in components and (
-            not definition.usage_notes or force_refresh
-        ):
+        if SynthesisComponent.USAGE_NOTES in pending:
             tasks.append(
                 usage_note_generation(
                     definition, word.text, ai, count=counts.usage_notes, state_tracker=state_tracker
@@ -360,13 +417,11 @@ async def enhance_definitions_parallel(
             task_info.append((definition, SynthesisComponent.USAGE_NOTES, len(tasks) - 1))
 
         # Regional Variants
-        if SynthesisComponent.REGIONAL_VARIANTS in components and (
-            not definition.region or force_refresh
-        ):
+        if SynthesisComponent.REGIONAL_VARIANTS in pending:
             tasks.append(assess_regional_variants(definition, ai, state_tracker))
             task_info.append((definition, SynthesisComponent.REGIONAL_VARIANTS, len(tasks) - 1))
 
-    if not tasks:
+    if not tasks and not fused_results:
         return
 
     # Execute tasks based on mode
@@ -381,13 +436,19 @@ async def enhance_definitions_parallel(
         # Execute all tasks in parallel (immediate mode)
         results = await asyncio.gather(*bounded_tasks, return_exceptions=True)
 
+    outcomes: list[tuple[Definition, SynthesisComponent, Any]] = [
+        (definitions[index], component, result)
+        for (index, component), result in fused_results.items()
+    ]
+    outcomes.extend(
+        (definition, component, results[task_idx]) for definition, component, task_idx in task_info
+    )
+
     # Process results and update definitions
     successes = 0
     failures = 0
 
-    for definition, component, task_idx in task_info:
-        result = results[task_idx]
-
+    for definition, component, result in outcomes:
         if isinstance(result, Exception):
             logger.error(f"Failed to enhance {component} for definition: {result}")
             failures += 1
@@ -10,12 +10,23 @@ from typing import Any
 from fastapi import Request, Response
 
 from ...utils.logging import get_logger
+from ...utils.metrics import (
+    DB_COMMAND_SECONDS,
+    HTTP_ERRORS,
+    HTTP_REQUEST_SECONDS,
+    REGISTRY,
+    HistogramSeries,
+)
 
 logger = get_logger(__name__)
 
 
 class PerformanceMetrics:
-    """Singleton for collecting performance metrics."""
+    """Singleton view over the process's latency histograms.
+
+    Samples go into the fixed-memory histograms in ``utils.metrics`` (also
+    exported at ``/metrics``); ``get_stats`` summarizes them.
+    """
 
     _instance = None
 
@@ -27,25 +38,13 @@ class PerformanceMetrics:
 
     def _initialize(self) -> None:
         """Initialize metrics storage."""
-        self.request_times: dict[str, list[dict[str, Any]]] = defaultdict(list)
         self.cache_stats: dict[str, int] = defaultdict(int)
-        self.db_query_times: dict[str, list[dict[str, Any]]] = defaultdict(list)
-        self.error_counts: dict[str, int] = defaultdict(int)
         self.start_time = datetime.now(UTC)
 
     def record_request(self, endpoint: str, duration: float, status_code: int) -> None:
         """Record request timing."""
-        self.request_times[endpoint].append(
-            {
-                "duration": duration,
-                "status_code": status_code,
-                "timestamp": datetime.now(UTC),
-            },
-        )
-
-        # Keep only last 1000 entries per endpoint
-        if len(self.request_times[endpoint]) > 1000:
-            self.request_times[endpoint] = self.request_times[endpoint][-1000:]
+        method, _, route = endpoint.partition(" ")
+        HTTP_REQUEST_SECONDS.observe(duration, method, route, str(status_code))
 
     def record_cache_hit(self, cache_type: str) -> None:
         """Record cache hit."""
@@ -57,41 +56,31 @@ class PerformanceMetrics:
 
     def record_db_query(self, collection: str, operation: str, duration: float) -> None:
         """Record database query timing."""
-        key = f"{collection}:{operation}"
-        self.db_query_times[key].append(
-            {
-                "duration": duration,
-                "timestamp": datetime.now(UTC),
-            },
-        )
-
-        # Keep only last 500 entries per query type
-        if len(self.db_query_times[key]) > 500:
-            self.db_query_times[key] = self.db_query_times[key][-500:]
+        DB_COMMAND_SECONDS.observe(duration, operation, collection)
 
     def record_error(self, endpoint: str, error_type: str) -> None:
         """Record error occurrence."""
-        key = f"{endpoint}:{error_type}"
-        self.error_counts[key] += 1
+        HTTP_ERRORS.inc(endpoint, error_type)
+
+    @staticmethod
+    def _summarize(series: HistogramSeries) -> dict[str, Any]:
+        count = series.count
+        p50, p95, p99 = (series.quantile(q) for q in (0.5, 0.95, 0.99))
+        return {
+            "count": count,
+            "avg_ms": series.sum / count * 1000 if count else 0.0,
+            "p50_ms": p50 * 1000 if p50 is not None else None,
+            "p95_ms": p95 * 1000 if p95 is not None else None,
+            "p99_ms": p99 * 1000 if p99 is not None else None,
+        }
 
     def get_stats(self) -> dict[str, Any]:
         """Get current performance statistics."""
         uptime = (datetime.now(UTC) - self.start_time).total_seconds()
 
-        # Calculate request stats
         request_stats = {}
-        for endpoint, times in self.request_times.items():
-            if times:
-                durations = [t["duration"] for t in times]
-                request_stats[endpoint] = {
-                    "count": len(times),
-                    "avg_ms": sum(durations) / len(durations) * 1000,
-                    "min_ms": min(durations) * 1000,
-                    "max_ms": max(durations) * 1000,
-                    "p95_ms": sorted(durations)[int(len(durations) * 0.95)] * 1000
-                    if len(durations) > 20
-                    else None,
-                }
+        for (method, route, status), series in HTTP_REQUEST_SECONDS.series.items():
+            request_stats[f"{method} {route} [{status}]"] = self._summarize(series)
 
         # Calculate cache hit rates
         cache_hit_rates = {}
@@ -105,27 +94,25 @@ class PerformanceMetrics:
                 "hit_rate": hits / total if total > 0 else 0,
             }
 
-        # Calculate DB query stats
-        db_stats = {}
-        for query_type, times in self.db_query_times.items():
-            if times:
-                durations = [t["duration"] for t in times]
-                db_stats[query_type] = {
-                    "count": len(times),
-                    "avg_ms": sum(durations) / len(durations) * 1000,
-                    "max_ms": max(durations) * 1000,
-                }
+        db_stats = {
+            f"{collection}:{command}": self._summarize(series)
+            for (command, collection), series in DB_COMMAND_SECONDS.series.items()
+        }
 
         return {
             "uptime_seconds": uptime,
             "request_stats": request_stats,
             "cache_stats": cache_hit_rates,
             "db_stats": db_stats,
-            "error_counts": dict(self.error_counts),
+            "error_counts": {
+                f"{route}:{error}": int(counter.value)
+                for (route, error), counter in HTTP_ERRORS.series.items()
+            },
         }
 
     def reset_stats(self) -> None:
         """Reset all statistics."""
+        REGISTRY.reset()
         self._initialize()
 
 
@@ -133,17 +120,23 @@ class PerformanceMetrics:
 metrics = PerformanceMetrics()
 
 
+def route_label(request: Request) -> str:
+    """Route template for a handled request (``/api/v1/words/{word}``), bounding label values."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
 @asynccontextmanager
 async def track_request_performance(request: Request, response: Response) -> Any:
     """Context manager for tracking request performance."""
-    start_time = time.time()
-    endpoint = f"{request.method} {request.url.path}"
+    start_time = time.perf_counter()
 
     try:
         yield
     finally:
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
         status_code = response.status_code
+        endpoint = f"{request.method} {route_label(request)}"
 
         # Record metrics
         metrics.record_request(endpoint, duration, status_code)
@@ -1,5 +1,6 @@
 """FastAPI application for Floridify dictionary service."""
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from typing import Any
@@ -9,9 +10,14 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from ..ai import get_ai_connector, get_definition_synthesizer
 from ..caching.core import get_global_cache, shutdown_global_cache
+from ..caching.manager import get_version_manager
+from ..core.search_client import shutdown_search_service_client
 from ..core.search_pipeline import get_search_engine_manager
+from ..search.semantic.encoder_pool import shutdown_encoder_pool
 from ..storage.mongodb import get_storage
+from ..text.normalize import TEXT_POOL_SHUTDOWN_WAIT, shutdown_text_pool
 from ..utils.logging import setup_logging
+from ..utils.metrics import start_metrics_flush_task, stop_metrics_flush_task
 from .middleware import CacheHeadersMiddleware, LoggingMiddleware
 from .middleware.auth import ClerkAuthMiddleware
 from .middleware.exception_handlers import register_exception_handlers
@@ -73,6 +79,14 @@ async def lifespan(app: FastAPI) -> Any:
         cache.start_ttl_cleanup_task(interval_seconds=60.0)
         print("✅ Background TTL cleanup task started (interval=60s)")
 
+        # Evict versioned cache entries on writes from any process (replica sets only;
+        # otherwise cached versions are revalidated once per trust window)
+        get_version_manager().start_change_listener()
+        print("✅ Versioned cache change-stream listener started")
+
+        # Publish latency histograms for cross-worker /metrics (needs FLORIDIFY_METRICS_DIR)
+        start_metrics_flush_task()
+
         # TTS backends use lazy initialization — models load on first request.
         # No eager init needed; AudioSynthesizer._get_kitten()/_get_kokoro()
         # handle thread-safe initialization with caching.
@@ -96,6 +110,7 @@ async def lifespan(app: FastAPI) -> Any:
     # Shutdown
     print("🔄 Shutting down...")
     try:
+        await get_version_manager().stop_change_listener()
         cache = await get_global_cache()
         await cache.stop_ttl_cleanup_task()
         await shutdown_global_cache()
@@ -104,6 +119,27 @@ async def lifespan(app: FastAPI) -> Any:
         # Shutdown errors are logged but non-fatal — resources will be reclaimed by OS
         print(f"⚠️ Cache shutdown error: {e}")
 
+    try:
+        await asyncio.to_thread(shutdown_text_pool, TEXT_POOL_SHUTDOWN_WAIT)
+        print("✅ Text worker pool shut down")
+    except Exception as e:
+        print(f"⚠️ Text worker pool shutdown error: {e}")
+
+    try:
+        await asyncio.to_thread(shutdown_encoder_pool)
+    except Exception as e:
+        print(f"⚠️ Encoder pool shutdown error: {e}")
+
+    try:
+        await shutdown_search_service_client()
+    except Exception as e:
+        print(f"⚠️ Search service client shutdown error: {e}")
+
+    try:
+        await stop_metrics_flush_task()
+    except Exception as e:
+        print(f"⚠️ Metrics flush shutdown error: {e}")
+
 
 # Create FastAPI application
 app = FastAPI(
@@ -92,8 +92,8 @@ ADMIN_PREFIXES = frozenset(
 
 def _is_public_endpoint(path: str, method: str) -> bool:
     """Check if endpoint is Tier 1 (public, no auth required)."""
-    # Health check at root
-    if path in ("/health", "/api"):
+    # Health check and Prometheus scrape at root
+    if path in ("/health", "/metrics", "/api"):
         return True
 
     # All GET requests to lookup, search, suggestions, health, config are public
@@ -9,6 +9,7 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from ...utils.logging import get_logger
+from ..core.monitoring import metrics, route_label
 
 logger = get_logger(__name__)
 
@@ -46,6 +47,9 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             # Calculate timing
             process_time = time.perf_counter() - start_time
             process_time_ms = int(process_time * 1000)
+            metrics.record_request(
+                f"{request.method} {route_label(request)}", process_time, response.status_code
+            )
 
             # Log response
             logger.info(
@@ -67,6 +71,8 @@ class LoggingMiddleware(BaseHTTPMiddleware):
             # Calculate timing for errors too
             process_time = time.perf_counter() - start_time
             process_time_ms = int(process_time * 1000)
+            metrics.record_request(f"{request.method} {route_label(request)}", process_time, 500)
+            metrics.record_error(route_label(request), type(e).__name__)
 
             # Log error
             logger.error(
@@ -136,8 +142,8 @@ class CacheHeadersMiddleware(BaseHTTPMiddleware):
                 response.headers["ETag"] = f'"{etag}"'
                 response.headers["Vary"] = "Accept-Encoding"
 
-            elif path.startswith("/api/v1/health"):
-                # Health checks - no caching
+            elif path.startswith("/api/v1/health") or path == "/metrics":
+                # Health checks and Prometheus scrapes - no caching
                 response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
                 response.headers["Pragma"] = "no-cache"
                 response.headers["Expires"] = "0"
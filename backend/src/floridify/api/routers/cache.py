@@ -61,13 +61,11 @@ async def get_cache_stats(
                 hit_rate = hits / total_requests
                 miss_rate = misses / total_requests
 
-            # Rough size estimation (not exact)
+            # Estimated L1 footprint tracked by the cache's byte budgeting
             size_bytes = None
             size_human = None
             if params.include_size:
-                memory_items = namespace_stats.get("memory_items", 0)
-                # Assume ~1KB per item (very rough)
-                size_bytes = memory_items * 1024
+                size_bytes = namespace_stats.get("memory_bytes", 0)
                 size_human = _format_bytes(size_bytes)
 
             return CacheStatsResponse(
@@ -110,11 +108,11 @@ async def get_cache_stats(
                 hit_rate = total_hits / total_requests
                 miss_rate = total_misses / total_requests
 
-            # Total size estimation
+            # Total estimated L1 footprint
             size_bytes = None
             size_human = None
             if params.include_size:
-                size_bytes = total_entries * 1024  # Rough estimate
+                size_bytes = cache.get_stats()["memory_bytes"]
                 size_human = _format_bytes(size_bytes)
 
             return CacheStatsResponse(
@@ -125,6 +123,7 @@ async def get_cache_stats(
                 size_bytes=size_bytes,
                 size_human=size_human,
                 by_namespace=all_stats,
+                versioned_validation=get_version_manager().generations.get_stats(),
             )
 
     except HTTPException:
@@ -4,13 +4,14 @@ import time
 from datetime import UTC, datetime
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from pydantic import BaseModel, Field
 
 from ...caching.core import get_global_cache
 from ...core.search_pipeline import get_search_engine_manager
 from ...storage.mongodb import _ensure_initialized, get_storage
 from ...utils.logging import get_logger
+from ...utils.metrics import PROMETHEUS_CONTENT_TYPE, render_metrics
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -62,7 +63,7 @@ class MetricsResponse(BaseModel):
     timestamp: str = Field(..., description="Metrics collection timestamp")
 
 
-@router.get("/metrics", response_model=MetricsResponse)
+@router.get("/api/v1/metrics", response_model=MetricsResponse)
 async def get_metrics() -> MetricsResponse:
     """Get basic operational metrics.
 
@@ -106,6 +107,15 @@ async def get_metrics() -> MetricsResponse:
     )
 
 
+@router.get("/metrics", include_in_schema=False)
+async def prometheus_metrics() -> Response:
+    """Request, cache, database, and search-stage latency histograms for Prometheus.
+
+    Aggregates every worker that publishes to ``FLORIDIFY_METRICS_DIR``.
+    """
+    return Response(content=render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
     """Get service health status.
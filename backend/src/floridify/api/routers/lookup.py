@@ -16,7 +16,7 @@ from ...caching import cached_api_call_with_dedup
 from ...caching.core import get_global_cache
 from ...caching.models import CacheNamespace
 from ...core.lookup_pipeline import _ensure_primary_audio, lookup_word_pipeline
-from ...core.state_tracker import Stages, StateTracker
+from ...core.state_tracker import Stages, StateTracker, TraceSpan
 from ...core.streaming import create_streaming_response
 from ...models.dictionary import (
     Definition as DefModel,
@@ -196,6 +196,9 @@ class DictionaryEntryResponse(BaseModel):
     # Richness score (0.0–1.0)
     richness_score: float | None = Field(None, description="Entry richness score (0.0–1.0)")
 
+    # Pipeline stage timings (?debug=true only)
+    trace: list[TraceSpan] | None = Field(None, description="Pipeline stage spans (debug only)")
+
 
 def parse_lookup_params(
     force_refresh: bool = Query(default=False, description="Force refresh of cached data"),
@@ -221,16 +224,20 @@ async def _cached_lookup(word: str, params: LookupParams) -> DictionaryEntryResp
     """Cached word lookup implementation."""
     logger.info(f"Looking up word: {word}")
 
-    # Use existing lookup pipeline without state tracking for cached version
-    entry = await lookup_word_pipeline(
-        word=word,
-        providers=params.providers,
-        languages=params.languages,
-        force_refresh=params.force_refresh,
-        no_ai=params.no_ai,
-        skip_search=True,
-        state_tracker=None,  # No state tracking for cached lookups
-    )
+    # No progress consumers here; the tracker only feeds the stage histograms
+    state_tracker = StateTracker(category="lookup")
+    try:
+        entry = await lookup_word_pipeline(
+            word=word,
+            providers=params.providers,
+            languages=params.languages,
+            force_refresh=params.force_refresh,
+            no_ai=params.no_ai,
+            skip_search=True,
+            state_tracker=state_tracker,
+        )
+    finally:
+        state_tracker.finish()
 
     if not entry:
         return None
@@ -253,6 +260,10 @@ async def lookup_word(
     user_role: OptionalUserRoleDep,
     user_id: OptionalUserDep = None,
     params: LookupParams = Depends(parse_lookup_params),
+    debug: bool = Query(
+        default=False,
+        description="Include pipeline stage timings (admin only; bypasses the response cache)",
+    ),
 ) -> DictionaryEntryResponse:
     """Comprehensive word definition lookup with AI-enhanced synthesis.
 
@@ -261,6 +272,7 @@ async def lookup_word(
         force_refresh: Bypass all caches for fresh data (default: false)
         providers: Dictionary sources to query (default: wiktionary)
         no_ai: Skip AI synthesis, return raw provider data (default: false)
+        debug: Attach the pipeline's stage spans as ``trace``; admin only (default: false)
 
     Returns:
         Comprehensive word entry with pronunciation, definitions, examples,
@@ -268,6 +280,7 @@ async def lookup_word(
         synonyms, and contextual examples.
 
     Raises:
+        403: ``debug`` requested by a non-admin
         404: Word not found in any provider or search index
         500: Internal processing error (provider failure, AI synthesis error)
         422: Invalid parameters (malformed word, unsupported provider)
@@ -285,6 +298,10 @@ async def lookup_word(
     except ValueError as e:
         raise HTTPException(400, str(e))
 
+    # Traces run the full pipeline uncached and expose internal timings
+    if debug and user_role != UserRole.ADMIN:
+        raise HTTPException(403, "Admin access required for debug traces")
+
     # Premium gating: free users can only get AI synthesis if it's already cached
     is_premium = user_role in (UserRole.PREMIUM, UserRole.ADMIN) if user_role else False
     if not is_premium and not params.no_ai:
@@ -302,24 +319,32 @@ async def lookup_word(
     start_time = time.perf_counter()
 
     try:
-        if params.force_refresh:
-            entry = await lookup_word_pipeline(
-                word=word,
-                providers=params.providers,
-                languages=params.languages,
-                force_refresh=True,
-                no_ai=params.no_ai,
-                state_tracker=None,
-                # user_id not passed here — router handles history tracking
-                # after the lookup completes (covers both cached and uncached paths)
-            )
-            if not entry:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"No definition found for word: {word}",
+        if params.force_refresh or debug:
+            state_tracker = StateTracker(category="lookup")
+            try:
+                entry = await lookup_word_pipeline(
+                    word=word,
+                    providers=params.providers,
+                    languages=params.languages,
+                    force_refresh=params.force_refresh,
+                    no_ai=params.no_ai,
+                    skip_search=not params.force_refresh,  # Same resolution as _cached_lookup
+                    state_tracker=state_tracker,
+                    # user_id not passed here — router handles history tracking
+                    # after the lookup completes (covers both cached and uncached paths)
                 )
-            response_dict = await DictionaryEntryLoader.load_as_lookup_response(entry=entry)
-            result = DictionaryEntryResponse(**response_dict)
+                if not entry:
+                    raise HTTPException(
+                        status_code=404,
+                        detail=f"No definition found for word: {word}",
+                    )
+                response_dict = await DictionaryEntryLoader.load_as_lookup_response(entry=entry)
+            finally:
+                state_tracker.finish()
+            result = DictionaryEntryResponse(
+                **response_dict,
+                trace=state_tracker.get_trace() if debug else None,
+            )
         else:
             result = await _cached_lookup(word, params)
 
@@ -359,6 +384,7 @@ async def _report_cached_progress(
     definitions_count: int,
 ) -> None:
     """Report progress for cached results."""
+    state_tracker.disable_tracing()  # Replayed stages carry no timing
     await state_tracker.update_stage(Stages.START)
     await state_tracker.update(stage=Stages.START, message=f"Starting lookup for '{word}'...")
     await state_tracker.update_stage(Stages.SEARCH_START)
@@ -1,11 +1,13 @@
 """Main search endpoints for word discovery."""
 
 import time
+from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from ....caching.models import VersionConfig
 from ....core.search_pipeline import get_search_engine_manager
+from ....corpus.core import Corpus
 from ....corpus.manager import get_tree_corpus_manager
 from ....models.parameters import SearchParams
 from ....models.responses import SearchResponse
@@ -14,6 +16,7 @@ from ....search.engine import Search
 from ....search.index import SearchIndex
 from ....utils.logging import get_logger
 from ....utils.sanitization import sanitize_mongodb_input
+from .models import BatchSearchRequest, BatchSearchResponse
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -56,6 +59,82 @@ def parse_search_params(
     )
 
 
+async def _get_corpus_search_engine(
+    params: SearchParams,
+) -> tuple[Search, Corpus, dict[str, Any]]:
+    """Build a Search engine for the corpus named by ``params`` (ID or name).
+
+    Applies the per-corpus semantic policy and global toggle, and returns the
+    engine, the corpus and the response metadata describing that policy.
+    """
+    mode_enum = params.mode
+
+    corpus_manager = get_tree_corpus_manager()
+
+    # Get the corpus by ID or name
+    corpus = await corpus_manager.get_corpus(
+        corpus_id=params.corpus_id,
+        corpus_name=params.corpus_name,
+        config=VersionConfig(use_cache=True),
+    )
+
+    if not corpus:
+        logger.warning(f"Corpus not found: id={params.corpus_id}, name={params.corpus_name}")
+        raise HTTPException(
+            status_code=404,
+            detail=f"Corpus not found: id={params.corpus_id}, name={params.corpus_name}",
+        )
+
+    # Per-corpus semantic policy (child-to-parent effective OR) + global engine toggle.
+    global_semantic_enabled = get_search_engine_manager()._semantic
+    corpus_semantic_enabled = corpus.semantic_enabled_effective
+
+    if mode_enum == SearchMode.SEMANTIC and not corpus_semantic_enabled:
+        raise HTTPException(
+            status_code=409,
+            detail=(
+                f"Semantic search disabled by corpus policy for '{corpus.corpus_name}'. "
+                "Enable it via PATCH /api/v1/corpus/{corpus_id}/semantic."
+            ),
+        )
+    if mode_enum == SearchMode.SEMANTIC and not global_semantic_enabled:
+        raise HTTPException(
+            status_code=409,
+            detail="Semantic search disabled globally (SEMANTIC_SEARCH_ENABLED=false).",
+        )
+
+    use_semantic = mode_enum == SearchMode.SEMANTIC or (
+        mode_enum == SearchMode.SMART and global_semantic_enabled and corpus_semantic_enabled
+    )
+    index = await SearchIndex.get_or_create(
+        corpus=corpus,
+        semantic=use_semantic,
+        config=VersionConfig(use_cache=True),
+    )
+
+    # Create search engine from index
+    search_engine = Search(index=index, corpus=corpus)
+    await search_engine.initialize()
+
+    # For per-corpus search, wait for semantic to be ready
+    # (small corpora build quickly, and each request creates a new Search instance)
+    if use_semantic:
+        await search_engine.await_semantic_ready()
+
+    response_metadata: dict[str, Any] = {
+        "corpus_id": str(corpus.corpus_id),
+        "corpus_name": corpus.corpus_name,
+        "semantic_enabled_effective": corpus_semantic_enabled,
+        "semantic_enabled_global": global_semantic_enabled,
+    }
+    if mode_enum == SearchMode.SMART and not use_semantic:
+        response_metadata["semantic_disabled_reason"] = (
+            "corpus_policy" if not corpus_semantic_enabled else "global_toggle"
+        )
+
+    return search_engine, corpus, response_metadata
+
+
 async def _cached_search(query: str, params: SearchParams) -> SearchResponse:
     """Cached search implementation."""
     # Support comma-separated modes (e.g., "exact,fuzzy")
@@ -110,61 +189,7 @@ async def _cached_search(query: str, params: SearchParams) -> SearchResponse:
                 f"Searching for '{query}' in corpus_id={params.corpus_id} corpus_name={params.corpus_name} (mode={mode_enum.value})"
             )
 
-            corpus_manager = get_tree_corpus_manager()
-
-            # Get the corpus by ID or name
-            corpus = await corpus_manager.get_corpus(
-                corpus_id=params.corpus_id,
-                corpus_name=params.corpus_name,
-                config=VersionConfig(use_cache=True),
-            )
-
-            if not corpus:
-                logger.warning(
-                    f"Corpus not found: id={params.corpus_id}, name={params.corpus_name}"
-                )
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Corpus not found: id={params.corpus_id}, name={params.corpus_name}",
-                )
-
-            # Per-corpus semantic policy (child-to-parent effective OR) + global engine toggle.
-            global_semantic_enabled = get_search_engine_manager()._semantic
-            corpus_semantic_enabled = corpus.semantic_enabled_effective
-
-            if mode_enum == SearchMode.SEMANTIC and not corpus_semantic_enabled:
-                raise HTTPException(
-                    status_code=409,
-                    detail=(
-                        f"Semantic search disabled by corpus policy for '{corpus.corpus_name}'. "
-                        "Enable it via PATCH /api/v1/corpus/{corpus_id}/semantic."
-                    ),
-                )
-            if mode_enum == SearchMode.SEMANTIC and not global_semantic_enabled:
-                raise HTTPException(
-                    status_code=409,
-                    detail="Semantic search disabled globally (SEMANTIC_SEARCH_ENABLED=false).",
-                )
-
-            use_semantic = mode_enum == SearchMode.SEMANTIC or (
-                mode_enum == SearchMode.SMART
-                and global_semantic_enabled
-                and corpus_semantic_enabled
-            )
-            index = await SearchIndex.get_or_create(
-                corpus=corpus,
-                semantic=use_semantic,
-                config=VersionConfig(use_cache=True),
-            )
-
-            # Create search engine from index
-            search_engine = Search(index=index, corpus=corpus)
-            await search_engine.initialize()
-
-            # For per-corpus search, wait for semantic to be ready
-            # (small corpora build quickly, and each request creates a new Search instance)
-            if use_semantic:
-                await search_engine.await_semantic_ready()
+            search_engine, corpus, response_metadata = await _get_corpus_search_engine(params)
 
             # Perform search
             results = await search_engine.search_with_mode(
@@ -179,17 +204,6 @@ async def _cached_search(query: str, params: SearchParams) -> SearchResponse:
                 if not result.language:
                     result.language = corpus.language
 
-            response_metadata = {
-                "corpus_id": str(corpus.corpus_id),
-                "corpus_name": corpus.corpus_name,
-                "semantic_enabled_effective": corpus_semantic_enabled,
-                "semantic_enabled_global": global_semantic_enabled,
-            }
-            if mode_enum == SearchMode.SMART and not use_semantic:
-                response_metadata["semantic_disabled_reason"] = (
-                    "corpus_policy" if not corpus_semantic_enabled else "global_toggle"
-                )
-
             return SearchResponse(
                 query=query,
                 results=results,
@@ -266,6 +280,73 @@ async def search_words_query(
         raise HTTPException(status_code=500, detail="Internal error during search")
 
 
+@router.post("/search/batch", response_model=BatchSearchResponse)
+async def search_words_batch(request: BatchSearchRequest) -> BatchSearchResponse:
+    """Search for many words in one call.
+
+    Runs every query through the same cascade as ``GET /search`` via
+    ``Search.search_many``: queries are normalized and deduplicated once,
+    the text stages run as one batch, and semantic fallbacks share a single
+    encode + FAISS call. Results are returned in request order.
+    """
+    queries = [_validate_search_query(q) for q in request.queries]
+    start_time = time.perf_counter()
+
+    try:
+        if request.corpus_id or request.corpus_name:
+            search_engine, corpus, response_metadata = await _get_corpus_search_engine(request)
+            batch = await search_engine.search_many(
+                queries,
+                mode=request.mode,
+                max_results=request.max_results,
+                min_score=request.min_score,
+            )
+            languages = [corpus.language] if corpus.language else request.languages
+        else:
+            manager = get_search_engine_manager()
+            language_search = await manager.get_engine(
+                languages=request.languages,
+                semantic=request.semantic,
+            )
+            batch = await language_search.search_many(
+                queries,
+                mode=request.mode,
+                max_results=request.max_results,
+                min_score=request.min_score,
+            )
+            response_metadata = {}
+            languages = request.languages
+
+        elapsed_ms = int((time.perf_counter() - start_time) * 1000)
+        logger.info(f"Batch search completed: {len(queries)} queries in {elapsed_ms}ms")
+
+        return BatchSearchResponse(
+            results=[
+                SearchResponse(
+                    query=query,
+                    results=results,
+                    total_found=len(results),
+                    languages=languages,
+                    mode=request.mode,
+                )
+                for query, results in zip(queries, batch, strict=True)
+            ],
+            total_queries=len(queries),
+            metadata={**response_metadata, "elapsed_ms": elapsed_ms},
+        )
+
+    except HTTPException:
+        raise
+    except (ValueError, SearchError) as e:
+        if "initializing" in str(e).lower():
+            raise HTTPException(status_code=503, detail=str(e))
+        logger.error(f"Batch search failed for {len(queries)} queries: {e}")
+        raise HTTPException(status_code=500, detail="Internal error during search")
+    except Exception as e:
+        logger.error(f"Batch search failed for {len(queries)} queries: {e}")
+        raise HTTPException(status_code=500, detail="Internal error during search")
+
+
 @router.get("/search/{query}", response_model=SearchResponse)
 async def search_words_path(
     query: str,
@@ -5,6 +5,28 @@ from typing import Any
 from pydantic import BaseModel, Field
 
 from ....models.base import Language
+from ....models.parameters import SearchParams
+from ....models.responses import SearchResponse
+from ....search.config import BATCH_SEARCH_MAX_QUERIES
+
+
+class BatchSearchRequest(SearchParams):
+    """Request for resolving many queries in one call (same params as GET /search)."""
+
+    queries: list[str] = Field(
+        ...,
+        min_length=1,
+        max_length=BATCH_SEARCH_MAX_QUERIES,
+        description="Search queries, resolved in order",
+    )
+
+
+class BatchSearchResponse(BaseModel):
+    """Response for batch search — one SearchResponse per query, in request order."""
+
+    results: list[SearchResponse] = Field(..., description="Per-query search responses")
+    total_queries: int = Field(..., description="Number of queries resolved")
+    metadata: dict[str, Any] = Field(default_factory=dict, description="Batch metadata")
 
 
 class RebuildIndexRequest(BaseModel):
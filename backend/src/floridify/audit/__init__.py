@@ -17,12 +17,15 @@ from .fixtures import (
     AUDIT_WIKITEXT_SAMPLE,
     CORPUS_SIZES,
     WIKITEXT_CORRECTNESS_CASES,
+    FakeSentenceModel,
     build_corpus_fixture,
+    build_entry_payloads,
     build_multi_version_payloads,
     build_search_fixture,
     build_semantic_fixture,
     fake_encode_texts,
     install_fake_semantic_encoder,
+    load_fake_sentence_model,
 )
 
 __all__ = [
@@ -31,6 +34,7 @@ __all__ = [
     "BenchmarkCase",
     "BenchmarkStats",
     "CORPUS_SIZES",
+    "FakeSentenceModel",
     "WIKITEXT_CORRECTNESS_CASES",
     "benchmark_async",
     "benchmark_sync",
@@ -38,11 +42,13 @@ __all__ = [
     "get_collected_cases",
     "reset_collected_cases",
     "build_corpus_fixture",
+    "build_entry_payloads",
     "build_multi_version_payloads",
     "build_search_fixture",
     "build_semantic_fixture",
     "fake_encode_texts",
     "install_fake_semantic_encoder",
+    "load_fake_sentence_model",
     "now_stamp",
     "summarize_samples",
     "write_json",
@@ -178,25 +178,39 @@ def fake_encode_texts(texts: list[str], *, dimension: int = 32) -> np.ndarray:
     return np.vstack(rows).astype("float32")
 
 
+class FakeSentenceModel:
+    """SentenceTransformer stand-in producing ``fake_encode_texts`` embeddings."""
+
+    def __init__(self, dimension: int = 32) -> None:
+        self.dimension = dimension
+
+    def get_sentence_embedding_dimension(self) -> int:
+        return self.dimension
+
+    def encode(self, sentences: list[str], **_: Any) -> np.ndarray:
+        return fake_encode_texts(list(sentences), dimension=self.dimension)
+
+
+def load_fake_sentence_model(model_name: str) -> FakeSentenceModel:
+    """Picklable model loader for encoder pool workers (32-dim fake model)."""
+    return FakeSentenceModel()
+
+
 def install_fake_semantic_encoder(search: SemanticSearch, *, dimension: int = 32) -> None:
     """Patch a SemanticSearch instance to use deterministic fake embeddings."""
     from ..search.semantic.encoder import SemanticEncoder
 
-    class _FakeSentenceModel:
-        def encode(self, sentences: list[str], **_: Any) -> np.ndarray:
-            return fake_encode_texts(list(sentences), dimension=dimension)
-
     def _fake_encode(
         self: SemanticEncoder,
         texts: list[str],
-        model_name: str = "",  # noqa: ARG001
-        batch_size: int = 32,  # noqa: ARG001
-        use_multiprocessing: bool = True,  # noqa: ARG001
+        model_name: str = "",
+        batch_size: int = 32,
+        use_multiprocessing: bool = True,
     ) -> np.ndarray:
         return fake_encode_texts(texts, dimension=dimension)
 
     encoder = search._encoder
-    encoder.sentence_model = _FakeSentenceModel()  # type: ignore[assignment]
+    encoder.sentence_model = FakeSentenceModel(dimension)  # type: ignore[assignment]
     encoder.device = "cpu"
     encoder.encode = types.MethodType(_fake_encode, encoder)  # type: ignore[method-assign]
 
@@ -245,3 +259,88 @@ def build_multi_version_payloads(num_versions: int = 10) -> list[dict[str, objec
             }
         )
     return payloads
+
+
+def _object_id(*parts: object) -> str:
+    return hashlib.md5(":".join(map(str, parts)).encode()).hexdigest()[:24]
+
+
+def build_entry_payloads(num_versions: int = 10, num_definitions: int = 24) -> list[dict[str, Any]]:
+    """Generate ``model_dump(mode="json")``-shaped synthesized entries across revisions.
+
+    Each revision rewords one sense, inserts a sense mid-list (with its id in
+    ``definition_ids``), and refreshes model/provenance metadata, the way
+    re-synthesis and edits change a stored entry.
+    """
+    word = "perspicacious"
+    payloads: list[dict[str, Any]] = []
+    senses: list[dict[str, Any]] = [
+        {
+            "id": _object_id(word, "sense", i),
+            "part_of_speech": ("adjective", "noun", "verb")[i % 3],
+            "text": f"Sense {i}: having a ready insight into things ({word}).",
+            "sense_number": f"{i // 3 + 1}{'abc'[i % 3]}",
+            "examples": [f"Example {i}.{j} using {word} in a sentence." for j in range(3)],
+            "synonyms": ["astute", "discerning", "perceptive", "shrewd"][: i % 4 + 1],
+            "tags": ["formal"] if i % 5 == 0 else [],
+        }
+        for i in range(num_definitions)
+    ]
+
+    for v in range(num_versions):
+        if v:
+            senses = [dict(sense) for sense in senses]
+            edited = (v * 7) % len(senses)
+            senses[edited]["text"] = f"{senses[edited]['text'].split(' (rev')[0]} (rev {v})."
+            senses.insert(
+                len(senses) // 2,
+                {
+                    "id": _object_id(word, "sense", num_definitions + v),
+                    "part_of_speech": "adjective",
+                    "text": f"Added sense in revision {v}.",
+                    "sense_number": None,
+                    "examples": [],
+                    "synonyms": [],
+                    "tags": ["new"],
+                },
+            )
+
+        payloads.append(
+            {
+                "id": _object_id(word, "entry"),
+                "word_id": _object_id(word),
+                "definition_ids": [sense["id"] for sense in senses],
+                "pronunciation_id": _object_id(word, "pronunciation"),
+                "fact_ids": [_object_id(word, "fact", i) for i in range(5)],
+                "image_ids": [],
+                "provider": "synthesis",
+                "languages": ["en"],
+                "etymology": {
+                    "text": "From Latin perspicax, from perspicere 'to look through'.",
+                    "origin_language": "la",
+                    "root_words": ["perspicax", "perspicere"],
+                },
+                "raw_data": {"senses": senses},
+                "phrases": [
+                    {"phrase": f"{word} observer {i}", "meaning": f"Phrase meaning {i}."}
+                    for i in range(4)
+                ],
+                "source_entries": [
+                    {
+                        "provider": provider,
+                        "entry_id": _object_id(word, provider),
+                        "version": f"1.0.{v}",
+                    }
+                    for provider in ("wiktionary", "wordnet", "merriam_webster")
+                ],
+                "model_info": {
+                    "name": "gpt-5-mini",
+                    "generation_count": v + 1,
+                    "confidence": round(0.8 + v / 100, 3),
+                },
+                "version": v + 1,
+                "created_at": "2025-01-01T00:00:00",
+                "updated_at": f"2025-01-{v % 28 + 1:02d}T12:00:00",
+            }
+        )
+    return payloads
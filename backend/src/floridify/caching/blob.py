@@ -0,0 +1,366 @@
+"""Raw-bytes blob files for the L2 cache.
+
+Large binary payloads (FAISS indices, embedding matrices, ffuzzy blobs) skip
+diskcache and its pickle round-trip: each payload is one file plus a small JSON
+sidecar recording its size, compression, and expiry.
+
+- Uncompressed blobs are returned as a read-only ``memoryview`` over an mmap of
+  the file: a read costs page faults instead of a copy + unpickle, and every
+  worker maps the same page-cache pages.
+- Compressed blobs are written as a streamed zstd frame, chunk by chunk, and
+  read back with a streaming decompressor into one preallocated buffer, so
+  neither direction holds a second full-size copy.
+- Payloads that don't compress (float embeddings, most FAISS indices) are
+  detected from their first chunk and stored raw so they stay mappable.
+
+Each write goes to a fresh, uniquely named data file; the sidecar is renamed
+into place last and names that file, so a reader always sees a complete data
+file matching its sidecar, and a reader holding an mmap keeps the old inode
+alive across an overwrite.
+
+Blob bytes count against the owning cache's size limit: ``sweep`` drops
+expired blobs and orphaned files, then evicts least-recently-used blobs until
+the store fits its budget. ``BlobStore`` keeps a running total of stored
+bytes so ``FilesystemBackend`` only sweeps once a write crosses the budget (or
+on a timer), evicting below it by a margin so the following writes don't each
+pay for another full directory scan.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import secrets
+import shutil
+import tempfile
+import time
+from collections.abc import Iterator
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import zstandard as zstd
+
+from ..utils.logging import get_logger
+from .models import CompressionType
+
+logger = get_logger(__name__)
+
+# Streaming granularity for compression and decompression
+BLOB_CHUNK_BYTES = 4 * 1024 * 1024
+# Store raw (mappable) when the first chunk compresses to more than this fraction
+MIN_COMPRESSION_SAVINGS = 0.9
+ZSTD_LEVEL = 3
+# Minimum interval between periodic sweeps (expiry, orphans, other processes' writes)
+BLOB_SWEEP_INTERVAL = timedelta(minutes=5)
+# Budget-triggered sweeps evict down to this fraction of the budget
+BLOB_EVICTION_TARGET = 0.9
+# Unreferenced data/temp files younger than this may belong to an in-flight write
+ORPHAN_GRACE_SECONDS = 60.0
+
+BytesLike = bytes | bytearray | memoryview
+
+
+def is_bytes_like(value: Any) -> bool:
+    """Whether a value is a raw binary payload eligible for blob storage."""
+    return isinstance(value, bytes | bytearray | memoryview)
+
+
+class BlobStore:
+    """Directory of ``<sha256(key)>.json`` sidecars, each naming its ``.bin`` payload.
+
+    Synchronous; ``FilesystemBackend`` runs these calls in its executor.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self._last_sweep = time.monotonic()
+        # Counts orphans until the first sweep; writes from other processes
+        # are picked up by the periodic one
+        self._stored_bytes = self.stats()["size"]
+
+    @property
+    def stored_bytes(self) -> int:
+        """Running total of payload bytes on disk, as of this process's view."""
+        return self._stored_bytes
+
+    def _meta_path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def _read_meta(self, meta_path: Path) -> dict[str, Any] | None:
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        # Sidecars from before data files were versioned don't name one
+        return meta if "file" in meta else None
+
+    def put(
+        self,
+        key: str,
+        payload: BytesLike,
+        ttl: timedelta | None = None,
+        compression: CompressionType | None = None,
+    ) -> int:
+        """Write a payload, streaming it through zstd when compression helps.
+
+        Any requested compression algorithm is served as zstd frames, the one
+        codec here with a sized streaming writer.
+
+        Args:
+            key: Cache key
+            payload: Raw bytes to store
+            ttl: Time-to-live (None = never expires)
+            compression: Requested compression (None = store raw)
+
+        Returns:
+            Bytes written to disk
+
+        """
+        view = memoryview(payload).cast("B")
+        size = len(view)
+        meta_path = self._meta_path(key)
+        data_path = meta_path.with_name(f"{meta_path.stem}-{secrets.token_hex(8)}.bin")
+
+        use_zstd = compression is not None and size > 0
+        if use_zstd:
+            head = view[:BLOB_CHUNK_BYTES]
+            trial = zstd.ZstdCompressor(level=ZSTD_LEVEL).compress(head)
+            use_zstd = len(trial) < len(head) * MIN_COMPRESSION_SAVINGS
+
+        fd, tmp_name = tempfile.mkstemp(prefix=".blob-", dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if use_zstd:
+                    cctx = zstd.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+                    with cctx.stream_writer(f, size=size, closefd=False) as writer:
+                        for start in range(0, size, BLOB_CHUNK_BYTES):
+                            writer.write(view[start : start + BLOB_CHUNK_BYTES])
+                else:
+                    f.write(view)
+                stored_size = f.tell()
+            os.replace(tmp_name, data_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        meta = {
+            "key": key,
+            "file": data_path.name,
+            "size": size,
+            "stored_size": stored_size,
+            "compression": CompressionType.ZSTD.value if use_zstd else None,
+            "created_at": time.time(),
+            "expires_at": time.time() + ttl.total_seconds() if ttl else None,
+        }
+        previous = self._read_meta(meta_path)
+        fd, tmp_meta = tempfile.mkstemp(prefix=".meta-", dir=self.directory)
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(meta, f)
+            os.replace(tmp_meta, meta_path)
+        except BaseException:
+            Path(tmp_meta).unlink(missing_ok=True)
+            data_path.unlink(missing_ok=True)
+            raise
+
+        self._stored_bytes += stored_size
+        # The replaced data file; one lost to a concurrent put is left to sweep()
+        if previous is not None and previous["file"] != data_path.name:
+            (self.directory / previous["file"]).unlink(missing_ok=True)
+            self._stored_bytes -= previous["stored_size"]
+        return stored_size
+
+    def get(self, key: str) -> memoryview | None:
+        """Read a payload without deserializing it.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Read-only view (mmap-backed when stored raw), or None if absent/expired
+
+        """
+        meta_path = self._meta_path(key)
+        # A concurrent put can replace the data file between reading the
+        # sidecar and opening the file; the re-read sidecar names the new one.
+        for _ in range(2):
+            meta = self._read_meta(meta_path)
+            if meta is None or meta.get("key") != key:
+                return None
+
+            expires_at = meta.get("expires_at")
+            if expires_at is not None and time.time() > expires_at:
+                self._discard(meta_path, meta)
+                return None
+
+            try:
+                with open(self.directory / meta["file"], "rb") as f:
+                    payload = self._read_payload(f, meta)
+            except FileNotFoundError:
+                continue
+
+            if payload is None:
+                self._discard(meta_path, meta)
+                return None
+            try:
+                os.utime(meta_path)  # recency for LRU eviction
+            except FileNotFoundError:
+                pass
+            return payload
+        return None
+
+    def _read_payload(self, f: Any, meta: dict[str, Any]) -> memoryview | None:
+        """Read an open data file; None when it doesn't match its sidecar."""
+        if os.fstat(f.fileno()).st_size != meta["stored_size"]:
+            logger.warning(f"Blob size mismatch for {meta['key']}; discarding")
+            return None
+
+        if meta["size"] == 0:
+            return memoryview(b"")
+
+        if meta["compression"] is None:
+            # The mapping outlives the file descriptor
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+        buffer = bytearray(meta["size"])
+        with zstd.ZstdDecompressor().stream_reader(f, closefd=False) as reader:
+            view = memoryview(buffer)
+            filled = 0
+            while filled < len(buffer):
+                n = reader.readinto(view[filled : filled + BLOB_CHUNK_BYTES])
+                if n == 0:
+                    break
+                filled += n
+        if filled != len(buffer):
+            logger.warning(f"Truncated blob for {meta['key']}; discarding")
+            return None
+        return memoryview(buffer).toreadonly()
+
+    def _discard(self, meta_path: Path, meta: dict[str, Any]) -> int:
+        """Remove the data file ``meta`` names, and its sidecar if not since replaced.
+
+        Returns:
+            Bytes freed
+
+        """
+        current = self._read_meta(meta_path)
+        if current is not None and current["file"] == meta["file"]:
+            meta_path.unlink(missing_ok=True)
+        data_path = self.directory / meta["file"]
+        try:
+            freed = data_path.stat().st_size
+            data_path.unlink()
+        except FileNotFoundError:
+            return 0
+        self._stored_bytes -= freed
+        return freed
+
+    def delete(self, key: str) -> bool:
+        """Remove a payload and its sidecar."""
+        meta_path = self._meta_path(key)
+        meta = self._read_meta(meta_path)
+        existed = meta_path.exists()
+        meta_path.unlink(missing_ok=True)
+        if meta is not None:
+            (self.directory / meta["file"]).unlink(missing_ok=True)
+            self._stored_bytes -= meta["stored_size"]
+        return existed
+
+    def keys(self) -> Iterator[str]:
+        """Iterate the keys of stored payloads (expired ones included)."""
+        for meta_path in self.directory.glob("*.json"):
+            meta = self._read_meta(meta_path)
+            if meta is not None:
+                yield meta["key"]
+
+    def sweep_due(self) -> bool:
+        """Whether ``BLOB_SWEEP_INTERVAL`` has passed since the last sweep."""
+        return time.monotonic() - self._last_sweep > BLOB_SWEEP_INTERVAL.total_seconds()
+
+    def sweep(self, size_limit: int | None = None) -> int:
+        """Drop expired blobs and orphaned files, then evict down to ``size_limit``.
+
+        Eviction is least-recently-used, by sidecar mtime (``get`` touches it).
+
+        Args:
+            size_limit: Byte budget for stored payloads (None = no limit)
+
+        Returns:
+            Bytes freed
+
+        """
+        self._last_sweep = time.monotonic()
+        now = time.time()
+        freed = 0
+        referenced: set[str] = set()
+        live: list[tuple[float, int, Path, dict[str, Any]]] = []
+
+        for meta_path in self.directory.glob("*.json"):
+            meta = self._read_meta(meta_path)
+            if meta is None:
+                continue
+            expires_at = meta.get("expires_at")
+            if expires_at is not None and now > expires_at:
+                freed += self._discard(meta_path, meta)
+                continue
+            try:
+                accessed = meta_path.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            referenced.add(meta["file"])
+            live.append((accessed, meta["stored_size"], meta_path, meta))
+
+        # Files no sidecar names: a put that lost a race, a crashed write, or an
+        # old-format blob. Young ones may still be mid-write.
+        for path in self.directory.iterdir():
+            if path.suffix == ".json" or path.name in referenced:
+                continue
+            try:
+                stat = path.stat()
+                if now - stat.st_mtime > ORPHAN_GRACE_SECONDS:
+                    path.unlink()
+                    freed += stat.st_size
+            except FileNotFoundError:
+                continue
+
+        total = sum(stored_size for _, stored_size, _, _ in live)
+        if size_limit is not None:
+            for _, stored_size, meta_path, meta in sorted(live, key=lambda entry: entry[0]):
+                if total <= size_limit:
+                    break
+                freed += self._discard(meta_path, meta)
+                total -= stored_size
+        # Resync the running total with what the scan found
+        self._stored_bytes = total
+
+        if freed:
+            logger.debug(f"Blob sweep freed {freed / 1024**2:.1f}MB in {self.directory}")
+        return freed
+
+    def clear(self) -> None:
+        """Remove every payload."""
+        shutil.rmtree(self.directory, ignore_errors=True)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def stats(self) -> dict[str, int]:
+        """Count and on-disk size of stored payloads."""
+        count = 0
+        size = 0
+        for data_path in self.directory.glob("*.bin"):
+            count += 1
+            size += data_path.stat().st_size
+        return {"count": count, "size": size}
+
+
+__all__ = [
+    "BLOB_CHUNK_BYTES",
+    "BLOB_EVICTION_TARGET",
+    "BLOB_SWEEP_INTERVAL",
+    "BlobStore",
+    "is_bytes_like",
+]
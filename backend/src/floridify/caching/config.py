@@ -4,6 +4,7 @@ Single source of truth for all caching configuration.
 All configuration uses frozen Pydantic models for immutability.
 """
 
+import os
 from datetime import timedelta
 
 from pydantic import BaseModel, ConfigDict
@@ -22,15 +23,29 @@ class DeltaConfig(BaseModel):
     snapshot_interval: int = 10  # Full snapshot every N versions
     max_chain_length: int = 50  # Safety limit on delta chain traversal
     enabled: bool = True
+    # Versions fetched per chain query (one page covers a full snapshot interval)
+    chain_page_size: int = 11
+    # Reconstructed versions kept in memory, keyed by (resource_id, version)
+    reconstruction_cache_size: int = 256
 
 
 DELTA_CONFIG = DeltaConfig()
 
+_MB = 1024 * 1024
+
+# Byte budget shared by all namespaces' L1 caches, on top of each namespace's own budget
+GLOBAL_MEMORY_BUDGET_BYTES = int(os.getenv("FLORIDIFY_CACHE_MEMORY_BUDGET_MB", "2048")) * _MB
+
+# How long a validated versioned cache hit is trusted without re-checking MongoDB
+# (unbounded while the change-stream listener is running)
+CACHE_VALIDATION_TTL_SECONDS = float(os.getenv("FLORIDIFY_CACHE_VALIDATION_TTL", "30"))
+
 
 class NamespaceCacheConfig(BaseModel):
     """Immutable configuration for a cache namespace.
 
-    Defines memory limits, TTLs, and compression settings for each namespace.
+    Defines memory limits (entry count and estimated bytes), TTLs, and
+    compression settings for each namespace.
     Frozen Pydantic model ensures configuration cannot be mutated after creation.
     """
 
@@ -38,9 +53,12 @@ class NamespaceCacheConfig(BaseModel):
 
     namespace: CacheNamespace
     memory_limit: int  # Maximum number of entries in L1 (memory) cache
+    memory_budget_bytes: int | None = None  # Maximum estimated L1 bytes (None = unbounded)
     memory_ttl: timedelta  # Time-to-live for L1 cache entries
     disk_ttl: timedelta | None  # Time-to-live for L2 (disk) cache entries
     compression: CompressionType | None = None  # Optional compression algorithm
+    # Serve L1 entries this long past memory_ttl while a loader refreshes them
+    stale_ttl: timedelta | None = None
 
 
 # All 13 namespace configurations - complete coverage, no partial mappings
@@ -48,38 +66,46 @@ DEFAULT_CONFIGS: dict[CacheNamespace, NamespaceCacheConfig] = {
     CacheNamespace.DEFAULT: NamespaceCacheConfig(
         namespace=CacheNamespace.DEFAULT,
         memory_limit=200,
+        memory_budget_bytes=64 * _MB,
         memory_ttl=timedelta(hours=6),
         disk_ttl=timedelta(days=1),
     ),
     CacheNamespace.DICTIONARY: NamespaceCacheConfig(
         namespace=CacheNamespace.DICTIONARY,
         memory_limit=500,
+        memory_budget_bytes=128 * _MB,
         memory_ttl=timedelta(hours=24),
         disk_ttl=timedelta(days=7),
     ),
     CacheNamespace.CORPUS: NamespaceCacheConfig(
         namespace=CacheNamespace.CORPUS,
         memory_limit=100,
+        memory_budget_bytes=1024 * _MB,
         memory_ttl=timedelta(days=30),
         disk_ttl=timedelta(days=90),
         compression=CompressionType.ZSTD,
+        stale_ttl=timedelta(days=1),
     ),
     CacheNamespace.SEMANTIC: NamespaceCacheConfig(
         namespace=CacheNamespace.SEMANTIC,
         memory_limit=5,
+        memory_budget_bytes=1024 * _MB,
         memory_ttl=timedelta(days=7),
         disk_ttl=timedelta(days=30),
         compression=CompressionType.ZSTD,
+        stale_ttl=timedelta(days=1),
     ),
     CacheNamespace.SEARCH: NamespaceCacheConfig(
         namespace=CacheNamespace.SEARCH,
         memory_limit=300,
+        memory_budget_bytes=128 * _MB,
         memory_ttl=timedelta(hours=1),
         disk_ttl=timedelta(hours=6),
     ),
     CacheNamespace.TRIE: NamespaceCacheConfig(
         namespace=CacheNamespace.TRIE,
         memory_limit=50,
+        memory_budget_bytes=256 * _MB,
         memory_ttl=timedelta(days=7),
         disk_ttl=timedelta(days=30),
         compression=CompressionType.LZ4,
@@ -87,6 +113,7 @@ DEFAULT_CONFIGS: dict[CacheNamespace, NamespaceCacheConfig] = {
     CacheNamespace.LITERATURE: NamespaceCacheConfig(
         namespace=CacheNamespace.LITERATURE,
         memory_limit=50,
+        memory_budget_bytes=256 * _MB,
         memory_ttl=timedelta(days=30),
         disk_ttl=timedelta(days=90),
         compression=CompressionType.GZIP,
@@ -94,6 +121,7 @@ DEFAULT_CONFIGS: dict[CacheNamespace, NamespaceCacheConfig] = {
     CacheNamespace.SCRAPING: NamespaceCacheConfig(
         namespace=CacheNamespace.SCRAPING,
         memory_limit=100,
+        memory_budget_bytes=64 * _MB,
         memory_ttl=timedelta(hours=1),
         disk_ttl=timedelta(hours=24),
         compression=CompressionType.ZSTD,
@@ -101,6 +129,7 @@ DEFAULT_CONFIGS: dict[CacheNamespace, NamespaceCacheConfig] = {
     CacheNamespace.LANGUAGE: NamespaceCacheConfig(
         namespace=CacheNamespace.LANGUAGE,
         memory_limit=100,
+        memory_budget_bytes=512 * _MB,
         memory_ttl=timedelta(days=7),
         disk_ttl=timedelta(days=30),
         compression=CompressionType.ZSTD,
@@ -108,6 +137,7 @@ DEFAULT_CONFIGS: dict[CacheNamespace, NamespaceCacheConfig] = {
     CacheNamespace.OPENAI: NamespaceCacheConfig(
         namespace=CacheNamespace.OPENAI,
         memory_limit=200,
+        memory_budget_bytes=64 * _MB,
         memory_ttl=timedelta(hours=24),
         disk_ttl=timedelta(days=7),
         compression=CompressionType.ZSTD,
@@ -115,24 +145,28 @@ DEFAULT_CONFIGS: dict[CacheNamespace, NamespaceCacheConfig] = {
     CacheNamespace.WOTD: NamespaceCacheConfig(
         namespace=CacheNamespace.WOTD,
         memory_limit=50,
+        memory_budget_bytes=16 * _MB,
         memory_ttl=timedelta(days=1),
         disk_ttl=timedelta(days=7),
     ),
     CacheNamespace.API: NamespaceCacheConfig(
         namespace=CacheNamespace.API,
         memory_limit=100,
+        memory_budget_bytes=64 * _MB,
         memory_ttl=timedelta(hours=1),
         disk_ttl=timedelta(hours=12),
     ),
     CacheNamespace.LEXICON: NamespaceCacheConfig(
         namespace=CacheNamespace.LEXICON,
         memory_limit=100,
+        memory_budget_bytes=128 * _MB,
         memory_ttl=timedelta(days=7),
         disk_ttl=timedelta(days=30),
     ),
     CacheNamespace.WORDLIST: NamespaceCacheConfig(
         namespace=CacheNamespace.WORDLIST,
         memory_limit=100,
+        memory_budget_bytes=64 * _MB,
         memory_ttl=timedelta(hours=1),
         disk_ttl=timedelta(hours=12),
     ),
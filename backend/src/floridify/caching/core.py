@@ -11,9 +11,11 @@ from typing import Any, Generic, TypeVar
 
 from ..search.config import INLINE_CONTENT_THRESHOLD_BYTES
 from ..utils.logging import get_logger
+from ..utils.metrics import CACHE_GET_SECONDS
+from .blob import is_bytes_like
 from .compression import compress_data, decompress_data
-from .config import DEFAULT_CONFIGS
-from .filesystem import FilesystemBackend
+from .config import DEFAULT_CONFIGS, GLOBAL_MEMORY_BUDGET_BYTES
+from .filesystem import FilesystemBackend, safe_pickle_loads
 from .keys import generate_resource_key
 from .models import (
     BaseVersionedData,
@@ -24,21 +26,70 @@ from .models import (
     StorageType,
     VersionConfig,
 )
-from .serialize import CacheStats, estimate_binary_size, serialize_content
+from .serialize import (
+    CacheStats,
+    estimate_binary_size,
+    estimate_memory_size,
+    pack_binary_payload,
+    serialize_content,
+    unpack_binary_payload,
+)
 
 logger = get_logger(__name__)
 
 DEFAULT_CLEANUP_INTERVAL_SECONDS = 300.0
 
+# Stands in for a binary_data dict in L2 records whose payloads live in blob files
+_BLOB_REFS = "__l2_blobs__"
+
 # Type variable for backend
 T = TypeVar("T", bound=FilesystemBackend)
 
 
+class MemoryCache(OrderedDict[str, dict[str, Any]]):
+    """OrderedDict of L1 entries that keeps a running total of their ``size``.
+
+    Every removal path (``del``, ``pop``, ``popitem``, ``clear``) updates
+    ``nbytes``, so callers that manipulate the dict directly stay accounted.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.nbytes = 0
+
+    def __setitem__(self, key: str, entry: dict[str, Any]) -> None:
+        if key in self:
+            self.nbytes -= super().__getitem__(key).get("size", 0)
+        super().__setitem__(key, entry)
+        self.nbytes += entry.get("size", 0)
+
+    def __delitem__(self, key: str) -> None:
+        self.nbytes -= super().__getitem__(key).get("size", 0)
+        super().__delitem__(key)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self:
+            return super().pop(key, *default)
+        entry = super().pop(key)
+        self.nbytes -= entry.get("size", 0)
+        return entry
+
+    def popitem(self, last: bool = True) -> tuple[str, dict[str, Any]]:
+        key, entry = super().popitem(last=last)
+        self.nbytes -= entry.get("size", 0)
+        return key, entry
+
+    def clear(self) -> None:
+        super().clear()
+        self.nbytes = 0
+
+
 class NamespaceConfig:
     """Configuration for a cache namespace.
 
-    Uses OrderedDict for LRU cache with O(1) move_to_end operations.
-    Oldest items are at the front, newest at the back.
+    L1 entries live in a ``MemoryCache`` (OrderedDict with byte accounting):
+    oldest items are at the front, newest at the back, and eviction picks the
+    lowest GDSF priority with ties going to the least recently used entry.
     """
 
     def __init__(
@@ -48,15 +99,21 @@ class NamespaceConfig:
         memory_ttl: timedelta | None = None,
         disk_ttl: timedelta | None = None,
         compression: CompressionType | None = None,
+        memory_budget_bytes: int | None = None,
+        stale_ttl: timedelta | None = None,
     ):
         self.name = name
         self.memory_limit = memory_limit
+        self.memory_budget_bytes = memory_budget_bytes
         self.memory_ttl = memory_ttl
+        self.stale_ttl = stale_ttl
         self.disk_ttl = disk_ttl
         self.compression = compression
-        # OrderedDict for O(1) LRU operations via move_to_end()
-        self.memory_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        # OrderedDict for O(1) recency updates via move_to_end()
+        self.memory_cache = MemoryCache()
         self.lock = asyncio.Lock()
+        # Single-flight: key -> (L2/loader task concurrent misses await, has loader)
+        self.inflight: dict[str, tuple[asyncio.Task[Any], bool]] = {}
         # Immutable cache stats for functional updates
         self.stats = CacheStats()
 
@@ -64,21 +121,35 @@ class NamespaceConfig:
 class GlobalCacheManager(Generic[T]):  # noqa: UP046
     """Two-tier cache: L1 memory + L2 filesystem.
 
-    Optimized for minimal serialization overhead.
+    Optimized for minimal serialization overhead. L1 is bounded per namespace
+    by entry count and estimated bytes, and across namespaces by a global byte
+    budget. Eviction uses GreedyDual-Size-Frequency: each entry's priority is
+    ``clock + hits / size``, and the clock advances to the priority of each
+    evicted entry, so small hot entries outlive large cold ones while stale
+    entries age out.
     """
 
-    def __init__(self, l2_backend: T):
+    def __init__(self, l2_backend: T, memory_budget_bytes: int | None = None):
         """Initialize with filesystem backend.
 
         Args:
             l2_backend: Filesystem backend for L2 storage
+            memory_budget_bytes: Global L1 byte budget across namespaces
+                (default: GLOBAL_MEMORY_BUDGET_BYTES)
 
         """
         self.namespaces: dict[CacheNamespace, NamespaceConfig] = {}
         self.l2_backend = l2_backend
+        self.memory_budget_bytes = memory_budget_bytes or GLOBAL_MEMORY_BUDGET_BYTES
+        self._clock = 0.0  # GDSF inflation value
         self._cleanup_task: asyncio.Task[None] | None = None
         self._init_default_namespaces()
 
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated bytes held by all namespaces' L1 caches."""
+        return sum(ns.memory_cache.nbytes for ns in self.namespaces.values())
+
     @staticmethod
     def _make_backend_key(namespace: CacheNamespace, key: str) -> str:
         """Construct backend cache key from namespace and key.
@@ -95,35 +166,64 @@ class GlobalCacheManager(Generic[T]):  # noqa: UP046
             return f"{namespace}:{key}"
         return f"{namespace.value}:{key}"
 
-    def _evict_lru(self, ns: NamespaceConfig, count: int = 1) -> int:
-        """Evict least recently used items from namespace.
-
-        Uses OrderedDict.popitem(last=False) for O(1) eviction of oldest items.
-
-        Args:
-            ns: Namespace configuration
-            count: Number of items to evict (default: 1, None = evict until under limit)
+    def _priority(self, entry: dict[str, Any]) -> float:
+        """GDSF priority of an L1 entry (uniform miss cost)."""
+        return self._clock + entry["hits"] / max(entry["size"], 1)
 
-        Returns:
-            Number of items evicted
+    @staticmethod
+    def _victim(ns: NamespaceConfig) -> tuple[str, dict[str, Any]]:
+        """Lowest-priority entry of a non-empty namespace (earliest wins ties, i.e. LRU)."""
+        return min(ns.memory_cache.items(), key=lambda item: item[1]["priority"])
+
+    def _evict_one(self, ns: NamespaceConfig) -> None:
+        """Evict the lowest-priority entry from a namespace and advance the clock."""
+        key, entry = self._victim(ns)
+        del ns.memory_cache[key]
+        self._clock = max(self._clock, entry["priority"])
+        ns.stats = ns.stats.increment_evictions()
+
+    def _store_in_memory(self, ns: NamespaceConfig, key: str, data: Any) -> None:
+        """Insert into L1, evicting until the entry fits every limit.
+
+        Must be called with ``ns.lock`` held. Evicting from other namespaces for
+        the global budget is safe without their locks: L1 bookkeeping never
+        awaits, so no other coroutine can be mid-update on them.
         """
+        size = estimate_memory_size(data)
+        ns.memory_cache.pop(key, None)
+
+        budget = ns.memory_budget_bytes
+        if (budget and size > budget) or size > self.memory_budget_bytes:
+            # Would flush the namespace for one entry; serve it from L2 instead
+            ns.stats = ns.stats.increment_rejections()
+            logger.debug(f"L1 rejected {ns.name.value}:{key} ({size / 1024**2:.1f}MB over budget)")
+            return
+
         evictions = 0
-        if count is None:
-            # Evict until under limit
-            while len(ns.memory_cache) >= ns.memory_limit:
-                # popitem(last=False) removes and returns oldest (first) item in O(1)
-                ns.memory_cache.popitem(last=False)
-                ns.stats = ns.stats.increment_evictions()
-                evictions += 1
-        else:
-            # Evict exact count
-            for _ in range(count):
-                if ns.memory_cache:
-                    # popitem(last=False) removes and returns oldest (first) item in O(1)
-                    ns.memory_cache.popitem(last=False)
-                    ns.stats = ns.stats.increment_evictions()
-                    evictions += 1
-        return evictions
+        while ns.memory_cache and (
+            len(ns.memory_cache) >= ns.memory_limit
+            or (budget and ns.memory_cache.nbytes + size > budget)
+        ):
+            self._evict_one(ns)
+            evictions += 1
+
+        while self.memory_bytes + size > self.memory_budget_bytes:
+            candidates = [other for other in self.namespaces.values() if other.memory_cache]
+            self._evict_one(min(candidates, key=lambda other: self._victim(other)[1]["priority"]))
+            evictions += 1
+
+        if evictions:
+            logger.debug(f"L1 evicted {evictions} items for {ns.name.value}:{key}")
+
+        entry = {"data": data, "timestamp": time.time(), "size": size, "hits": 1}
+        entry["priority"] = self._priority(entry)
+        ns.memory_cache[key] = entry
+
+    def _touch(self, ns: NamespaceConfig, key: str, entry: dict[str, Any]) -> None:
+        """Record an L1 hit: bump frequency, refresh priority and recency."""
+        entry["hits"] += 1
+        entry["priority"] = self._priority(entry)
+        ns.memory_cache.move_to_end(key)
 
     async def initialize(self) -> None:
         """Initialize the cache manager."""
@@ -143,6 +243,8 @@ class GlobalCacheManager(Generic[T]):  # noqa: UP046
                 memory_ttl=frozen_config.memory_ttl,
                 disk_ttl=frozen_config.disk_ttl,
                 compression=frozen_config.compression,
+                memory_budget_bytes=frozen_config.memory_budget_bytes,
+                stale_ttl=frozen_config.stale_ttl,
             )
             self.namespaces[namespace] = ns_config
 
@@ -155,6 +257,11 @@ class GlobalCacheManager(Generic[T]):  # noqa: UP046
     ) -> Any | None:
         """Two-tier get with optional loader.
 
+        Concurrent misses on the same key are coalesced into a single L2 read /
+        loader call. In namespaces with ``stale_ttl``, an entry that expired
+        less than ``stale_ttl`` ago is returned immediately while a background
+        load refreshes it (only when a loader is given).
+
         Args:
             namespace: Cache namespace
             key: Cache key
@@ -183,52 +290,116 @@ class GlobalCacheManager(Generic[T]):  # noqa: UP046
 
         # L1: Memory cache
         async with ns.lock:
-            if key in ns.memory_cache:
-                entry = ns.memory_cache[key]
-
-                # Check TTL
-                if ns.memory_ttl:
-                    age = time.time() - entry["timestamp"]
-                    if age > ns.memory_ttl.total_seconds():
-                        del ns.memory_cache[key]
-                        ns.stats = ns.stats.increment_evictions()
-                        logger.debug(f"L1 cache expired: {namespace.value}:{key} (age={age:.2f}s)")
-                    else:
-                        # Move to end for LRU using OrderedDict.move_to_end() - O(1)
-                        ns.memory_cache.move_to_end(key)
-                        ns.stats = ns.stats.increment_hits()
-                        elapsed = (time.perf_counter() - start_time) * 1000
-                        logger.debug(f"L1 cache HIT: {namespace.value}:{key} ({elapsed:.2f}ms)")
-                        return entry["data"]
-                else:
-                    # Move to end for LRU using OrderedDict.move_to_end() - O(1)
-                    ns.memory_cache.move_to_end(key)
+            entry = ns.memory_cache.get(key)
+            if entry is not None:
+                age = time.time() - entry["timestamp"]
+                ttl = ns.memory_ttl.total_seconds() if ns.memory_ttl else None
+                if ttl is None or age <= ttl:
+                    self._touch(ns, key, entry)
                     ns.stats = ns.stats.increment_hits()
-                    elapsed = (time.perf_counter() - start_time) * 1000
-                    logger.debug(f"L1 cache HIT: {namespace.value}:{key} ({elapsed:.2f}ms)")
+                    elapsed = time.perf_counter() - start_time
+                    CACHE_GET_SECONDS.observe(elapsed, namespace.value, "l1_hit")
+                    logger.debug(f"L1 cache HIT: {namespace.value}:{key} ({elapsed * 1000:.2f}ms)")
+                    return entry["data"]
+
+                stale_window = ns.stale_ttl.total_seconds() if ns.stale_ttl else 0.0
+                if loader and age <= ttl + stale_window:
+                    # Stale-while-revalidate: serve the expired entry, refresh behind it
+                    self._touch(ns, key, entry)
+                    ns.stats = ns.stats.increment_stale_hits()
+                    self._start_load(ns, namespace, key, loader, refresh=True)
+                    CACHE_GET_SECONDS.observe(
+                        time.perf_counter() - start_time, namespace.value, "l1_stale"
+                    )
+                    logger.debug(f"L1 cache STALE: {namespace.value}:{key} (age={age:.2f}s)")
                     return entry["data"]
 
+                del ns.memory_cache[key]
+                ns.stats = ns.stats.increment_evictions()
+                logger.debug(f"L1 cache expired: {namespace.value}:{key} (age={age:.2f}s)")
+
+        # L2 + loader: concurrent misses on a key share one in-flight load
+        task, joined = self._start_load(ns, namespace, key, loader)
+        if joined:
+            ns.stats = ns.stats.increment_coalesced()
+            logger.debug(f"Cache COALESCED: {namespace.value}:{key}")
+        # Shield so a cancelled caller doesn't abort the load other callers are awaiting
+        return await asyncio.shield(task)
+
+    def _start_load(
+        self,
+        ns: NamespaceConfig,
+        namespace: CacheNamespace,
+        key: str,
+        loader: Callable[[], Any] | None,
+        refresh: bool = False,
+    ) -> tuple[asyncio.Task[Any], bool]:
+        """Return the in-flight load for a key, starting one if none is running.
+
+        Args:
+            ns: Namespace state
+            namespace: Cache namespace
+            key: Cache key
+            loader: Optional loader to call when L2 misses
+            refresh: Call the loader directly, skipping L2 (revalidating a stale entry)
+
+        Returns:
+            Tuple of (load task, whether an existing load was joined)
+        """
+        current = ns.inflight.get(key)
+        if current is not None:
+            task, has_loader = current
+            # A plain lookup can't stand in for a caller that has a loader
+            if not task.done() and (has_loader or loader is None):
+                return task, True
+
+        task = asyncio.create_task(
+            self._load(ns, namespace, key, loader, refresh),
+            name=f"cache-load:{namespace.value}:{key}",
+        )
+        ns.inflight[key] = (task, loader is not None)
+
+        def _release(done: asyncio.Task[Any]) -> None:
+            if key in ns.inflight and ns.inflight[key][0] is done:
+                del ns.inflight[key]
+
+        task.add_done_callback(_release)
+        return task, False
+
+    async def _load(
+        self,
+        ns: NamespaceConfig,
+        namespace: CacheNamespace,
+        key: str,
+        loader: Callable[[], Any] | None,
+        refresh: bool = False,
+    ) -> Any | None:
+        """Resolve an L1 miss from L2, falling back to the loader.
+
+        A refresh skips L2: its copy was written alongside the stale L1 entry.
+        """
+        start_time = time.perf_counter()
+
         # L2: Filesystem cache
         backend_key = self._make_backend_key(namespace, key)
         try:
-            data = await self.l2_backend.get(backend_key)
+            data = None if refresh else await self._get_l2(ns, backend_key)
 
             if data is not None:
-                # Decompress if needed
-                if ns.compression and isinstance(data, bytes):
-                    data = await self._decompress_data(data, ns.compression)
-
                 # Promote to L1
                 await self._promote_to_memory(ns, key, data)
-                elapsed = (time.perf_counter() - start_time) * 1000
-                logger.debug(f"L2 cache HIT: {namespace.value}:{key} ({elapsed:.2f}ms)")
+                elapsed = time.perf_counter() - start_time
+                CACHE_GET_SECONDS.observe(elapsed, namespace.value, "l2_hit")
+                logger.debug(f"L2 cache HIT: {namespace.value}:{key} ({elapsed * 1000:.2f}ms)")
                 return data
         except Exception as e:
             logger.error(f"L2 cache error for {namespace.value}:{key}: {e}", exc_info=True)
 
-        ns.stats = ns.stats.increment_misses()
-        elapsed = (time.perf_counter() - start_time) * 1000
-        logger.debug(f"Cache MISS: {namespace.value}:{key} ({elapsed:.2f}ms)")
+        if not refresh:
+            ns.stats = ns.stats.increment_misses()
+            elapsed = time.perf_counter() - start_time
+            CACHE_GET_SECONDS.observe(elapsed, namespace.value, "miss")
+            logger.debug(f"Cache MISS: {namespace.value}:{key} ({elapsed * 1000:.2f}ms)")
 
         # Cache miss - use loader
         if loader:
@@ -260,24 +431,14 @@ class GlobalCacheManager(Generic[T]):  # noqa: UP046
 
         # L1: Memory cache
         async with ns.lock:
-            # LRU eviction
-            evictions = self._evict_lru(ns, count=None)
-            if evictions > 0:
-                logger.debug(f"L1 evicted {evictions} items from {namespace.value}")
-
-            ns.memory_cache[key] = {"data": value, "timestamp": time.time()}
+            self._store_in_memory(ns, key, value)
 
         # L2: Filesystem with compression
         backend_key = self._make_backend_key(namespace, key)
         ttl = ttl_override or ns.disk_ttl
 
         try:
-            # Compress if configured
-            store_value = value
-            if ns.compression:
-                store_value = await self._compress_data(value, ns.compression)
-
-            await self.l2_backend.set(backend_key, store_value, ttl)
+            await self._set_l2(ns, backend_key, value, ttl)
 
             elapsed = (time.perf_counter() - start_time) * 1000
             logger.debug(
@@ -287,6 +448,71 @@ class GlobalCacheManager(Generic[T]):  # noqa: UP046
         except Exception as e:
             logger.error(f"Failed to set cache {namespace.value}:{key}: {e}", exc_info=True)
 
+    @staticmethod
+    def _blob_key(backend_key: str, name: str) -> str:
+        """L2 key of one binary_data payload of a cached record."""
+        return f"{backend_key}#binary_data/{name}"
+
+    async def _set_l2(
+        self, ns: NamespaceConfig, backend_key: str, value: Any, ttl: timedelta | None
+    ) -> None:
+        """Write a value to L2, keeping raw binary payloads out of pickle.
+
+        Bytes values, and the bytes values of a record's ``binary_data`` dict
+        (FAISS indices, embeddings, ffuzzy blobs), go to the backend's blob
+        files; everything else is compressed (if configured) and pickled.
+        """
+        if is_bytes_like(value):
+            await self.l2_backend.set_bytes(backend_key, value, ttl, ns.compression)
+            return
+
+        binary_data = value.get("binary_data") if isinstance(value, dict) else None
+        if isinstance(binary_data, dict) and binary_data:
+            if all(is_bytes_like(payload) for payload in binary_data.values()):
+                for name, payload in binary_data.items():
+                    blob_key = self._blob_key(backend_key, name)
+                    await self.l2_backend.set_bytes(blob_key, payload, ttl, ns.compression)
+                value = {**value, "binary_data": {_BLOB_REFS: list(binary_data)}}
+
+        store_value = value
+        if ns.compression:
+            store_value = await self._compress_data(value, ns.compression)
+        await self.l2_backend.set(backend_key, store_value, ttl)
+
+    async def _get_l2_record(self, ns: NamespaceConfig, backend_key: str) -> Any | None:
+        """Read an L2 value with blob references left unresolved."""
+        data = await self.l2_backend.get(backend_key)
+        if data is None:
+            return await self.l2_backend.get_bytes(backend_key)
+
+        # Decompress if needed
+        if ns.compression and isinstance(data, bytes):
+            data = await self._decompress_data(data, ns.compression)
+        return data
+
+    @staticmethod
+    def _blob_names(data: Any) -> list[str]:
+        binary_data = data.get("binary_data") if isinstance(data, dict) else None
+        if isinstance(binary_data, dict):
+            return list(binary_data.get(_BLOB_REFS, []))
+        return []
+
+    async def _get_l2(self, ns: NamespaceConfig, backend_key: str) -> Any | None:
+        """Read an L2 value, mapping ``binary_data`` payloads back in as memoryviews."""
+        data = await self._get_l2_record(ns, backend_key)
+        names = self._blob_names(data)
+        if not names:
+            return data
+
+        payloads: dict[str, memoryview] = {}
+        for name in names:
+            payload = await self.l2_backend.get_bytes(self._blob_key(backend_key, name))
+            if payload is None:
+                # A payload expired or was evicted independently; treat as a miss
+                return None
+            payloads[name] = payload
+        return {**data, "binary_data": payloads}
+
     async def delete(self, namespace: CacheNamespace, key: str) -> bool:
         """Delete from both tiers."""
         ns = self.namespaces.get(namespace)
@@ -298,10 +524,24 @@ class GlobalCacheManager(Generic[T]):  # noqa: UP046
             if key in ns.memory_cache:
                 del ns.memory_cache[key]
 
-        # Remove from L2
+        # Remove from L2, including any binary_data payload files
         backend_key = self._make_backend_key(namespace, key)
+        try:
+            record = await self._get_l2_record(ns, backend_key)
+        except Exception:
+            record = None
+        for name in self._blob_names(record):
+            await self.l2_backend.delete(self._blob_key(backend_key, name))
         return await self.l2_backend.delete(backend_key)
 
+    async def evict_memory(self, namespace: CacheNamespace, key: str) -> bool:
+        """Drop an entry from L1 only, keeping the L2 copy."""
+        ns = self.namespaces.get(namespace)
+        if not ns:
+            return False
+        async with ns.lock:
+            return ns.memory_cache.pop(key, None) is not None
+
     async def clear_namespace(self, namespace: CacheNamespace) -> None:
         """Clear all entries in a namespace."""
         ns = self.namespaces.get(namespace)
@@ -313,7 +553,7 @@ class GlobalCacheManager(Generic[T]):  # noqa: UP046
             ns.memory_cache.clear()
 
         # Clear L2
-        pattern = f"{namespace.value}:*"
+        pattern = self._make_backend_key(namespace, "*")
         await self.l2_backend.clear_pattern(pattern)
 
     async def clear_all(self) -> None:
@@ -328,17 +568,9 @@ class GlobalCacheManager(Generic[T]):  # noqa: UP046
         await self.l2_backend.clear_all()
 
     async def _promote_to_memory(self, ns: NamespaceConfig, key: str, data: Any) -> None:
-        """Promote data from L2 to L1 with LRU eviction.
-
-        Uses OrderedDict.popitem(last=False) for O(1) eviction.
-        """
+        """Promote data from L2 to L1, evicting by GDSF priority if needed."""
         async with ns.lock:
-            # LRU eviction if needed - popitem(last=False) removes oldest in O(1)
-            while len(ns.memory_cache) >= ns.memory_limit:
-                ns.memory_cache.popitem(last=False)
-                ns.stats = ns.stats.increment_evictions()
-
-            ns.memory_cache[key] = {"data": data, "timestamp": time.time()}
+            self._store_in_memory(ns, key, data)
 
     async def _compress_data(self, data: Any, compression: CompressionType) -> bytes:
         """Compress data with specified algorithm."""
@@ -356,16 +588,32 @@ class GlobalCacheManager(Generic[T]):  # noqa: UP046
                 return {
                     "namespace": namespace.value,
                     "memory_count": len(ns.memory_cache),
+                    "memory_bytes": ns.memory_cache.nbytes,
+                    "memory_budget_bytes": ns.memory_budget_bytes,
                     "stats": ns.stats.model_dump(),
                 }
 
         # Aggregate stats using functional approach
-        total_stats = {"hits": 0, "misses": 0, "evictions": 0, "memory_count": 0}
+        total_stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "rejections": 0,
+            "coalesced": 0,
+            "stale_hits": 0,
+            "memory_count": 0,
+            "memory_bytes": 0,
+            "memory_budget_bytes": self.memory_budget_bytes,
+        }
         for ns in self.namespaces.values():
             total_stats["hits"] += ns.stats.hits
             total_stats["misses"] += ns.stats.misses
             total_stats["evictions"] += ns.stats.evictions
+            total_stats["rejections"] += ns.stats.rejections
+            total_stats["coalesced"] += ns.stats.coalesced
+            total_stats["stale_hits"] += ns.stats.stale_hits
             total_stats["memory_count"] += len(ns.memory_cache)
+            total_stats["memory_bytes"] += ns.memory_cache.nbytes
 
         return total_stats
 
@@ -382,7 +630,10 @@ class GlobalCacheManager(Generic[T]):  # noqa: UP046
             if ns.memory_ttl is None:
                 continue
 
+            # Entries inside the stale-while-revalidate window are still servable
             ttl_seconds = ns.memory_ttl.total_seconds()
+            if ns.stale_ttl:
+                ttl_seconds += ns.stale_ttl.total_seconds()
             expired_keys: list[str] = []
 
             async with ns.lock:
@@ -542,43 +793,54 @@ async def get_versioned_content(
         if isinstance(namespace, str):
             namespace = CacheNamespace(namespace)
 
-        # 1. Try L1/L2 cache first (works for both DATABASE and CACHE storage types)
+        storage_type = location.storage_type
+        if isinstance(storage_type, str):
+            storage_type = StorageType(storage_type)
+        gridfs_path = location.path if storage_type == StorageType.DATABASE else None
+
+        async def load_from_gridfs() -> Any:
+            # Lazy: heavyweight module
+            from .gridfs import gridfs_read
+
+            # Use the compression type recorded at write time.
+            # binary_payload path (container) has no compression;
+            # normal large content uses ZSTD, decompressed while streaming.
+            compression = location.compression
+            if isinstance(compression, str):
+                compression = CompressionType(compression)
+            raw = await gridfs_read(gridfs_path, compression)
+            if raw is None:
+                return None
+            # Binary payloads come back as views into the streamed buffer
+            unpacked = unpack_binary_payload(raw)
+            if unpacked is not None:
+                return unpacked
+            # Pickled content (and binary payloads written before the container format)
+            return safe_pickle_loads(raw)
+
+        # 1. L1/L2 cache, with GridFS as the loader for DATABASE storage so
+        #    concurrent readers of one resource share a single fetch
         if location.cache_key and namespace:
             cache = await get_global_cache()
             use_cache = True if not config else config.use_cache
             cached_content = await cache.get(
-                namespace=namespace, key=location.cache_key, use_cache=use_cache
+                namespace=namespace,
+                key=location.cache_key,
+                loader=load_from_gridfs if gridfs_path else None,
+                use_cache=use_cache,
             )
             if cached_content is not None:
                 if isinstance(cached_content, dict):
                     return cached_content
                 return dict(cached_content)
 
-        # 2. GridFS fallback for DATABASE storage
-        storage_type = location.storage_type
-        if isinstance(storage_type, str):
-            storage_type = StorageType(storage_type)
-
-        if storage_type == StorageType.DATABASE and location.path:
-            # Lazy: heavyweight module
-            from .gridfs import gridfs_get
-
-            raw = await gridfs_get(location.path)
-            if raw is not None:
-                # Use the compression type recorded at write time.
-                # binary_payload path (pickle-only) has no compression;
-                # normal large content uses ZSTD.
-                compression = location.compression
-                if isinstance(compression, str):
-                    compression = CompressionType(compression)
-                content = decompress_data(raw, compression)
-                # Promote to L1/L2 for future reads
-                if location.cache_key and namespace:
-                    cache = await get_global_cache()
-                    await cache.set(namespace, location.cache_key, content)
+        # 2. GridFS without a cache key to coalesce on
+        elif gridfs_path:
+            content = await load_from_gridfs()
+            if content is not None:
                 if isinstance(content, dict):
                     return content
-                return dict(content) if content is not None else None
+                return dict(content)
 
         # If we haven't returned yet, the data is unavailable
         logger.warning(
@@ -599,9 +861,10 @@ async def set_versioned_content(
 
     Three storage paths:
 
-    1. ``binary_payload`` provided  → pickle ``{**content, "binary_data": binary_payload}``
-       and upload to GridFS in a single shot. Used by models with opaque binary
-       blobs (FAISS indices, ffuzzy bytes) so the JSON path never sees them.
+    1. ``binary_payload`` provided  → lay out ``content`` plus the raw payloads
+       as a container (:func:`pack_binary_payload`) streamed to GridFS without
+       joining them. Used by models with opaque binary blobs (FAISS indices,
+       ffuzzy bytes) so neither JSON nor pickle ever sees them.
     2. Small content (<16KB)       → store inline in the MongoDB document.
     3. Large content (>=16KB)      → ZSTD compress and upload to GridFS.
 
@@ -609,15 +872,12 @@ async def set_versioned_content(
     dict (binary included for path 1) so subsequent reads in the same process
     skip the GridFS round trip.
     """
-    # Lazy: heavyweight module
-    import pickle
-
     # Lazy: heavyweight module
     from .gridfs import gridfs_put
 
     # ── Path 1: explicit binary payload ─────────────────────────────────
-    # Pickle metadata + binary together. Skip JSON entirely so multi-GB
-    # blobs never hit pydantic's encoder.
+    # Container of pickled metadata + raw payloads. Skip JSON entirely so
+    # multi-GB blobs never hit pydantic's encoder (or a pickle copy).
     if binary_payload is not None:
         if not isinstance(content, dict):
             raise TypeError("binary_payload requires content to be a dict (the metadata document)")
@@ -649,13 +909,11 @@ async def set_versioned_content(
         if isinstance(resource_type, str):
             resource_type = ResourceType(resource_type)
 
-        # Pickle directly — caller is responsible for any internal compression
-        # (e.g. SemanticIndex serializes embeddings with FAISS native I/O).
-        pickled = pickle.dumps(full_content, protocol=pickle.HIGHEST_PROTOCOL)
-
+        # Payloads are stored verbatim — caller is responsible for any internal
+        # compression (e.g. SemanticIndex serializes the index with FAISS native I/O).
         file_id = await gridfs_put(
             filename=f"{resource_type.value}:{versioned_data.resource_id}",
-            data=pickled,
+            data=pack_binary_payload(content, binary_payload),
             metadata={
                 "resource_type": resource_type.value,
                 "resource_id": versioned_data.resource_id,
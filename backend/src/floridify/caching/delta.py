@@ -1,7 +1,13 @@
 """Pure functions for delta-based version storage.
 
 Zero I/O, deterministic, testable in isolation.
-Uses DeepDiff for efficient change detection and bidirectional delta computation.
+
+Storage deltas (``compute_delta`` / ``apply_delta``) use a purpose-built
+structural patch for JSON-like dict/list content: unchanged subtrees cost
+nothing, lists are aligned by stable IDs (``id``/``_id``/``uuid``) or by
+value where possible, and unchanged runs are encoded as source ranges.
+Deltas written by the previous DeepDiff engine are still applied.
+DeepDiff remains in use for the human-readable diffs shown by the API.
 """
 
 from __future__ import annotations
@@ -10,6 +16,187 @@ from typing import Any
 
 from deepdiff import DeepDiff, Delta
 
+DELTA_FORMAT = "structural/1"
+
+# Keys that identify list elements across versions (first one present in every element wins)
+LIST_ID_KEYS = ("id", "_id", "uuid")
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+# Patch nodes (all JSON/BSON-safe lists):
+#   ["=", value]                     replace with value
+#   ["{", [[key, patch], ...], [removed keys]]
+#   ["[", [op, ...]]                 rebuild the list from ops:
+#       ["r", start, count]          copy source[start:start + count]
+#       ["p", index, patch]          source[index] with patch applied
+#       ["v", [values]]              literal values
+
+
+def _diff(src: Any, tgt: Any) -> list[Any] | None:
+    """Patch turning ``src`` into ``tgt``, or None if they are identical."""
+    if src is tgt:
+        return None
+    if type(src) is not type(tgt):
+        return ["=", tgt]
+    if isinstance(tgt, dict):
+        return _diff_dict(src, tgt)
+    if isinstance(tgt, list):
+        return _diff_list(src, tgt)
+    return None if src == tgt else ["=", tgt]
+
+
+def _diff_dict(src: dict[Any, Any], tgt: dict[Any, Any]) -> list[Any] | None:
+    changes = []
+    for key, value in tgt.items():
+        if key in src:
+            patch = _diff(src[key], value)
+            if patch is not None:
+                changes.append([key, patch])
+        else:
+            changes.append([key, ["=", value]])
+    removed = [key for key in src if key not in tgt]
+    if not changes and not removed:
+        return None
+    return ["{", changes, removed]
+
+
+def _list_key(src: list[Any], tgt: list[Any]) -> Any:
+    """Function mapping elements to a stable identity, or None for positional alignment."""
+    items = src + tgt
+    if all(type(item) in _SCALAR_TYPES for item in items):
+        return lambda item: (type(item), item)
+    if not all(type(item) is dict for item in items):
+        return None
+    for id_key in LIST_ID_KEYS:
+        if all(_unique_ids(side, id_key) for side in (src, tgt)):
+            return lambda item, id_key=id_key: item[id_key]
+    return None
+
+
+def _unique_ids(items: list[dict[Any, Any]], id_key: str) -> bool:
+    ids = [item.get(id_key) for item in items]
+    return all(i is not None and type(i) in _SCALAR_TYPES for i in ids) and len(set(ids)) == len(
+        ids
+    )
+
+
+class _ListOps:
+    """Accumulates list ops, merging adjacent source runs and literals."""
+
+    def __init__(self) -> None:
+        self.ops: list[list[Any]] = []
+        self.reused = False
+
+    def ref(self, index: int) -> None:
+        self.reused = True
+        last = self.ops[-1] if self.ops else None
+        if last is not None and last[0] == "r" and last[1] + last[2] == index:
+            last[2] += 1
+        else:
+            self.ops.append(["r", index, 1])
+
+    def patched(self, index: int, patch: list[Any]) -> None:
+        if patch[0] == "=":
+            self.literal(patch[1])
+            return
+        self.reused = True
+        self.ops.append(["p", index, patch])
+
+    def literal(self, value: Any) -> None:
+        last = self.ops[-1] if self.ops else None
+        if last is not None and last[0] == "v":
+            last[1].append(value)
+        else:
+            self.ops.append(["v", [value]])
+
+
+def _diff_list(src: list[Any], tgt: list[Any]) -> list[Any] | None:
+    if not src and not tgt:
+        return None
+    ops = _ListOps()
+    key = _list_key(src, tgt) if src and tgt else None
+
+    if key is not None:
+        positions: dict[Any, int] = {}
+        for index, item in enumerate(src):
+            positions.setdefault(key(item), index)
+        for item in tgt:
+            index = positions.get(key(item))
+            if index is None:
+                ops.literal(item)
+                continue
+            patch = _diff(src[index], item)
+            if patch is None:
+                ops.ref(index)
+            else:
+                ops.patched(index, patch)
+    else:
+        # Positional: keep the common prefix and suffix, align the middle by index
+        limit = min(len(src), len(tgt))
+        prefix = 0
+        while prefix < limit and _diff(src[prefix], tgt[prefix]) is None:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and _diff(src[-1 - suffix], tgt[-1 - suffix]) is None:
+            suffix += 1
+
+        for index in range(prefix):
+            ops.ref(index)
+        src_middle = len(src) - suffix
+        for offset, item in enumerate(tgt[prefix : len(tgt) - suffix]):
+            index = prefix + offset
+            if index < src_middle:
+                patch = _diff(src[index], item)
+                if patch is None:
+                    ops.ref(index)
+                else:
+                    ops.patched(index, patch)
+            else:
+                ops.literal(item)
+        for index in range(src_middle, len(src)):
+            ops.ref(index)
+
+    if len(src) == len(tgt) and ops.ops == [["r", 0, len(src)]]:
+        return None
+    if not ops.reused:
+        return ["=", tgt]
+    return ["[", ops.ops]
+
+
+def _clone(value: Any) -> Any:
+    """Copy dict/list containers (scalars are immutable and shared)."""
+    if isinstance(value, dict):
+        return {key: _clone(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone(item) for item in value]
+    return value
+
+
+def _patch(value: Any, patch: list[Any]) -> Any:
+    """Apply ``patch`` to ``value`` (a private clone, mutated in place)."""
+    tag = patch[0]
+    if tag == "=":
+        return _clone(patch[1])
+    if tag == "{":
+        for key, child in patch[1]:
+            value[key] = _patch(value.get(key), child)
+        for key in patch[2]:
+            value.pop(key, None)
+        return value
+    if tag == "[":
+        result: list[Any] = []
+        for op in patch[1]:
+            if op[0] == "r":
+                result.extend(value[op[1] : op[1] + op[2]])
+            elif op[0] == "p":
+                result.append(_patch(value[op[1]], op[2]))
+            elif op[0] == "v":
+                result.extend(_clone(item) for item in op[1])
+            else:
+                raise ValueError(f"Unknown list op {op[0]!r}")
+        return result
+    raise ValueError(f"Unknown patch node {tag!r}")
+
 
 def compute_delta(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
     """Compute a serializable delta from old to new content.
@@ -21,7 +208,8 @@ def compute_delta(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
         new: Current version content dict
 
     Returns:
-        Serializable delta dict (DeepDiff flat representation)
+        Serializable delta dict (``{"format": DELTA_FORMAT, "patch": ...}``),
+        or ``{}`` if the contents are identical
 
     Examples:
         >>> old = {"a": 1, "b": 2}
@@ -30,19 +218,20 @@ def compute_delta(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
         >>> apply_delta(new, delta) == old
         True
     """
-    diff = DeepDiff(new, old, verbose_level=2)
-    if not diff:
+    patch = _diff(new, old)
+    if patch is None:
         return {}
-    # Serialize to a portable dict format
-    return diff.to_dict()
+    return {"format": DELTA_FORMAT, "patch": patch}
 
 
 def apply_delta(snapshot: dict[str, Any], delta: dict[str, Any]) -> dict[str, Any]:
     """Reconstruct a previous version by applying a delta to a snapshot.
 
+    The snapshot is not modified, and the result shares no containers with it.
+
     Args:
         snapshot: The base snapshot content (newer version)
-        delta: Delta dict produced by compute_delta()
+        delta: Delta dict produced by compute_delta() (or the older DeepDiff engine)
 
     Returns:
         Reconstructed content of the older version
@@ -54,9 +243,11 @@ def apply_delta(snapshot: dict[str, Any], delta: dict[str, Any]) -> dict[str, An
         {'a': 1, 'b': 2}
     """
     if not delta:
-        return dict(snapshot)
+        return _clone(snapshot)
     try:
-        d = Delta(delta)
+        if delta.get("format") == DELTA_FORMAT:
+            return _patch(_clone(snapshot), delta["patch"])  # type: ignore[no-any-return]
+        d = Delta(delta)  # Stored before the structural engine
         return d + snapshot  # type: ignore[return-value]
     except Exception as e:
         raise ValueError(f"Failed to apply delta (keys: {list(delta.keys())[:5]}): {e}") from e
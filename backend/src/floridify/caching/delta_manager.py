@@ -1,11 +1,14 @@
 """Delta chain management for versioned data.
 
 Handles conversion of full snapshots to delta-compressed versions and
-reconstruction of full content from delta chains.
+reconstruction of full content from delta chains. Chains are resolved with
+paged range queries and reconstructed versions are kept in a bounded LRU.
 """
 
 from __future__ import annotations
 
+import copy
+from collections import OrderedDict
 from typing import Any
 
 from ..utils.logging import get_logger
@@ -76,32 +79,116 @@ async def convert_to_delta(
     )
 
 
-async def reconstruct_from_delta(
+class ReconstructionCache:
+    """Bounded LRU of reconstructed version content, keyed by (resource_id, version).
+
+    Versions are immutable once written, so an entry never goes stale; the
+    document id is stored alongside so a version string reused after a
+    resource is deleted and recreated does not hit. Entries are owned by the
+    cache: ``put`` and ``get`` copy, so callers may mutate what they receive.
+    """
+
+    def __init__(self, maxsize: int = DELTA_CONFIG.reconstruction_cache_size) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[str, str], tuple[Any, dict[str, Any]]] = OrderedDict()
+        self._keys_by_id: dict[Any, tuple[str, str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def peek(self, version: BaseVersionedData) -> dict[str, Any] | None:
+        """Cached content for ``version`` without copying (read-only use)."""
+        key = (version.resource_id, version.version_info.version)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != version.id:
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def peek_id(self, version_id: Any) -> dict[str, Any] | None:
+        """Cached content for the version document ``version_id`` (read-only use)."""
+        key = self._keys_by_id.get(version_id)
+        if key is None:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key][1]
+
+    def get(self, version: BaseVersionedData) -> dict[str, Any] | None:
+        """Cached content for ``version`` (a private copy), or None."""
+        content = self.peek(version)
+        if content is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return copy.deepcopy(content)
+
+    def put(self, version: BaseVersionedData, content: dict[str, Any]) -> None:
+        if self.maxsize <= 0:
+            return
+        key = (version.resource_id, version.version_info.version)
+        previous = self._entries.get(key)
+        if previous is not None:
+            self._keys_by_id.pop(previous[0], None)
+        self._entries[key] = (version.id, copy.deepcopy(content))
+        self._entries.move_to_end(key)
+        self._keys_by_id[version.id] = key
+        while len(self._entries) > self.maxsize:
+            _, (evicted_id, _) = self._entries.popitem(last=False)
+            self._keys_by_id.pop(evicted_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._keys_by_id.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_reconstruction_cache = ReconstructionCache()
+
+
+def get_reconstruction_cache() -> ReconstructionCache:
+    """Get the process-wide cache of reconstructed delta versions."""
+    return _reconstruction_cache
+
+
+async def _collect_chain(
     delta_version: BaseVersionedData,
     resource_type: ResourceType,
-    get_model_class: Any,
-) -> dict[str, Any] | None:
-    """Reconstruct full content for a delta-stored version.
+    model_class: Any,
+) -> tuple[list[BaseVersionedData], dict[str, Any]] | None:
+    """Walk from ``delta_version`` to the nearest reconstructable base.
 
-    Walks the delta_base_id chain until hitting a full snapshot,
-    then applies deltas in reverse order to reconstruct the target version.
-
-    Args:
-        delta_version: The version stored as a delta
-        resource_type: Type of resource
-        get_model_class: Callable that maps resource_type to model class
+    The base is either a full snapshot or a version already in the
+    reconstruction cache. Bases are always newer versions of the same
+    resource, so the chain is read in pages of the versions that follow the
+    current hop (``_id`` range on the resource's chain index) rather than one
+    ``get`` per hop; a base missing from its page falls back to a point read.
 
     Returns:
-        Reconstructed content dict, or None if chain is broken
+        ``(chain, base_content)`` with ``chain = [target, ..., last delta]``,
+        or None if the chain is broken or too long
     """
-    model_class = get_model_class(resource_type)
-
-    # Collect delta chain: walk from delta_version toward the nearest snapshot
-    chain: list[BaseVersionedData] = [delta_version]
+    chain: list[BaseVersionedData] = []
+    fetched: dict[Any, BaseVersionedData] = {}
     current = delta_version
     safety = DELTA_CONFIG.max_chain_length
 
-    while current.version_info.storage_mode == "delta" and safety > 0:
+    while True:
+        if current.version_info.storage_mode != "delta":
+            if current.content_inline is None:
+                logger.error(f"Snapshot base v{current.version_info.version} has no inline content")
+                return None
+            return chain, current.content_inline
+
+        if safety <= 0:
+            logger.error(
+                f"Delta chain exceeded max length ({DELTA_CONFIG.max_chain_length}) "
+                f"for {delta_version.resource_id}"
+            )
+            return None
+
         base_id = current.version_info.delta_base_id
         if base_id is None:
             logger.error(
@@ -109,40 +196,78 @@ async def reconstruct_from_delta(
             )
             return None
 
-        base_version = await model_class.get(base_id)
+        chain.append(current)
+        safety -= 1
+
+        # The base itself may already be reconstructed (e.g. paging newest to oldest)
+        cached = _reconstruction_cache.peek_id(base_id)
+        if cached is not None:
+            return chain, cached
+
+        if base_id not in fetched:
+            page = (
+                await model_class.find(
+                    {
+                        "resource_type": resource_type.value,
+                        "resource_id": delta_version.resource_id,
+                        "_id": {"$gt": current.id},
+                    }
+                )
+                .sort("+_id")
+                .limit(DELTA_CONFIG.chain_page_size)
+                .to_list()
+            )
+            fetched.update((doc.id, doc) for doc in page)
+
+        base_version = fetched.get(base_id) or await model_class.get(base_id)
         if base_version is None:
             logger.error(
                 f"Broken delta chain: base {base_id} not found for v{current.version_info.version}"
             )
             return None
 
-        chain.append(base_version)
         current = base_version
-        safety -= 1
 
-    if safety <= 0:
-        logger.error(
-            f"Delta chain exceeded max length ({DELTA_CONFIG.max_chain_length}) "
-            f"for {delta_version.resource_id}"
-        )
-        return None
 
-    # The last element in chain is the snapshot base
-    snapshot = chain[-1]
-    if snapshot.content_inline is None:
-        logger.error(f"Snapshot base v{snapshot.version_info.version} has no inline content")
+async def reconstruct_from_delta(
+    delta_version: BaseVersionedData,
+    resource_type: ResourceType,
+    get_model_class: Any,
+) -> dict[str, Any] | None:
+    """Reconstruct full content for a delta-stored version.
+
+    Resolves the delta_base_id chain up to the nearest full snapshot (or the
+    nearest version already reconstructed), then applies deltas in reverse
+    order to reconstruct the target version. Every version reconstructed along
+    the way is cached, so reading a neighbouring version replays at most the
+    deltas between the two.
+
+    Args:
+        delta_version: The version stored as a delta
+        resource_type: Type of resource
+        get_model_class: Callable that maps resource_type to model class
+
+    Returns:
+        Reconstructed content dict, or None if chain is broken
+    """
+    cached = _reconstruction_cache.get(delta_version)
+    if cached is not None:
+        return cached
+
+    model_class = get_model_class(resource_type)
+    collected = await _collect_chain(delta_version, resource_type, model_class)
+    if collected is None:
         return None
 
-    # Apply deltas from snapshot toward the target version
-    # chain = [target_delta, ..., intermediate_delta, snapshot]
-    # We apply deltas from second-to-last back to first
-    chain_length = len(chain) - 1  # Exclude the snapshot itself
-    result = dict(snapshot.content_inline)
-    for delta_ver in reversed(chain[:-1]):
+    # chain = [target_delta, ..., intermediate_delta]; the base follows the last element
+    chain, result = collected
+    chain_length = len(chain)
+    for delta_ver in reversed(chain):
         if delta_ver.content_inline is None:
             logger.error(f"Delta v{delta_ver.version_info.version} has no content")
             return None
         result = apply_delta(result, delta_ver.content_inline)
+        _reconstruction_cache.put(delta_ver, result)
 
     # Auto-resnapshot: if chain was long, save reconstructed as new snapshot
     # to prevent unbounded delta chain traversal on subsequent reads
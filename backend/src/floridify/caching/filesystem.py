@@ -1,4 +1,9 @@
-"""Filesystem cache backend using diskcache for L2 storage."""
+"""Filesystem cache backend using diskcache for L2 storage.
+
+Raw binary payloads bypass diskcache and go to a ``BlobStore`` of plain files
+(see ``caching.blob``) so they are never pickled and can be read via mmap.
+Their bytes share the backend's ``size_limit`` with diskcache's volume.
+"""
 
 from __future__ import annotations
 
@@ -14,6 +19,8 @@ import diskcache as dc  # type: ignore[import-untyped]
 
 from ..utils.logging import get_logger
 from ..utils.paths import get_cache_directory
+from .blob import BLOB_EVICTION_TARGET, BlobStore, BytesLike
+from .models import CompressionType
 
 logger = get_logger(__name__)
 
@@ -77,7 +84,7 @@ class RestrictedUnpickler(pickle.Unpickler):
         )
 
 
-def safe_pickle_loads(data: bytes) -> Any:
+def safe_pickle_loads(data: BytesLike) -> Any:
     """Safely deserialize pickled data using RestrictedUnpickler."""
     return RestrictedUnpickler(io.BytesIO(data)).load()
 
@@ -113,12 +120,15 @@ class FilesystemBackend:
 
         cache_dir.mkdir(parents=True, exist_ok=True)
         self.cache_dir = cache_dir
+        self.size_limit = size_limit
         self.default_ttl = default_ttl
 
         # Cached event loop reference for performance (5-10% speedup)
         self._loop: asyncio.AbstractEventLoop | None = None
         self._loop_id: int | None = None
 
+        self.blobs = BlobStore(self.cache_dir / "blobs")
+
         self.cache = dc.Cache(
             directory=str(self.cache_dir),
             size_limit=size_limit,
@@ -188,13 +198,69 @@ class FilesystemBackend:
 
             expire = ttl.total_seconds() if ttl else self.default_ttl.total_seconds()
             self.cache.set(key, data, expire=expire)
+            self.blobs.delete(key)
+
+        await loop.run_in_executor(None, _set)
+
+    async def get_bytes(self, key: str) -> memoryview | None:
+        """Get a raw payload stored with set_bytes, without deserialization.
+
+        Returns:
+            Read-only view (mmap-backed for uncompressed payloads), or None
+
+        """
+        loop = self._get_loop()
+
+        def _get() -> memoryview | None:
+            if self.blobs.sweep_due():
+                self._sweep_blobs()
+            return self.blobs.get(key)
+
+        return await loop.run_in_executor(None, _get)
+
+    async def set_bytes(
+        self,
+        key: str,
+        payload: BytesLike,
+        ttl: timedelta | None = None,
+        compression: CompressionType | None = None,
+    ) -> None:
+        """Store a raw payload as a file, streaming it through zstd if requested.
+
+        Args:
+            key: Cache key
+            payload: Raw bytes to store
+            ttl: Time-to-live (default: backend default TTL)
+            compression: Requested compression (stored raw if it doesn't help)
+
+        """
+        loop = self._get_loop()
+
+        def _set() -> None:
+            self.blobs.put(key, payload, ttl or self.default_ttl, compression)
+            self.cache.delete(key)
+            if self.blobs.sweep_due() or self.blobs.stored_bytes > self._blob_budget():
+                self._sweep_blobs()
 
         await loop.run_in_executor(None, _set)
 
+    def _blob_budget(self) -> int:
+        """Bytes of the size limit that diskcache leaves for blobs."""
+        return max(0, self.size_limit - self.cache.volume())
+
+    def _sweep_blobs(self) -> None:
+        """Expire blobs and evict them to below the blob budget."""
+        self.blobs.sweep(int(self._blob_budget() * BLOB_EVICTION_TARGET))
+
     async def delete(self, key: str) -> bool:
         """Remove key from cache."""
         loop = self._get_loop()
-        return await loop.run_in_executor(None, self.cache.delete, key)
+
+        def _delete() -> bool:
+            removed_blob = self.blobs.delete(key)
+            return bool(self.cache.delete(key)) or removed_blob
+
+        return await loop.run_in_executor(None, _delete)
 
     async def exists(self, key: str) -> bool:
         """Check if key exists."""
@@ -212,6 +278,10 @@ class FilesystemBackend:
                 if fnmatch.fnmatch(key, pattern):
                     del self.cache[key]
                     count += 1
+            for key in list(self.blobs.keys()):
+                if fnmatch.fnmatch(key, pattern):
+                    self.blobs.delete(key)
+                    count += 1
             return count
 
         return await loop.run_in_executor(None, _clear)
@@ -219,7 +289,12 @@ class FilesystemBackend:
     async def clear_all(self) -> None:
         """Clear all cached items."""
         loop = self._get_loop()
-        await loop.run_in_executor(None, self.cache.clear)
+
+        def _clear() -> None:
+            self.cache.clear()
+            self.blobs.clear()
+
+        await loop.run_in_executor(None, _clear)
 
     async def clear(self) -> None:
         """Clear all cached items (alias for clear_all)."""
@@ -230,11 +305,14 @@ class FilesystemBackend:
         loop = self._get_loop()
 
         def _stats() -> dict[str, Any]:
+            blob_stats = self.blobs.stats()
             return {
                 "hits": self.cache.stats()["hits"],
                 "misses": self.cache.stats()["misses"],
-                "size": self.cache.volume(),
-                "count": len(self.cache),
+                "size": self.cache.volume() + blob_stats["size"],
+                "count": len(self.cache) + blob_stats["count"],
+                "blob_count": blob_stats["count"],
+                "blob_size": blob_stats["size"],
             }
 
         return await loop.run_in_executor(None, _stats)
@@ -0,0 +1,220 @@
+"""Generation counters that let versioned cache hits skip MongoDB validation.
+
+``VersionedDataManager.get_latest`` used to confirm every cached "latest"
+version with a ``find_one`` (plus an external-content read) before returning
+it. ``CacheGenerations`` replaces that round-trip with a cheap check:
+
+- Every write path through the manager bumps a per-resource generation
+  (bulk deletes that bypass the manager bump a whole resource type).
+- When an entry is cached or validated, the current generation is recorded
+  alongside the document id.
+- A cache hit whose recorded generation still matches is trusted without a
+  query. A mismatch means the entry is stale and is evicted.
+
+Writes from other processes are covered in two ways: trust expires after
+``CACHE_VALIDATION_TTL_SECONDS`` (one validation query per window), and an
+optional MongoDB change-stream listener bumps generations and evicts entries
+as soon as another process writes; while it runs, trust never expires.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+from ..utils.logging import get_logger
+from .config import CACHE_VALIDATION_TTL_SECONDS
+from .models import ResourceType
+
+logger = get_logger(__name__)
+
+ResourceKey = tuple[ResourceType, str]
+
+
+@dataclass(slots=True)
+class _Validated:
+    """Generation and document a cached entry was last confirmed against."""
+
+    generation: tuple[int, int]
+    doc_id: Any
+    validated_at: float
+
+
+class CacheGenerations:
+    """Per-resource generation counters plus validation bookkeeping."""
+
+    def __init__(self, trust_ttl: float = CACHE_VALIDATION_TTL_SECONDS) -> None:
+        self.trust_ttl = trust_ttl
+        self.listening = False
+
+        self._type_generations: dict[ResourceType, int] = {}
+        self._generations: dict[ResourceKey, int] = {}
+        self._validated: dict[ResourceKey, _Validated] = {}
+        # Document id -> resource, so delete events (which carry only _id) resolve
+        self._doc_keys: dict[Any, ResourceKey] = {}
+
+        self.validations_avoided = 0
+        self.validation_queries = 0
+        self.stale_evictions = 0
+        self._watch_task: asyncio.Task[None] | None = None
+
+    def generation(self, resource_type: ResourceType, resource_id: str) -> tuple[int, int]:
+        """Current (type, resource) generation for a resource."""
+        return (
+            self._type_generations.get(resource_type, 0),
+            self._generations.get((resource_type, resource_id), 0),
+        )
+
+    def bump(self, resource_type: ResourceType, resource_id: str | None = None) -> None:
+        """Mark a resource (or every resource of a type, if ``resource_id`` is None) as changed."""
+        if resource_id is None:
+            self._type_generations[resource_type] = self._type_generations.get(resource_type, 0) + 1
+            return
+        key = (resource_type, resource_id)
+        self._generations[key] = self._generations.get(key, 0) + 1
+
+    def mark_validated(
+        self,
+        resource_type: ResourceType,
+        resource_id: str,
+        doc_id: Any,
+        generation: tuple[int, int] | None = None,
+    ) -> None:
+        """Record that ``doc_id`` is the current latest version of a resource.
+
+        ``generation`` is the generation observed before the document was read;
+        it defaults to the current one.
+        """
+        key = (resource_type, resource_id)
+        previous = self._validated.get(key)
+        if previous is not None and previous.doc_id != doc_id:
+            self._doc_keys.pop(previous.doc_id, None)
+        self._validated[key] = _Validated(
+            generation or self.generation(resource_type, resource_id), doc_id, time.monotonic()
+        )
+        self._doc_keys[doc_id] = key
+
+    def check(self, resource_type: ResourceType, resource_id: str, doc_id: Any) -> bool | None:
+        """Decide whether a cached latest version can be served without a query.
+
+        Returns:
+            True if the entry is trusted, False if it is known stale (a write
+            happened since it was cached), None if it must be validated.
+
+        """
+        record = self._validated.get((resource_type, resource_id))
+        if record is None:
+            return None
+        if record.generation != self.generation(resource_type, resource_id):
+            return False
+        if record.doc_id != doc_id:
+            return None
+        if not self.listening and time.monotonic() - record.validated_at > self.trust_ttl:
+            return None
+        return True
+
+    def forget(self, resource_type: ResourceType, resource_id: str) -> None:
+        """Drop the validation record for a resource."""
+        record = self._validated.pop((resource_type, resource_id), None)
+        if record is not None:
+            self._doc_keys.pop(record.doc_id, None)
+
+    def resolve(self, change: dict[str, Any]) -> ResourceKey | None:
+        """Map a change-stream event to the resource it touches."""
+        document = change.get("fullDocument") or {}
+        resource_id = document.get("resource_id")
+        resource_type = document.get("resource_type")
+        if resource_id is not None and resource_type is not None:
+            try:
+                return ResourceType(resource_type), resource_id
+            except ValueError:
+                return None
+        doc_id = (change.get("documentKey") or {}).get("_id")
+        return self._doc_keys.get(doc_id)
+
+    def is_relevant(self, change: dict[str, Any], key: ResourceKey) -> bool:
+        """Whether a change can make the tracked latest version of ``key`` stale.
+
+        Inserts of the already-tracked document are this process's own saves,
+        and updates/deletes of other (non-latest) versions change nothing
+        callers can observe through ``get_latest``.
+        """
+        doc_id = (change.get("documentKey") or {}).get("_id")
+        record = self._validated.get(key)
+        tracked = record is not None and record.doc_id == doc_id
+        if change.get("operationType") == "insert":
+            return not tracked
+        return tracked
+
+    async def watch(
+        self,
+        collection: Any,
+        evict: Callable[[ResourceType, str], Awaitable[None]],
+    ) -> None:
+        """Follow a MongoDB change stream, bumping and evicting changed resources.
+
+        Change streams need a replica set; on a standalone server the listener
+        logs and exits, and trust falls back to ``trust_ttl``.
+        """
+        try:
+            async with collection.watch(full_document="updateLookup") as stream:
+                self.listening = True
+                logger.info("Versioned cache change-stream listener started")
+                async for change in stream:
+                    key = self.resolve(change)
+                    if key is None or not self.is_relevant(change, key):
+                        continue
+                    resource_type, resource_id = key
+                    self.bump(resource_type, resource_id)
+                    self.forget(resource_type, resource_id)
+                    try:
+                        await evict(resource_type, resource_id)
+                    except Exception as e:
+                        logger.warning(f"Failed to evict {resource_type.value}:{resource_id}: {e}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(
+                f"Change streams unavailable ({e.__class__.__name__}), "
+                f"cache hits revalidate every {self.trust_ttl:.0f}s"
+            )
+        finally:
+            self.listening = False
+
+    def start_watch(
+        self,
+        collection: Any,
+        evict: Callable[[ResourceType, str], Awaitable[None]],
+    ) -> asyncio.Task[None]:
+        """Start the change-stream listener as a background task."""
+        if self._watch_task is not None and not self._watch_task.done():
+            return self._watch_task
+        self._watch_task = asyncio.create_task(
+            self.watch(collection, evict), name="versioned-cache-watch"
+        )
+        return self._watch_task
+
+    async def stop_watch(self) -> None:
+        """Stop the change-stream listener."""
+        if self._watch_task is not None and not self._watch_task.done():
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                logger.debug("Change-stream listener cancelled")
+        self._watch_task = None
+        self.listening = False
+
+    def get_stats(self) -> dict[str, Any]:
+        """Counters for validation queries run versus avoided."""
+        return {
+            "validations_avoided": self.validations_avoided,
+            "validation_queries": self.validation_queries,
+            "stale_evictions": self.stale_evictions,
+            "tracked_resources": len(self._validated),
+            "listening": self.listening,
+            "trust_ttl_seconds": self.trust_ttl,
+        }
@@ -6,17 +6,34 @@ chunk count for large blobs (e.g., 400MB SEMANTIC → ~100 chunks).
 
 Content stored here never expires — it survives server restarts and cache
 eviction, unlike the transient L1/L2 tiers.
+
+Reads stream chunk by chunk (``gridfs_read``): zstd frames are decompressed
+incrementally and every byte lands directly in its final home — a
+preallocated buffer for small files, or an unlinked, mmap'd spool file for
+large ones — so a several-hundred-MB blob never exists twice in memory.
+LZ4 and GZIP content, which has no sized streaming frame here, is fetched
+whole and decoded in a worker thread.
 """
 
 from __future__ import annotations
 
+import asyncio
+import gzip
+import mmap
+import os
+import tempfile
+from collections.abc import Sequence
 from typing import Any
 
+import lz4.frame  # type: ignore[import-untyped]
+import zstandard as zstd
 from bson import ObjectId
 from gridfs import NoFile
 from motor.motor_asyncio import AsyncIOMotorGridFSBucket
 
 from ..utils.logging import get_logger
+from ..utils.paths import get_cache_directory
+from .models import CompressionType
 
 logger = get_logger(__name__)
 
@@ -26,6 +43,11 @@ _bucket_loop_id: int | None = None
 # 4MB chunks: a 400MB blob = ~100 chunks instead of ~1600 at default 255KB
 _CHUNK_SIZE = 4 * 1024 * 1024
 
+# Reads at least this large are spooled to an mmap'd file instead of the heap
+SPOOL_THRESHOLD_BYTES = 64 * 1024 * 1024
+
+BytesLike = bytes | bytearray | memoryview
+
 
 async def get_gridfs_bucket() -> AsyncIOMotorGridFSBucket:
     """Get or create the GridFS bucket, recreating if the event loop changed.
@@ -35,9 +57,6 @@ async def get_gridfs_bucket() -> AsyncIOMotorGridFSBucket:
     event loops) or production (single event loop).
     """
     global _bucket, _bucket_loop_id
-    # Lazy: heavyweight module
-    import asyncio
-
     loop_id = id(asyncio.get_running_loop())
     if _bucket is None or _bucket_loop_id != loop_id:
         from .models import BaseVersionedData
@@ -52,20 +71,55 @@ async def get_gridfs_bucket() -> AsyncIOMotorGridFSBucket:
     return _bucket
 
 
-async def gridfs_put(filename: str, data: bytes, metadata: dict[str, Any] | None = None) -> str:
+class _PartsReader:
+    """File-like ``read()`` over a sequence of buffers, without joining them."""
+
+    def __init__(self, parts: Sequence[BytesLike]) -> None:
+        self._parts = [memoryview(part).cast("B") for part in parts]
+        self._index = 0
+        self._offset = 0
+
+    def read(self, size: int = -1) -> bytes:
+        out = bytearray()
+        while self._index < len(self._parts) and (size < 0 or len(out) < size):
+            part = self._parts[self._index]
+            take = len(part) - self._offset
+            if size >= 0:
+                take = min(take, size - len(out))
+            out += part[self._offset : self._offset + take]
+            self._offset += take
+            if self._offset == len(part):
+                self._index += 1
+                self._offset = 0
+        return bytes(out)
+
+
+async def gridfs_put(
+    filename: str,
+    data: BytesLike | Sequence[BytesLike],
+    metadata: dict[str, Any] | None = None,
+) -> str:
     """Upload bytes to GridFS.
 
     Args:
         filename: Logical filename for the GridFS entry
-        data: Raw bytes to store
+        data: Raw bytes to store, or a sequence of buffers uploaded back to back
+            (streamed chunk by chunk, never concatenated)
         metadata: Optional metadata dict stored alongside the file
 
     Returns:
         str(ObjectId) suitable for ContentLocation.path
     """
     bucket = await get_gridfs_bucket()
-    file_id = await bucket.upload_from_stream(filename, data, metadata=metadata)
-    logger.debug(f"GridFS PUT: {filename} ({len(data):,} bytes) -> {file_id}")
+    if isinstance(data, bytes):
+        source: Any = data
+        size = len(data)
+    else:
+        parts = [data] if isinstance(data, bytearray | memoryview) else list(data)
+        source = _PartsReader(parts)
+        size = sum(memoryview(part).nbytes for part in parts)
+    file_id = await bucket.upload_from_stream(filename, source, metadata=metadata)
+    logger.debug(f"GridFS PUT: {filename} ({size:,} bytes) -> {file_id}")
     return str(file_id)
 
 
@@ -89,6 +143,134 @@ async def gridfs_get(file_id_str: str) -> bytes | None:
         raise StorageError("read", file_id_str, str(e)) from e
 
 
+class _Sink:
+    """Fixed-size destination for streamed bytes: heap buffer or mmap'd spool file."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.filled = 0
+        self._file: Any = None
+        self._buffer: bytearray | None = None
+        if size >= SPOOL_THRESHOLD_BYTES:
+            spool_dir = get_cache_directory("gridfs_spool")
+            fd, path = tempfile.mkstemp(prefix=".spool-", dir=spool_dir)
+            # Unlinked at once: the mapping keeps the inode alive, nothing leaks
+            os.unlink(path)
+            self._file = os.fdopen(fd, "w+b")
+        else:
+            self._buffer = bytearray(size)
+
+    def write(self, data: BytesLike) -> None:
+        n = memoryview(data).nbytes
+        if self.filled + n > self.size:
+            raise ValueError(f"GridFS payload larger than its declared size ({self.size:,} bytes)")
+        if self._file is not None:
+            self._file.write(data)
+        else:
+            assert self._buffer is not None
+            self._buffer[self.filled : self.filled + n] = data
+        self.filled += n
+
+    def result(self) -> memoryview:
+        if self.filled != self.size:
+            self.close()
+            raise ValueError(f"Truncated GridFS payload ({self.filled:,}/{self.size:,} bytes)")
+        if self._file is None:
+            assert self._buffer is not None
+            return memoryview(self._buffer).toreadonly()
+        self._file.flush()
+        try:
+            if self.size == 0:
+                return memoryview(b"")
+            return memoryview(mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ))
+        finally:
+            self._file.close()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+def _decompress_whole(raw: bytes, compression: CompressionType) -> bytes:
+    """Decode an LZ4 or GZIP payload (no streaming path here)."""
+    if compression == CompressionType.LZ4:
+        return lz4.frame.decompress(raw)
+    return gzip.decompress(raw)
+
+
+async def gridfs_read(
+    file_id_str: str, compression: CompressionType | None = None
+) -> memoryview | None:
+    """Stream a GridFS file into memory, decompressing zstd frames on the fly.
+
+    Chunks are decompressed as they arrive and written straight into a buffer
+    sized from the zstd frame header (or the file length when uncompressed).
+    Results of ``SPOOL_THRESHOLD_BYTES`` or more live in an mmap'd spool file
+    rather than the heap.
+
+    Args:
+        file_id_str: ObjectId string of the file
+        compression: Compression recorded at write time
+
+    Returns:
+        Read-only view of the (decompressed) payload, or None if not found
+
+    Raises:
+        ValueError: If ``compression`` is not a supported codec
+        StorageError: If the file can't be read or decoded
+
+    """
+    if compression not in (None, CompressionType.ZSTD):
+        if compression not in (CompressionType.LZ4, CompressionType.GZIP):
+            raise ValueError(f"Unsupported GridFS compression: {compression}")
+        # Only zstd has a streaming frame format here; other codecs decode whole
+        raw = await gridfs_get(file_id_str)
+        if raw is None:
+            return None
+        try:
+            data = await asyncio.to_thread(_decompress_whole, raw, compression)
+        except Exception as e:
+            from ..api.core.exceptions import StorageError
+
+            raise StorageError("read", file_id_str, str(e)) from e
+        return memoryview(data).toreadonly()
+
+    bucket = await get_gridfs_bucket()
+    sink: _Sink | None = None
+    try:
+        stream = await bucket.open_download_stream(ObjectId(file_id_str))
+        decompressor = zstd.ZstdDecompressor().decompressobj() if compression else None
+        if decompressor is None:
+            sink = _Sink(stream.length)
+
+        while chunk := await stream.readchunk():
+            if decompressor is None:
+                assert sink is not None
+                sink.write(chunk)
+                continue
+            if sink is None:
+                size = zstd.frame_content_size(chunk)
+                if size < 0:
+                    raise ValueError("zstd frame does not record its content size")
+                sink = _Sink(size)
+            sink.write(decompressor.decompress(chunk))
+
+        if sink is None:
+            sink = _Sink(0)
+        view = sink.result()
+        logger.debug(f"GridFS READ: {file_id_str} ({stream.length:,} -> {len(view):,} bytes)")
+        return view
+    except NoFile:
+        logger.warning(f"GridFS READ: {file_id_str} not found")
+        return None
+    except Exception as e:
+        if sink is not None:
+            sink.close()
+        from ..api.core.exceptions import StorageError
+
+        raise StorageError("read", file_id_str, str(e)) from e
+
+
 async def gridfs_delete(file_id_str: str) -> None:
     """Delete a GridFS file by ObjectId string. No-op if already gone."""
     bucket = await get_gridfs_bucket()
@@ -18,6 +18,7 @@ from .config import DELTA_CONFIG, RESOURCE_TYPE_MAP
 from .core import GlobalCacheManager, get_global_cache, get_versioned_content, set_versioned_content
 from .delta_manager import convert_to_delta, reconstruct_from_delta
 from .filesystem import FilesystemBackend
+from .generations import CacheGenerations
 from .keys import generate_resource_key as _generate_cache_key
 from .models import (
     DELTA_ELIGIBLE_TYPES,
@@ -56,6 +57,8 @@ class VersionedDataManager:
         self._locks: defaultdict[tuple[int, ResourceType, str], asyncio.Lock] = defaultdict(
             asyncio.Lock
         )
+        # Generation counters let cached latest versions skip the MongoDB check
+        self.generations = CacheGenerations()
 
     def _get_lock(self, resource_type: ResourceType, resource_id: str) -> asyncio.Lock:
         """Get or create lock for a specific resource.
@@ -336,6 +339,7 @@ class VersionedDataManager:
                 ) from e
 
             # Tree structures handled by TreeCorpusManager for corpus types
+            self.generations.bump(resource_type, resource_id)
 
             # CRITICAL FIX: Cache update INSIDE lock for atomicity
             # Use single set() operation which overwrites - no need for delete()
@@ -348,6 +352,7 @@ class VersionedDataManager:
                 try:
                     # Atomic cache update: set() overwrites old value in single operation
                     await self.cache.set(namespace, cache_key, versioned, config.ttl)
+                    self.generations.mark_validated(resource_type, resource_id, versioned.id)
                     logger.debug(f"Cache updated atomically for {cache_key[:16]}... inside lock")
                 except Exception as cache_error:
                     # Cache is advisory — warn but don't fail
@@ -438,39 +443,28 @@ class VersionedDataManager:
                     cached_obj = None
 
                 if cached_obj:
-                    if not config.version:
-                        try:
-                            doc = await model_class.find_one({"_id": cached_obj.id})
-                            if not doc:
-                                logger.debug(
-                                    f"Cached document for {cache_key} no longer exists, invalidating cache"
-                                )
-                                await self.cache.delete(namespace, cache_key)
-                            else:
-                                if cached_obj.content_location is not None:
-                                    content = await get_versioned_content(cached_obj)
-                                    if content is None:
-                                        logger.error(
-                                            f"External content missing for {cache_key}, invalidating cache"
-                                        )
-                                        await self.cache.delete(namespace, cache_key)
-                                    else:
-                                        logger.debug(f"Cache hit for {cache_key} (validated)")
-                                        return cached_obj  # type: ignore[no-any-return]
-                                else:
-                                    logger.debug(f"Cache hit for {cache_key}")
-                                    return cached_obj  # type: ignore[no-any-return]
-                        except (TypeError, ValueError, ValidationError) as e:
-                            logger.warning(
-                                f"Cache validation failed for {cache_key}: {e}, invalidating cache",
-                                exc_info=True,
-                            )
-                            await self.cache.delete(namespace, cache_key)
-                    else:
+                    if config.version:
                         logger.debug(f"Cache hit for {cache_key} (version-specific)")
                         return cached_obj  # type: ignore[no-any-return]
 
+                    trusted = self.generations.check(resource_type, resource_id, cached_obj.id)
+                    if trusted:
+                        # No write since this entry was validated: pure memory hit
+                        self.generations.validations_avoided += 1
+                        logger.debug(f"Cache hit for {cache_key}")
+                        return cached_obj  # type: ignore[no-any-return]
+                    if trusted is False:
+                        # Written since this entry was cached; reload from the database
+                        self.generations.stale_evictions += 1
+                        logger.debug(f"Cached entry for {cache_key} is stale, invalidating cache")
+                        await self.cache.delete(namespace, cache_key)
+                    elif await self._validate_cached(cached_obj, namespace, cache_key):
+                        self.generations.mark_validated(resource_type, resource_id, cached_obj.id)
+                        return cached_obj  # type: ignore[no-any-return]
+
         # Query database with error handling
+        # Generation is read before the query so a concurrent write marks this result stale
+        generation = self.generations.generation(resource_type, resource_id)
         # Use the specific model class for polymorphic queries (not BaseVersionedData)
         # After fixing _class_id, each subclass needs to query using its own class
         model_class = self._get_model_class(resource_type)
@@ -558,6 +552,8 @@ class VersionedDataManager:
                             exc_info=True,
                         )
 
+                self.generations.bump(resource_type, resource_id)
+
                 # Best effort cache cleanup so new versions do not collide with stale entries
                 # content_location is a defined field on BaseVersionedData, always exists
                 cache_location = result.content_location
@@ -595,12 +591,52 @@ class VersionedDataManager:
                 self.cache = await get_global_cache()
             try:
                 await self.cache.set(namespace, cache_key, result, result.ttl)
+                if not config.version:
+                    self.generations.mark_validated(
+                        resource_type, resource_id, result.id, generation
+                    )
             except Exception as cache_error:
                 # Cache is advisory — warn but don't fail
                 logger.warning(f"Failed to cache {cache_key}: {cache_error}")
 
         return result
 
+    async def _validate_cached(
+        self,
+        cached_obj: BaseVersionedData,
+        namespace: CacheNamespace,
+        cache_key: str,
+    ) -> bool:
+        """Confirm a cached latest version still exists (and its external content loads).
+
+        Evicts the entry and returns False when it does not.
+        """
+        assert self.cache is not None
+        model_class = self._get_model_class(cached_obj.resource_type)
+        self.generations.validation_queries += 1
+        try:
+            doc = await model_class.find_one({"_id": cached_obj.id})
+            if not doc:
+                logger.debug(
+                    f"Cached document for {cache_key} no longer exists, invalidating cache"
+                )
+            elif cached_obj.content_location is not None:
+                content = await get_versioned_content(cached_obj)
+                if content is not None:
+                    logger.debug(f"Cache hit for {cache_key} (validated)")
+                    return True
+                logger.error(f"External content missing for {cache_key}, invalidating cache")
+            else:
+                logger.debug(f"Cache hit for {cache_key} (validated)")
+                return True
+        except (TypeError, ValueError, ValidationError) as e:
+            logger.warning(
+                f"Cache validation failed for {cache_key}: {e}, invalidating cache",
+                exc_info=True,
+            )
+        await self.cache.delete(namespace, cache_key)
+        return False
+
     async def get_by_version(
         self,
         resource_id: str,
@@ -637,6 +673,7 @@ class VersionedDataManager:
         if self.cache is None:
             self.cache = await get_global_cache()
 
+        self.generations.bump(resource_type, resource_id)
         await self.cache.delete(namespace, cache_key)
         logger.debug(f"Invalidated cache for {resource_type.value}:{resource_id}")
 
@@ -668,6 +705,7 @@ class VersionedDataManager:
         async with self._get_lock(resource_type, resource_id):
             # Always save the object first
             await metadata_obj.save()
+            self.generations.bump(resource_type, resource_id)
 
             # If this version claims to be latest, ensure only one version can be latest
             if metadata_obj.version_info.is_latest:
@@ -759,6 +797,7 @@ class VersionedDataManager:
 
         Delegates to :func:`version_crud.delete_version`.
         """
+        self.generations.bump(resource_type, resource_id)
         success, self.cache = await _delete_version(
             resource_id,
             resource_type,
@@ -802,6 +841,18 @@ class VersionedDataManager:
             return None
         return None
 
+    def start_change_listener(self) -> asyncio.Task[None]:
+        """Evict cached versions as soon as any process writes them (needs a replica set)."""
+        return self.generations.start_watch(
+            BaseVersionedData.get_pymongo_collection(),
+            # watch() passes (resource_type, resource_id); invalidate_cache takes the reverse
+            lambda resource_type, resource_id: self.invalidate_cache(resource_id, resource_type),
+        )
+
+    async def stop_change_listener(self) -> None:
+        """Stop the change-stream listener started by :meth:`start_change_listener`."""
+        await self.generations.stop_watch()
+
     def _get_model_class(self, resource_type: ResourceType) -> type[BaseVersionedData]:
         """Map resource type enum to model class using registry pattern."""
         # Deferred import to avoid circular dependency
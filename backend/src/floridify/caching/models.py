@@ -258,6 +258,12 @@ class BaseVersionedData(Document):
                 ],
                 name="resource_type_id_latest_idx",
             ),
+            # Delta chain resolution: versions of a resource newer than a given _id
+            # Covers: resource_type + resource_id + _id range, sorted by _id
+            IndexModel(
+                [("resource_type", 1), ("resource_id", 1), ("_id", 1)],
+                name="resource_type_id_chain_idx",
+            ),
             # Specific version lookup
             # Covers: resource_type + resource_id + exact version query
             IndexModel(
@@ -8,14 +8,20 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
+import pickle
+import sys
 import zlib
 from datetime import datetime
 from enum import Enum
+from itertools import islice
 from typing import Any
 
+import numpy as np
 from beanie import PydanticObjectId
 from pydantic import BaseModel, ConfigDict
 
+from .filesystem import safe_pickle_loads
 from .utils import json_encoder
 
 __all__ = [
@@ -24,7 +30,10 @@ __all__ = [
     "compute_content_hash",
     "encode_for_json",
     "estimate_binary_size",
+    "estimate_memory_size",
+    "pack_binary_payload",
     "serialize_content",
+    "unpack_binary_payload",
 ]
 
 
@@ -66,6 +75,9 @@ class CacheStats(BaseModel):
         hits: Number of cache hits
         misses: Number of cache misses
         evictions: Number of cache evictions
+        rejections: Number of entries too large to admit to L1
+        coalesced: Number of misses that joined an in-flight load
+        stale_hits: Number of expired entries served while refreshing
 
     Examples:
         >>> stats = CacheStats(hits=10, misses=5, evictions=2)
@@ -83,6 +95,9 @@ class CacheStats(BaseModel):
     hits: int = 0
     misses: int = 0
     evictions: int = 0
+    rejections: int = 0
+    coalesced: int = 0
+    stale_hits: int = 0
 
     def increment_hits(self) -> CacheStats:
         """Create new stats with hits incremented by 1."""
@@ -96,6 +111,18 @@ class CacheStats(BaseModel):
         """Create new stats with evictions incremented by count."""
         return self.model_copy(update={"evictions": self.evictions + count})
 
+    def increment_rejections(self) -> CacheStats:
+        """Create new stats with rejections (entries too large for L1) incremented by 1."""
+        return self.model_copy(update={"rejections": self.rejections + 1})
+
+    def increment_coalesced(self) -> CacheStats:
+        """Create new stats with coalesced (joined an in-flight load) incremented by 1."""
+        return self.model_copy(update={"coalesced": self.coalesced + 1})
+
+    def increment_stale_hits(self) -> CacheStats:
+        """Create new stats with stale hits (served while refreshing) incremented by 1."""
+        return self.model_copy(update={"stale_hits": self.stale_hits + 1})
+
 
 class SerializedContent(BaseModel):
     """Immutable serialized content with pre-computed metadata.
@@ -224,8 +251,8 @@ def estimate_binary_size(content: dict[str, Any]) -> tuple[int, str]:
     binary_data = content.get("binary_data", {})
     if isinstance(binary_data, dict):
         for value in binary_data.values():
-            if isinstance(value, bytes):
-                binary_size += len(value)
+            if isinstance(value, bytes | bytearray | memoryview):
+                binary_size += memoryview(value).nbytes
                 crc = zlib.crc32(value, crc)
             elif isinstance(value, str):
                 encoded = value.encode("utf-8")
@@ -235,3 +262,174 @@ def estimate_binary_size(content: dict[str, Any]) -> tuple[int, str]:
     estimated_size = binary_size + 1000
     checksum = f"crc32:{crc & 0xFFFFFFFF:08x}"
     return estimated_size, checksum
+
+
+# Binary payload container: magic, 8-byte header length, pickled header, then
+# each payload at a 64-byte-aligned offset so numpy views over it are aligned
+BINARY_PAYLOAD_MAGIC = b"FLBLOB01"
+_PAYLOAD_ALIGN = 64
+
+
+def _padding(offset: int) -> int:
+    return -offset % _PAYLOAD_ALIGN
+
+
+def pack_binary_payload(
+    content: dict[str, Any], binary_payload: dict[str, Any]
+) -> list[bytes | bytearray | memoryview]:
+    """Lay out metadata plus raw binary payloads as a sequence of buffers.
+
+    The small ``content`` dict is pickled into a header that also records
+    each payload's (offset, length); payload bytes follow verbatim. The
+    buffers are meant to be written back to back (never joined in memory),
+    and :func:`unpack_binary_payload` slices the payloads back out of the
+    stored file without copying them.
+
+    Args:
+        content: Metadata dict (no binary values)
+        binary_payload: Name -> bytes-like payload
+
+    Returns:
+        Buffers whose concatenation is the container
+
+    Examples:
+        >>> parts = pack_binary_payload({"n": 1}, {"blob": b"abc"})
+        >>> unpacked = unpack_binary_payload(memoryview(b"".join(parts)))
+        >>> unpacked["n"], bytes(unpacked["binary_data"]["blob"])
+        (1, b'abc')
+    """
+    views = {name: memoryview(payload).cast("B") for name, payload in binary_payload.items()}
+
+    # Offsets are relative to the end of the header, so they don't depend on it
+    segments: dict[str, tuple[int, int]] = {}
+    offset = 0
+    for name, view in views.items():
+        offset += _padding(offset)
+        segments[name] = (offset, len(view))
+        offset += len(view)
+
+    header = pickle.dumps({"content": content, "segments": segments}, protocol=5)
+    prefix = BINARY_PAYLOAD_MAGIC + len(header).to_bytes(8, "little") + header
+    prefix += b"\0" * _padding(len(prefix))
+
+    parts: list[bytes | bytearray | memoryview] = [prefix]
+    position = 0
+    for name, view in views.items():
+        start, _ = segments[name]
+        if start > position:
+            parts.append(b"\0" * (start - position))
+        parts.append(view)
+        position = start + len(view)
+    return parts
+
+
+def unpack_binary_payload(data: bytes | bytearray | memoryview) -> dict[str, Any] | None:
+    """Read a :func:`pack_binary_payload` container without copying payloads.
+
+    Args:
+        data: Container bytes (typically an mmap-backed memoryview)
+
+    Returns:
+        ``{**content, "binary_data": {name: memoryview}}`` with each view a
+        slice of ``data``, or None if ``data`` is not a container
+
+    """
+    view = memoryview(data).cast("B")
+    magic_len = len(BINARY_PAYLOAD_MAGIC)
+    if view[:magic_len] != BINARY_PAYLOAD_MAGIC:
+        return None
+
+    header_len = int.from_bytes(view[magic_len : magic_len + 8], "little")
+    header_start = magic_len + 8
+    header = safe_pickle_loads(bytes(view[header_start : header_start + header_len]))
+    base = header_start + header_len
+    base += _padding(base)
+
+    binary_data = {}
+    for name, (offset, length) in header["segments"].items():
+        start = base + offset
+        if start + length > len(view):
+            raise ValueError(f"Truncated binary payload container (segment {name!r})")
+        binary_data[name] = view[start : start + length].toreadonly()
+    return {**header["content"], "binary_data": binary_data}
+
+
+# Containers larger than this are sized from an evenly spaced sample of their items
+_SIZE_SAMPLE_ITEMS = 256
+_ARRAY_HEADER_BYTES = 112
+
+
+def estimate_memory_size(obj: Any, _depth: int = 0) -> int:
+    """Estimate the resident memory footprint of a cached object in bytes.
+
+    Pure function. What it counts:
+
+    - numpy arrays: a fixed header plus ``nbytes``; ``np.memmap`` arrays count
+      the header only, as their pages live in the shared page cache
+    - memoryviews: ``sys.getsizeof`` plus ``nbytes``, except views over an
+      ``mmap`` (L2 blob files), which count ``sys.getsizeof`` only
+    - str/bytes/bytearray/scalars/None: ``sys.getsizeof``
+    - dicts, lists, tuples, sets: ``sys.getsizeof`` plus their items, recursing
+      to depth 8; beyond ``_SIZE_SAMPLE_ITEMS`` items the total is extrapolated
+      from an evenly spaced sample, so sizing a 1M-entry vocabulary stays cheap
+    - Pydantic models and other objects with a ``__dict__``: ``sys.getsizeof``
+      plus their ``__dict__``
+
+    Anything else counts ``sys.getsizeof`` only. That includes objects using
+    ``__slots__``, notably the corpus columnar views (``StringColumn``,
+    ``CSRMap``, ``DenseIndexMap``, ...): their numpy buffers are not counted,
+    whether they are mapped from disk or, after incremental updates, held in
+    memory.
+
+    Args:
+        obj: Object to size
+
+    Returns:
+        Estimated size in bytes
+
+    Examples:
+        >>> estimate_memory_size(b"x" * 1000) >= 1000
+        True
+        >>> estimate_memory_size({"words": ["a"] * 10_000}) > 80_000
+        True
+    """
+    if _depth > 8:
+        return sys.getsizeof(obj)
+
+    if isinstance(obj, np.ndarray):
+        # Mapped pages are shared page cache, not this process's heap
+        return _ARRAY_HEADER_BYTES + (0 if isinstance(obj, np.memmap) else obj.nbytes)
+
+    if isinstance(obj, memoryview):
+        # Views over mmap'd L2 blob files are shared page cache too
+        return sys.getsizeof(obj) + (0 if isinstance(obj.obj, mmap.mmap) else obj.nbytes)
+
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+        return sys.getsizeof(obj)
+
+    if isinstance(obj, BaseModel):
+        return sys.getsizeof(obj) + estimate_memory_size(obj.__dict__, _depth + 1)
+
+    if isinstance(obj, dict):
+        step = max(len(obj) // _SIZE_SAMPLE_ITEMS, 1)
+        items = list(islice(obj.items(), 0, None, step))
+        sampled = sum(
+            estimate_memory_size(k, _depth + 1) + estimate_memory_size(v, _depth + 1)
+            for k, v in items
+        )
+        return sys.getsizeof(obj) + sampled * len(obj) // max(len(items), 1)
+
+    if isinstance(obj, (list, tuple)):
+        sample = obj[:: max(len(obj) // _SIZE_SAMPLE_ITEMS, 1)]
+        sampled = sum(estimate_memory_size(item, _depth + 1) for item in sample)
+        return sys.getsizeof(obj) + sampled * len(obj) // max(len(sample), 1)
+
+    if isinstance(obj, (set, frozenset)):
+        sample = list(islice(obj, _SIZE_SAMPLE_ITEMS))
+        sampled = sum(estimate_memory_size(item, _depth + 1) for item in sample)
+        return sys.getsizeof(obj) + sampled * len(obj) // max(len(sample), 1)
+
+    if hasattr(obj, "__dict__"):
+        return sys.getsizeof(obj) + estimate_memory_size(vars(obj), _depth + 1)
+
+    return sys.getsizeof(obj)
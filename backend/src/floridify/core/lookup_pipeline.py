@@ -42,7 +42,7 @@ from ..utils.logging import (
     log_timing,
 )
 from .search_pipeline import find_best_match
-from .state_tracker import Stages, StateTracker
+from .state_tracker import Stages, StateTracker, record_span
 
 logger = get_logger(__name__)
 
@@ -208,6 +208,9 @@ async def lookup_word_pipeline(
                 if is_synthesis or no_ai:
                     source = "synthesis" if is_synthesis else str(existing.provider)
                     logger.info(f"📋 Using cached {source} entry for '{best_match}'")
+                    if state_tracker:
+                        # Cache hits stay out of the stage latency histograms
+                        state_tracker.disable_tracing()
                     asyncio.create_task(_ensure_primary_audio(existing)).add_done_callback(
                         _log_background_failure
                     )
@@ -421,6 +424,8 @@ async def _get_provider_definition(
                     f"Provider {provider.value} timed out after {_PROVIDER_TIMEOUT_SECONDS}s for '{word}'"
                 )
                 raise ProviderTimeoutError(provider.value, _PROVIDER_TIMEOUT_SECONDS)
+            finally:
+                record_span(f"provider:{provider.value}", fetch_start)
 
             fetch_duration = time.perf_counter() - fetch_start
 
@@ -0,0 +1,240 @@
+"""Pooled client for the standalone search service.
+
+When ``SEARCH_SERVICE_URL`` is set, best-match lookups are proxied to the
+search service. ``SearchServiceClient`` keeps one long-lived ``httpx``
+connection pool for that (keep-alive, HTTP/2 when the service is reached over
+TLS) instead of opening a client per lookup, and:
+
+- coalesces concurrent ``find_best_match`` calls with the same mode and
+  languages into one ``POST /search/batch`` request (a lone call uses the
+  cached ``GET /search``);
+- hedges: if an attempt has not answered within ``SEARCH_CLIENT_HEDGE_DELAY_MS``
+  a duplicate is sent and whichever succeeds first wins.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import httpx
+
+from ..models.base import Language
+from ..search.config import (
+    SEARCH_CLIENT_BATCH_MAX_SIZE,
+    SEARCH_CLIENT_BATCH_WINDOW_MS,
+    SEARCH_CLIENT_CONNECT_TIMEOUT_SECONDS,
+    SEARCH_CLIENT_HEDGE_DELAY_MS,
+    SEARCH_CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+    SEARCH_CLIENT_MAX_CONNECTIONS,
+    SEARCH_CLIENT_MAX_KEEPALIVE,
+    SEARCH_CLIENT_TIMEOUT_SECONDS,
+)
+from ..search.result import SearchResult
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_BatchKey = tuple[str, tuple[str, ...]]  # (mode, language codes)
+
+
+def _best_result(payload: dict[str, Any]) -> SearchResult | None:
+    """First result of a SearchResponse payload, if any."""
+    results = payload.get("results") or []
+    if not results:
+        return None
+    r = results[0]
+    return SearchResult(
+        word=r["word"],
+        score=r.get("score", 1.0),
+        method=r.get("method", "exact"),
+        language=r.get("language"),
+    )
+
+
+class SearchServiceClient:
+    """Long-lived, coalescing, hedged client for the search service.
+
+    Args:
+        base_url: Search service root, e.g. ``http://search:8000``
+        transport: Optional httpx transport (tests)
+        hedge_delay_ms: Delay before a duplicate attempt (<= 0 disables hedging)
+        window_ms: How long the first lookup of a batch waits for company
+        max_batch_size: Flush as soon as this many lookups are waiting
+
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        transport: httpx.AsyncBaseTransport | None = None,
+        hedge_delay_ms: float = SEARCH_CLIENT_HEDGE_DELAY_MS,
+        window_ms: float = SEARCH_CLIENT_BATCH_WINDOW_MS,
+        max_batch_size: int = SEARCH_CLIENT_BATCH_MAX_SIZE,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.hedge_delay_ms = hedge_delay_ms
+        self.window_ms = window_ms
+        self.max_batch_size = max(1, max_batch_size)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,  # Used when the service is behind TLS; plain http stays HTTP/1.1
+            transport=transport,
+            timeout=httpx.Timeout(
+                SEARCH_CLIENT_TIMEOUT_SECONDS, connect=SEARCH_CLIENT_CONNECT_TIMEOUT_SECONDS
+            ),
+            limits=httpx.Limits(
+                max_connections=SEARCH_CLIENT_MAX_CONNECTIONS,
+                max_keepalive_connections=SEARCH_CLIENT_MAX_KEEPALIVE,
+                keepalive_expiry=SEARCH_CLIENT_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        )
+
+        self._pending: dict[_BatchKey, list[tuple[str, asyncio.Future[SearchResult | None]]]] = {}
+        self._timers: dict[_BatchKey, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def aclose(self) -> None:
+        """Close the connection pool."""
+        await self._client.aclose()
+
+    async def find_best_match(
+        self,
+        word: str,
+        languages: list[Language] | None = None,
+        semantic: bool = True,
+    ) -> SearchResult | None:
+        """Best match for ``word`` from the search service (coalesced with concurrent calls).
+
+        Raises:
+            httpx.HTTPError: If every attempt for this lookup's batch failed
+
+        """
+        key: _BatchKey = (
+            "smart" if semantic else "exact",
+            tuple(lang.value for lang in languages) if languages else (),
+        )
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[SearchResult | None] = loop.create_future()
+        bucket = self._pending.setdefault(key, [])
+        bucket.append((word, future))
+
+        if len(bucket) >= self.max_batch_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(max(self.window_ms, 0.0) / 1000, self._flush, key)
+
+        return await future
+
+    def _flush(self, key: _BatchKey) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(key, [])
+        if batch:
+            task = asyncio.create_task(self._run(key, batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run(
+        self,
+        key: _BatchKey,
+        batch: list[tuple[str, asyncio.Future[SearchResult | None]]],
+    ) -> None:
+        words = list(dict.fromkeys(word for word, _ in batch))
+        try:
+            if len(words) == 1:
+                matches = {words[0]: await self._search_one(words[0], key)}
+            else:
+                matches = await self._search_many(words, key)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for word, future in batch:
+            if not future.done():
+                future.set_result(matches.get(word))
+
+    async def _search_one(self, word: str, key: _BatchKey) -> SearchResult | None:
+        mode, languages = key
+        params: dict[str, Any] = {"q": word, "mode": mode, "max_results": 1}
+        if languages:
+            params["languages"] = list(languages)
+
+        response = await self._hedged(lambda: self._client.get("/api/v1/search", params=params))
+        return _best_result(response.json())
+
+    async def _search_many(
+        self, words: list[str], key: _BatchKey
+    ) -> dict[str, SearchResult | None]:
+        mode, languages = key
+        body: dict[str, Any] = {"queries": words, "mode": mode, "max_results": 1}
+        if languages:
+            body["languages"] = list(languages)
+
+        response = await self._hedged(lambda: self._client.post("/api/v1/search/batch", json=body))
+        responses = response.json().get("results", [])
+        logger.debug(f"Coalesced {len(words)} remote best-match lookups into one batch")
+        return {word: _best_result(payload) for word, payload in zip(words, responses, strict=True)}
+
+    async def _hedged(self, send: Callable[[], Awaitable[httpx.Response]]) -> httpx.Response:
+        """Run ``send``; if it is slow, race it against one duplicate attempt."""
+
+        async def attempt() -> httpx.Response:
+            response = await send()
+            response.raise_for_status()
+            return response
+
+        first = asyncio.ensure_future(attempt())
+        if self.hedge_delay_ms <= 0:
+            return await first
+
+        pending: set[asyncio.Future[httpx.Response]] = {first}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.hedge_delay_ms / 1000)
+            if not done:
+                logger.debug(f"Search service slower than {self.hedge_delay_ms:.0f}ms; hedging")
+                pending.add(asyncio.ensure_future(attempt()))
+
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            assert error is not None
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+# Global singleton client
+_search_service_client: SearchServiceClient | None = None
+
+
+def get_search_service_client(base_url: str) -> SearchServiceClient:
+    """Get the process-wide search service client, creating it on first use."""
+    global _search_service_client
+    if _search_service_client is None or _search_service_client.base_url != base_url.rstrip("/"):
+        _search_service_client = SearchServiceClient(base_url)
+    return _search_service_client
+
+
+async def shutdown_search_service_client() -> None:
+    """Close the search service client's connection pool, if created."""
+    global _search_service_client
+    client, _search_service_client = _search_service_client, None
+    if client is not None:
+        await client.aclose()
+
+
+__all__ = [
+    "SearchServiceClient",
+    "get_search_service_client",
+    "shutdown_search_service_client",
+]
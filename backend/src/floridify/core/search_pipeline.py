@@ -28,6 +28,7 @@ from ..utils.logging import (
     log_stage,
     log_timing,
 )
+from .search_client import get_search_service_client
 
 logger = get_logger(__name__)
 
@@ -493,32 +494,15 @@ async def _find_best_match_remote(
     semantic: bool,
     service_url: str,
 ) -> SearchResult | None:
-    """Proxy search to the external search service via httpx."""
-    import httpx
-
-    params: dict[str, Any] = {
-        "q": word,
-        "mode": "smart" if semantic else "exact",
-        "max_results": 1,
-    }
-    if languages:
-        params["languages"] = [lang.value for lang in languages]
+    """Proxy search to the external search service via the pooled client.
 
+    Concurrent calls are coalesced into one batch request by the client.
+    """
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.get(f"{service_url}/api/v1/search", params=params)
-            resp.raise_for_status()
-            data = resp.json()
-
-        results = data.get("results", [])
-        if results:
-            r = results[0]
-            best = SearchResult(
-                word=r["word"],
-                score=r.get("score", 1.0),
-                method=r.get("method", "exact"),
-                language=r.get("language"),
-            )
+        best = await get_search_service_client(service_url).find_best_match(
+            word, languages, semantic
+        )
+        if best:
             logger.debug(
                 f"✅ Remote best match for '{word}': '{best.word}' (score: {best.score:.3f})"
             )
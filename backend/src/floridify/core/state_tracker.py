@@ -1,19 +1,33 @@
-"""State tracking for pipeline operations with async event streaming."""
+"""State tracking for pipeline operations with async event streaming.
+
+Besides streaming progress, a ``StateTracker`` traces the pipeline: every
+change to one of its defined stages opens a top-level span (closing the
+previous one), and nested work such as provider fetches and AI calls is
+recorded under the active stage via ``record_span``. ``finish()`` feeds the
+spans into the per-stage latency histogram; ``get_trace()`` returns them for
+debug responses.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import time
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from typing import Any
 
 from pydantic import BaseModel, Field
 
 from ..utils.logging import get_logger
+from ..utils.metrics import PIPELINE_STAGE_SECONDS
 
 logger = get_logger(__name__)
 
+STATE_QUEUE_MAXSIZE = 100  # Buffered states when nobody consumes get_states()
+TRACE_MAX_SPANS = 256  # Spans kept per tracker; later ones are dropped
+
 
 class ProcessStage(BaseModel):
     """Dynamic stage definition with flexible progress mapping."""
@@ -320,6 +334,35 @@ class PipelineState(BaseModel):
         return result
 
 
+class TraceSpan(BaseModel):
+    """Timed pipeline stage, or a nested call made during one."""
+
+    name: str = Field(..., description="Stage name, or nested span (e.g. provider:wiktionary)")
+    parent: str | None = Field(None, description="Enclosing stage; None for top-level stages")
+    start_ms: float = Field(..., description="Start offset from the beginning of the trace")
+    duration_ms: float | None = Field(None, description="Elapsed time; None while still open")
+
+
+# Active (tracker, stage span) of the running pipeline; copied into tasks it spawns
+_active_span: ContextVar[tuple[StateTracker, TraceSpan] | None] = ContextVar(
+    "floridify_active_span", default=None
+)
+
+
+def record_span(name: str, started: float) -> None:
+    """Record a finished nested span under the active pipeline stage, if any.
+
+    Args:
+        name: Span name (e.g. ``provider:wiktionary``, ``ai:synthesize_definition``)
+        started: ``time.perf_counter()`` value taken when the work began
+
+    """
+    active = _active_span.get()
+    if active is not None:
+        tracker, parent = active
+        tracker._record_span(name, started, time.perf_counter(), parent.name)
+
+
 class StateTracker:
     """Tracks pipeline state and provides async event streaming."""
 
@@ -327,15 +370,17 @@ class StateTracker:
         self,
         category: str = "general",
         custom_stages: list[ProcessStage] | None = None,
+        tracing: bool = True,
     ) -> None:
         """Initialize the state tracker.
 
         Args:
             category: Process category (lookup, upload, image, etc.)
             custom_stages: Optional custom stage definitions
+            tracing: Record stage spans (False is the no-op fast mode)
 
         """
-        self._queue: asyncio.Queue[PipelineState] = asyncio.Queue()
+        self._queue: asyncio.Queue[PipelineState] = asyncio.Queue(maxsize=STATE_QUEUE_MAXSIZE)
         self._current_state: PipelineState | None = None
         self._subscribers: set[asyncio.Queue[PipelineState]] = set()
         self._category = category
@@ -344,6 +389,9 @@ class StateTracker:
         # Build progress map from stages
         self._progress_map = {stage.name: stage.progress for stage in self._stages}
 
+        self._tracing = tracing
+        self._reset_trace()
+
     async def update(
         self,
         stage: str,
@@ -378,27 +426,38 @@ class StateTracker:
 
         self._current_state = state
 
-        # Put state in main queue
-        await self._queue.put(state)
+        if self._tracing:
+            if is_complete or error is not None:
+                self.finish()
+            elif stage in self._progress_map and (
+                self._stage_span is None or self._stage_span.name != stage
+            ):
+                self._open_stage_span(stage)
+
+        # Put state in main queue (bounded: unread states are dropped oldest-first)
+        self._offer(self._queue, state)
 
         # Notify all subscribers
         for subscriber in self._subscribers:
+            self._offer(subscriber, state)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue[PipelineState], state: PipelineState) -> None:
+        """Non-blocking put that drops the oldest event when ``queue`` is full."""
+        try:
+            queue.put_nowait(state)
+        except asyncio.QueueFull:
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
             try:
-                # Non-blocking put to avoid deadlocks
-                subscriber.put_nowait(state)
+                queue.put_nowait(state)
             except asyncio.QueueFull:
-                # Drop oldest event and enqueue the new one to prevent data loss
-                try:
-                    subscriber.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
-                try:
-                    subscriber.put_nowait(state)
-                except asyncio.QueueFull:
-                    logger.warning(
-                        "Subscriber queue persistently full, dropping state update",
-                        extra={"stage": state.stage, "progress": state.progress},
-                    )
+                logger.warning(
+                    "State queue persistently full, dropping state update",
+                    extra={"stage": state.stage, "progress": state.progress},
+                )
 
     async def update_stage(self, stage: str, progress: int | None = None) -> None:
         """Optimized update for stage-only changes (most common case)."""
@@ -453,6 +512,7 @@ class StateTracker:
     def reset(self) -> None:
         """Reset the state tracker."""
         self._current_state = None
+        self._reset_trace()
         # Clear the queue
         while not self._queue.empty():
             try:
@@ -460,6 +520,76 @@ class StateTracker:
             except asyncio.QueueEmpty:
                 break
 
+    # ─── Tracing ──────────────────────────────────────────────────────
+
+    def _reset_trace(self) -> None:
+        self._trace_origin = time.perf_counter()
+        self._spans: list[TraceSpan] = []
+        self._stage_span: TraceSpan | None = None
+        self._observed_spans = 0
+
+    def _offset_ms(self, at: float) -> float:
+        return (at - self._trace_origin) * 1000
+
+    def _close_stage_span(self, at: float) -> None:
+        span = self._stage_span
+        if span is not None and span.duration_ms is None:
+            span.duration_ms = self._offset_ms(at) - span.start_ms
+        self._stage_span = None
+
+    def _open_stage_span(self, stage: str) -> None:
+        now = time.perf_counter()
+        self._close_stage_span(now)
+        span = TraceSpan(name=stage, start_ms=self._offset_ms(now))
+        if len(self._spans) < TRACE_MAX_SPANS:
+            self._spans.append(span)
+        self._stage_span = span
+        _active_span.set((self, span))
+
+    def _record_span(self, name: str, started: float, ended: float, parent: str) -> None:
+        if not self._tracing or len(self._spans) >= TRACE_MAX_SPANS:
+            return
+        start_ms = self._offset_ms(started)
+        self._spans.append(
+            TraceSpan(
+                name=name,
+                parent=parent,
+                start_ms=start_ms,
+                duration_ms=self._offset_ms(ended) - start_ms,
+            )
+        )
+
+    def disable_tracing(self) -> None:
+        """Switch to the no-op fast mode (e.g. once a lookup is served from cache).
+
+        The open stage is closed and kept in ``get_trace()``, but nothing recorded
+        by this tracker reaches the stage histograms.
+        """
+        if self._tracing:
+            self._close_stage_span(time.perf_counter())
+            self._tracing = False
+
+    def finish(self) -> None:
+        """Close the open stage and observe new spans in the stage latency histogram.
+
+        Called on completion or error; safe to call more than once.
+        """
+        if not self._tracing:
+            return
+        self._close_stage_span(time.perf_counter())
+        for span in self._spans[self._observed_spans :]:
+            if span.duration_ms is not None:
+                PIPELINE_STAGE_SECONDS.observe(span.duration_ms / 1000, self._category, span.name)
+        self._observed_spans = len(self._spans)
+
+        active = _active_span.get()
+        if active is not None and active[0] is self:
+            _active_span.set(None)
+
+    def get_trace(self) -> list[TraceSpan]:
+        """Recorded spans in start order (stages top-level, nested calls under them)."""
+        return [span.model_copy() for span in self._spans]
+
     def get_stage_definitions(self) -> list[ProcessStage]:
         """Get the stage definitions for this tracker."""
         return self._stages.copy()
@@ -0,0 +1,733 @@
+"""Memory-mapped columnar storage for corpus vocabulary and index maps.
+
+A loaded ``Corpus`` otherwise holds its vocabularies as Python lists and its
+index maps as ``dict[int, list[int]]`` — hundreds of MB of objects per worker
+for a 1M-word language corpus. This module writes those fields once to a
+compact columnar layout and maps it back read-only with ``np.load(mmap_mode="r")``
+so every uvicorn worker and the search service share the same page-cache pages:
+
+- string columns: concatenated UTF-8 blob + ``int64`` offset array, plus an
+  ``int32`` sort permutation for O(log n) text -> index lookups
+- one-to-many maps: CSR (``int64`` indptr + ``int32`` indices)
+- word -> lemma map: dense ``int32`` array (``-1`` = unmapped)
+
+The trigram candidate index is persisted alongside, keyed by a digest of the
+vocabulary: one contiguous postings buffer plus a trigram offset table, so a
+cold start maps it instead of rebuilding it.
+
+The view classes implement the ``Sequence``/``Mapping`` protocols the rest of
+the codebase already uses on these fields, so ``Corpus`` accessors work over
+them unchanged. Views pickle as plain lists/dicts. The incremental update
+path (``Corpus.add_words``/``remove_words``) reuses the CSR and dense views
+over in-memory arrays, so an edit is a few vectorized array ops instead of a
+rebuild of every dict.
+
+The remaining (small) corpus fields are written next to the columns, and each
+process keeps one ``SharedCorpus`` handle per corpus version. Once the columns
+exist, loading a corpus builds it from that handle without fetching or
+validating the full content dict.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, overload
+
+import numpy as np
+
+from ..search.fuzzy.candidates import (
+    LengthBuckets,
+    TrigramIndex,
+    pack_candidate_index,
+    unpack_candidate_index,
+)
+from ..utils.logging import get_logger
+from ..utils.paths import get_cache_directory
+from .utils import get_vocabulary_hash
+
+if TYPE_CHECKING:
+    from .core import Corpus
+
+logger = get_logger(__name__)
+
+# Share loaded corpora through memory-mapped columns (disable to keep plain lists/dicts)
+CORPUS_MMAP_ENABLED = os.getenv("FLORIDIFY_CORPUS_MMAP", "true").lower() in ("true", "1", "yes")
+# Below this size the Python objects are cheap and the mmap indirection isn't worth it
+CORPUS_MMAP_MIN_VOCABULARY = int(os.getenv("FLORIDIFY_CORPUS_MMAP_MIN_VOCABULARY", "50000"))
+
+COLUMNAR_FORMAT_VERSION = 2
+
+# Corpus fields backed by columnar views
+COLUMNAR_FIELDS = (
+    "vocabulary",
+    "original_vocabulary",
+    "vocabulary_to_index",
+    "normalized_to_original_indices",
+    "lemmatized_vocabulary",
+    "lemma_text_to_index",
+    "word_to_lemma_indices",
+    "lemma_to_word_indices",
+)
+
+_MARKER = "COMPLETE"
+_FIELDS_FILE = "fields.json"
+
+# Strings decoded per blob read when iterating a column
+_ITER_CHUNK = 4096
+
+_CANDIDATE_ARRAYS = (
+    "trigram_keys",
+    "trigram_offsets",
+    "postings",
+    "bucket_lengths",
+    "bucket_offsets",
+    "bucket_indices",
+)
+
+
+class StringColumn(Sequence[str]):
+    """Read-only ``list[str]`` view over a UTF-8 blob + offset array."""
+
+    __slots__ = ("_blob", "_offsets")
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray) -> None:
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(len(self)))]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("StringColumn index out of range")
+        return self._get(index)
+
+    def _get(self, index: int) -> str:
+        start, end = int(self._offsets[index]), int(self._offsets[index + 1])
+        return self._blob[start:end].tobytes().decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        # Decode chunk by chunk so a full pass never holds a copy of the whole blob
+        blob, offsets, n = self._blob, self._offsets, len(self)
+        for start in range(0, n, _ITER_CHUNK):
+            stop = min(start + _ITER_CHUNK, n)
+            bounds = offsets[start : stop + 1].tolist()
+            base = bounds[0]
+            data = blob[base : bounds[-1]].tobytes()
+            for i in range(stop - start):
+                yield data[bounds[i] - base : bounds[i + 1] - base].decode("utf-8")
+
+    def tolist(self) -> list[str]:
+        """Decode every string (one pass over the blob)."""
+        data = self._blob.tobytes()
+        offsets = self._offsets.tolist()
+        return [data[offsets[i] : offsets[i + 1]].decode("utf-8") for i in range(len(self))]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (list, (self.tolist(),))
+
+    def __repr__(self) -> str:
+        return f"StringColumn(len={len(self)})"
+
+
+class StringIndexMap(Mapping[str, int]):
+    """Read-only ``dict[str, int]`` view mapping a string column's values to positions.
+
+    Lookups bisect an ``int32`` permutation that orders the column by text.
+    """
+
+    __slots__ = ("_column", "_order")
+
+    def __init__(self, column: StringColumn, order: np.ndarray) -> None:
+        self._column = column
+        self._order = order
+
+    def get(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        if not isinstance(key, str):
+            return default
+        order = self._order
+        pos = bisect_left(order, key, key=lambda i: self._column._get(int(i)))
+        if pos < len(order):
+            index = int(order[pos])
+            if self._column._get(index) == key:
+                return index
+        return default
+
+    def __getitem__(self, key: str) -> int:
+        index = self.get(key)
+        if index is None:
+            raise KeyError(key)
+        return index
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._column)
+
+    def __len__(self) -> int:
+        return len(self._column)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (dict(zip(self._column.tolist(), range(len(self._column)))),))
+
+    def __repr__(self) -> str:
+        return f"StringIndexMap(len={len(self)})"
+
+
+class SortedIndexMap(Mapping[str, int]):
+    """Read-only ``dict[str, int]`` view mapping a sorted word list's values to positions.
+
+    Lookups bisect the list itself, so splicing words in or out of the list
+    needs no index maintenance.
+    """
+
+    __slots__ = ("_words",)
+
+    def __init__(self, words: Sequence[str]) -> None:
+        self._words = words
+
+    def get(self, key: str, default: Any = None) -> Any:  # type: ignore[override]
+        if not isinstance(key, str):
+            return default
+        pos = bisect_left(self._words, key)
+        if pos < len(self._words) and self._words[pos] == key:
+            return pos
+        return default
+
+    def __getitem__(self, key: str) -> int:
+        index = self.get(key)
+        if index is None:
+            raise KeyError(key)
+        return index
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._words)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (dict(zip(self._words, range(len(self._words)))),))
+
+    def __repr__(self) -> str:
+        return f"SortedIndexMap(len={len(self)})"
+
+
+class CSRMap(Mapping[int, list[int]]):
+    """Read-only ``dict[int, list[int]]`` view over CSR arrays.
+
+    Rows with no entries are treated as absent keys, matching the dicts this
+    replaces (which only held keys that had at least one value).
+    """
+
+    __slots__ = ("_indptr", "_indices", "_len")
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray) -> None:
+        self._indptr = indptr
+        self._indices = indices
+        self._len: int | None = None
+
+    def _row(self, key: int) -> tuple[int, int] | None:
+        if not isinstance(key, (int, np.integer)) or not 0 <= key < len(self._indptr) - 1:
+            return None
+        start, end = int(self._indptr[key]), int(self._indptr[key + 1])
+        return (start, end) if end > start else None
+
+    def get(self, key: int, default: Any = None) -> Any:  # type: ignore[override]
+        row = self._row(key)
+        return self._indices[row[0] : row[1]].tolist() if row else default
+
+    def __getitem__(self, key: int) -> list[int]:
+        row = self._row(key)
+        if row is None:
+            raise KeyError(key)
+        return self._indices[row[0] : row[1]].tolist()
+
+    def __contains__(self, key: object) -> bool:
+        return self._row(key) is not None  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(np.flatnonzero(np.diff(self._indptr)).tolist())
+
+    def __len__(self) -> int:
+        if self._len is None:
+            self._len = int(np.count_nonzero(np.diff(self._indptr)))
+        return self._len
+
+    def todict(self) -> dict[int, list[int]]:
+        indptr = self._indptr.tolist()
+        indices = self._indices.tolist()
+        return {
+            row: indices[indptr[row] : indptr[row + 1]]
+            for row in range(len(indptr) - 1)
+            if indptr[row + 1] > indptr[row]
+        }
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (self.todict(),))
+
+    def __repr__(self) -> str:
+        return f"CSRMap(len={len(self)})"
+
+
+class DenseIndexMap(Mapping[int, int]):
+    """Read-only ``dict[int, int]`` view over a dense ``int32`` array (``-1`` = absent)."""
+
+    __slots__ = ("_values", "_len")
+
+    def __init__(self, values: np.ndarray) -> None:
+        self._values = values
+        self._len: int | None = None
+
+    def get(self, key: int, default: Any = None) -> Any:  # type: ignore[override]
+        if not isinstance(key, (int, np.integer)) or not 0 <= key < len(self._values):
+            return default
+        value = int(self._values[key])
+        return value if value >= 0 else default
+
+    def __getitem__(self, key: int) -> int:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None  # type: ignore[arg-type]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(np.flatnonzero(self._values >= 0).tolist())
+
+    def __len__(self) -> int:
+        if self._len is None:
+            self._len = int(np.count_nonzero(self._values >= 0))
+        return self._len
+
+    def todict(self) -> dict[int, int]:
+        return {i: v for i, v in enumerate(self._values.tolist()) if v >= 0}
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (dict, (self.todict(),))
+
+    def __repr__(self) -> str:
+        return f"DenseIndexMap(len={len(self)})"
+
+
+def is_columnar(value: Any) -> bool:
+    """Check whether a corpus field value is a memory-mapped view."""
+    return isinstance(value, (StringColumn, StringIndexMap, CSRMap, DenseIndexMap))
+
+
+def materialize(value: Any) -> Any:
+    """Convert a columnar view back into the plain list/dict it stands in for."""
+    if isinstance(value, StringColumn):
+        return value.tolist()
+    if isinstance(value, StringIndexMap):
+        return dict(zip(value._column.tolist(), range(len(value))))
+    if isinstance(value, SortedIndexMap):
+        return dict(zip(value._words, range(len(value))))
+    if isinstance(value, (CSRMap, DenseIndexMap)):
+        return value.todict()
+    return value
+
+
+# ── Encoding ──────────────────────────────────────────────────────────
+
+
+def _encode_strings(words: Iterable[str]) -> tuple[np.ndarray, np.ndarray]:
+    encoded = [w.encode("utf-8") for w in words]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded)), out=offsets[1:])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return blob, offsets
+
+
+def _sort_order(words: Sequence[str]) -> np.ndarray:
+    return np.array(sorted(range(len(words)), key=words.__getitem__), dtype=np.int32)
+
+
+def _encode_csr(mapping: Mapping[int, Sequence[int]], rows: int) -> tuple[np.ndarray, np.ndarray]:
+    counts = np.zeros(rows, dtype=np.int64)
+    for key, values in mapping.items():
+        if 0 <= key < rows:
+            counts[key] = len(values)
+    indptr = np.zeros(rows + 1, dtype=np.int64)
+    np.cumsum(counts, out=indptr[1:])
+    indices = np.empty(int(indptr[-1]), dtype=np.int32)
+    for key, values in mapping.items():
+        if 0 <= key < rows and values:
+            indices[indptr[key] : indptr[key + 1]] = values
+    return indptr, indices
+
+
+def _encode_dense(mapping: Mapping[int, int], rows: int) -> np.ndarray:
+    values = np.full(rows, -1, dtype=np.int32)
+    for key, value in mapping.items():
+        if 0 <= key < rows:
+            values[key] = value
+    return values
+
+
+def as_csr(mapping: Mapping[int, Sequence[int]], rows: int) -> tuple[np.ndarray, np.ndarray]:
+    """CSR ``(indptr, indices)`` arrays for a one-to-many map.
+
+    A ``CSRMap`` hands back its own arrays; anything else is encoded once.
+    """
+    if isinstance(mapping, CSRMap) and len(mapping._indptr) == rows + 1:
+        return mapping._indptr, mapping._indices
+    return _encode_csr(mapping, rows)
+
+
+def as_dense(mapping: Mapping[int, int], rows: int) -> np.ndarray:
+    """Dense ``int32`` array (``-1`` = absent) for an int -> int map.
+
+    A ``DenseIndexMap`` hands back its own array; anything else is encoded once.
+    """
+    if isinstance(mapping, DenseIndexMap) and len(mapping._values) == rows:
+        return mapping._values
+    return _encode_dense(mapping, rows)
+
+
+def _corpus_arrays(corpus: Corpus) -> dict[str, np.ndarray]:
+    vocabulary = list(corpus.vocabulary)
+    lemmas = list(corpus.lemmatized_vocabulary)
+    vocab_blob, vocab_offsets = _encode_strings(vocabulary)
+    original_blob, original_offsets = _encode_strings(corpus.original_vocabulary)
+    lemma_blob, lemma_offsets = _encode_strings(lemmas)
+    n2o_indptr, n2o_indices = _encode_csr(corpus.normalized_to_original_indices, len(vocabulary))
+    l2w_indptr, l2w_indices = _encode_csr(corpus.lemma_to_word_indices, len(lemmas))
+    return {
+        "vocab_blob": vocab_blob,
+        "vocab_offsets": vocab_offsets,
+        "vocab_order": _sort_order(vocabulary),
+        "original_blob": original_blob,
+        "original_offsets": original_offsets,
+        "n2o_indptr": n2o_indptr,
+        "n2o_indices": n2o_indices,
+        "lemma_blob": lemma_blob,
+        "lemma_offsets": lemma_offsets,
+        "lemma_order": _sort_order(lemmas),
+        "word_to_lemma": _encode_dense(corpus.word_to_lemma_indices, len(vocabulary)),
+        "l2w_indptr": l2w_indptr,
+        "l2w_indices": l2w_indices,
+    }
+
+
+# ── On-disk layout ────────────────────────────────────────────────────
+
+
+def get_columnar_directory(key: str) -> Path:
+    """Directory holding the columnar files for a corpus content hash."""
+    return get_cache_directory("corpus_columnar") / f"v{COLUMNAR_FORMAT_VERSION}-{key}"
+
+
+def _write_arrays(
+    directory: Path,
+    arrays: dict[str, np.ndarray],
+    extra_files: dict[str, str] | None = None,
+) -> Path:
+    """Atomically write named arrays (and small text files) as a column directory.
+
+    Files are written to a sibling temp directory and renamed into place, so
+    concurrent workers racing on the same key either see a complete directory
+    or none at all.
+    """
+    if (directory / _MARKER).exists():
+        return directory
+
+    directory.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(prefix=f".{directory.name}-", dir=directory.parent))
+    try:
+        for name, array in arrays.items():
+            np.save(tmp_dir / f"{name}.npy", array, allow_pickle=False)
+        for name, text in (extra_files or {}).items():
+            (tmp_dir / name).write_text(text)
+        (tmp_dir / _MARKER).touch()
+        try:
+            os.replace(tmp_dir, directory)
+        except OSError:
+            # Another worker finished first — its copy is identical
+            if not (directory / _MARKER).exists():
+                raise
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return directory
+
+
+def _open_array(directory: Path, name: str) -> np.ndarray:
+    return np.load(directory / f"{name}.npy", mmap_mode="r", allow_pickle=False)
+
+
+def write_columnar(corpus: Corpus, directory: Path) -> Path:
+    """Write a corpus's vocabulary and index maps as columnar ``.npy`` files.
+
+    Args:
+        corpus: Corpus whose fields to encode
+        directory: Final directory for the column files
+
+    Returns:
+        The directory containing the column files
+
+    """
+    if (directory / _MARKER).exists():
+        return directory
+    fields = corpus.model_dump(mode="json", exclude=set(COLUMNAR_FIELDS))
+    _write_arrays(directory, _corpus_arrays(corpus), {_FIELDS_FILE: json.dumps(fields)})
+    logger.debug(f"Wrote columnar corpus {corpus.corpus_name} to {directory}")
+    return directory
+
+
+class SharedCorpus:
+    """Process-wide handle on one corpus version's columnar directory.
+
+    Holds the read-only views (one set of memmaps per process, however many
+    ``Corpus`` objects use them) and the small non-columnar fields, so a corpus
+    can be rebuilt without its content dict.
+    """
+
+    __slots__ = ("directory", "fields", "views")
+
+    def __init__(self, directory: Path) -> None:
+        if not (directory / _MARKER).exists():
+            raise FileNotFoundError(f"No complete columnar corpus at {directory}")
+
+        def load(name: str) -> np.ndarray:
+            return _open_array(directory, name)
+
+        vocabulary = StringColumn(load("vocab_blob"), load("vocab_offsets"))
+        lemmas = StringColumn(load("lemma_blob"), load("lemma_offsets"))
+        self.directory = directory
+        self.views: dict[str, Any] = {
+            "vocabulary": vocabulary,
+            "original_vocabulary": StringColumn(load("original_blob"), load("original_offsets")),
+            "vocabulary_to_index": StringIndexMap(vocabulary, load("vocab_order")),
+            "normalized_to_original_indices": CSRMap(load("n2o_indptr"), load("n2o_indices")),
+            "lemmatized_vocabulary": lemmas,
+            "lemma_text_to_index": StringIndexMap(lemmas, load("lemma_order")),
+            "word_to_lemma_indices": DenseIndexMap(load("word_to_lemma")),
+            "lemma_to_word_indices": CSRMap(load("l2w_indptr"), load("l2w_indices")),
+        }
+        fields_path = directory / _FIELDS_FILE
+        self.fields: dict[str, Any] = (
+            json.loads(fields_path.read_text()) if fields_path.exists() else {}
+        )
+
+    def to_corpus(self, **overrides: Any) -> Corpus:
+        """Build a ``Corpus`` over the shared views.
+
+        Only the small fields go through validation; the views are attached as-is.
+
+        Args:
+            **overrides: Field values taking precedence over the stored fields
+
+        Returns:
+            Corpus backed by the shared columns
+
+        """
+        from .core import Corpus
+
+        corpus = Corpus.model_validate({**self.fields, **overrides, "vocabulary": []})
+        corpus.attach_columnar(self.directory)
+        if not corpus.vocabulary_hash:
+            corpus.vocabulary_hash = get_vocabulary_hash(list(corpus.vocabulary))
+        return corpus
+
+
+_shared: dict[Path, SharedCorpus] = {}
+_shared_lock = threading.Lock()
+
+
+def _shared_handle(directory: Path) -> SharedCorpus:
+    with _shared_lock:
+        handle = _shared.get(directory)
+        if handle is None:
+            handle = _shared[directory] = SharedCorpus(directory)
+        return handle
+
+
+def open_columnar(directory: Path) -> dict[str, Any]:
+    """Memory-map a columnar directory into ``Corpus`` field views.
+
+    Views are opened once per process and directory, then reused.
+
+    Args:
+        directory: Directory written by ``write_columnar``
+
+    Returns:
+        Mapping of ``Corpus`` field name -> read-only view
+
+    Raises:
+        FileNotFoundError: If the directory is missing or incomplete
+
+    """
+    return dict(_shared_handle(directory).views)
+
+
+def get_shared_corpus(data_hash: str | None) -> SharedCorpus | None:
+    """Look up the shared columns for a corpus version, if they were written.
+
+    Args:
+        data_hash: Content hash of the corpus version (``version_info.data_hash``)
+
+    Returns:
+        The process-wide handle, or None when disabled or not yet written
+
+    """
+    if not CORPUS_MMAP_ENABLED or not data_hash:
+        return None
+    directory = get_columnar_directory(data_hash[:32])
+    if not (directory / _MARKER).exists():
+        return None
+    try:
+        return _shared_handle(directory)
+    except Exception as e:
+        logger.warning(f"Failed to open shared corpus columns at {directory}: {e}")
+        return None
+
+
+def share_corpus(corpus: Corpus) -> Corpus:
+    """Swap a loaded corpus's heavy fields for shared memory-mapped views.
+
+    The first process to load a given corpus version writes the columns; every
+    later load (in any process) is built from them by ``get_shared_corpus``.
+    No-op when disabled, when the corpus is small, or when it has no content
+    hash to key the files by.
+
+    Args:
+        corpus: Freshly loaded corpus
+
+    Returns:
+        The same corpus, with columnar fields attached when applicable
+
+    """
+    if (
+        not CORPUS_MMAP_ENABLED
+        or len(corpus.vocabulary) < CORPUS_MMAP_MIN_VOCABULARY
+        or not corpus.version_info
+        or not corpus.version_info.data_hash
+    ):
+        return corpus
+
+    directory = get_columnar_directory(corpus.version_info.data_hash[:32])
+    try:
+        write_columnar(corpus, directory)
+        corpus.attach_columnar(directory)
+    except Exception as e:
+        logger.warning(f"Falling back to in-memory corpus for {corpus.corpus_name}: {e}")
+    return corpus
+
+
+# ── Persisted candidate index ─────────────────────────────────────────
+
+
+def vocabulary_digest(vocabulary: Sequence[str]) -> str:
+    """Full-content digest of a vocabulary.
+
+    ``vocabulary_hash`` only samples the vocabulary (and can lag behind edits
+    made outside ``Corpus``), so persisted indices are keyed by this instead.
+    """
+    return hashlib.blake2b("\n".join(vocabulary).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get_candidate_index_directory(digest: str) -> Path:
+    """Directory holding the packed trigram candidate index for a vocabulary digest."""
+    return (
+        get_cache_directory("corpus_columnar") / f"candidates-v{COLUMNAR_FORMAT_VERSION}-{digest}"
+    )
+
+
+def load_candidate_index(
+    vocabulary: Sequence[str],
+) -> tuple[TrigramIndex, LengthBuckets] | None:
+    """Map the persisted candidate index for a vocabulary, if one exists.
+
+    Args:
+        vocabulary: Normalized vocabulary the index was built from
+
+    Returns:
+        Memory-mapped (trigram_index, length_buckets), or None when absent or disabled
+
+    """
+    if not CORPUS_MMAP_ENABLED or len(vocabulary) < CORPUS_MMAP_MIN_VOCABULARY:
+        return None
+
+    directory = get_candidate_index_directory(vocabulary_digest(vocabulary))
+    if not (directory / _MARKER).exists():
+        return None
+
+    try:
+        arrays = {name: _open_array(directory, name) for name in _CANDIDATE_ARRAYS}
+        return unpack_candidate_index(arrays)
+    except Exception as e:
+        logger.warning(f"Failed to load candidate index from {directory}: {e}")
+        return None
+
+
+def store_candidate_index(
+    vocabulary: Sequence[str],
+    trigram_index: TrigramIndex,
+    length_buckets: LengthBuckets,
+) -> None:
+    """Persist a candidate index keyed by its vocabulary's digest.
+
+    Args:
+        vocabulary: Normalized vocabulary the index was built from
+        trigram_index: Index from build_candidate_index
+        length_buckets: Buckets from build_candidate_index
+
+    """
+    if not CORPUS_MMAP_ENABLED or len(vocabulary) < CORPUS_MMAP_MIN_VOCABULARY:
+        return
+
+    directory = get_candidate_index_directory(vocabulary_digest(vocabulary))
+    try:
+        _write_arrays(directory, pack_candidate_index(trigram_index, length_buckets))
+        logger.debug(f"Persisted candidate index to {directory}")
+    except Exception as e:
+        logger.warning(f"Failed to persist candidate index to {directory}: {e}")
+
+
+__all__ = [
+    "COLUMNAR_FIELDS",
+    "CSRMap",
+    "DenseIndexMap",
+    "SharedCorpus",
+    "SortedIndexMap",
+    "StringColumn",
+    "StringIndexMap",
+    "as_csr",
+    "as_dense",
+    "get_candidate_index_directory",
+    "get_columnar_directory",
+    "get_shared_corpus",
+    "is_columnar",
+    "load_candidate_index",
+    "materialize",
+    "open_columnar",
+    "share_corpus",
+    "store_candidate_index",
+    "vocabulary_digest",
+    "write_columnar",
+]
@@ -5,15 +5,23 @@ Contains the actual vocabulary processing and storage logic and base corpus sour
 
 from __future__ import annotations
 
+import threading
 import time
 import unicodedata
 from datetime import datetime
+from pathlib import Path
 from typing import Any, ClassVar
 
 import coolname
 import numpy as np
 from beanie import PydanticObjectId
-from pydantic import BaseModel, Field, field_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    SerializerFunctionWrapHandler,
+    field_serializer,
+    field_validator,
+)
 
 from ..caching.manager import get_version_manager
 from ..caching.models import (
@@ -28,22 +36,39 @@ from ..search.fuzzy.candidates import (
     build_candidate_index,
     get_candidates,
     get_substring_candidates,
+    update_candidate_index,
     word_trigrams,
 )
 from ..text.normalize import batch_normalize
 from ..utils.logging import get_logger
+from .columnar import (
+    COLUMNAR_FIELDS,
+    SortedIndexMap,
+    is_columnar,
+    load_candidate_index,
+    materialize,
+    open_columnar,
+    store_candidate_index,
+)
 from .models import CorpusType
 from .utils import get_vocabulary_hash
 from .vocabulary import (
+    add_original_indices,
     create_lemmatization_maps,
-    filter_words,
-    merge_words,
+    delete_indices,
+    insert_words,
     normalize_vocabulary,
     rebuild_original_indices,
+    remap_original_indices,
+    update_lemmatization_maps,
 )
 
 logger = get_logger(__name__)
 
+# Serializes publishing a (vocabulary, trigram index, length buckets) snapshot;
+# lookups on the search thread pool read a published snapshot without it.
+_candidate_view_lock = threading.Lock()
+
 
 class Corpus(BaseModel):
     """Represents a corpus of vocabulary with semantic and search capabilities.
@@ -77,7 +102,9 @@ class Corpus(BaseModel):
             return Language(v)  # Convert string to enum
         return v
 
-    # Core vocabulary data - sorted normalized vocabulary
+    # Core vocabulary data - sorted normalized vocabulary.
+    # Loaded corpora may hold read-only memory-mapped views in place of the
+    # list/dict fields below (see corpus.columnar); they serialize as plain values.
     vocabulary: list[str]
     original_vocabulary: list[str] = Field(
         default_factory=list,
@@ -94,9 +121,10 @@ class Corpus(BaseModel):
     word_to_lemma_indices: dict[int, int] = Field(default_factory=dict)
     lemma_to_word_indices: dict[int, list[int]] = Field(default_factory=dict)
 
-    # Trigram inverted index for fuzzy candidate selection (transient, rebuilt on load).
+    # Trigram inverted index for fuzzy candidate selection (not serialized with the corpus).
     # Typed as Any to accept both numpy arrays (runtime) and plain lists (from old cached data).
-    # Always rebuilt via _build_candidate_index() after load.
+    # Mapped from the on-disk copy keyed by a vocabulary digest (see corpus.columnar), or built
+    # lazily on first candidate lookup via _ensure_candidate_index().
     trigram_index: Any = Field(default_factory=dict, exclude=True)
     length_buckets: Any = Field(default_factory=dict, exclude=True)
 
@@ -132,6 +160,8 @@ class Corpus(BaseModel):
     # Version tracking (populated from metadata when loaded)
     version_info: VersionInfo | None = None
     _metadata_id: PydanticObjectId | None = None  # Internal reference to metadata document
+    # (vocabulary, trigram_index, length_buckets) as one reference for candidate lookups
+    _candidate_view: tuple[list[str], Any, Any] | None = None
 
     model_config = {
         "arbitrary_types_allowed": True,
@@ -185,6 +215,11 @@ class Corpus(BaseModel):
         # Storage configuration
         content_location: ContentLocation | None = None
 
+    @field_serializer(*COLUMNAR_FIELDS, mode="wrap")
+    def _serialize_columnar(self, value: Any, handler: SerializerFunctionWrapHandler) -> Any:
+        """Serialize memory-mapped views as the plain lists/dicts they stand in for."""
+        return handler(materialize(value))
+
     def model_post_init(self, __context: Any) -> None:
         """Post-initialization to inject slug name and compute vocabulary_hash."""
         super().model_post_init(__context)
@@ -329,9 +364,89 @@ class Corpus(BaseModel):
             self.lemma_to_word_indices,
         ) = create_lemmatization_maps(self.vocabulary)
 
+    async def _prepare_incremental_update(self) -> None:
+        """Bring derived maps in line with the vocabulary before a delta update.
+
+        Memory-mapped word lists are copied into mutable lists and maps that
+        older cached versions didn't persist are rebuilt, once; the index maps
+        themselves are converted to array-backed views by the first edit.
+        """
+        for name in ("vocabulary", "original_vocabulary", "lemmatized_vocabulary"):
+            setattr(self, name, materialize(getattr(self, name)))
+        self.lemma_text_to_index = materialize(self.lemma_text_to_index)
+        self.vocabulary_to_index = SortedIndexMap(self.vocabulary)
+        if self.original_vocabulary and not self.normalized_to_original_indices:
+            self.normalized_to_original_indices = rebuild_original_indices(
+                self.vocabulary, self.original_vocabulary, self.vocabulary_to_index
+            )
+        if self.vocabulary and not self.lemmatized_vocabulary:
+            await self._create_unified_indices()
+        if self.vocabulary and not (isinstance(self.trigram_index, dict) and self.trigram_index):
+            self._build_candidate_index()
+
+    def _apply_vocabulary_delta(
+        self,
+        vocabulary: list[str],
+        remap: np.ndarray,
+        added_words: list[str] | None = None,
+        added_indices: np.ndarray | None = None,
+        original_remap: np.ndarray | None = None,
+        removed_words: list[str] | None = None,
+    ) -> None:
+        """Patch every index-keyed structure for an edited vocabulary.
+
+        Args:
+            vocabulary: New sorted vocabulary
+            remap: Old word index -> new index (``-1`` = removed)
+            added_words: Words inserted into the vocabulary
+            added_indices: New index of each added word
+            original_remap: Old original index -> new index, when originals were dropped
+            removed_words: Words removed from the vocabulary
+
+        """
+        self.vocabulary_to_index = SortedIndexMap(vocabulary)
+        self.normalized_to_original_indices = remap_original_indices(
+            self.normalized_to_original_indices, remap, len(vocabulary), original_remap
+        )
+
+        (
+            self.lemmatized_vocabulary,
+            self.lemma_text_to_index,
+            self.word_to_lemma_indices,
+            self.lemma_to_word_indices,
+        ) = update_lemmatization_maps(
+            self.lemmatized_vocabulary,
+            self.lemma_text_to_index,
+            self.word_to_lemma_indices,
+            self.lemma_to_word_indices,
+            remap,
+            len(vocabulary),
+            added_words,
+            added_indices,
+        )
+        # The old index is left intact for lookups still reading it; the new
+        # vocabulary and index are published together.
+        trigram_index, length_buckets = update_candidate_index(
+            self.trigram_index,
+            self.length_buckets,
+            remap,
+            added_words,
+            added_indices,
+            removed_words,
+        )
+        with _candidate_view_lock:
+            self.vocabulary = vocabulary
+            self.trigram_index, self.length_buckets = trigram_index, length_buckets
+            self._candidate_view = (vocabulary, trigram_index, length_buckets)
+
+        self.vocabulary_hash = get_vocabulary_hash(self.vocabulary, is_sorted=True)
+
     async def add_words(self, words: list[str]) -> int:
         """Add words to the corpus incrementally.
 
+        Only the new words are normalized and lemmatized; existing index maps
+        and the candidate index are remapped rather than rebuilt.
+
         Args:
             words: List of words to add
 
@@ -344,14 +459,26 @@ class Corpus(BaseModel):
 
         logger.info(f"Adding {len(words)} words to corpus {self.corpus_name}")
 
+        await self._prepare_incremental_update()
         original_unique_count = len(self.vocabulary)
 
-        # Add to original_vocabulary
-        self.original_vocabulary.extend(words)
+        # Splice new normalized words into the sorted vocabulary
+        normalized_new = batch_normalize(words)
+        vocabulary, remap, added, added_indices = insert_words(
+            self.vocabulary, self.vocabulary_to_index, normalized_new
+        )
+        self._apply_vocabulary_delta(vocabulary, remap, added, added_indices)
 
-        # Merge and rebuild
-        self.vocabulary, normalized_new = merge_words(self.vocabulary, words)
-        await self._rebuild_indices()
+        # Append originals and map them to their normalized entries
+        offset = len(self.original_vocabulary)
+        self.original_vocabulary.extend(words)
+        self.normalized_to_original_indices = add_original_indices(
+            self.normalized_to_original_indices,
+            self.original_vocabulary,
+            normalized_new,
+            offset,
+            self.vocabulary_to_index,
+        )
 
         # Update word frequencies
         for word in normalized_new:
@@ -373,6 +500,9 @@ class Corpus(BaseModel):
     async def remove_words(self, words: list[str]) -> int:
         """Remove words from the corpus incrementally.
 
+        Removed entries are dropped from each index map and the remaining
+        indices remapped; nothing is re-normalized or re-lemmatized.
+
         Args:
             words: List of words to remove
 
@@ -385,16 +515,29 @@ class Corpus(BaseModel):
 
         logger.info(f"Removing {len(words)} words from corpus {self.corpus_name}")
 
+        await self._prepare_incremental_update()
         original_unique_count = len(self.vocabulary)
 
-        # Filter both vocabularies and rebuild
-        self.vocabulary, self.original_vocabulary = filter_words(
-            self.vocabulary, self.original_vocabulary, words
-        )
-        await self._rebuild_indices()
+        normalized_remove = set(batch_normalize(words))
+        removed_words = [word for word in normalized_remove if word in self.vocabulary_to_index]
+        removed_indices = [self.vocabulary_to_index[word] for word in removed_words]
+
+        if removed_indices:
+            # Originals go with their normalized entry
+            removed_originals = [
+                orig_idx
+                for idx in removed_indices
+                for orig_idx in self.normalized_to_original_indices.get(idx, ())
+            ]
+            self.original_vocabulary, original_remap = delete_indices(
+                self.original_vocabulary, removed_originals
+            )
+            vocabulary, remap = delete_indices(self.vocabulary, removed_indices)
+            self._apply_vocabulary_delta(
+                vocabulary, remap, original_remap=original_remap, removed_words=removed_words
+            )
 
         # Remove from word frequencies
-        normalized_remove = set(batch_normalize(words))
         for word in normalized_remove:
             self.word_frequencies.pop(word, None)
 
@@ -411,6 +554,22 @@ class Corpus(BaseModel):
 
         return removed_count
 
+    @property
+    def is_columnar(self) -> bool:
+        """Whether vocabulary and index maps are memory-mapped views."""
+        return is_columnar(self.vocabulary)
+
+    def attach_columnar(self, directory: Path) -> None:
+        """Replace vocabulary and index maps with read-only memory-mapped views.
+
+        Args:
+            directory: Directory written by ``corpus.columnar.write_columnar``
+
+        """
+        for name, view in open_columnar(directory).items():
+            setattr(self, name, view)
+        logger.debug(f"Attached columnar storage for corpus {self.corpus_name}")
+
     def get_word_by_index(self, index: int) -> str | None:
         """Get a word by its index in the normalized vocabulary."""
         return self.vocabulary[index] if 0 <= index < len(self.vocabulary) else None
@@ -479,12 +638,13 @@ class Corpus(BaseModel):
             List of vocabulary indices
 
         """
+        vocabulary, trigram_index, length_buckets = self._candidate_snapshot()
         return get_candidates(
             query=query,
-            vocabulary=self.vocabulary,
+            vocabulary=vocabulary,
             vocabulary_to_index=self.vocabulary_to_index,
-            trigram_index=self.trigram_index,
-            length_buckets=self.length_buckets,
+            trigram_index=trigram_index,
+            length_buckets=length_buckets,
             lemma_text_to_index=self.lemma_text_to_index if use_lemmas else None,
             lemma_to_word_indices=self.lemma_to_word_indices if use_lemmas else None,
             max_results=max_results,
@@ -510,19 +670,65 @@ class Corpus(BaseModel):
             List of vocabulary indices containing the query as a substring
 
         """
+        vocabulary, trigram_index, _ = self._candidate_snapshot()
         return get_substring_candidates(
             query=query,
-            vocabulary=self.vocabulary,
-            trigram_index=self.trigram_index,
+            vocabulary=vocabulary,
+            trigram_index=trigram_index,
             max_results=max_results,
         )
 
+    def get_substring_matches(self, query: str, max_results: int = 50) -> list[str]:
+        """Normalized words containing ``query``, resolved against the same snapshot.
+
+        Safe to call while another thread applies ``add_words``/``remove_words``:
+        indices are never looked up in a vocabulary they weren't computed for.
+        """
+        vocabulary, trigram_index, _ = self._candidate_snapshot()
+        return [
+            vocabulary[idx]
+            for idx in get_substring_candidates(
+                query=query,
+                vocabulary=vocabulary,
+                trigram_index=trigram_index,
+                max_results=max_results,
+            )
+        ]
+
+    def _candidate_snapshot(self) -> tuple[list[str], Any, Any]:
+        """Vocabulary with the candidate index built for it, read as one reference.
+
+        Incremental edits derive a new index and publish it with the new
+        vocabulary in one swap, so lookups on other threads never pair
+        indices with the wrong vocabulary.
+        """
+        view = self._candidate_view
+        if view is not None and view[0] is self.vocabulary and view[1] is self.trigram_index:
+            return view
+        self._ensure_candidate_index()
+        with _candidate_view_lock:
+            view = (self.vocabulary, self.trigram_index, self.length_buckets)
+            self._candidate_view = view
+        return view
+
     def _build_candidate_index(self) -> None:
         """Build trigram inverted index and length buckets for candidate selection.
 
-        Delegates to candidate_index.build_candidate_index().
+        Maps the persisted index for this vocabulary when one exists; otherwise
+        delegates to candidate_index.build_candidate_index() and persists the result.
         """
+        loaded = load_candidate_index(self.vocabulary)
+        if loaded is not None:
+            self.trigram_index, self.length_buckets = loaded
+            return
+
         self.trigram_index, self.length_buckets = build_candidate_index(self.vocabulary)
+        store_candidate_index(self.vocabulary, self.trigram_index, self.length_buckets)
+
+    def _ensure_candidate_index(self) -> None:
+        """Build the candidate index on first use after a load."""
+        if self.vocabulary and not self.trigram_index:
+            self._build_candidate_index()
 
     @classmethod
     def model_load(cls, data: dict[str, Any]) -> Corpus:
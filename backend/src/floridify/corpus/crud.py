@@ -7,16 +7,18 @@ not method-binding.
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 import coolname
 from beanie import PydanticObjectId
 
-from ..caching.core import get_versioned_content
+from ..caching.core import get_global_cache, get_versioned_content
 from ..caching.manager import VersionedDataManager
 from ..caching.models import BaseVersionedData, CacheNamespace, ResourceType, VersionConfig
 from ..models.base import Language
 from ..utils.logging import get_logger
+from .columnar import get_shared_corpus, share_corpus
 from .core import Corpus
 from .models import CorpusType
 from .semantic_policy import recompute_semantic_effective_upward
@@ -458,6 +460,14 @@ async def get_corpus(
     if not metadata:
         return None
 
+    # Versions whose columns were already shared are built from the process-wide
+    # handle: no content fetch, and only the small fields are validated
+    use_cache = config.use_cache if config else True
+    data_hash = metadata.version_info.data_hash if metadata.version_info else None
+    shared = get_shared_corpus(data_hash) if use_cache else None
+    if shared is not None:
+        return await asyncio.to_thread(shared.to_corpus, **_metadata_fields(metadata))
+
     # Get content from versioned storage, respecting config.use_cache
     content = await get_versioned_content(metadata, config=config)
     if not content:
@@ -466,26 +476,7 @@ async def get_corpus(
     # Ensure all required fields from metadata
     # Corpus-specific fields should come from metadata attributes, not content
     # Let Pydantic v2 handle enum conversion automatically during model_validate()
-    content.update(
-        {
-            "corpus_id": metadata.id,
-            "corpus_uuid": metadata.uuid,  # CRITICAL: Copy UUID (guaranteed to exist)
-            "corpus_name": metadata.resource_id,
-            "corpus_type": metadata.corpus_type,  # Pydantic v2 handles enum conversion
-            "language": metadata.language,  # Pydantic v2 handles enum conversion
-            "parent_uuid": metadata.parent_uuid,
-            "child_uuids": metadata.child_uuids or [],
-            "is_master": metadata.is_master,
-            "semantic_enabled_explicit": metadata.semantic_enabled_explicit,
-            "semantic_enabled_effective": metadata.semantic_enabled_effective,
-            "semantic_model": metadata.semantic_model,
-        }
-    )
-
-    # Clean self-references even when reading using extracted helper
-    content["child_uuids"] = remove_self_references(
-        content.get("child_uuids"), corpus_uuid=content.get("corpus_uuid")
-    )
+    content.update(_metadata_fields(metadata))
 
     # Handle vocabulary
     if "vocabulary" not in content:
@@ -512,12 +503,46 @@ async def get_corpus(
         content["word_to_lemma_indices"] = corpus_obj.word_to_lemma_indices
         content["lemma_to_word_indices"] = corpus_obj.lemma_to_word_indices
 
+    # Create the Corpus, sharing large vocabularies across processes via mmap
+    corpus = await asyncio.to_thread(share_corpus, Corpus.model_validate(content))
+    if corpus.is_columnar:
+        # Later loads go through the shared handle; don't keep the decoded dict too
+        await _release_cached_content(metadata)
+    return corpus
+
+
+def _metadata_fields(metadata: Corpus.Metadata) -> dict[str, Any]:
+    """Corpus fields that come from the metadata document rather than content."""
+    fields: dict[str, Any] = {
+        "corpus_id": metadata.id,
+        "corpus_uuid": metadata.uuid,  # CRITICAL: Copy UUID (guaranteed to exist)
+        "corpus_name": metadata.resource_id,
+        "corpus_type": metadata.corpus_type,  # Pydantic v2 handles enum conversion
+        "language": metadata.language,  # Pydantic v2 handles enum conversion
+        "parent_uuid": metadata.parent_uuid,
+        # Clean self-references even when reading using extracted helper
+        "child_uuids": remove_self_references(metadata.child_uuids, corpus_uuid=metadata.uuid),
+        "is_master": metadata.is_master,
+        "semantic_enabled_explicit": metadata.semantic_enabled_explicit,
+        "semantic_enabled_effective": metadata.semantic_enabled_effective,
+        "semantic_model": metadata.semantic_model,
+    }
     # Ensure version info - convert to dict for Pydantic validation
     if metadata.version_info:
-        content["version_info"] = metadata.version_info.model_dump(mode="json")
-
-    # Create and return the Corpus
-    return Corpus.model_validate(content)
+        fields["version_info"] = metadata.version_info.model_dump(mode="json")
+    return fields
+
+
+async def _release_cached_content(metadata: Corpus.Metadata) -> None:
+    """Drop a corpus version's content dict from the in-memory cache tier."""
+    location = metadata.content_location
+    if not location or not location.cache_key or not location.cache_namespace:
+        return
+    namespace = location.cache_namespace
+    if isinstance(namespace, str):
+        namespace = CacheNamespace(namespace)
+    cache = await get_global_cache()
+    await cache.evict_memory(namespace, location.cache_key)
 
 
 async def get_corpora_by_ids(
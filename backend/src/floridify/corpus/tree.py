@@ -397,6 +397,9 @@ async def delete_corpus(
             SemanticIndex.Metadata.find({"corpus_uuid": corpus_uuid_to_delete}).delete(),
             return_exceptions=True,
         )
+        # Bulk deletes bypass the version manager; drop trust in cached index versions
+        for resource_type in (ResourceType.TRIE, ResourceType.SEARCH, ResourceType.SEMANTIC):
+            vm.generations.bump(resource_type)
         logger.info(f"Deleted search indices for corpus {corpus_name_to_clear}")
 
     # Delete ALL metadata documents with the same UUID from MongoDB
@@ -404,6 +407,7 @@ async def delete_corpus(
     if corpus.corpus_uuid:
         # Delete all documents with this UUID (all versions)
         result = await Corpus.Metadata.find({"uuid": corpus.corpus_uuid}).delete()
+        vm.generations.bump(ResourceType.CORPUS)
         logger.info(
             f"Deleted all versions of corpus {corpus_name_to_clear} (UUID: {corpus.corpus_uuid}, {result.deleted_count if result else 0} documents)"
         )
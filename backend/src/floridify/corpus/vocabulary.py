@@ -6,8 +6,14 @@ extracted from Corpus to separate data processing from the data model.
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from collections.abc import Mapping
+
+import numpy as np
+
 from ..text.normalize import batch_lemmatize, batch_normalize
 from ..utils.logging import get_logger
+from .columnar import CSRMap, DenseIndexMap, as_csr, as_dense
 
 logger = get_logger(__name__)
 
@@ -64,7 +70,7 @@ def normalize_vocabulary(
 def rebuild_original_indices(
     vocabulary: list[str],
     original_vocabulary: list[str],
-    vocabulary_to_index: dict[str, int],
+    vocabulary_to_index: Mapping[str, int],
 ) -> dict[int, list[int]]:
     """Rebuild normalized_to_original_indices from vocabulary + original_vocabulary.
 
@@ -88,6 +94,15 @@ def rebuild_original_indices(
     return normalized_to_original_indices
 
 
+def lemmatize_words(words: list[str]) -> list[str]:
+    """Lemmatize each word, returning one lemma per input word (empty words map to themselves)."""
+    unique_lemmas, word_lemma_indices, _ = batch_lemmatize(words)
+    return [
+        unique_lemmas[lemma_idx] if lemma_idx >= 0 else word
+        for word, lemma_idx in zip(words, word_lemma_indices, strict=True)
+    ]
+
+
 def create_lemmatization_maps(
     vocabulary: list[str],
 ) -> tuple[list[str], dict[str, int], dict[int, int], dict[int, list[int]]]:
@@ -103,7 +118,7 @@ def create_lemmatization_maps(
           - word_to_lemma_indices: word_index -> lemma_index
           - lemma_to_word_indices: lemma_index -> [word_indices]
     """
-    lemmas, _, _ = batch_lemmatize(vocabulary)
+    lemmas = lemmatize_words(vocabulary)
 
     # Build unique lemma vocabulary (preserving first-seen order)
     unique_lemmas: list[str] = []
@@ -132,38 +147,258 @@ def create_lemmatization_maps(
     return unique_lemmas, lemma_text_to_index, word_to_lemma_indices, lemma_to_word_indices
 
 
-def merge_words(
-    existing_vocabulary: list[str],
-    new_words: list[str],
-) -> tuple[list[str], list[str]]:
-    """Normalize new words and merge with existing vocabulary.
+# ── Incremental maintenance ───────────────────────────────────────────
+#
+# Edits to a sorted vocabulary shift the index of every later word. Instead
+# of re-normalizing and re-lemmatizing everything, the helpers below describe
+# an edit as a monotone ``remap`` array (old index -> new index, ``-1`` for
+# removed) and patch each index-keyed structure through it. The one-to-many
+# maps are kept as CSR arrays and word -> lemma as a dense array (see
+# corpus.columnar), so the shift is one vectorized gather per structure and
+# only the added/removed entries are touched from Python.
+
+
+def insert_words(
+    vocabulary: list[str],
+    vocabulary_to_index: Mapping[str, int],
+    normalized_words: list[str],
+) -> tuple[list[str], np.ndarray, list[str], np.ndarray]:
+    """Splice already-normalized words into a sorted vocabulary.
+
+    Args:
+        vocabulary: Sorted, deduplicated vocabulary
+        vocabulary_to_index: Word -> index mapping for ``vocabulary``
+        normalized_words: Normalized words to insert (duplicates allowed)
 
     Returns:
-        Tuple of (merged_sorted_vocabulary, normalized_new_words).
+        Tuple of:
+          - merged: new sorted vocabulary
+          - remap: int64 array, old index -> new index
+          - added: sorted words that were not already present
+          - added_indices: int64 array, new index of each word in ``added``
     """
-    normalized_new = batch_normalize(new_words)
-    merged = set(existing_vocabulary) | set(normalized_new)
-    return sorted(merged), normalized_new
+    added = sorted({w for w in normalized_words if w not in vocabulary_to_index})
+    n = len(vocabulary)
+    if not added:
+        return vocabulary, np.arange(n, dtype=np.int64), [], np.empty(0, dtype=np.int64)
 
+    positions = np.fromiter(
+        (bisect_left(vocabulary, w) for w in added), dtype=np.int64, count=len(added)
+    )
+    remap = np.arange(n, dtype=np.int64) + np.searchsorted(positions, np.arange(n), side="right")
+    added_indices = positions + np.arange(len(added), dtype=np.int64)
 
-def filter_words(
-    vocabulary: list[str],
-    original_vocabulary: list[str],
-    words_to_remove: list[str],
-) -> tuple[list[str], list[str]]:
-    """Remove words from both vocabularies.
+    merged: list[str] = []
+    prev = 0
+    for pos, word in zip(positions.tolist(), added, strict=True):
+        merged.extend(vocabulary[prev:pos])
+        merged.append(word)
+        prev = pos
+    merged.extend(vocabulary[prev:])
+
+    return merged, remap, added, added_indices
+
+
+def delete_indices(items: list[str], indices: list[int]) -> tuple[list[str], np.ndarray]:
+    """Drop positions from a list.
+
+    Args:
+        items: Source list
+        indices: Positions to drop (any order, duplicates allowed)
 
     Returns:
-        Tuple of (filtered_vocabulary, filtered_original_vocabulary).
+        Tuple of (kept items, int64 remap with ``-1`` for dropped positions)
     """
-    normalized_remove = set(batch_normalize(words_to_remove))
-    filtered_vocab = sorted([w for w in vocabulary if w not in normalized_remove])
+    n = len(items)
+    keep = np.ones(n, dtype=bool)
+    if indices:
+        keep[np.asarray(indices, dtype=np.int64)] = False
+    remap = np.where(keep, np.cumsum(keep) - 1, -1)
 
-    # Filter original vocabulary
-    normalized_orig = batch_normalize(original_vocabulary)
-    keep_indices = [
-        i for i, norm_word in enumerate(normalized_orig) if norm_word not in normalized_remove
+    kept: list[str] = []
+    prev = 0
+    for idx in np.flatnonzero(~keep).tolist():
+        kept.extend(items[prev:idx])
+        prev = idx + 1
+    kept.extend(items[prev:])
+
+    return kept, remap
+
+
+def _csr_rows(indptr: np.ndarray) -> np.ndarray:
+    """Row of every CSR entry."""
+    return np.repeat(np.arange(len(indptr) - 1, dtype=np.int64), np.diff(indptr))
+
+
+def _csr_indptr(rows: np.ndarray, n_rows: int) -> np.ndarray:
+    """CSR row pointer for entries grouped by ascending ``rows``."""
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n_rows), out=indptr[1:])
+    return indptr
+
+
+def remap_original_indices(
+    normalized_to_original_indices: Mapping[int, list[int]],
+    remap: np.ndarray,
+    n_words: int,
+    original_remap: np.ndarray | None = None,
+) -> CSRMap:
+    """Re-key normalized -> original indices after a vocabulary edit.
+
+    Args:
+        normalized_to_original_indices: Mapping to patch (not mutated)
+        remap: Normalized index remap (``-1`` = removed)
+        n_words: Size of the edited vocabulary
+        original_remap: Optional original index remap when originals were dropped
+
+    Returns:
+        Patched mapping with removed entries dropped
+    """
+    indptr, indices = as_csr(normalized_to_original_indices, len(remap))
+    rows = remap[_csr_rows(indptr)]
+    keep = rows >= 0
+    if original_remap is not None:
+        indices = original_remap[indices].astype(np.int32)
+    return CSRMap(_csr_indptr(rows[keep], n_words), indices[keep])
+
+
+def add_original_indices(
+    normalized_to_original_indices: Mapping[int, list[int]],
+    original_vocabulary: list[str],
+    normalized_words: list[str],
+    offset: int,
+    vocabulary_to_index: Mapping[str, int],
+) -> CSRMap:
+    """Register appended originals in ``normalized_to_original_indices``.
+
+    Args:
+        normalized_to_original_indices: Mapping to extend (not mutated)
+        original_vocabulary: Original vocabulary, already extended
+        normalized_words: Normalized form of each appended original
+        offset: Index of the first appended original
+        vocabulary_to_index: Word -> index mapping for the edited vocabulary
+
+    Returns:
+        Extended mapping
+    """
+    n_words = len(vocabulary_to_index)
+    indptr, indices = as_csr(normalized_to_original_indices, n_words)
+    pairs = [
+        (sorted_idx, orig_idx)
+        for orig_idx, norm_word in enumerate(normalized_words, start=offset)
+        if (sorted_idx := vocabulary_to_index.get(norm_word)) is not None
     ]
-    filtered_original = [original_vocabulary[i] for i in keep_indices]
+    if not pairs:
+        return CSRMap(indptr, indices)
+
+    pairs.sort(key=lambda pair: pair[0])
+    new_rows = np.array([row for row, _ in pairs], dtype=np.int64)
+    new_indices = np.array([orig_idx for _, orig_idx in pairs], dtype=np.int32)
+
+    # Appended originals have the highest indices, so they go at the end of their row
+    rows = _csr_rows(indptr)
+    at = np.searchsorted(rows, new_rows, side="right")
+    rows = np.insert(rows, at, new_rows)
+    indices = np.insert(indices, at, new_indices)
+    indptr = _csr_indptr(rows, n_words)
+
+    # Keep the diacritics-preferred ordering of normalize_vocabulary
+    for sorted_idx in set(new_rows.tolist()):
+        start, end = int(indptr[sorted_idx]), int(indptr[sorted_idx + 1])
+        if end - start > 1:
+            indices[start:end] = sorted(
+                indices[start:end].tolist(),
+                key=lambda idx: (not has_diacritics(original_vocabulary[idx]), idx),
+            )
+
+    return CSRMap(indptr, indices)
+
+
+def update_lemmatization_maps(
+    lemmatized_vocabulary: list[str],
+    lemma_text_to_index: dict[str, int],
+    word_to_lemma_indices: Mapping[int, int],
+    lemma_to_word_indices: Mapping[int, list[int]],
+    remap: np.ndarray,
+    n_words: int,
+    added_words: list[str] | None = None,
+    added_indices: np.ndarray | None = None,
+) -> tuple[list[str], dict[str, int], DenseIndexMap, CSRMap]:
+    """Patch lemmatization maps after a vocabulary edit.
+
+    Only ``added_words`` are lemmatized. New lemmas are appended; a lemma left
+    without any word after a removal is dropped by moving the last lemma into
+    its slot, so only the moved lemma's entries change.
 
-    return filtered_vocab, filtered_original
+    Args:
+        lemmatized_vocabulary: Current unique lemmas (updated in place)
+        lemma_text_to_index: Lemma -> lemma index (updated in place)
+        word_to_lemma_indices: Word index -> lemma index (not mutated)
+        lemma_to_word_indices: Lemma index -> word indices (not mutated)
+        remap: Word index remap (``-1`` = removed)
+        n_words: Size of the edited vocabulary
+        added_words: Newly inserted words
+        added_indices: New word index of each added word
+
+    Returns:
+        Same four structures as ``create_lemmatization_maps``
+    """
+    # Surviving words keep their lemma at their new position
+    kept = remap >= 0
+    word_to_lemma = np.full(n_words, -1, dtype=np.int32)
+    word_to_lemma[remap[kept]] = as_dense(word_to_lemma_indices, len(remap))[kept]
+
+    lemma_indptr, lemma_indices = as_csr(lemma_to_word_indices, len(lemmatized_vocabulary))
+    rows = _csr_rows(lemma_indptr)
+    words = remap[lemma_indices]
+    kept = words >= 0
+    rows, words = rows[kept], words[kept]
+
+    # Fill the slot of each orphaned lemma with the current last lemma
+    orphans = np.flatnonzero(np.bincount(rows, minlength=len(lemmatized_vocabulary)) == 0)
+    if len(orphans):
+        lemma_remap = np.arange(len(lemmatized_vocabulary), dtype=np.int64)
+        owner = lemma_remap.copy()  # original lemma index held by each slot
+        for slot in reversed(orphans.tolist()):
+            del lemma_text_to_index[lemmatized_vocabulary[slot]]
+            last = len(lemmatized_vocabulary) - 1
+            moved = lemmatized_vocabulary.pop()
+            if slot != last:
+                lemmatized_vocabulary[slot] = moved
+                lemma_text_to_index[moved] = slot
+                lemma_remap[owner[last]] = slot
+                owner[slot] = owner[last]
+        rows = lemma_remap[rows]
+        word_to_lemma = np.where(word_to_lemma >= 0, lemma_remap[word_to_lemma], -1).astype(
+            np.int32
+        )
+        order = np.argsort(rows, kind="stable")
+        rows, words = rows[order], words[order]
+
+    if added_words and added_indices is not None:
+        new_lemmas: list[int] = []
+        for lemma in lemmatize_words(added_words):
+            lemma_idx = lemma_text_to_index.get(lemma)
+            if lemma_idx is None:
+                lemma_idx = len(lemmatized_vocabulary)
+                lemmatized_vocabulary.append(lemma)
+                lemma_text_to_index[lemma] = lemma_idx
+            new_lemmas.append(lemma_idx)
+        new_rows = np.array(new_lemmas, dtype=np.int64)
+        new_words = np.asarray(added_indices, dtype=np.int64)
+        word_to_lemma[new_words] = new_rows
+
+        # Insert at the (lemma, word) sort position so each row stays ascending
+        stride = n_words + 1
+        new_keys = new_rows * stride + new_words
+        order = np.argsort(new_keys, kind="stable")
+        at = np.searchsorted(rows * stride + words, new_keys[order])
+        rows = np.insert(rows, at, new_rows[order])
+        words = np.insert(words, at, new_words[order])
+
+    return (
+        lemmatized_vocabulary,
+        lemma_text_to_index,
+        DenseIndexMap(word_to_lemma),
+        CSRMap(_csr_indptr(rows, len(lemmatized_vocabulary)), words.astype(np.int32)),
+    )
@@ -270,6 +270,10 @@ class CacheStatsResponse(BaseResponse):
         None,
         description="Stats per namespace",
     )
+    versioned_validation: dict[str, Any] | None = Field(
+        None,
+        description="Versioned cache-hit validation counters (queries run vs avoided)",
+    )
 
 
 class ConfigResponse(BaseResponse):
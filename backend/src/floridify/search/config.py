@@ -128,6 +128,11 @@ BLOOM_ERROR_RATE_SMALL = 0.001  # < 10K words
 BLOOM_ERROR_RATE_MEDIUM = 0.01  # 10K-100K
 BLOOM_ERROR_RATE_LARGE = 0.05  # > 100K
 
+# ─── Prefix Completion ───────────────────────────────────────────
+
+COMPLETION_TOP_K = 64  # Completions precomputed per heavy prefix (>= typical max_results)
+COMPLETION_MIN_RANGE = 256  # Prefixes matching fewer words are ranked on demand
+
 # ─── Caching ──────────────────────────────────────────────────────
 
 INLINE_CONTENT_THRESHOLD_BYTES = 16 * 1024  # 16 KB — below this, store inline in MongoDB
@@ -135,3 +140,19 @@ INLINE_CONTENT_THRESHOLD_BYTES = 16 * 1024  # 16 KB — below this, store inline
 # ─── Search Pipeline ─────────────────────────────────────────────
 
 CORPUS_CHECK_INTERVAL_SECONDS = 30.0  # Hot-reload polling frequency
+CASCADE_TIME_BUDGET_MS = 50.0  # Hard ceiling on a smart cascade (typeahead responsiveness)
+CASCADE_MAX_WORKERS = 4  # Threads running substring/fuzzy stages off the event loop
+CASCADE_MAX_ABANDONED_STAGES = 2  # Overrunning fuzzy calls allowed to hold cascade workers
+BATCH_SEARCH_MAX_QUERIES = 5_000  # Upper bound on queries per POST /search/batch
+
+# ─── Search Service Client ───────────────────────────────────────
+# Used by the API app when SEARCH_SERVICE_URL delegates lookups to the search service
+
+SEARCH_CLIENT_TIMEOUT_SECONDS = 5.0  # Per attempt; a cascade is budgeted at 50ms
+SEARCH_CLIENT_CONNECT_TIMEOUT_SECONDS = 1.0  # Same-network service: slow connect = down
+SEARCH_CLIENT_MAX_CONNECTIONS = 32
+SEARCH_CLIENT_MAX_KEEPALIVE = 16
+SEARCH_CLIENT_KEEPALIVE_EXPIRY_SECONDS = 60.0
+SEARCH_CLIENT_HEDGE_DELAY_MS = 150.0  # Send a duplicate request if the first is this slow
+SEARCH_CLIENT_BATCH_WINDOW_MS = 2.0  # Coalesce concurrent best-match lookups
+SEARCH_CLIENT_BATCH_MAX_SIZE = 64
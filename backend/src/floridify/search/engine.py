@@ -7,19 +7,27 @@ from __future__ import annotations
 
 import asyncio
 import itertools
-from difflib import SequenceMatcher
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any
 
 import ffuzzy
+import numpy as np
+from rapidfuzz import fuzz, process
 
 from ..caching.models import VersionConfig
 from ..corpus.core import Corpus
 from ..corpus.manager import get_tree_corpus_manager
 from ..text import normalize
 from ..utils.logging import get_logger
+from ..utils.metrics import SEARCH_STAGE_SECONDS
 from .cache import get_cached_search, put_cached_search
 from .config import (
     BKTREE_MAX_QUERY_LENGTH,
+    CASCADE_MAX_ABANDONED_STAGES,
+    CASCADE_MAX_WORKERS,
+    CASCADE_TIME_BUDGET_MS,
     HIGH_QUALITY_FUZZY_SCORE,
     LEXICAL_GATE_SCORE_MARGIN,
     LEXICAL_SANITY_THRESHOLD,
@@ -47,6 +55,56 @@ from .trie.search import TrieSearch
 
 logger = get_logger(__name__)
 
+# Per-query output of the batched text stages: the final ranked list when exact +
+# prefix already fill the request, otherwise (exact, prefix, substring, fuzzy).
+_TextStages = (
+    list[SearchResult]
+    | tuple[list[SearchResult], list[SearchResult], list[SearchResult], list[SearchResult]]
+)
+
+# Shared by every engine: substring (numpy) and fuzzy (Rust) release the GIL, so
+# a small pool runs them in parallel without stalling the event loop.
+_cascade_executor: ThreadPoolExecutor | None = None
+
+
+def _get_cascade_executor() -> ThreadPoolExecutor:
+    """Thread pool for the CPU-bound smart cascade stages."""
+    global _cascade_executor
+    if _cascade_executor is None:
+        _cascade_executor = ThreadPoolExecutor(
+            max_workers=CASCADE_MAX_WORKERS, thread_name_prefix="search-cascade"
+        )
+    return _cascade_executor
+
+
+# Stages the cascade deadline gave up on that were already running in a worker.
+# Threads can't be interrupted, so these hold a worker until they finish; the
+# cascade stops submitting fuzzy while too many are in flight.
+_abandoned_stages: set[Future[Any]] = set()
+
+
+def _abandon_stage(future: Future[Any]) -> None:
+    """Cancel a stage past the deadline, tracking it if it is already running."""
+    if not future.cancel():
+        _abandoned_stages.add(future)
+        future.add_done_callback(_abandoned_stages.discard)
+
+
+def _record_stage_timings(timings: dict[str, Any]) -> None:
+    """Feed a cascade's stage timings (ms) into the search-stage latency histogram."""
+    for stage, elapsed_ms in timings.items():
+        if isinstance(elapsed_ms, float):
+            SEARCH_STAGE_SECONDS.observe(elapsed_ms / 1000, stage)
+
+
+def _timed_stage(
+    func: Callable[..., list[SearchResult]], *args: Any
+) -> tuple[list[SearchResult], float]:
+    """Run one cascade stage, returning its results and wall time in ms."""
+    start = time.perf_counter()
+    results = func(*args)
+    return results, (time.perf_counter() - start) * 1000
+
 
 class Search:
     """High-performance search engine using corpus-based vocabulary.
@@ -641,6 +699,7 @@ class Search:
         max_results: int = 20,
         min_score: float | None = None,
         collect_all_matches: bool = False,
+        stage_timings: dict[str, Any] | None = None,
     ) -> list[SearchResult]:
         """Search with explicit mode selection.
 
@@ -650,6 +709,8 @@ class Search:
             max_results: Maximum results to return
             min_score: Minimum score threshold
             collect_all_matches: If True, collect all (method, score) pairs per word
+            stage_timings: SMART mode fills this with per-stage wall time (ms),
+                the cascade total and any stages cancelled by the time budget
 
         """
         # Ensure initialization
@@ -678,6 +739,7 @@ class Search:
                 min_score,
                 self.index.semantic_enabled if self.index else False,
                 collect_all_matches=collect_all_matches,
+                stage_timings=stage_timings,
             )
         elif mode == SearchMode.EXACT:
             results = self.search_exact(normalized_query)
@@ -710,6 +772,202 @@ class Search:
 
         return results
 
+    async def search_many(
+        self,
+        queries: list[str],
+        mode: SearchMode = SearchMode.SMART,
+        max_results: int = 20,
+        min_score: float | None = None,
+        collect_all_matches: bool = False,
+    ) -> list[list[SearchResult]]:
+        """Run a batch of queries through the search cascade in one call.
+
+        Batched counterpart of search_with_mode() for wordlist resolution.
+        Queries are normalized once up front and deduplicated. The text stages
+        (exact, prefix, substring, fuzzy) run as one batch off the event loop,
+        and every semantic fallback is encoded in a single forward pass and
+        searched with one FAISS call. The typeahead time budget does not apply.
+
+        Args:
+            queries: Search queries
+            mode: Search mode (SMART, EXACT, FUZZY, SEMANTIC)
+            max_results: Maximum results per query
+            min_score: Minimum score threshold
+            collect_all_matches: If True, collect all (method, score) pairs per word
+
+        Returns:
+            One result list per input query, in input order
+
+        """
+        await self.initialize()
+
+        normalized_queries = [normalize(query) for query in queries]
+        unique_queries = list(dict.fromkeys(q for q in normalized_queries if q))
+        if not unique_queries:
+            return [[] for _ in queries]
+
+        min_score = (
+            min_score
+            if min_score is not None
+            else (self.index.min_score if self.index else DEFAULT_MIN_SCORE)
+        )
+
+        if mode == SearchMode.SMART:
+            batch = await self._smart_search_many(
+                unique_queries,
+                max_results,
+                min_score,
+                self.index.semantic_enabled if self.index else False,
+                collect_all_matches=collect_all_matches,
+            )
+        elif mode == SearchMode.EXACT:
+            batch = [self.search_exact(query) for query in unique_queries]
+        elif mode == SearchMode.FUZZY:
+            batch = await asyncio.to_thread(
+                self.search_fuzzy_many, unique_queries, max_results, min_score
+            )
+        elif mode == SearchMode.SEMANTIC:
+            try:
+                await asyncio.wait_for(self.await_semantic_ready(), timeout=5.0)
+            except TimeoutError:
+                raise ValueError("Semantic search is still initializing. Try again shortly.")
+            if not self.semantic_search:
+                raise ValueError("Semantic search is not available")
+            batch = await self.search_semantic_many(unique_queries, max_results, min_score)
+        else:
+            raise ValueError(f"Unsupported search mode: {mode}")
+
+        results_by_query = dict(zip(unique_queries, batch, strict=True))
+        if self.corpus:
+            for results in batch:
+                for result in results:
+                    if result.language is None:
+                        result.language = self.corpus.language
+
+        return [list(results_by_query.get(query, [])) for query in normalized_queries]
+
+    async def _smart_search_many(
+        self,
+        queries: list[str],
+        max_results: int,
+        min_score: float,
+        semantic: bool,
+        collect_all_matches: bool = False,
+    ) -> list[list[SearchResult]]:
+        """Batched smart cascade: text stages in one thread hop, semantic in one encode."""
+        stages = await asyncio.to_thread(
+            self._text_stages_many, queries, max_results, min_score, collect_all_matches
+        )
+
+        # Collect semantic fallbacks across the batch (same gating as the cascade)
+        semantic_requests: list[tuple[str, int, float]] = []
+        semantic_positions: list[int] = []
+        if semantic and self._semantic_ready and self.semantic_search:
+            for position, (query, stage) in enumerate(zip(queries, stages, strict=True)):
+                if isinstance(stage, list):
+                    continue
+                exact_results, prefix_results, substring_results, fuzzy_results = stage
+                if exact_results:
+                    continue
+                has_text_results = bool(prefix_results or substring_results or fuzzy_results)
+                semantic_limit, semantic_min = self._semantic_request(
+                    max_results,
+                    min_score,
+                    exact_results,
+                    prefix_results,
+                    fuzzy_results,
+                    has_text_results,
+                )
+                if semantic_limit > 0:
+                    semantic_requests.append((query, semantic_limit, semantic_min))
+                    semantic_positions.append(position)
+
+        semantic_batch = (
+            await self._search_semantic_batch(semantic_requests) if semantic_requests else []
+        )
+        semantic_by_position = dict(zip(semantic_positions, semantic_batch, strict=True))
+
+        batch: list[list[SearchResult]] = []
+        for position, stage in enumerate(stages):
+            if isinstance(stage, list):
+                batch.append(stage)
+                continue
+            exact_results, prefix_results, substring_results, fuzzy_results = stage
+            batch.append(
+                self._merge_cascade_results(
+                    exact_results,
+                    prefix_results,
+                    substring_results,
+                    fuzzy_results,
+                    semantic_by_position.get(position, []),
+                    max_results,
+                    min_score,
+                    collect_all_matches,
+                )
+            )
+        return batch
+
+    def _text_stages_many(
+        self,
+        queries: list[str],
+        max_results: int,
+        min_score: float,
+        collect_all_matches: bool,
+    ) -> list[_TextStages]:
+        """Exact → prefix → substring → fuzzy for a batch of normalized queries.
+
+        Returns, per query, either the final ranked list (exact + prefix already
+        fill max_results) or the (exact, prefix, substring, fuzzy) stage results
+        for merging once the semantic stage has run.
+        """
+        # 1-2. Exact + prefix (marisa-trie lookups)
+        exact_batch = [self.search_exact(query) for query in queries]
+        prefix_batch = [
+            self._prefix_results(query, exact_results, max_results)
+            for query, exact_results in zip(queries, exact_batch, strict=True)
+        ]
+
+        # 3. Substring for queries that still need candidates
+        open_positions = [
+            position
+            for position in range(len(queries))
+            if len(exact_batch[position]) + len(prefix_batch[position]) < max_results
+        ]
+        substring_by_position = {
+            position: self.search_substring(queries[position], max_results=max_results)
+            if len(queries[position]) >= 3
+            else []
+            for position in open_positions
+        }
+
+        # 4. Fuzzy as one batch over queries without an exact match
+        fuzzy_positions = [position for position in open_positions if not exact_batch[position]]
+        fuzzy_batch = self.search_fuzzy_many(
+            [queries[position] for position in fuzzy_positions], max_results, min_score
+        )
+        fuzzy_by_position = dict(zip(fuzzy_positions, fuzzy_batch, strict=True))
+
+        stages: list[_TextStages] = []
+        for position in range(len(queries)):
+            if position not in substring_by_position:
+                stages.append(
+                    self._rank_results(
+                        list(itertools.chain(exact_batch[position], prefix_batch[position])),
+                        max_results,
+                        collect_all_matches,
+                    )
+                )
+                continue
+            stages.append(
+                (
+                    exact_batch[position],
+                    prefix_batch[position],
+                    substring_by_position[position],
+                    fuzzy_by_position.get(position, []),
+                )
+            )
+        return stages
+
     def search_exact(
         self,
         query: str,
@@ -796,6 +1054,38 @@ class Search:
             logger.warning(f"Fuzzy search failed: {e}")
             return []
 
+    def search_fuzzy_many(
+        self,
+        queries: list[str],
+        max_results: int = 20,
+        min_score: float = DEFAULT_MIN_SCORE,
+    ) -> list[list[SearchResult]]:
+        """Fuzzy matching for a batch of normalized queries.
+
+        Args:
+            queries: Normalized search queries
+            max_results: Maximum results per query
+            min_score: Minimum score threshold
+
+        Returns:
+            One result list per query, in input order
+
+        """
+        if self.fuzzy_search is None or self.corpus is None:
+            return [[] for _ in queries]
+
+        batch = self.fuzzy_search.search_many(
+            queries,
+            corpus=self.corpus,
+            max_results=max_results,
+            min_score=min_score,
+        )
+        for matches in batch:
+            for match in matches:
+                match.method = SearchMethod.FUZZY
+                match.word = self._get_original_word(match.word)
+        return batch
+
     def search_substring(
         self,
         query: str,
@@ -843,11 +1133,9 @@ class Search:
                 )
         # Fallback: trigram-based substring search
         elif self.corpus:
-            candidates = self.corpus.get_substring_candidates(
+            for word in self.corpus.get_substring_matches(
                 normalized_query, max_results=max_results
-            )
-            for word_idx in candidates:
-                word = self.corpus.vocabulary[word_idx]
+            ):
                 original_word = self._get_original_word(word)
                 coverage = len(normalized_query) / len(word)
                 pos = word.find(normalized_query)
@@ -915,48 +1203,13 @@ class Search:
         try:
             # Normalize at entry point
             normalized_query = normalize(query)
-            strict_floor = (
-                self.SEMANTIC_PHRASE_MIN_SCORE
-                if " " in normalized_query
-                else self.SEMANTIC_SINGLE_WORD_MIN_SCORE
-            )
-            # For small corpora (<2000 words), the semantic space is too sparse —
-            # unrelated words can score 0.80+ simply because there aren't enough
-            # neighbours to push them down.  Raise the floor to compensate.
-            if self.corpus and len(self.corpus.vocabulary) < SEMANTIC_SMALL_CORPUS_SIZE:
-                strict_floor = max(
-                    strict_floor,
-                    SEMANTIC_SMALL_CORPUS_WORD_FLOOR
-                    if " " not in normalized_query
-                    else SEMANTIC_SMALL_CORPUS_PHRASE_FLOOR,
-                )
-            effective_min_score = max(min_score, strict_floor)
+            effective_min_score = self._semantic_floor(normalized_query, min_score)
             results = await self.semantic_search.search(
                 normalized_query,
                 max_results,
                 effective_min_score,
             )
-
-            # Lexical sanity gate — reject semantic matches that are textually
-            # unrelated.  The previous gate (lexical < 0.2) was too permissive:
-            # most real words exceed 0.2 against each other so they sailed
-            # through unchecked.  Raise the bar to 0.35 and widen the score
-            # margin so that only genuinely close results survive.
-            filtered_results: list[SearchResult] = []
-            for result in results:
-                candidate = normalize(result.word)
-                if candidate == normalized_query:
-                    filtered_results.append(result)
-                    continue
-
-                lexical_similarity = SequenceMatcher(None, normalized_query, candidate).ratio()
-                # For small corpora, require higher lexical overlap
-                if (
-                    lexical_similarity < LEXICAL_SANITY_THRESHOLD
-                    and result.score < effective_min_score + LEXICAL_GATE_SCORE_MARGIN
-                ):
-                    continue
-                filtered_results.append(result)
+            filtered_results = self._lexical_gate(normalized_query, results, effective_min_score)
 
             results = filtered_results[:max_results]
             # Restore diacritics in semantic results
@@ -967,6 +1220,112 @@ class Search:
             logger.warning(f"Semantic search failed: {e}")
             raise SearchError("semantic", str(e)) from e
 
+    async def search_semantic_many(
+        self,
+        queries: list[str],
+        max_results: int = 20,
+        min_score: float = DEFAULT_MIN_SCORE,
+    ) -> list[list[SearchResult]]:
+        """Semantic matching for a batch of queries in one encode and one FAISS call.
+
+        Args:
+            queries: Search queries (will be normalized)
+            max_results: Maximum results per query
+            min_score: Minimum score threshold
+
+        Returns:
+            One result list per query, in input order
+
+        """
+        return await self._search_semantic_batch(
+            [(normalize(query), max_results, min_score) for query in queries]
+        )
+
+    async def _search_semantic_batch(
+        self,
+        requests: list[tuple[str, int, float]],
+    ) -> list[list[SearchResult]]:
+        """Run (normalized_query, max_results, min_score) requests as one semantic batch.
+
+        The batch is searched once with the widest limit and the lowest
+        effective floor; each request is then cut down to its own floor,
+        lexical gate and limit.
+        """
+        if not self._semantic_ready or not self.semantic_search:
+            logger.debug("Semantic search not ready yet - returning empty results")
+            return [[] for _ in requests]
+
+        try:
+            floors = [self._semantic_floor(query, min_score) for query, _, min_score in requests]
+            raw_batch = await self.semantic_search.search_many(
+                [query for query, _, _ in requests],
+                max(limit for _, limit, _ in requests),
+                min(floors),
+            )
+
+            batch: list[list[SearchResult]] = []
+            for (query, limit, _), floor, raw_results in zip(
+                requests, floors, raw_batch, strict=True
+            ):
+                results = [result.model_copy() for result in raw_results if result.score >= floor]
+                results = self._lexical_gate(query, results, floor)[:limit]
+                # Restore diacritics in semantic results
+                for result in results:
+                    result.word = self._get_original_word(result.word)
+                batch.append(results)
+            return batch
+        except Exception as e:
+            logger.warning(f"Batch semantic search failed: {e}")
+            raise SearchError("semantic", str(e)) from e
+
+    def _semantic_floor(self, normalized_query: str, min_score: float) -> float:
+        """Effective semantic min score: caller floor raised to the strict per-query floor."""
+        strict_floor = (
+            self.SEMANTIC_PHRASE_MIN_SCORE
+            if " " in normalized_query
+            else self.SEMANTIC_SINGLE_WORD_MIN_SCORE
+        )
+        # For small corpora (<2000 words), the semantic space is too sparse —
+        # unrelated words can score 0.80+ simply because there aren't enough
+        # neighbours to push them down.  Raise the floor to compensate.
+        if self.corpus and len(self.corpus.vocabulary) < SEMANTIC_SMALL_CORPUS_SIZE:
+            strict_floor = max(
+                strict_floor,
+                SEMANTIC_SMALL_CORPUS_WORD_FLOOR
+                if " " not in normalized_query
+                else SEMANTIC_SMALL_CORPUS_PHRASE_FLOOR,
+            )
+        return max(min_score, strict_floor)
+
+    @staticmethod
+    def _lexical_gate(
+        normalized_query: str,
+        results: list[SearchResult],
+        effective_min_score: float,
+    ) -> list[SearchResult]:
+        """Lexical sanity gate — reject semantic matches that are textually unrelated.
+
+        The previous gate (lexical < 0.2) was too permissive: most real words
+        exceed 0.2 against each other so they sailed through unchecked.  Raise
+        the bar to 0.35 and widen the score margin so that only genuinely close
+        results survive.
+        """
+        if not results:
+            return []
+
+        # One batched Indel-ratio row (query x candidates) instead of a
+        # SequenceMatcher per candidate; exact matches score 1.0 and always pass.
+        candidates = [normalize(result.word) for result in results]
+        lexical_similarity = (
+            process.cdist([normalized_query], candidates, scorer=fuzz.ratio, dtype=np.float64)[0]
+            / 100.0
+        )
+        scores = np.fromiter((result.score for result in results), np.float64, len(results))
+        keep = (lexical_similarity >= LEXICAL_SANITY_THRESHOLD) | (
+            scores >= effective_min_score + LEXICAL_GATE_SCORE_MARGIN
+        )
+        return [result for result, kept in zip(results, keep, strict=True) if kept]
+
     async def cascade_search(
         self,
         query: str,
@@ -1019,48 +1378,38 @@ class Search:
         min_score: float,
         semantic: bool,
         collect_all_matches: bool = False,
+        stage_timings: dict[str, Any] | None = None,
     ) -> list[SearchResult]:
-        """Sequential search cascade that always includes prefix results for autocomplete.
+        """Search cascade that always includes prefix results for autocomplete.
 
         Unlike a pure cascade with early termination, this always runs prefix search
         alongside exact search. For a search dropdown/autocomplete, users expect to see
         words that START WITH their query, not just an exact match.
 
-        Order: exact → prefix → substring → fuzzy → semantic.
-        Time-budgeted: cascade aborts after CASCADE_TIME_BUDGET_MS to ensure
-        sub-50ms response for typeahead.
+        Order: exact → prefix → (substring ∥ fuzzy) → semantic.
+        Exact and prefix are microsecond trie lookups and run inline. Substring
+        and fuzzy run concurrently on the cascade thread pool, so a slow fuzzy
+        query never blocks the event loop. The text stages are bounded by
+        CASCADE_TIME_BUDGET_MS: stages still running at the deadline are
+        cancelled and the cascade keeps what has finished. Semantic starts only
+        while budget remains and then runs to completion.
         """
-        import time as _time
-
-        _cascade_start = _time.perf_counter()
-        CASCADE_TIME_BUDGET_MS = 50.0  # hard ceiling for typeahead responsiveness
+        cascade_start = time.perf_counter()
+        deadline = cascade_start + CASCADE_TIME_BUDGET_MS / 1000
+        timings = stage_timings if stage_timings is not None else {}
+        cancelled: list[str] = []
 
-        def _budget_exceeded() -> bool:
-            return (_time.perf_counter() - _cascade_start) * 1000 > CASCADE_TIME_BUDGET_MS
+        def remaining() -> float:
+            return deadline - time.perf_counter()
 
         # 1. Exact search (fastest — marisa-trie O(m))
-        exact_results = self.search_exact(query)
+        exact_results, timings["exact"] = _timed_stage(self.search_exact, query)
 
-        # 2. ALWAYS run prefix search — this is cheap (marisa-trie) and essential for
-        #    autocomplete UX. "de" should show "deer", "dear", "deep", etc.
-        prefix_results: list[SearchResult] = []
-        prefix_words = self.search_prefix(query, max_results=max_results)
-        if prefix_words:
-            # Build a set of exact-match words to avoid duplicating them in prefix results
-            exact_words = {r.word.lower() for r in exact_results}
-
-            prefix_results = [
-                SearchResult(
-                    word=word,
-                    lemmatized_word=None,
-                    score=max(0.85, 1.0 - 0.02 * abs(len(word) - len(query))),
-                    method=SearchMethod.PREFIX,
-                    language=None,
-                    metadata=None,
-                )
-                for word in prefix_words
-                if word.lower() not in exact_words
-            ]
+        # 2. ALWAYS run prefix search — this is cheap (top-k completion index) and
+        #    essential for autocomplete UX. "de" should show "deer", "dear", "deep", etc.
+        prefix_results, timings["prefix"] = _timed_stage(
+            self._prefix_results, query, exact_results, max_results
+        )
 
         # Early exit: if exact + prefix already fill max_results, no need for fuzzy/semantic
         combined_count = len(exact_results) + len(prefix_results)
@@ -1068,53 +1417,166 @@ class Search:
             logger.debug(
                 f"Early exit: {len(exact_results)} exact + {len(prefix_results)} prefix matches"
             )
-            all_results = list(itertools.chain(exact_results, prefix_results))
-            dedup = deduplicate_results_multi if collect_all_matches else deduplicate_results
-            unique_results = dedup(all_results)
-            return sorted(
-                unique_results,
-                key=sort_key,
-                reverse=True,
-            )[:max_results]
+            timings["total"] = (time.perf_counter() - cascade_start) * 1000
+            _record_stage_timings(timings)
+            return self._rank_results(
+                list(itertools.chain(exact_results, prefix_results)),
+                max_results,
+                collect_all_matches,
+            )
 
         # Early exit on exact match: when the query IS a known word, fuzzy/semantic
         # are wasteful — they're for misspellings and discovery. Exact + prefix +
         # substring are sufficient, and substring is cheap (suffix array).
         has_exact = bool(exact_results)
 
-        # 3. Substring search (for infix matches like "graph" → "paragraph")
-        substring_results: list[SearchResult] = []
-        if len(query) >= 3 and not _budget_exceeded():
-            substring_results = self.search_substring(query, max_results=max_results)
-
-        # 4. Fuzzy search — skip only when:
-        #   - Exact match exists (no misspelling to correct)
-        #   - Cascade time budget is spent
-        # Note: long queries (>BKTREE_MAX_QUERY_LENGTH) still run fuzzy —
-        # the BK-tree is skipped internally by FuzzySearch, but trigram +
-        # phonetic strategies still fire. The cascade doesn't need to know
-        # about BK-tree routing; that's FuzzySearch's concern.
-        skip_fuzzy = has_exact or _budget_exceeded()
-        fuzzy_results = [] if skip_fuzzy else self.search_fuzzy(query, max_results, min_score)
+        # 3-4. Substring (infix matches like "graph" → "paragraph") and fuzzy run
+        # concurrently. Fuzzy is skipped when an exact match exists (no misspelling
+        # to correct). Long queries (>BKTREE_MAX_QUERY_LENGTH) still run fuzzy —
+        # FuzzySearch routes around the BK-tree internally.
+        executor = _get_cascade_executor()
+        stages: dict[str, Future[tuple[list[SearchResult], float]]] = {}
+        if remaining() > 0:
+            if len(query) >= 3:
+                stages["substring"] = executor.submit(
+                    _timed_stage, self.search_substring, query, max_results
+                )
+            if not has_exact:
+                if len(_abandoned_stages) < CASCADE_MAX_ABANDONED_STAGES:
+                    stages["fuzzy"] = executor.submit(
+                        _timed_stage, self.search_fuzzy, query, max_results, min_score
+                    )
+                else:
+                    # Earlier fuzzy calls are still overrunning in the pool; queueing
+                    # another behind them would only be cancelled at the deadline.
+                    cancelled.append("fuzzy")
+
+        stage_results: dict[str, list[SearchResult]] = {}
+        if stages:
+            waiters = {name: asyncio.wrap_future(future) for name, future in stages.items()}
+            await asyncio.wait(waiters.values(), timeout=max(0.0, remaining()))
+            for name, waiter in waiters.items():
+                if not waiter.done():
+                    # Queued work is dropped; a stage already running in a worker
+                    # finishes there, but the response no longer waits for it.
+                    _abandon_stage(stages[name])
+                    waiter.cancel()
+                    cancelled.append(name)
+                    continue
+                try:
+                    stage_results[name], timings[name] = waiter.result()
+                except Exception as e:
+                    logger.warning(f"Cascade {name} stage failed for {query!r}: {e}")
+        substring_results = stage_results.get("substring", [])
+        fuzzy_results = stage_results.get("fuzzy", [])
 
         # 5. Semantic search — quality-based gating
         # Only supplement when exact/fuzzy/prefix provide some anchor results.
         # When there are NO text-based results, require a much higher semantic
         # score to avoid garbage (e.g., "exampl" → "table" at 73%).
-        semantic_results = []
+        semantic_results: list[SearchResult] = []
         has_text_results = bool(
             exact_results or prefix_results or substring_results or fuzzy_results
         )
-        if semantic and not has_exact and not _budget_exceeded() and self._semantic_ready and self.semantic_search:
-            high_quality = [r for r in fuzzy_results if r.score >= HIGH_QUALITY_FUZZY_SCORE]
-            semantic_limit = max(
-                0, max_results - len(high_quality) - len(prefix_results) - len(exact_results)
+        if (
+            semantic
+            and not has_exact
+            and remaining() > 0
+            and self._semantic_ready
+            and self.semantic_search
+        ):
+            semantic_limit, semantic_min = self._semantic_request(
+                max_results,
+                min_score,
+                exact_results,
+                prefix_results,
+                fuzzy_results,
+                has_text_results,
             )
             if semantic_limit > 0:
-                semantic_min = min_score if has_text_results else self.SEMANTIC_FALLBACK_MIN_SCORE
+                # Started only while budget remains, then allowed to finish: a
+                # cancelled encode is wasted work the next keystroke repeats.
+                semantic_start = time.perf_counter()
                 semantic_results = await self.search_semantic(query, semantic_limit, semantic_min)
+                timings["semantic"] = (time.perf_counter() - semantic_start) * 1000
+
+        if cancelled:
+            timings["cancelled"] = cancelled
+            logger.debug(
+                f"Cascade budget ({CASCADE_TIME_BUDGET_MS:.0f}ms) exceeded for {query!r}, "
+                f"cancelled: {', '.join(cancelled)}"
+            )
+        timings["total"] = (time.perf_counter() - cascade_start) * 1000
+        _record_stage_timings(timings)
+
+        # 6. Merge, deduplicate and rank
+        return self._merge_cascade_results(
+            exact_results,
+            prefix_results,
+            substring_results,
+            fuzzy_results,
+            semantic_results,
+            max_results,
+            min_score,
+            collect_all_matches,
+        )
+
+    def _prefix_results(
+        self,
+        query: str,
+        exact_results: list[SearchResult],
+        max_results: int,
+    ) -> list[SearchResult]:
+        """Prefix stage of the smart cascade, excluding words already matched exactly."""
+        prefix_words = self.search_prefix(query, max_results=max_results)
+        if not prefix_words:
+            return []
+
+        # Build a set of exact-match words to avoid duplicating them in prefix results
+        exact_words = {r.word.lower() for r in exact_results}
 
-        # 6. Merge and deduplicate with memory-efficient generators
+        return [
+            SearchResult(
+                word=word,
+                lemmatized_word=None,
+                score=max(0.85, 1.0 - 0.02 * abs(len(word) - len(query))),
+                method=SearchMethod.PREFIX,
+                language=None,
+                metadata=None,
+            )
+            for word in prefix_words
+            if word.lower() not in exact_words
+        ]
+
+    def _semantic_request(
+        self,
+        max_results: int,
+        min_score: float,
+        exact_results: list[SearchResult],
+        prefix_results: list[SearchResult],
+        fuzzy_results: list[SearchResult],
+        has_text_results: bool,
+    ) -> tuple[int, float]:
+        """Semantic stage limit and min score given the text-stage results."""
+        high_quality = [r for r in fuzzy_results if r.score >= HIGH_QUALITY_FUZZY_SCORE]
+        semantic_limit = max(
+            0, max_results - len(high_quality) - len(prefix_results) - len(exact_results)
+        )
+        semantic_min = min_score if has_text_results else self.SEMANTIC_FALLBACK_MIN_SCORE
+        return semantic_limit, semantic_min
+
+    def _merge_cascade_results(
+        self,
+        exact_results: list[SearchResult],
+        prefix_results: list[SearchResult],
+        substring_results: list[SearchResult],
+        fuzzy_results: list[SearchResult],
+        semantic_results: list[SearchResult],
+        max_results: int,
+        min_score: float,
+        collect_all_matches: bool,
+    ) -> list[SearchResult]:
+        """Merge cascade stages, deduplicate and rank."""
         fuzzy_gen = (r for r in fuzzy_results if r.score >= min_score)
         semantic_gen = (r for r in semantic_results if r.score >= min_score)
 
@@ -1124,10 +1586,17 @@ class Search:
                 exact_results, prefix_results, substring_results, fuzzy_gen, semantic_gen
             )
         )
+        return self._rank_results(all_results, max_results, collect_all_matches)
 
-        # Deduplicate and sort
+    @staticmethod
+    def _rank_results(
+        results: list[SearchResult],
+        max_results: int,
+        collect_all_matches: bool,
+    ) -> list[SearchResult]:
+        """Deduplicate and sort results by score with method tiebreaker."""
         dedup = deduplicate_results_multi if collect_all_matches else deduplicate_results
-        unique_results = dedup(all_results)
+        unique_results = dedup(results)
 
         return sorted(
             unique_results,
@@ -32,8 +32,12 @@ LengthBuckets = dict[int, np.ndarray]  # dtype=np.int32
 
 
 def _next_char_hash(char: str) -> int:
-    """Hash a character to a bit position (0-7) for the next-char mask."""
-    return hash(char) & 7
+    """Hash a character to a bit position (0-7) for the next-char mask.
+
+    Fibonacci hashing of the code point — deterministic across processes
+    (unlike ``hash(str)``), so persisted masks stay valid.
+    """
+    return ((ord(char) * 0x9E3779B1) & 0xFFFFFFFF) >> 29
 
 
 def word_trigrams(word: str) -> list[str]:
@@ -68,6 +72,29 @@ def word_substring_trigrams(word: str) -> list[str]:
     return [word[i : i + 3] for i in range(len(word) - 2)]
 
 
+# Code points fit in 21 bits, so a trigram packs losslessly into one uint64 key.
+_CODEPOINT_BITS = 21
+_CODEPOINT_MASK = (1 << _CODEPOINT_BITS) - 1
+
+
+def _pack_trigram(trigram: str) -> int:
+    """Pack a 3-character trigram into its uint64 key."""
+    return (
+        (ord(trigram[0]) << (2 * _CODEPOINT_BITS))
+        | (ord(trigram[1]) << _CODEPOINT_BITS)
+        | ord(trigram[2])
+    )
+
+
+def _unpack_trigram(key: int) -> str:
+    """Decode a packed uint64 trigram key back to its 3-character string."""
+    return (
+        chr(key >> (2 * _CODEPOINT_BITS))
+        + chr((key >> _CODEPOINT_BITS) & _CODEPOINT_MASK)
+        + chr(key & _CODEPOINT_MASK)
+    )
+
+
 def build_candidate_index(
     vocabulary: list[str],
 ) -> tuple[TrigramIndex, LengthBuckets]:
@@ -76,6 +103,12 @@ def build_candidate_index(
     Trigram posting lists use structured numpy arrays with 8-bit positional
     and next-char masks for high-precision candidate filtering.
 
+    Construction is NumPy-native: every padded word is laid out in one
+    UTF-32 code point buffer, all (trigram, word, loc, nxt) rows are derived
+    as flat arrays, sorted once with ``lexsort``, duplicate (trigram, word)
+    rows are merged with ``bitwise_or.reduceat``, and each trigram's posting
+    list is a view into one contiguous buffer.
+
     Args:
         vocabulary: Sorted, normalized vocabulary list
 
@@ -85,90 +118,271 @@ def build_candidate_index(
         - length_buckets maps word lengths to int32 numpy arrays
 
     """
-    # Phase 1: Collect as Python lists (O(1) amortized append)
-    trigram_lists: dict[str, list[tuple[int, int, int]]] = {}
-    length_lists: dict[int, list[int]] = {}
-
-    for idx, word in enumerate(vocabulary):
-        padded = f"##{word}##"
-        n_trigrams = len(padded) - 2
-
-        for i in range(n_trigrams):
-            tg = padded[i : i + 3]
-
-            # Positional mask: bit (i % 8) records where this trigram appears
-            loc_bit = 1 << (i & 7)
+    n_words = len(vocabulary)
+    if n_words == 0:
+        return {}, {}
+
+    # Phase 1: one code point buffer holding every "##word##"
+    word_lengths = np.fromiter(map(len, vocabulary), dtype=np.int64, count=n_words)
+    padded_lengths = word_lengths + 4
+    codepoints = np.frombuffer(
+        "".join(f"##{word}##" for word in vocabulary).encode("utf-32-le", "surrogatepass"),
+        dtype=np.uint32,
+    ).astype(np.uint64)
+    word_starts = np.zeros(n_words, dtype=np.int64)
+    np.cumsum(padded_lengths[:-1], out=word_starts[1:])
+
+    # Phase 2: flat (trigram key, word idx, loc bit, nxt bit) rows
+    trigrams_per_word = padded_lengths - 2
+    word_idx = np.repeat(np.arange(n_words, dtype=np.int32), trigrams_per_word)
+    first_row = np.repeat(np.cumsum(trigrams_per_word) - trigrams_per_word, trigrams_per_word)
+    position = np.arange(len(word_idx), dtype=np.int64) - first_row
+    offsets = np.repeat(word_starts, trigrams_per_word) + position
+
+    keys = (
+        (codepoints[offsets] << np.uint64(2 * _CODEPOINT_BITS))
+        | (codepoints[offsets + 1] << np.uint64(_CODEPOINT_BITS))
+        | codepoints[offsets + 2]
+    )
 
-            # Next-char mask: hash of character after trigram for "3.5-gram" precision
-            next_pos = i + 3
-            if next_pos < len(padded):
-                nxt_bit = 1 << _next_char_hash(padded[next_pos])
-            else:
-                nxt_bit = 1 << 7  # sentinel bit for end-of-word
-
-            if tg not in trigram_lists:
-                trigram_lists[tg] = []
-            trigram_lists[tg].append((idx, loc_bit, nxt_bit))
-
-        # Length bucket
-        length = len(word)
-        if length not in length_lists:
-            length_lists[length] = []
-        length_lists[length].append(idx)
-
-    # Phase 2: Convert to numpy arrays for cache-friendly, vectorized access
-    trigram_index: TrigramIndex = {}
-    for tg, entries in trigram_lists.items():
-        arr = np.empty(len(entries), dtype=POSTING_DTYPE)
-        for j, (idx, loc, nxt) in enumerate(entries):
-            arr[j] = (idx, loc, nxt)
-        # Sort by vocabulary index for consistent ordering
-        arr.sort(order="idx")
-        # Merge masks for duplicate (trigram, word_idx) pairs. A word can have
-        # the same trigram at multiple positions — we OR the masks together.
-        if len(arr) > 1:
-            unique_mask = np.empty(len(arr), dtype=bool)
-            unique_mask[0] = True
-            unique_mask[1:] = arr["idx"][1:] != arr["idx"][:-1]
-            if not unique_mask.all():
-                # Merge duplicate entries by OR-ing masks
-                merged: list[tuple[int, int, int]] = []
-                cur_idx, cur_loc, cur_nxt = (
-                    int(arr[0]["idx"]),
-                    int(arr[0]["loc"]),
-                    int(arr[0]["nxt"]),
-                )
-                for k in range(1, len(arr)):
-                    if arr[k]["idx"] == cur_idx:
-                        cur_loc |= int(arr[k]["loc"])
-                        cur_nxt |= int(arr[k]["nxt"])
-                    else:
-                        merged.append((cur_idx, cur_loc, cur_nxt))
-                        cur_idx, cur_loc, cur_nxt = (
-                            int(arr[k]["idx"]),
-                            int(arr[k]["loc"]),
-                            int(arr[k]["nxt"]),
-                        )
-                merged.append((cur_idx, cur_loc, cur_nxt))
-                arr = np.array(merged, dtype=POSTING_DTYPE)
-        trigram_index[tg] = arr
-
-    length_buckets: LengthBuckets = {}
-    for length, indices in length_lists.items():
-        bucket = np.array(sorted(indices), dtype=np.int32)
-        length_buckets[length] = bucket
-
-    total_postings = sum(len(arr) for arr in trigram_index.values())
-    memory_bytes = total_postings * POSTING_DTYPE.itemsize
+    # Positional mask: bit (i % 8) records where this trigram appears
+    loc = np.left_shift(1, position & 7).astype(np.uint8)
+
+    # Next-char mask: hash of character after trigram for "3.5-gram" precision;
+    # the last trigram of each word has no next char and gets sentinel bit 7.
+    has_next = position < (trigrams_per_word[word_idx] - 1)
+    next_cp = codepoints[np.where(has_next, offsets + 3, offsets)]
+    unique_cp, cp_inverse = np.unique(next_cp, return_inverse=True)
+    cp_bits = np.array([1 << _next_char_hash(chr(int(cp))) for cp in unique_cp], dtype=np.uint8)
+    nxt = np.where(has_next, cp_bits[cp_inverse], np.uint8(1 << 7)).astype(np.uint8)
+
+    # Phase 3: sort by (trigram, word) and OR-merge duplicate pairs
+    order = np.lexsort((word_idx, keys))
+    keys, word_idx, loc, nxt = keys[order], word_idx[order], loc[order], nxt[order]
+
+    row_start = np.ones(len(keys), dtype=bool)
+    row_start[1:] = (keys[1:] != keys[:-1]) | (word_idx[1:] != word_idx[:-1])
+    starts = np.flatnonzero(row_start)
+
+    postings = np.empty(len(starts), dtype=POSTING_DTYPE)
+    postings["idx"] = word_idx[starts]
+    postings["loc"] = np.bitwise_or.reduceat(loc, starts)
+    postings["nxt"] = np.bitwise_or.reduceat(nxt, starts)
+    merged_keys = keys[starts]
+
+    # Phase 4: per-trigram views into the contiguous posting buffer
+    trigram_bounds = np.flatnonzero(np.r_[True, merged_keys[1:] != merged_keys[:-1], True])
+    trigram_index: TrigramIndex = {
+        _unpack_trigram(int(merged_keys[lo])): postings[lo:hi]
+        for lo, hi in zip(trigram_bounds[:-1].tolist(), trigram_bounds[1:].tolist(), strict=True)
+    }
+
+    # Length buckets: stable sort keeps indices ascending within each bucket
+    by_length = np.argsort(word_lengths, kind="stable").astype(np.int32)
+    sorted_lengths = word_lengths[by_length]
+    bucket_bounds = np.flatnonzero(np.r_[True, sorted_lengths[1:] != sorted_lengths[:-1], True])
+    length_buckets: LengthBuckets = {
+        int(sorted_lengths[lo]): by_length[lo:hi]
+        for lo, hi in zip(bucket_bounds[:-1].tolist(), bucket_bounds[1:].tolist(), strict=True)
+    }
+
+    memory_bytes = postings.nbytes
     logger.info(
         f"Built candidate index: {len(trigram_index)} trigrams "
-        f"({total_postings:,} postings, {memory_bytes / 1024:.0f}KB), "
+        f"({len(postings):,} postings, {memory_bytes / 1024:.0f}KB), "
         f"{len(length_buckets)} length buckets",
     )
 
     return trigram_index, length_buckets
 
 
+def pack_candidate_index(
+    trigram_index: TrigramIndex,
+    length_buckets: LengthBuckets,
+) -> dict[str, np.ndarray]:
+    """Flatten a candidate index into contiguous arrays for persistence.
+
+    Layout: one ``POSTING_DTYPE`` postings buffer with a sorted uint64 trigram
+    key table and int64 offsets, plus the same CSR shape for length buckets.
+
+    Args:
+        trigram_index: Index from build_candidate_index
+        length_buckets: Buckets from build_candidate_index
+
+    Returns:
+        Named arrays accepted by ``unpack_candidate_index``
+
+    """
+    trigrams = sorted(trigram_index, key=_pack_trigram)
+    trigram_postings = [trigram_index[tg] for tg in trigrams]
+    trigram_offsets = np.zeros(len(trigrams) + 1, dtype=np.int64)
+    np.cumsum([len(p) for p in trigram_postings], out=trigram_offsets[1:])
+
+    lengths = sorted(length_buckets)
+    buckets = [length_buckets[length] for length in lengths]
+    bucket_offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in buckets], out=bucket_offsets[1:])
+
+    return {
+        "trigram_keys": np.array([_pack_trigram(tg) for tg in trigrams], dtype=np.uint64),
+        "trigram_offsets": trigram_offsets,
+        "postings": (
+            np.concatenate(trigram_postings, dtype=POSTING_DTYPE)
+            if trigram_postings
+            else np.empty(0, dtype=POSTING_DTYPE)
+        ),
+        "bucket_lengths": np.array(lengths, dtype=np.int64),
+        "bucket_offsets": bucket_offsets,
+        "bucket_indices": (
+            np.concatenate(buckets).astype(np.int32) if buckets else np.empty(0, dtype=np.int32)
+        ),
+    }
+
+
+def unpack_candidate_index(arrays: dict[str, np.ndarray]) -> tuple[TrigramIndex, LengthBuckets]:
+    """Rebuild the dict-of-views candidate index from packed arrays (zero-copy).
+
+    Posting lists and buckets are slices of the packed buffers, so memory-mapped
+    inputs stay memory-mapped.
+
+    Args:
+        arrays: Output of ``pack_candidate_index`` (or memory-mapped copies)
+
+    Returns:
+        Tuple of (trigram_index, length_buckets)
+
+    """
+    postings = arrays["postings"]
+    offsets = arrays["trigram_offsets"].tolist()
+    trigram_index: TrigramIndex = {
+        _unpack_trigram(key): postings[offsets[i] : offsets[i + 1]]
+        for i, key in enumerate(arrays["trigram_keys"].tolist())
+    }
+
+    indices = arrays["bucket_indices"]
+    bucket_offsets = arrays["bucket_offsets"].tolist()
+    length_buckets: LengthBuckets = {
+        length: indices[bucket_offsets[i] : bucket_offsets[i + 1]]
+        for i, length in enumerate(arrays["bucket_lengths"].tolist())
+    }
+    return trigram_index, length_buckets
+
+
+def _remap_indices(indices: np.ndarray, remap: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Apply a monotone index remap, returning (new indices, keep mask)."""
+    new_indices = remap[indices]
+    keep = new_indices >= 0
+    return new_indices[keep], keep
+
+
+def _concat_postings(
+    trigrams: list[str], parts: list[PostingArray], remap: np.ndarray | None = None
+) -> TrigramIndex:
+    """Copy posting lists into one new buffer (optionally remapping indices) and re-slice it."""
+    offsets = np.zeros(len(parts) + 1, dtype=np.int64)
+    np.cumsum(np.fromiter(map(len, parts), dtype=np.int64, count=len(parts)), out=offsets[1:])
+    # An explicit dtype skips per-part structured dtype promotion
+    buffer = np.concatenate(parts, dtype=POSTING_DTYPE) if parts else np.empty(0, POSTING_DTYPE)
+    if remap is not None:
+        buffer["idx"] = remap[buffer["idx"]]
+    bounds = offsets.tolist()
+    return {tg: buffer[bounds[i] : bounds[i + 1]] for i, tg in enumerate(trigrams)}
+
+
+def update_candidate_index(
+    trigram_index: TrigramIndex,
+    length_buckets: LengthBuckets,
+    remap: np.ndarray,
+    added_words: list[str] | None = None,
+    added_indices: np.ndarray | None = None,
+    removed_words: list[str] | None = None,
+) -> tuple[TrigramIndex, LengthBuckets]:
+    """Derive the candidate index for an edited vocabulary instead of rebuilding it.
+
+    Nothing is re-tokenized except ``added_words`` and ``removed_words``:
+    untouched posting lists are gathered into one new buffer with a single
+    vectorized remap, and the posting lists of trigrams that occur in the
+    edited words are merged (surviving + new postings) into a second one.
+    Because ``remap`` is monotone, remapped posting lists stay sorted.
+
+    The inputs are never mutated, so lookups still reading the previous
+    index (against the previous vocabulary) stay consistent while the new
+    one is built; the caller publishes both together.
+
+    Args:
+        trigram_index: Index from build_candidate_index (not mutated)
+        length_buckets: Buckets from build_candidate_index (not mutated)
+        remap: Old vocabulary index -> new index, ``-1`` for removed words
+        added_words: Words inserted into the vocabulary
+        added_indices: New vocabulary index of each added word
+        removed_words: Words dropped from the vocabulary (``remap`` is ``-1``)
+
+    Returns:
+        Tuple of new (trigram_index, length_buckets)
+
+    """
+    remap32 = np.asarray(remap, dtype=np.int32)
+
+    patched_buckets: LengthBuckets = {}
+    for length, bucket in length_buckets.items():
+        new_idx, _ = _remap_indices(bucket, remap32)
+        if len(new_idx) > 0:
+            patched_buckets[length] = new_idx.astype(np.int32)
+
+    delta_index: TrigramIndex = {}
+    if added_words and added_indices is not None:
+        delta_map = np.asarray(added_indices, dtype=np.int32)
+        delta_index, delta_buckets = build_candidate_index(added_words)
+        delta_index = _concat_postings(list(delta_index), list(delta_index.values()), delta_map)
+
+        for length, bucket in delta_buckets.items():
+            new_idx = delta_map[bucket]
+            if (existing := patched_buckets.get(length)) is not None:
+                new_idx = np.sort(np.concatenate([existing, new_idx]))
+            patched_buckets[length] = new_idx.astype(np.int32)
+
+    touched = {tg for word in removed_words or () for tg in word_trigrams(word)}
+    touched.update(delta_index)
+    untouched = [tg for tg in trigram_index if tg not in touched]
+    patched = _concat_postings(untouched, [trigram_index[tg] for tg in untouched], remap32)
+
+    # Rebuild the touched posting lists together: surviving + new postings of
+    # every touched trigram, sorted by (trigram, index) into one new buffer.
+    parts: list[PostingArray] = []
+    groups: list[int] = []
+    is_old: list[bool] = []
+    trigrams: list[str] = []
+    for tg in touched:
+        postings = [
+            (p, old)
+            for p, old in ((trigram_index.get(tg), True), (delta_index.get(tg), False))
+            if p is not None
+        ]
+        if postings:
+            parts.extend(p for p, _ in postings)
+            is_old.extend(old for _, old in postings)
+            groups.extend([len(trigrams)] * len(postings))
+            trigrams.append(tg)
+    if not parts:
+        return patched, patched_buckets
+
+    part_lengths = [len(p) for p in parts]
+    merged = np.concatenate(parts, dtype=POSTING_DTYPE)
+    old_rows = np.repeat(np.array(is_old, dtype=bool), part_lengths)
+    merged["idx"][old_rows] = remap32[merged["idx"][old_rows]]
+    group_ids = np.repeat(np.array(groups, dtype=np.int64), part_lengths)
+    kept = merged["idx"] >= 0
+    merged, group_ids = merged[kept], group_ids[kept]
+    order = np.lexsort((merged["idx"], group_ids))
+    merged, group_ids = merged[order], group_ids[order]
+    bounds = np.searchsorted(group_ids, np.arange(len(trigrams) + 1)).tolist()
+    for i, tg in enumerate(trigrams):
+        if bounds[i + 1] > bounds[i]:
+            patched[tg] = merged[bounds[i] : bounds[i + 1]]
+
+    return patched, patched_buckets
+
+
 def get_candidates(
     query: str,
     vocabulary: list[str],
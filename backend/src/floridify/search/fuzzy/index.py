@@ -58,7 +58,8 @@ class FuzzyIndex(BaseModel):
     suffix_array_size_bytes: int = 0
 
     # Binary payload — never serialized through model_dump.
-    # Holds {"ffuzzy": bytes, "suffix_array": bytes}.
+    # Holds {"ffuzzy": bytes, "suffix_array": bytes} (memoryviews when loaded
+    # from the L2 cache).
     binary_data: dict[str, bytes] | None = Field(
         default=None,
         exclude=True,
@@ -143,7 +144,8 @@ class FuzzyIndex(BaseModel):
 
         ffuzzy_index: Any = None
         if ffuzzy_bytes:
-            ffuzzy_index = ffuzzy.Index.from_bytes(ffuzzy_bytes)
+            # L2 hands payloads back as (mmap-backed) memoryviews; the crate takes bytes
+            ffuzzy_index = ffuzzy.Index.from_bytes(bytes(ffuzzy_bytes))
 
         suffix_array = pickle.loads(suffix_array_bytes) if suffix_array_bytes else None
         return ffuzzy_index, None, suffix_array
@@ -225,7 +227,7 @@ class FuzzyIndex(BaseModel):
                 and existing.binary_data.get("ffuzzy")
             ):
                 try:
-                    ffuzzy.Index.from_bytes(existing.binary_data["ffuzzy"])
+                    ffuzzy.Index.from_bytes(bytes(existing.binary_data["ffuzzy"]))
                 except Exception as e:
                     logger.info(
                         f"Cached FuzzyIndex for '{corpus.corpus_name}' "
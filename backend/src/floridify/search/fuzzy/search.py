@@ -94,19 +94,67 @@ class FuzzySearch:
             logger.warning(f"ffuzzy search failed for {query!r}: {e}")
             return []
 
-        results: list[SearchResult] = []
-        for hit in raw_hits:
-            results.append(
-                SearchResult(
-                    word=hit.word,
-                    score=hit.score,
-                    method=SearchMethod.FUZZY,
-                    lemmatized_word=None,
-                    language=corpus.language,
-                    metadata={"engine": hit.engine} if hit.engine != "exact" else None,
-                ),
+        return self._convert_hits(raw_hits, corpus)
+
+    def search_many(
+        self,
+        queries: list[str],
+        corpus: Corpus,
+        max_results: int = 20,
+        min_score: float | None = None,
+    ) -> list[list[SearchResult]]:
+        """Run a batch of hybrid fuzzy searches against the loaded index.
+
+        The ``ffuzzy`` binding only exposes single-query ``search``, so the
+        batch is a tight loop over the Rust index. Callers should dispatch
+        the whole batch with one ``asyncio.to_thread`` rather than one per
+        query.
+
+        Args:
+            queries: Normalized query strings.
+            corpus: Corpus for language tagging on results.
+            max_results: Maximum results per query.
+            min_score: Optional override for the minimum score threshold.
+
+        Returns:
+            One result list per query, in input order.
+        """
+        if self._ffuzzy is None:
+            return [[] for _ in queries]
+
+        threshold = float(min_score if min_score is not None else self.min_score)
+        batch: list[list[SearchResult]] = []
+        for query in queries:
+            if not query:
+                batch.append([])
+                continue
+            try:
+                raw_hits = self._ffuzzy.search(
+                    query,
+                    max_results=max_results,
+                    min_score=threshold,
+                )
+            except Exception as e:  # pragma: no cover — Rust errors are already specific
+                logger.warning(f"ffuzzy search failed for {query!r}: {e}")
+                batch.append([])
+                continue
+            batch.append(self._convert_hits(raw_hits, corpus))
+        return batch
+
+    @staticmethod
+    def _convert_hits(raw_hits: Any, corpus: Corpus) -> list[SearchResult]:
+        """Convert ``ffuzzy.SearchHit`` objects to ``SearchResult``."""
+        return [
+            SearchResult(
+                word=hit.word,
+                score=hit.score,
+                method=SearchMethod.FUZZY,
+                lemmatized_word=None,
+                language=corpus.language,
+                metadata={"engine": hit.engine} if hit.engine != "exact" else None,
             )
-        return results
+            for hit in raw_hits
+        ]
 
 
 __all__ = ["FuzzySearch"]
@@ -55,6 +55,7 @@ class LanguageSearch:
         mode: SearchMode,
         max_results: int = 20,
         min_score: float | None = None,
+        stage_timings: dict[str, Any] | None = None,
     ) -> list[SearchResult]:
         """Search with explicit mode selection."""
         return await self.search_engine.search_with_mode(
@@ -62,6 +63,22 @@ class LanguageSearch:
             mode=mode,
             max_results=max_results,
             min_score=min_score,
+            stage_timings=stage_timings,
+        )
+
+    async def search_many(
+        self,
+        queries: list[str],
+        mode: SearchMode = SearchMode.SMART,
+        max_results: int = 20,
+        min_score: float | None = None,
+    ) -> list[list[SearchResult]]:
+        """Batched search with explicit mode selection."""
+        return await self.search_engine.search_many(
+            queries=queries,
+            mode=mode,
+            max_results=max_results,
+            min_score=min_score,
         )
 
     async def search(
@@ -0,0 +1,201 @@
+"""Micro-batching of concurrent semantic queries.
+
+Under typeahead load many single-query searches arrive within milliseconds of
+each other, and each one would otherwise run its own forward pass and its own
+one-row FAISS search against the same model. ``QueryBatcher`` holds queries
+for a short window (or until the batch is full), encodes every query that
+still needs an embedding in one forward pass, runs one FAISS search over the
+stacked matrix, and hands each caller its own row.
+
+Batches run one at a time per engine: the model is a single shared resource,
+so queries arriving while a batch is running form the next batch instead of
+contending with it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from ...utils.logging import get_logger
+from .constants import SEMANTIC_BATCH_MAX_SIZE, SEMANTIC_BATCH_WINDOW_MS
+
+logger = get_logger(__name__)
+
+
+class BatchStats:
+    """Running counters for batch sizes and queue latency."""
+
+    def __init__(self) -> None:
+        self.batches = 0
+        self.queries = 0
+        self.encoded = 0
+        self.max_batch_size = 0
+        self.batch_sizes: dict[int, int] = {}
+        self.total_queue_ms = 0.0
+        self.max_queue_ms = 0.0
+
+    def record(self, size: int, encoded: int, queue_ms: list[float]) -> None:
+        self.batches += 1
+        self.queries += size
+        self.encoded += encoded
+        self.max_batch_size = max(self.max_batch_size, size)
+        self.batch_sizes[size] = self.batch_sizes.get(size, 0) + 1
+        self.total_queue_ms += sum(queue_ms)
+        self.max_queue_ms = max(self.max_queue_ms, *queue_ms)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "batches": self.batches,
+            "queries": self.queries,
+            "encoded": self.encoded,
+            "avg_batch_size": self.queries / self.batches if self.batches else 0.0,
+            "max_batch_size": self.max_batch_size,
+            "batch_sizes": dict(sorted(self.batch_sizes.items())),
+            "avg_queue_ms": self.total_queue_ms / self.queries if self.queries else 0.0,
+            "max_queue_ms": self.max_queue_ms,
+        }
+
+
+class _PendingQuery:
+    __slots__ = ("query", "embedding", "k", "future", "enqueued_at")
+
+    def __init__(
+        self,
+        query: str,
+        embedding: np.ndarray | None,
+        k: int,
+        future: asyncio.Future[tuple[np.ndarray, np.ndarray, np.ndarray]],
+    ) -> None:
+        self.query = query
+        self.embedding = embedding
+        self.k = k
+        self.future = future
+        self.enqueued_at = time.perf_counter()
+
+
+class QueryBatcher:
+    """Collects concurrent queries into shared encode + FAISS calls.
+
+    Args:
+        encode: Encodes a list of texts to an (n, d) matrix (sync; run in a thread)
+        search: FAISS-style search of an (n, d) float32 matrix for k neighbours (sync)
+        window_ms: How long the first query of a batch waits for company
+        max_batch_size: Flush as soon as this many queries are waiting
+
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[list[str]], np.ndarray],
+        search: Callable[[np.ndarray, int], tuple[np.ndarray, np.ndarray]],
+        window_ms: float = SEMANTIC_BATCH_WINDOW_MS,
+        max_batch_size: int = SEMANTIC_BATCH_MAX_SIZE,
+    ) -> None:
+        self._encode = encode
+        self._search = search
+        self.window_ms = window_ms
+        self.max_batch_size = max(1, max_batch_size)
+        self.stats = BatchStats()
+
+        self._pending: list[_PendingQuery] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._run_lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(
+        self,
+        query: str,
+        embedding: np.ndarray | None,
+        k: int,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Queue one query and wait for its batch.
+
+        Args:
+            query: Normalized query text (encoded if ``embedding`` is None)
+            embedding: Precomputed query embedding, if any
+            k: Number of neighbours to return
+
+        Returns:
+            Tuple of (query embedding, distances row, indices row)
+
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[tuple[np.ndarray, np.ndarray, np.ndarray]] = loop.create_future()
+        self._pending.append(_PendingQuery(query, embedding, k, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(max(self.window_ms, 0.0) / 1000, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            task = asyncio.create_task(self._run())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    def _take_batch(self) -> list[_PendingQuery]:
+        """Take up to ``max_batch_size`` queued queries, oldest first."""
+        batch = self._pending[: self.max_batch_size]
+        del self._pending[: self.max_batch_size]
+        if self._pending:
+            # More than a full batch is waiting: queue the next run right away
+            self._flush()
+        elif self._timer is not None:
+            # The queries the timer was armed for are in this batch
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    async def _run(self) -> None:
+        async with self._run_lock:
+            # Take the queue only once the model is free: everything that queued
+            # up behind the previous batch goes out together. Callers that gave
+            # up while queued don't need a slot in the batch.
+            batch = [item for item in self._take_batch() if not item.future.done()]
+            if not batch:
+                return
+
+            started = time.perf_counter()
+            queue_ms = [(started - item.enqueued_at) * 1000 for item in batch]
+
+            try:
+                to_encode = list(dict.fromkeys(i.query for i in batch if i.embedding is None))
+                if to_encode:
+                    # One forward pass for every query in the batch without an embedding
+                    encoded = await asyncio.to_thread(self._encode, to_encode)
+                    by_query = dict(zip(to_encode, encoded, strict=True))
+                    for item in batch:
+                        if item.embedding is None:
+                            item.embedding = by_query[item.query]
+
+                matrix = np.vstack([item.embedding for item in batch]).astype("float32")
+                k = max(item.k for item in batch)
+
+                # One FAISS search over the stacked (n, d) query matrix
+                distances, indices = await asyncio.to_thread(self._search, matrix, k)
+            except Exception as e:
+                for item in batch:
+                    if not item.future.done():
+                        item.future.set_exception(e)
+                return
+
+            self.stats.record(len(batch), len(to_encode), queue_ms)
+            for row, item in enumerate(batch):
+                if not item.future.done():
+                    item.future.set_result(
+                        (item.embedding, distances[row, : item.k], indices[row, : item.k])
+                    )
+
+
+__all__ = ["BatchStats", "QueryBatcher"]
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 
 from ...utils.logging import get_logger
+from .embedding_store import encode_with_store
 from .encoder import SemanticEncoder
 from .index_builder import build_optimized_index, configure_faiss_threading
 from .persistence import save_embeddings_and_index
@@ -186,7 +187,9 @@ class SemanticEmbeddingBuilder:
         configure_faiss_threading()
 
         # Model-aware optimized quantization strategy
-        sentence_index = build_optimized_index(dimension, vocab_size, sentence_embeddings)
+        sentence_index = build_optimized_index(
+            dimension, vocab_size, sentence_embeddings, coarse_mode=index.coarse_mode
+        )
 
         total_time = time.time() - embedding_start
         embeddings_per_sec = vocab_count / total_time if total_time > 0 else 0
@@ -206,7 +209,29 @@ class SemanticEmbeddingBuilder:
         embedding_vocabulary: list[str],
         index: SemanticIndex,
     ) -> np.ndarray:
-        """Encode vocabulary with batching for large corpora.
+        """Encode vocabulary, reusing embeddings from the persistent embedding store.
+
+        Only lemmas the store has never seen for this model are encoded.
+
+        Args:
+            embedding_vocabulary: List of words/lemmas to encode
+            index: SemanticIndex for model name and batch size
+
+        Returns:
+            Numpy array of embeddings
+        """
+        return encode_with_store(
+            embedding_vocabulary,
+            index.model_name,
+            lambda texts: self._encode_texts(texts, index),
+        )
+
+    def _encode_texts(
+        self,
+        embedding_vocabulary: list[str],
+        index: SemanticIndex,
+    ) -> np.ndarray:
+        """Encode texts with batching for large corpora.
 
         Args:
             embedding_vocabulary: List of words/lemmas to encode
@@ -56,6 +56,19 @@ MATRYOSHKA_DIM: int | None = int(os.getenv("FLORIDIFY_MATRYOSHKA_DIM", "512"))
 if MATRYOSHKA_DIM == 0:
     MATRYOSHKA_DIM = None  # Disable truncation
 
+# Coarse-to-fine retrieval (per SemanticIndex.coarse_mode): a compact coarse index
+# proposes candidates that are re-ranked exactly with the full stored vectors.
+#   "matryoshka": first COARSE_MATRYOSHKA_DIM dims (MRL models), inner product
+#   "binary":     sign bits of the full vector, Hamming distance
+# Unset keeps the single-stage FAISS index chosen by corpus size.
+SemanticCoarseMode = Literal["matryoshka", "binary"]
+_coarse_mode = os.getenv("FLORIDIFY_SEMANTIC_COARSE_MODE", "").lower()
+SEMANTIC_COARSE_MODE: SemanticCoarseMode | None = (
+    _coarse_mode if _coarse_mode in ("matryoshka", "binary") else None  # type: ignore[assignment]
+)
+COARSE_MATRYOSHKA_DIM = 64
+COARSE_RERANK_CANDIDATES = int(os.getenv("FLORIDIFY_SEMANTIC_COARSE_CANDIDATES", "256"))
+
 # FAISS Configuration
 L2_DISTANCE_NORMALIZATION = 2  # Divisor for L2 distance to similarity conversion
 
@@ -79,6 +92,28 @@ MODEL_BATCH_SIZES = {
 }
 DEFAULT_BATCH_SIZE = 32
 
+# Query micro-batching: concurrent search() calls share one encode + one FAISS search
+SEMANTIC_BATCHING_ENABLED = os.getenv("FLORIDIFY_SEMANTIC_BATCHING", "true").lower() == "true"
+SEMANTIC_BATCH_WINDOW_MS = float(os.getenv("FLORIDIFY_SEMANTIC_BATCH_WINDOW_MS", "3"))
+SEMANTIC_BATCH_MAX_SIZE = int(os.getenv("FLORIDIFY_SEMANTIC_BATCH_MAX_SIZE", "32"))
+
+# Persistent encoder pool for large CPU builds: spawned workers keep the model loaded
+# across builds and write embeddings into shared memory rather than through pipes.
+ENCODER_POOL_ENABLED = os.getenv("FLORIDIFY_ENCODER_POOL", "true").lower() == "true"
+ENCODER_POOL_MAX_WORKERS = int(os.getenv("FLORIDIFY_ENCODER_POOL_WORKERS", "4"))
+ENCODER_POOL_MIN_TEXTS = 5000  # Below this, worker dispatch costs more than it saves
+ENCODER_POOL_CHUNK_SIZE = 512  # Texts per queued task
+ENCODER_POOL_WORKER_MEMORY_GB = 1.5  # Model + batch tensors + overhead per worker
+
+# Persistent embedding store: encoded texts are reused across corpora and versions.
+# int8 here is per-row absmax scaling of float32 outputs, unaffected by the
+# batch-calibration problem that disables USE_QUANTIZATION below.
+EMBEDDING_STORE_ENABLED = os.getenv("FLORIDIFY_EMBEDDING_STORE", "true").lower() == "true"
+EMBEDDING_STORE_DTYPE: Literal["float16", "int8"] = (
+    "int8" if os.getenv("FLORIDIFY_EMBEDDING_STORE_DTYPE", "").lower() == "int8" else "float16"
+)
+EMBEDDING_STORE_MAX_SEGMENTS = 8  # Segments are merged into one beyond this
+
 # Optimization Configuration
 ENABLE_GPU_ACCELERATION = True  # Enable GPU acceleration when available
 MEMORY_MAP_EMBEDDINGS = True  # Use memory-mapped storage for zero-copy access
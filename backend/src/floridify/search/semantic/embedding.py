@@ -1,6 +1,6 @@
 """Embedding model management and encoding for semantic search.
 
-Handles model loading, caching, and text encoding with multiprocessing support.
+Handles model loading and caching.
 """
 
 from __future__ import annotations
@@ -9,53 +9,11 @@ import asyncio
 import time
 from typing import Any
 
-import numpy as np
-
 from ...utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
-def _encode_chunk_worker(
-    chunk: list[str],
-    model_name: str,
-    batch_size: int,
-    worker_id: int,
-) -> np.ndarray:
-    """Worker function for multiprocessing encoding.
-
-    Must be at module level for pickling. Each worker loads its own model instance
-    to avoid shared state and GIL contention.
-
-    Args:
-        chunk: List of texts to encode
-        model_name: Name/path of sentence transformer model
-        batch_size: Batch size for encoding
-        worker_id: Worker process ID for logging
-
-    Returns:
-        Numpy array of embeddings for the chunk
-    """
-    from sentence_transformers import SentenceTransformer
-
-    # Each worker loads its own model to avoid shared state
-    model = SentenceTransformer(model_name)
-
-    # Encode the chunk (single-process within this worker)
-    embeddings = model.encode(
-        sentences=chunk,
-        batch_size=batch_size,
-        show_progress_bar=False,  # Disable to avoid clutter from multiple workers
-        output_value="sentence_embedding",
-        precision="float32",
-        convert_to_numpy=True,
-        convert_to_tensor=False,
-        normalize_embeddings=True,
-    )
-
-    return embeddings
-
-
 # Global model cache using asyncio lock for thread-safety
 # Lazy import optimization: sentence_transformers loaded only when semantic search is used
 _model_cache: dict[str, Any] = {}  # Values are SentenceTransformer instances
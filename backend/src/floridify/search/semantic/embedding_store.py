@@ -0,0 +1,444 @@
+"""Persistent, content-addressed embedding store.
+
+Every corpus build used to encode its lemmatized vocabulary from scratch, so
+the language master corpus, its children, literature and wordlist corpora
+re-encoded the same words with the same model, and a new corpus version
+re-encoded every unchanged word. This store keeps each encoded text on disk,
+keyed by (model name, output dimension, text hash), so encoding only ever
+runs for texts the model has not seen before.
+
+Layout: one directory per (model, dimension, dtype), holding immutable
+segments. A segment is a sorted ``uint64`` key array (first 8 bytes of the
+text's BLAKE2b digest) plus a row-aligned ``float16`` or ``int8`` (with
+per-row scales) vector array, all ``.npy`` files memory-mapped on load.
+Lookups are one ``searchsorted`` per segment. New texts are appended as a new
+segment, and segments are merged once there are more than
+``EMBEDDING_STORE_MAX_SEGMENTS``.
+
+Bump ``EMBEDDING_STORE_VERSION`` whenever encoder output changes for the same
+model (e.g. a different normalization), so stale vectors are never served.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+import uuid
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ...utils.logging import get_logger
+from ...utils.paths import get_cache_directory
+from .constants import (
+    EMBEDDING_STORE_DTYPE,
+    EMBEDDING_STORE_ENABLED,
+    EMBEDDING_STORE_MAX_SEGMENTS,
+    MATRYOSHKA_DIM,
+    MATRYOSHKA_DIMENSIONS,
+    MODEL_DIMENSIONS,
+)
+
+logger = get_logger(__name__)
+
+EMBEDDING_STORE_VERSION = 1
+
+_KEYS = ".keys.npy"
+_VECTORS = ".vectors.npy"
+_SCALES = ".scales.npy"
+
+# Rows copied per write when compaction streams segments into the merged file
+_COMPACT_CHUNK_ROWS = 65536
+
+
+def text_keys(texts: Sequence[str]) -> np.ndarray:
+    """64-bit content keys for texts (BLAKE2b, little-endian)."""
+    digests = b"".join(
+        hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest() for text in texts
+    )
+    return np.frombuffer(digests, dtype="<u8")
+
+
+def _save_atomic(path: Path, array: np.ndarray) -> None:
+    """Write an .npy file via a temp file renamed into place."""
+    fd, tmp_name = tempfile.mkstemp(prefix=".segment-", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, array, allow_pickle=False)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _save_gathered_atomic(
+    path: Path, parts: Sequence[np.ndarray], bounds: np.ndarray, rows: np.ndarray
+) -> None:
+    """Write ``np.concatenate(parts)[rows]`` to an .npy file without building it.
+
+    The output is a memory-mapped .npy filled from one part at a time, in
+    chunks of ``_COMPACT_CHUNK_ROWS``, so only a chunk of rows is ever copied
+    into memory.
+
+    Args:
+        path: Destination .npy file
+        parts: Arrays sharing dtype and trailing shape
+        bounds: Start row of each part in the concatenation
+        rows: Rows of the concatenation to write, in output order
+
+    """
+    fd, tmp_name = tempfile.mkstemp(prefix=".segment-", suffix=".tmp", dir=path.parent)
+    os.close(fd)
+    try:
+        out = np.lib.format.open_memmap(
+            tmp_name, mode="w+", dtype=parts[0].dtype, shape=(len(rows), *parts[0].shape[1:])
+        )
+        owner = np.searchsorted(bounds, rows, side="right") - 1
+        for i, part in enumerate(parts):
+            targets = np.flatnonzero(owner == i)
+            for start in range(0, targets.size, _COMPACT_CHUNK_ROWS):
+                chunk = targets[start : start + _COMPACT_CHUNK_ROWS]
+                out[chunk] = part[rows[chunk] - bounds[i]]
+        out.flush()
+        del out
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+@dataclass(slots=True)
+class _Segment:
+    """One immutable, memory-mapped batch of stored embeddings."""
+
+    name: str
+    keys: np.ndarray  # Sorted uint64
+    vectors: np.ndarray  # float16, or int8 with per-row scales
+    scales: np.ndarray | None
+
+    def locate(self, keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Rows of ``keys`` in this segment, and which keys were found."""
+        if len(self.keys) == 0:
+            return np.empty(0, dtype=np.intp), np.zeros(len(keys), dtype=bool)
+        positions = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        found = self.keys[positions] == keys
+        return positions[found], found
+
+    def decode(self, rows: np.ndarray) -> np.ndarray:
+        """float32 vectors for the given rows."""
+        vectors = np.asarray(self.vectors[rows], dtype=np.float32)
+        if self.scales is not None:
+            vectors *= self.scales[rows, None]
+        return vectors
+
+
+class EmbeddingStore:
+    """Content-addressed embeddings for one model and output dimension.
+
+    Args:
+        directory: Segment directory (created if missing)
+        dimension: Embedding width; vectors of any other width are rejected
+        dtype: On-disk precision, ``float16`` or ``int8``
+
+    Segments are immutable and written via rename, so concurrent processes
+    only ever map complete files. Two processes compacting at once may both
+    keep a merged copy; duplicate keys are harmless.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        dimension: int,
+        dtype: str = EMBEDDING_STORE_DTYPE,
+    ) -> None:
+        self.directory = directory
+        self.dimension = dimension
+        self.dtype = dtype
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._segments: list[_Segment] = []
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.added = 0
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Map segments written since the last refresh and drop removed ones."""
+        with self._lock:
+            names = {path.name.removesuffix(_KEYS) for path in self.directory.glob(f"*{_KEYS}")}
+            segments = [segment for segment in self._segments if segment.name in names]
+            loaded = {segment.name for segment in segments}
+            for name in sorted(names - loaded):
+                try:
+                    segments.append(self._load_segment(name))
+                except Exception as e:
+                    logger.warning(f"Ignoring unreadable embedding segment {name}: {e}")
+            self._segments = segments
+
+    def _load_segment(self, name: str) -> _Segment:
+        base = self.directory / name
+        vectors = np.load(f"{base}{_VECTORS}", mmap_mode="r", allow_pickle=False)
+        keys = np.load(f"{base}{_KEYS}", mmap_mode="r", allow_pickle=False)
+        scales_path = Path(f"{base}{_SCALES}")
+        scales = np.load(scales_path, mmap_mode="r") if scales_path.exists() else None
+        if vectors.ndim != 2 or vectors.shape != (len(keys), self.dimension):
+            raise ValueError(f"shape {vectors.shape} does not match {len(keys)}x{self.dimension}")
+        return _Segment(name, keys, vectors, scales)
+
+    def __len__(self) -> int:
+        return sum(len(segment.keys) for segment in self._segments)
+
+    def _find(self, keys: np.ndarray) -> np.ndarray:
+        """Which keys are stored in any segment."""
+        found = np.zeros(len(keys), dtype=bool)
+        for segment in self._segments:
+            pending = np.flatnonzero(~found)
+            if pending.size == 0:
+                break
+            _, hit = segment.locate(keys[pending])
+            found[pending[hit]] = True
+        return found
+
+    def lookup(self, texts: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+        """Stored embeddings for texts.
+
+        Returns:
+            ``(embeddings, found)``: a float32 ``(len(texts), dimension)`` array
+            (zero rows where nothing is stored) and the boolean hit mask.
+
+        """
+        self.refresh()
+        keys = text_keys(texts)
+        embeddings = np.zeros((len(keys), self.dimension), dtype=np.float32)
+        found = np.zeros(len(keys), dtype=bool)
+        for segment in self._segments:
+            pending = np.flatnonzero(~found)
+            if pending.size == 0:
+                break
+            rows, hit = segment.locate(keys[pending])
+            if rows.size:
+                targets = pending[hit]
+                embeddings[targets] = segment.decode(rows)
+                found[targets] = True
+
+        hits = int(found.sum())
+        self.hits += hits
+        self.misses += len(keys) - hits
+        return embeddings, found
+
+    def add(self, texts: Sequence[str], embeddings: np.ndarray) -> int:
+        """Persist embeddings for texts not already stored.
+
+        Args:
+            texts: Encoded texts
+            embeddings: Float embeddings, one row per text
+
+        Returns:
+            Number of texts added
+
+        """
+        if (
+            embeddings.ndim != 2
+            or embeddings.shape != (len(texts), self.dimension)
+            or embeddings.dtype.kind != "f"
+        ):
+            logger.warning(
+                f"Not storing {embeddings.dtype} embeddings of shape {embeddings.shape} "
+                f"in {self.directory.name} (expects float rows of width {self.dimension})"
+            )
+            return 0
+
+        keys = text_keys(texts)
+        with self._lock:
+            new = np.flatnonzero(~self._find(keys))
+            if new.size == 0:
+                return 0
+            # Dedupe within the batch, sorted by key
+            unique_keys, first = np.unique(keys[new], return_index=True)
+            rows = new[first]
+            vectors, scales = self._quantize(np.asarray(embeddings[rows], dtype=np.float32))
+            self._segments.append(self._write_segment(unique_keys, vectors, scales))
+            self.added += len(unique_keys)
+            if len(self._segments) > EMBEDDING_STORE_MAX_SEGMENTS:
+                self._compact()
+
+        logger.debug(
+            f"Embedding store {self.directory.name}: +{len(unique_keys)} ({len(self)} total)"
+        )
+        return len(unique_keys)
+
+    def _quantize(self, vectors: np.ndarray) -> tuple[np.ndarray, np.ndarray | None]:
+        if self.dtype != "int8":
+            return vectors.astype(np.float16), None
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.rint(vectors / scales[:, None]).astype(np.int8)
+        return quantized, scales.astype(np.float32)
+
+    def _write_segment(
+        self, keys: np.ndarray, vectors: np.ndarray, scales: np.ndarray | None
+    ) -> _Segment:
+        """Write a segment (keys last, so a visible key file means a complete segment)."""
+        name = uuid.uuid4().hex
+        base = self.directory / name
+        _save_atomic(Path(f"{base}{_VECTORS}"), vectors)
+        if scales is not None:
+            _save_atomic(Path(f"{base}{_SCALES}"), scales)
+        _save_atomic(Path(f"{base}{_KEYS}"), np.ascontiguousarray(keys, dtype="<u8"))
+        return self._load_segment(name)
+
+    def _compact(self) -> None:
+        """Merge every segment into one (caller holds the lock).
+
+        Only the keys are concatenated in memory; vectors and scales are
+        streamed from each mapped segment into the merged files.
+        """
+        old = self._segments
+        keys = np.concatenate([segment.keys for segment in old])
+        unique_keys, first = np.unique(keys, return_index=True)
+        bounds = np.cumsum([0] + [len(segment.keys) for segment in old[:-1]])
+
+        # Same file order as _write_segment: keys last
+        name = uuid.uuid4().hex
+        base = self.directory / name
+        _save_gathered_atomic(
+            Path(f"{base}{_VECTORS}"), [segment.vectors for segment in old], bounds, first
+        )
+        if all(segment.scales is not None for segment in old):
+            _save_gathered_atomic(
+                Path(f"{base}{_SCALES}"),
+                [segment.scales for segment in old],  # type: ignore[misc]
+                bounds,
+                first,
+            )
+        _save_atomic(Path(f"{base}{_KEYS}"), np.ascontiguousarray(unique_keys, dtype="<u8"))
+        merged = self._load_segment(name)
+        for segment in old:
+            for suffix in (_KEYS, _VECTORS, _SCALES):
+                Path(f"{self.directory / segment.name}{suffix}").unlink(missing_ok=True)
+        self._segments = [merged]
+        logger.info(
+            f"Compacted {len(old)} embedding segments in {self.directory.name} "
+            f"({len(unique_keys):,} entries)"
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Size and hit-rate counters."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "segments": len(self._segments),
+            "dimension": self.dimension,
+            "dtype": self.dtype,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "added": self.added,
+        }
+
+
+def store_dimension(model_name: str) -> int | None:
+    """Output width of ``SemanticEncoder.encode`` for a model (after Matryoshka truncation)."""
+    supported = MATRYOSHKA_DIMENSIONS.get(model_name)  # type: ignore[call-overload]
+    if MATRYOSHKA_DIM is not None and supported and MATRYOSHKA_DIM in supported:
+        return MATRYOSHKA_DIM
+    return MODEL_DIMENSIONS.get(model_name)  # type: ignore[call-overload,no-any-return]
+
+
+_stores: dict[tuple[str, int, str], EmbeddingStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_embedding_store(model_name: str) -> EmbeddingStore | None:
+    """Process-wide store for a model, or None when disabled or the width is unknown."""
+    if not EMBEDDING_STORE_ENABLED:
+        return None
+    dimension = store_dimension(model_name)
+    if dimension is None:
+        return None
+
+    key = (model_name, dimension, EMBEDDING_STORE_DTYPE)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            directory = (
+                get_cache_directory("embeddings")
+                / f"v{EMBEDDING_STORE_VERSION}"
+                / f"{model_name.replace('/', '--')}-{dimension}d-{EMBEDDING_STORE_DTYPE}"
+            )
+            store = _stores[key] = EmbeddingStore(directory, dimension)
+        return store
+
+
+def reset_embedding_stores() -> None:
+    """Drop loaded stores so the next access re-maps them from disk."""
+    with _stores_lock:
+        _stores.clear()
+
+
+def encode_with_store(
+    texts: list[str],
+    model_name: str,
+    encode: Callable[[list[str]], np.ndarray],
+) -> np.ndarray:
+    """Embeddings for texts, calling ``encode`` only for texts the store lacks.
+
+    Args:
+        texts: Texts to embed
+        model_name: Model the embeddings belong to
+        encode: Encoder for the missing texts (one row per text)
+
+    Returns:
+        float32 embeddings, one row per text, in input order
+
+    """
+    store = get_embedding_store(model_name)
+    if store is None or not texts:
+        return encode(texts)
+
+    embeddings, found = store.lookup(texts)
+    missing = np.flatnonzero(~found)
+    logger.info(
+        f"Embedding store: {len(texts) - missing.size:,}/{len(texts):,} cached, "
+        f"encoding {missing.size:,}"
+    )
+    if missing.size == 0:
+        return embeddings
+
+    missing_texts = [texts[i] for i in missing]
+    fresh = encode(missing_texts)
+    if fresh.shape != (missing.size, store.dimension):
+        logger.warning(
+            f"Encoder returned {fresh.shape} for {model_name}, expected width "
+            f"{store.dimension}; bypassing embedding store"
+        )
+        return fresh if missing.size == len(texts) else encode(texts)
+
+    embeddings[missing] = fresh
+    store.add(missing_texts, fresh)
+    return embeddings
+
+
+def get_embedding_store_stats() -> dict[str, dict[str, Any]]:
+    """Stats for every loaded store, keyed by directory name."""
+    with _stores_lock:
+        return {store.directory.name: store.get_stats() for store in _stores.values()}
+
+
+__all__ = [
+    "EMBEDDING_STORE_VERSION",
+    "EmbeddingStore",
+    "encode_with_store",
+    "get_embedding_store",
+    "get_embedding_store_stats",
+    "reset_embedding_stores",
+    "store_dimension",
+    "text_keys",
+]
@@ -2,11 +2,6 @@
 
 from __future__ import annotations
 
-import math
-import multiprocessing as mp
-import os
-import platform
-import time
 from typing import Any, Literal
 
 import numpy as np
@@ -14,12 +9,15 @@ import numpy as np
 from ...utils.logging import get_logger
 from .constants import (
     ENABLE_GPU_ACCELERATION,
+    ENCODER_POOL_ENABLED,
+    ENCODER_POOL_MIN_TEXTS,
     MATRYOSHKA_DIM,
     MATRYOSHKA_DIMENSIONS,
     QUANTIZATION_PRECISION,
     USE_QUANTIZATION,
 )
-from .embedding import _encode_chunk_worker, get_cached_model
+from .embedding import get_cached_model
+from .encoder_pool import encode_with_pool
 
 logger = get_logger(__name__)
 
@@ -99,8 +97,9 @@ class SemanticEncoder:
         - int8: 75% memory reduction, ~2-3x speedup, <2% quality loss
         - binary: 97% memory reduction, ~10x speedup, ~5-10% quality loss
 
-        Multiprocessing provides linear speedup with CPU cores for large corpora.
-        Uses sentence-transformers' native multi-process pool (process-based, not threading).
+        Multiprocessing provides near-linear speedup with CPU cores for large corpora,
+        via the persistent encoder pool (see ``encoder_pool``); if the pool is
+        unavailable, encoding falls back to a single process.
 
         Args:
             texts: List of texts to encode
@@ -118,15 +117,13 @@ class SemanticEncoder:
         # INT8 quantization needs at least 100 embeddings for stable quantization ranges
         use_quantization = USE_QUANTIZATION and len(texts) >= 100
 
-        # CRITICAL: Multiprocessing is disabled in Docker/containerized environments.
-        # Both fork (deadlocks from asyncio lock inheritance) and spawn
-        # (BrokenPipeError on large result arrays in pipes) fail reliably.
-        # Single-process encoding is slower but actually completes.
-        in_container = os.path.exists("/.dockerenv") or os.path.exists("/run/.containerenv")
+        # Large CPU builds use the persistent shared-memory pool, which is safe in
+        # containers: workers are spawned (no inherited asyncio/Motor locks) and
+        # embeddings never travel through pipes.
         will_use_multiprocessing = (
             use_multiprocessing
-            and not in_container
-            and len(texts) > 5000
+            and ENCODER_POOL_ENABLED
+            and len(texts) >= ENCODER_POOL_MIN_TEXTS
             and self.device == "cpu"
         )
         precision: Literal["float32", "int8", "uint8", "binary", "ubinary"] = (
@@ -136,95 +133,12 @@ class SemanticEncoder:
             else (QUANTIZATION_PRECISION if use_quantization else "float32")
         )
 
-        # Multi-process encoding for large corpora on CPU
-        # Uses custom multiprocessing.Pool for reliable cross-platform support
-        # Each worker loads its own model to avoid shared state and GIL contention
         if will_use_multiprocessing:
-            return self._encode_multiprocess(texts, model_name, batch_size, precision)
-        else:
-            embeddings = self._encode_single(texts, batch_size, precision)
-            return self.truncate_matryoshka(embeddings, model_name)
-
-    def _encode_multiprocess(
-        self,
-        texts: list[str],
-        model_name: str,
-        batch_size: int,
-        precision: str,
-    ) -> np.ndarray:
-        """Encode texts using multiprocessing for large corpora on CPU.
-
-        Args:
-            texts: List of texts to encode
-            model_name: Model name for worker processes
-            batch_size: Batch size within each worker
-            precision: Encoding precision
-
-        Returns:
-            Numpy array of embeddings
-        """
-        # Docker-compatible CPU detection: use sched_getaffinity for container CPU limits
-        # Falls back to cpu_count() if sched_getaffinity unavailable (Windows)
-        try:
-            available_cpus = len(os.sched_getaffinity(0))
-        except AttributeError:
-            available_cpus = os.cpu_count() or 8
-
-        # Spawn workers each load the model independently (~600MB each).
-        # Cap based on available memory to avoid OOM.
-        try:
-            import psutil
-            mem_gb = psutil.virtual_memory().total / (1024 ** 3)
-        except ImportError:
-            mem_gb = 16  # fallback assumption
-        # Each spawn worker needs ~1.5GB (model + batch tensors + overhead).
-        # Leave 4GB for parent process + OS + search engine structures.
-        mem_workers = max(1, int((mem_gb - 4) / 1.5))
-        num_workers = min(available_cpus, mem_workers, 4)
-
-        logger.info(
-            f"Encoding {len(texts)} texts with {num_workers} parallel processes "
-            f"(Docker-aware CPU detection: {available_cpus} cores, precision={precision})"
-        )
-
-        # Split texts into chunks for parallel processing
-        chunk_size = math.ceil(len(texts) / num_workers)
-        chunks = [texts[i : i + chunk_size] for i in range(0, len(texts), chunk_size)]
-
-        logger.info(
-            f"Split into {len(chunks)} chunks of ~{chunk_size} texts each "
-            f"(batch_size={batch_size} within each worker)"
-        )
-
-        # Create worker arguments
-        worker_args = [(chunk, model_name, batch_size, i) for i, chunk in enumerate(chunks)]
-
-        # Always use spawn: fork is unsafe when the parent has an active asyncio
-        # event loop with Motor/MongoDB connections — forked workers inherit
-        # held locks and futexes, causing deadlocks. Spawn is slower (each
-        # worker loads the model independently) but correct.
-        ctx = mp.get_context("spawn")
-
-        logger.info(
-            f"Starting multiprocessing.Pool with {num_workers} workers (spawn method)..."
-        )
-        start_time = time.perf_counter()
-
-        with ctx.Pool(processes=num_workers) as pool:
-            logger.info("Pool started, encoding chunks in parallel...")
-
-            # Map chunks to workers and collect results
-            results = pool.starmap(_encode_chunk_worker, worker_args)
-
-        # Concatenate results from all workers
-        embeddings = np.vstack(results)
-        elapsed = time.perf_counter() - start_time
-
-        logger.info(
-            f"Multi-process encoding complete: {embeddings.shape} in {elapsed:.1f}s "
-            f"({len(texts) / elapsed:.0f} words/sec, {num_workers} workers)"
-        )
+            embeddings = encode_with_pool(texts, model_name, batch_size)
+            if embeddings is not None:
+                return self.truncate_matryoshka(embeddings, model_name)
 
+        embeddings = self._encode_single(texts, batch_size, precision)
         return self.truncate_matryoshka(embeddings, model_name)
 
     def _encode_single(
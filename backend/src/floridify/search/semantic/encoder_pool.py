@@ -0,0 +1,268 @@
+"""Persistent multiprocess encoder pool with shared-memory output.
+
+Each worker is spawned once, loads the model once, and is reused across
+builds. Text chunks travel to workers through the executor's call queue;
+embeddings come back by being written straight into a
+``multiprocessing.shared_memory`` buffer, so only row counts cross the pipes.
+Returning the arrays themselves is what made the old per-build pool fail with
+``BrokenPipeError`` inside containers.
+
+Workers use the ``spawn`` start method: forking a process that holds an
+asyncio loop and Motor connections copies their locks mid-state and deadlocks.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+from typing import Any
+
+import numpy as np
+
+from ...utils.logging import get_logger
+from .constants import (
+    ENCODER_POOL_CHUNK_SIZE,
+    ENCODER_POOL_MAX_WORKERS,
+    ENCODER_POOL_WORKER_MEMORY_GB,
+)
+
+logger = get_logger(__name__)
+
+# POSIX shared memory is backed by /dev/shm on Linux; Docker caps it at 64MB
+# unless shm_size is raised, so large outputs are encoded in windows that fit.
+_SHM_DIR = "/dev/shm"
+_SHM_HEADROOM = 0.8
+
+_encoder_pool: ProcessPoolExecutor | None = None
+_encoder_pool_model: str | None = None
+_encoder_pool_dimension: int = 0
+_encoder_pool_lock = threading.Lock()
+
+# Worker-process state, set by _init_worker
+_worker_model: Any | None = None
+
+
+def load_sentence_model(model_name: str) -> Any:
+    """Default worker model loader (returns a SentenceTransformer)."""
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name, trust_remote_code=True)
+
+
+def _init_worker(model_name: str, load_model: Callable[[str], Any]) -> None:
+    """Pool initializer: load the model once per worker process."""
+    global _worker_model
+    _worker_model = load_model(model_name)
+
+
+def _worker_dimension() -> int:
+    assert _worker_model is not None
+    return int(_worker_model.get_sentence_embedding_dimension())
+
+
+def _encode_into_shared_memory(
+    shm_name: str,
+    offset: int,
+    texts: list[str],
+    batch_size: int,
+    dimension: int,
+) -> int:
+    """Encode a chunk and write its rows at ``offset`` in the shared buffer."""
+    assert _worker_model is not None
+    embeddings = _worker_model.encode(
+        sentences=texts,
+        batch_size=batch_size,
+        show_progress_bar=False,
+        output_value="sentence_embedding",
+        precision="float32",
+        convert_to_numpy=True,
+        convert_to_tensor=False,
+        normalize_embeddings=True,
+    )
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        rows = np.ndarray(
+            (len(texts), dimension),
+            dtype=np.float32,
+            buffer=shm.buf,
+            offset=offset * dimension * 4,
+        )
+        rows[:] = embeddings
+        del rows  # Release the buffer export before close()
+    finally:
+        shm.close()
+    return len(texts)
+
+
+def encoder_pool_size() -> int:
+    """Worker count bounded by CPUs, memory (one model per worker) and config."""
+    try:
+        available_cpus = len(os.sched_getaffinity(0))  # Honours container CPU limits
+    except AttributeError:
+        available_cpus = os.cpu_count() or 8
+
+    try:
+        import psutil
+
+        mem_gb = psutil.virtual_memory().total / (1024**3)
+    except ImportError:
+        mem_gb = 16  # fallback assumption
+    # Leave 4GB for parent process + OS + search engine structures
+    mem_workers = max(1, int((mem_gb - 4) / ENCODER_POOL_WORKER_MEMORY_GB))
+    return max(1, min(available_cpus, mem_workers, ENCODER_POOL_MAX_WORKERS))
+
+
+def _start_pool(
+    model_name: str, load_model: Callable[[str], Any]
+) -> tuple[ProcessPoolExecutor, int]:
+    workers = encoder_pool_size()
+    start_time = time.perf_counter()
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(model_name, load_model),
+    )
+    try:
+        dimension = pool.submit(_worker_dimension).result()
+    except BaseException:
+        pool.shutdown(wait=False, cancel_futures=True)
+        raise
+    logger.info(
+        f"Started encoder pool for {model_name} ({workers} processes, {dimension}D) "
+        f"in {time.perf_counter() - start_time:.1f}s"
+    )
+    return pool, dimension
+
+
+def get_encoder_pool(
+    model_name: str,
+    load_model: Callable[[str], Any] = load_sentence_model,
+) -> tuple[ProcessPoolExecutor, int]:
+    """Get the process-wide encoder pool for ``model_name``, starting it on first use.
+
+    Only one model's pool is kept: requesting another model replaces it, since
+    every worker holds its own copy of the weights.
+
+    Returns:
+        ``(pool, dimension)``: the executor and its model's embedding width
+
+    """
+    global _encoder_pool, _encoder_pool_model, _encoder_pool_dimension
+
+    with _encoder_pool_lock:
+        if _encoder_pool is not None and _encoder_pool_model != model_name:
+            _encoder_pool.shutdown(wait=False, cancel_futures=True)
+            _encoder_pool = None
+        if _encoder_pool is None:
+            _encoder_pool, _encoder_pool_dimension = _start_pool(model_name, load_model)
+            _encoder_pool_model = model_name
+        return _encoder_pool, _encoder_pool_dimension
+
+
+def shutdown_encoder_pool(wait: bool = True) -> None:
+    """Stop the encoder pool, if started. The next pooled encode restarts it."""
+    global _encoder_pool, _encoder_pool_model
+
+    with _encoder_pool_lock:
+        pool, _encoder_pool, _encoder_pool_model = _encoder_pool, None, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+        logger.info("Encoder pool shut down")
+
+
+def _window_rows(n_texts: int, row_bytes: int) -> int:
+    """Rows per shared buffer: everything, unless /dev/shm is too small."""
+    try:
+        stats = os.statvfs(_SHM_DIR)
+    except OSError:
+        return n_texts  # No tmpfs-backed shm (macOS): no fixed cap
+    budget_rows = int(stats.f_bavail * stats.f_frsize * _SHM_HEADROOM) // row_bytes
+    if budget_rows < 1:
+        raise OSError(f"No free shared memory in {_SHM_DIR}")
+    return min(n_texts, budget_rows)
+
+
+def _encode_window(
+    pool: ProcessPoolExecutor,
+    texts: list[str],
+    batch_size: int,
+    dimension: int,
+    out: np.ndarray,
+) -> None:
+    shm = shared_memory.SharedMemory(create=True, size=len(texts) * dimension * 4)
+    try:
+        futures = [
+            pool.submit(
+                _encode_into_shared_memory,
+                shm.name,
+                offset,
+                texts[offset : offset + ENCODER_POOL_CHUNK_SIZE],
+                batch_size,
+                dimension,
+            )
+            for offset in range(0, len(texts), ENCODER_POOL_CHUNK_SIZE)
+        ]
+        try:
+            for future in futures:
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+        window = np.ndarray((len(texts), dimension), dtype=np.float32, buffer=shm.buf)
+        out[:] = window
+        del window  # Release the buffer export before close()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def encode_with_pool(
+    texts: list[str],
+    model_name: str,
+    batch_size: int,
+    load_model: Callable[[str], Any] = load_sentence_model,
+) -> np.ndarray | None:
+    """Encode texts on the persistent pool into a float32 ``(n, dim)`` array.
+
+    Returns None if the pool could not be used (a worker died, the model
+    failed to load, or shared memory is unavailable), after discarding the
+    pool so the next call starts a fresh one; callers then fall back to
+    single-process encoding.
+    """
+    try:
+        pool, dimension = get_encoder_pool(model_name, load_model)
+        output = np.empty((len(texts), dimension), dtype=np.float32)
+        if not texts:
+            return output
+
+        window = _window_rows(len(texts), dimension * 4)
+        start_time = time.perf_counter()
+        for begin in range(0, len(texts), window):
+            end = min(begin + window, len(texts))
+            _encode_window(pool, texts[begin:end], batch_size, dimension, output[begin:end])
+    except Exception as e:
+        logger.warning(f"Encoder pool unavailable ({e}); falling back to single-process")
+        shutdown_encoder_pool(wait=False)
+        return None
+
+    elapsed = time.perf_counter() - start_time
+    logger.info(
+        f"Pooled encoding complete: {output.shape} in {elapsed:.1f}s "
+        f"({len(texts) / max(elapsed, 1e-9):.0f} texts/sec)"
+    )
+    return output
+
+
+__all__ = [
+    "encode_with_pool",
+    "encoder_pool_size",
+    "get_encoder_pool",
+    "load_sentence_model",
+    "shutdown_encoder_pool",
+]
@@ -17,7 +17,14 @@ from ...caching.models import (
 )
 from ...corpus.core import Corpus
 from ...utils.logging import get_logger
-from .constants import DEFAULT_BATCH_SIZE, DEFAULT_SENTENCE_MODEL, MATRYOSHKA_DIM, MODEL_BATCH_SIZES
+from .constants import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_SENTENCE_MODEL,
+    MATRYOSHKA_DIM,
+    MATRYOSHKA_DIMENSIONS,
+    MODEL_BATCH_SIZES,
+    SEMANTIC_COARSE_MODE,
+)
 
 logger = get_logger(__name__)
 
@@ -69,6 +76,9 @@ class SemanticIndex(BaseModel):
     # Index configuration
     index_type: str = "Flat"  # Flat, IVF, IVFPQ, etc.
     index_params: dict[str, Any] = Field(default_factory=dict)  # nlist, nprobe, etc.
+    # Two-stage retrieval: "matryoshka" or "binary" coarse index re-ranked with the
+    # full vectors (derived from embeddings on load, never persisted). None = one FAISS index.
+    coarse_mode: str | None = None
 
     # Statistics
     num_embeddings: int = 0
@@ -77,7 +87,9 @@ class SemanticIndex(BaseModel):
 
     # Opaque binary payload — never serialized through model_dump.
     # Holds {"embeddings_bytes": bytes, "index_bytes": bytes}. The version
-    # manager pickles this into GridFS via the binary_payload= hook.
+    # manager streams this into GridFS via the binary_payload= hook. Values
+    # loaded from GridFS or the L2 cache are read-only memoryviews (mmap'd
+    # for large payloads).
     binary_data: dict[str, bytes] | None = Field(
         default=None,
         exclude=True,
@@ -192,6 +204,7 @@ class SemanticIndex(BaseModel):
         corpus: Corpus,
         model_name: str | None = None,
         batch_size: int | None = None,
+        coarse_mode: str | None = None,
     ) -> SemanticIndex:
         """Create new semantic index from corpus.
 
@@ -199,6 +212,7 @@ class SemanticIndex(BaseModel):
             corpus: Corpus containing vocabulary and lemmas
             model_name: Sentence transformer model to use
             batch_size: Batch size for embedding generation
+            coarse_mode: Coarse-to-fine retrieval mode (defaults to SEMANTIC_COARSE_MODE)
 
         Returns:
             SemanticIndex instance ready for embedding generation
@@ -217,12 +231,19 @@ class SemanticIndex(BaseModel):
         if not corpus.corpus_uuid:
             raise ValueError("Corpus must have corpus_uuid set")
 
+        coarse_mode = coarse_mode or SEMANTIC_COARSE_MODE
+        if coarse_mode == "matryoshka" and model_name not in MATRYOSHKA_DIMENSIONS:
+            # A prefix of a non-MRL embedding carries no ranking signal; sign bits do
+            logger.warning(f"{model_name} is not Matryoshka-trained, using binary coarse index")
+            coarse_mode = "binary"
+
         return cls(
             corpus_uuid=corpus.corpus_uuid,
             corpus_name=corpus.corpus_name,
             vocabulary_hash=corpus.vocabulary_hash,
             model_name=model_name,
             batch_size=batch_size,
+            coarse_mode=coarse_mode,
         )
 
     @classmethod
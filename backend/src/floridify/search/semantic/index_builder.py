@@ -1,7 +1,8 @@
 """FAISS index construction with tiered optimization strategies.
 
 Builds optimized FAISS indices based on corpus size, choosing from:
-Flat L2, IVF-Flat, INT8 ScalarQuantizer, HNSW, IVF-PQ, and OPQ+IVF-PQ.
+Flat L2, IVF-Flat, INT8 ScalarQuantizer, HNSW, IVF-PQ, and OPQ+IVF-PQ,
+or a two-stage CoarseToFineIndex when a coarse retrieval mode is selected.
 """
 
 from __future__ import annotations
@@ -12,6 +13,7 @@ from typing import Any
 import numpy as np
 
 from ...utils.logging import get_logger
+from .coarse import CoarseToFineIndex
 from .constants import (
     HNSW_EF_CONSTRUCTION,
     HNSW_EF_SEARCH,
@@ -55,9 +57,13 @@ def build_optimized_index(
     dimension: int,
     vocab_size: int,
     sentence_embeddings: np.ndarray | None,
+    coarse_mode: str | None = None,
 ) -> Any:  # Returns faiss.Index
     """Build optimized FAISS index with model-aware quantization strategies.
 
+    With ``coarse_mode`` ("matryoshka" or "binary"), returns a CoarseToFineIndex
+    instead, regardless of corpus size: exact re-ranking of coarse candidates.
+
     Quantization strategies by corpus size:
 
     SMALL (<10k): Exact search - no compression
@@ -94,6 +100,7 @@ def build_optimized_index(
         dimension: Embedding vector dimension
         vocab_size: Number of vocabulary items
         sentence_embeddings: The embedding vectors to index
+        coarse_mode: Two-stage coarse retrieval mode (None = single-stage FAISS)
 
     Returns:
         Built and populated FAISS index
@@ -105,6 +112,9 @@ def build_optimized_index(
         logger.warning("No embeddings to index - creating empty index")
         return faiss.IndexFlatL2(dimension)
 
+    if coarse_mode:
+        return CoarseToFineIndex(sentence_embeddings, coarse_mode)
+
     # Memory baseline: FP32 vectors
     base_memory_mb = (vocab_size * dimension * 4) / (1024 * 1024)
     model_type = "BGE-M3" if dimension == 1024 else "MiniLM" if dimension == 384 else "Custom"
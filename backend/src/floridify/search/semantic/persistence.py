@@ -1,15 +1,20 @@
 """Persistence layer for semantic search embeddings and FAISS indices.
 
-Serialization uses pickle for embeddings and FAISS native I/O for the
-index. The resulting bytes are handed to ``SemanticIndex.save()`` which
-routes them through the version manager's ``binary_payload`` hook —
+Serialization uses the ``.npy`` format for embeddings and FAISS native I/O
+for the index. The resulting bytes are handed to ``SemanticIndex.save()``
+which routes them through the version manager's ``binary_payload`` hook —
 single GridFS upload, no double-compression, no JSON encoding.
+
+Loading accepts any bytes-like payload, including the read-only memoryviews
+that GridFS streaming and the L2 blob store return: ``.npy`` embeddings
+become an ndarray view over the payload, and the FAISS index is deserialized
+straight from it, with no intermediate ``bytes`` or temp file.
 """
 
 from __future__ import annotations
 
+import io
 import os
-import pickle
 import tempfile
 from typing import Any
 
@@ -18,19 +23,42 @@ import numpy as np
 from ...caching.filesystem import safe_pickle_loads
 from ...caching.models import VersionConfig
 from ...utils.logging import get_logger
+from .coarse import CoarseToFineIndex
 from .index import SemanticIndex
 
 logger = get_logger(__name__)
 
 
+_NPY_MAGIC = b"\x93NUMPY"
+# Upper bound on an .npy preamble (magic + version + length + header)
+_NPY_HEADER_MAX = 12 + 65535
+
+
+def _array_from_npy(payload: bytes | memoryview) -> np.ndarray:
+    """View ``.npy``-formatted bytes as an ndarray without copying the data."""
+    view = memoryview(payload).cast("B")
+    header = io.BytesIO(view[:_NPY_HEADER_MAX])
+    version = np.lib.format.read_magic(header)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(header)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(header)
+    count = int(np.prod(shape, dtype=np.int64))
+    array = np.frombuffer(view, dtype=dtype, count=count, offset=header.tell())
+    return array.reshape(shape, order="F" if fortran_order else "C")
+
+
 def load_embeddings_from_binary_data(
     binary_data: dict[str, bytes],
     corpus_name: str,
 ) -> np.ndarray:
-    """Load embeddings from raw pickle bytes.
+    """Load embeddings from ``.npy`` (or legacy pickle) bytes.
+
+    ``.npy`` payloads are returned as a view over ``binary_data`` — read-only
+    when the payload is a read-only (e.g. mmap-backed) buffer.
 
     Args:
-        binary_data: Dictionary containing ``embeddings_bytes`` (pickle bytes).
+        binary_data: Dictionary containing ``embeddings_bytes``.
         corpus_name: Name of the corpus (for error messages).
 
     Returns:
@@ -40,14 +68,17 @@ def load_embeddings_from_binary_data(
         RuntimeError: If data is missing or corrupted.
     """
     raw_bytes = binary_data.get("embeddings_bytes")
-    if not raw_bytes:
+    if raw_bytes is None or len(raw_bytes) == 0:
         raise RuntimeError(
             f"Invalid semantic index format for '{corpus_name}': missing 'embeddings_bytes'."
         )
 
     try:
         logger.debug(f"Loading raw embeddings ({len(raw_bytes) / 1024 / 1024:.1f}MB)")
-        embeddings = safe_pickle_loads(raw_bytes)
+        if bytes(raw_bytes[: len(_NPY_MAGIC)]) == _NPY_MAGIC:
+            embeddings = _array_from_npy(raw_bytes)
+        else:
+            embeddings = safe_pickle_loads(raw_bytes)
 
         logger.debug(
             f"Loaded embeddings: {len(raw_bytes) / 1024 / 1024:.2f}MB, "
@@ -70,6 +101,9 @@ def load_faiss_index_from_binary_data(
 ) -> Any:  # Returns faiss.Index
     """Load a FAISS index from raw bytes.
 
+    The index is deserialized directly from the payload buffer (FAISS copies
+    it into its own structures), never via a temp file.
+
     Args:
         binary_data: Dictionary containing ``index_bytes`` (FAISS native bytes).
         corpus_name: Name of the corpus (for error messages).
@@ -81,7 +115,7 @@ def load_faiss_index_from_binary_data(
         RuntimeError: If data is missing or corrupted.
     """
     index_bytes = binary_data.get("index_bytes")
-    if not index_bytes:
+    if index_bytes is None or len(index_bytes) == 0:
         raise RuntimeError(
             f"Invalid semantic index format for '{corpus_name}': missing 'index_bytes'."
         )
@@ -91,16 +125,8 @@ def load_faiss_index_from_binary_data(
 
         logger.debug(f"Loading raw FAISS index ({len(index_bytes) / 1024 / 1024:.1f}MB)")
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".faiss") as tmp_file:
-            tmp_file.write(index_bytes)
-            tmp_path = tmp_file.name
-
-        try:
-            sentence_index = faiss.read_index(tmp_path)
-            logger.debug(f"Loaded FAISS index: {len(index_bytes) / 1024 / 1024:.1f}MB")
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+        sentence_index = faiss.deserialize_index(np.frombuffer(index_bytes, dtype=np.uint8))
+        logger.debug(f"Loaded FAISS index: {len(index_bytes) / 1024 / 1024:.1f}MB")
 
         return sentence_index
     except RuntimeError:
@@ -109,6 +135,21 @@ def load_faiss_index_from_binary_data(
         raise RuntimeError(f"Corrupted FAISS index data for '{corpus_name}': {e}") from e
 
 
+def load_search_index(
+    index: SemanticIndex,
+    binary_data: dict[str, bytes],
+    embeddings: np.ndarray,
+) -> Any:  # Returns faiss.Index or CoarseToFineIndex
+    """Search index for a loaded SemanticIndex.
+
+    Coarse-to-fine indices are rebuilt from the embeddings (cheap: a prefix
+    slice or sign bits); everything else is deserialized from ``index_bytes``.
+    """
+    if index.coarse_mode:
+        return CoarseToFineIndex(embeddings, index.coarse_mode)
+    return load_faiss_index_from_binary_data(binary_data, index.corpus_name)
+
+
 async def save_embeddings_and_index(
     index: SemanticIndex,
     sentence_embeddings: np.ndarray | None,
@@ -118,7 +159,7 @@ async def save_embeddings_and_index(
 ) -> None:
     """Save embeddings and FAISS index to the index model.
 
-    Serializes embeddings (pickle) and the FAISS index (native C++ I/O)
+    Serializes embeddings (``.npy``) and the FAISS index (native C++ I/O)
     into raw bytes, then hands the dict to ``SemanticIndex.save()`` which
     routes it through the version manager's ``binary_payload`` hook —
     one GridFS upload, no JSON, no double-serialization.
@@ -136,13 +177,17 @@ async def save_embeddings_and_index(
     binary_data: dict[str, bytes] = {}
 
     if sentence_embeddings is not None and sentence_embeddings.size > 0:
-        embeddings_bytes = pickle.dumps(sentence_embeddings)
+        # .npy loads back as a zero-copy view over the stored payload
+        buffer = io.BytesIO()
+        np.save(buffer, np.ascontiguousarray(sentence_embeddings), allow_pickle=False)
+        embeddings_bytes = buffer.getvalue()
         logger.info(f"Serialized embeddings: {len(embeddings_bytes) / 1024 / 1024:.1f}MB")
         binary_data["embeddings_bytes"] = embeddings_bytes
 
     # FAISS native disk I/O — pickling faiss.serialize_index() double-serializes
-    # and hangs for 20+ minutes on large indices.
-    if sentence_index is not None:
+    # and hangs for 20+ minutes on large indices. Coarse-to-fine indices are
+    # derived from the embeddings on load and have nothing to serialize.
+    if sentence_index is not None and not isinstance(sentence_index, CoarseToFineIndex):
         import faiss
 
         logger.info("Serializing FAISS index using native disk I/O")
@@ -165,7 +210,9 @@ async def save_embeddings_and_index(
         (sentence_embeddings.nbytes / (1024 * 1024)) if sentence_embeddings is not None else 0.0
     )
 
-    if sentence_index is not None:
+    if isinstance(sentence_index, CoarseToFineIndex):
+        index.index_type = f"CoarseToFine-{sentence_index.mode}"
+    elif sentence_index is not None:
         index_class_name = sentence_index.__class__.__name__
         if "HNSW" in index_class_name:
             index.index_type = "HNSW"
@@ -14,18 +14,21 @@ from ...corpus.manager import get_tree_corpus_manager
 from ...utils.logging import get_logger
 from ..constants import SearchMethod
 from ..result import SearchResult
+from .batcher import QueryBatcher
 from .builder import SemanticEmbeddingBuilder
 from .constants import (
     DEFAULT_SENTENCE_MODEL,
     L2_DISTANCE_NORMALIZATION,
+    SEMANTIC_BATCHING_ENABLED,
     SemanticModel,
 )
+from .embedding_store import encode_with_store, get_embedding_store
 from .encoder import SemanticEncoder
 from .index import SemanticIndex
 from .index_builder import build_optimized_index, configure_faiss_threading
 from .persistence import (
     load_embeddings_from_binary_data,
-    load_faiss_index_from_binary_data,
+    load_search_index,
     save_embeddings_and_index,
 )
 from .query_cache import SemanticQueryCache
@@ -62,6 +65,11 @@ class SemanticSearch:
         # Per-word embedding cache for incremental updates (<50k words)
         self._word_embeddings: dict[str, np.ndarray] | None = None
 
+        # Embedding index -> (has_word, word, lemma) arrays for result mapping,
+        # rebuilt whenever the corpus, embeddings or variant mapping change
+        self._result_map: tuple[np.ndarray, np.ndarray, np.ndarray] | None = None
+        self._result_map_source: tuple[Any, ...] = ()
+
         # Query/result cache manager (LRU + L2 persistence)
         self._query_cache_manager = SemanticQueryCache(
             corpus_uuid=index.corpus_uuid if index else "",
@@ -69,6 +77,9 @@ class SemanticSearch:
             query_cache_size=query_cache_size,
         )
 
+        # Micro-batches concurrent search() calls into shared encode + FAISS calls
+        self._batcher = QueryBatcher(self._encode_queries, self._search_index)
+
         # Note: _load_from_index is now async, caller must await it after construction
         # This is handled in from_corpus() and from_index() class methods
 
@@ -197,10 +208,11 @@ class SemanticSearch:
         # that asyncio.to_thread() uses—starving HTTP request handlers.
         try:
             corpus_name = self.index.corpus_name
+            semantic_index = self.index
 
             def _load_all():
                 embeddings = load_embeddings_from_binary_data(binary_data, corpus_name)
-                index = load_faiss_index_from_binary_data(binary_data, corpus_name)
+                index = load_search_index(semantic_index, binary_data, embeddings)
                 return embeddings, index
 
             loop = asyncio.get_running_loop()
@@ -312,6 +324,7 @@ class SemanticSearch:
                     corpus=corpus,
                     model_name=self.index.model_name,
                     batch_size=self.index.batch_size,
+                    coarse_mode=self.index.coarse_mode,
                 )
 
                 # Remove deleted words from per-word cache
@@ -321,12 +334,19 @@ class SemanticSearch:
                 # Encode only new words
                 if added:
                     added_list = sorted(added)
-                    # encoder.encode() applies Matryoshka truncation internally
-                    new_embs = self._encoder.encode(
+                    # encoder.encode() applies Matryoshka truncation internally;
+                    # words seen by any corpus before come from the embedding store
+                    model_name = self.index.model_name
+                    batch_size = self.index.batch_size
+                    new_embs = encode_with_store(
                         added_list,
-                        model_name=self.index.model_name,
-                        batch_size=self.index.batch_size,
-                        use_multiprocessing=False,
+                        model_name,
+                        lambda texts: self._encoder.encode(
+                            texts,
+                            model_name=model_name,
+                            batch_size=batch_size,
+                            use_multiprocessing=False,
+                        ),
                     )
                     for word, emb in zip(added_list, new_embs):
                         self._word_embeddings[word] = emb
@@ -344,7 +364,10 @@ class SemanticSearch:
                 configure_faiss_threading()
                 dimension = self.sentence_embeddings.shape[1]
                 self.sentence_index = build_optimized_index(
-                    dimension, len(ordered_vocab), self.sentence_embeddings
+                    dimension,
+                    len(ordered_vocab),
+                    self.sentence_embeddings,
+                    coarse_mode=self.index.coarse_mode,
                 )
 
                 self.index.vocabulary_hash = corpus.vocabulary_hash
@@ -371,6 +394,7 @@ class SemanticSearch:
                     corpus=corpus,
                     model_name=self.index.model_name,
                     batch_size=self.index.batch_size,
+                    coarse_mode=self.index.coarse_mode,
                 )
                 self.sentence_embeddings = None
                 self.sentence_index = None
@@ -400,7 +424,7 @@ class SemanticSearch:
         self.sentence_embeddings = load_embeddings_from_binary_data(
             binary_data, self.index.corpus_name
         )
-        self.sentence_index = load_faiss_index_from_binary_data(binary_data, self.index.corpus_name)
+        self.sentence_index = load_search_index(self.index, binary_data, self.sentence_embeddings)
 
     def _lookup_vocab_embedding(self, normalized_query: str) -> np.ndarray | None:
         """Look up pre-computed embedding for in-vocabulary queries.
@@ -487,93 +511,37 @@ class SemanticSearch:
                     normalized_query
                 )
 
-            if query_embedding is None:
-                # Cache miss - generate embedding asynchronously (releases GIL)
-                # encoder.encode() applies Matryoshka truncation internally
-                query_embedding = await asyncio.to_thread(
-                    self._encoder.encode,
-                    [normalized_query],
-                    self.index.model_name,
-                    self.index.batch_size,
-                    False,  # use_multiprocessing
-                )
-                query_embedding = query_embedding[0]
+            k = max_results + min(max_results, 10)  # Adaptive buffer for score filtering
 
+            if SEMANTIC_BATCHING_ENABLED:
+                # Encode (on a miss) and search together with concurrent queries
+                needs_encoding = query_embedding is None
+                query_embedding, distance_row, index_row = await self._batcher.submit(
+                    normalized_query, query_embedding, k
+                )
+                if needs_encoding:
+                    self._query_cache_manager.cache_query_embedding(
+                        normalized_query, query_embedding
+                    )
+                distances, indices = distance_row[None, :], index_row[None, :]
+            else:
                 if query_embedding is None:
-                    return []
-
-                # Cache the embedding for future queries
-                self._query_cache_manager.cache_query_embedding(normalized_query, query_embedding)
-
-            # Search using FAISS asynchronously (releases GIL)
-            distances, indices = await asyncio.to_thread(
-                self.sentence_index.search,
-                query_embedding.astype("float32").reshape(1, -1),
-                max_results + min(max_results, 10),  # Adaptive buffer for score filtering
-            )
-
-            # Convert distances to similarity scores (1 - normalized_distance)
-            # L2 distance range is [0, 2] for normalized vectors
-            similarities = 1 - (distances[0] / L2_DISTANCE_NORMALIZATION)
-
-            # Pre-filter valid indices and scores for batch processing
-            embedding_vocab_size = len(self.sentence_embeddings)
-            valid_mask = (
-                (indices[0] >= 0)
-                & (similarities >= min_score)
-                & (indices[0] < embedding_vocab_size)
-            )
-            valid_embedding_indices = indices[0][valid_mask]
-            valid_similarities = similarities[valid_mask]
-
-            # Create results directly - no complex mapping needed since we use lemmas directly
-            results = []
-            lemma_to_word_indices = self.corpus.lemma_to_word_indices
-
-            # Get variant mapping from index if available (already int->int)
-            variant_mapping = self.index.variant_mapping if self.index else {}
-
-            for embedding_idx, similarity in zip(
-                valid_embedding_indices,
-                valid_similarities,
-                strict=False,
-            ):
-                # Use variant mapping from index or direct mapping
-                lemma_idx = variant_mapping.get(embedding_idx, embedding_idx)
-
-                if lemma_idx >= len(self.corpus.lemmatized_vocabulary):
-                    continue  # Skip invalid indices
-
-                lemma = self.corpus.lemmatized_vocabulary[lemma_idx]
-
-                # Map lemma index to original word
-                if lemma_idx < len(lemma_to_word_indices):
-                    original_word_indices = lemma_to_word_indices[lemma_idx]
-                    # Use first index if multiple mappings exist
-                    if isinstance(original_word_indices, list) and original_word_indices:
-                        word = self.corpus.get_original_word_by_index(original_word_indices[0])
-                    elif isinstance(original_word_indices, int):
-                        word = self.corpus.get_original_word_by_index(original_word_indices)
-                    else:
-                        word = lemma
-                else:
-                    word = lemma  # Direct use if mapping unavailable
-
-                # Only add result if we have a valid word
-                if word:
-                    results.append(
-                        SearchResult(
-                            word=word,
-                            lemmatized_word=lemma,
-                            score=float(similarity),
-                            method=SearchMethod.SEMANTIC,
-                            language=None,
-                            metadata=None,
-                        ),
+                    # Cache miss - generate embedding asynchronously (releases GIL)
+                    query_embedding = (
+                        await asyncio.to_thread(self._encode_queries, [normalized_query])
+                    )[0]
+
+                    # Cache the embedding for future queries
+                    self._query_cache_manager.cache_query_embedding(
+                        normalized_query, query_embedding
                     )
 
-                if len(results) >= max_results:
-                    break
+                # Search using FAISS asynchronously (releases GIL)
+                distances, indices = await asyncio.to_thread(
+                    self._search_index, query_embedding.reshape(1, -1), k
+                )
+
+            results = self._map_search_results(distances[0], indices[0], max_results, min_score)
 
             # Cache results for future queries
             self._query_cache_manager.cache_results(
@@ -586,6 +554,222 @@ class SemanticSearch:
             logger.error(f"Semantic search failed: {e}", exc_info=True)
             raise RuntimeError(f"Semantic search failed for query '{normalized_query}': {e}") from e
 
+    def _encode_queries(self, queries: list[str]) -> np.ndarray:
+        """Encode query texts in one forward pass (sync; run in a thread)."""
+        # encoder.encode() applies Matryoshka truncation internally
+        return self._encoder.encode(
+            queries,
+            self.index.model_name if self.index else "",
+            self.index.batch_size if self.index else 1,
+            False,  # use_multiprocessing
+        )
+
+    def _search_index(self, query_matrix: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """FAISS search of an (n, d) query matrix (sync; run in a thread)."""
+        if self.sentence_index is None:
+            raise RuntimeError("Semantic index not loaded")
+        return self.sentence_index.search(np.ascontiguousarray(query_matrix, dtype="float32"), k)
+
+    def _map_search_results(
+        self,
+        distances: np.ndarray,
+        indices: np.ndarray,
+        max_results: int,
+        min_score: float,
+    ) -> list[SearchResult]:
+        """Map one row of FAISS output to SearchResults over the corpus vocabulary.
+
+        Args:
+            distances: L2 distances for a single query row
+            indices: Embedding indices for a single query row
+            max_results: Maximum number of results to return
+            min_score: Minimum similarity score (0-1)
+
+        Returns:
+            Search results in FAISS rank order
+
+        """
+        if self.corpus is None or self.sentence_embeddings is None:
+            return []
+
+        # Convert distances to similarity scores (1 - normalized_distance)
+        # L2 distance range is [0, 2] for normalized vectors
+        similarities = 1 - (distances / L2_DISTANCE_NORMALIZATION)
+
+        has_word, words, lemmas = self._get_result_map()
+        valid_mask = (indices >= 0) & (indices < len(has_word)) & (similarities >= min_score)
+        valid_mask[valid_mask] = has_word[indices[valid_mask]]
+        selected = np.flatnonzero(valid_mask)[:max_results]
+        embedding_indices = indices[selected]
+
+        return [
+            SearchResult(
+                word=word,
+                lemmatized_word=lemma,
+                score=score,
+                method=SearchMethod.SEMANTIC,
+                language=None,
+                metadata=None,
+            )
+            for word, lemma, score in zip(
+                words[embedding_indices].tolist(),
+                lemmas[embedding_indices].tolist(),
+                similarities[selected].tolist(),
+                strict=True,
+            )
+        ]
+
+    def _get_result_map(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Per-embedding ``(has_word, words, lemmas)`` arrays for result mapping.
+
+        Resolves embedding index -> lemma index (``variant_mapping``) -> first
+        original word once per corpus and embedding set, so mapping a FAISS row
+        is one fancy-index rather than per-result dict lookups.
+        """
+        assert self.corpus is not None and self.sentence_embeddings is not None
+        variant_mapping = self.index.variant_mapping if self.index else {}
+        source = (self.corpus, self.sentence_embeddings, variant_mapping)
+        if self._result_map is not None and all(
+            current is cached
+            for current, cached in zip(source, self._result_map_source, strict=True)
+        ):
+            return self._result_map
+
+        corpus = self.corpus
+        num_embeddings = len(self.sentence_embeddings)
+        lemma_vocabulary = corpus.lemmatized_vocabulary
+
+        # Embedding index -> lemma index (-1 where out of range)
+        embedding_to_lemma = np.arange(num_embeddings, dtype=np.int64)
+        for embedding_idx, lemma_idx in variant_mapping.items():
+            if 0 <= embedding_idx < num_embeddings:
+                embedding_to_lemma[embedding_idx] = lemma_idx
+        embedding_to_lemma[
+            (embedding_to_lemma < 0) | (embedding_to_lemma >= len(lemma_vocabulary))
+        ] = -1
+
+        # Lemma index -> display word: its first original word, else the lemma itself
+        lemma_words = np.empty(len(lemma_vocabulary), dtype=object)
+        for lemma_idx, lemma in enumerate(lemma_vocabulary):
+            word_indices = corpus.lemma_to_word_indices.get(lemma_idx)
+            if isinstance(word_indices, list) and word_indices:
+                lemma_words[lemma_idx] = corpus.get_original_word_by_index(word_indices[0])
+            elif isinstance(word_indices, int):
+                lemma_words[lemma_idx] = corpus.get_original_word_by_index(word_indices)
+            else:
+                lemma_words[lemma_idx] = lemma
+
+        mapped = embedding_to_lemma >= 0
+        words = np.full(num_embeddings, None, dtype=object)
+        lemmas = np.full(num_embeddings, None, dtype=object)
+        words[mapped] = lemma_words[embedding_to_lemma[mapped]]
+        lemmas[mapped] = np.array(lemma_vocabulary, dtype=object)[embedding_to_lemma[mapped]]
+        has_word = np.fromiter((bool(word) for word in words), dtype=bool, count=num_embeddings)
+
+        self._result_map = (has_word, words, lemmas)
+        self._result_map_source = source
+        return self._result_map
+
+    async def search_many(
+        self,
+        queries: list[str],
+        max_results: int = 20,
+        min_score: float = 0.0,
+    ) -> list[list[SearchResult]]:
+        """Semantic search for a batch of queries with one encode and one FAISS call.
+
+        Each query goes through the same cache tiers as search() (result cache,
+        in-vocabulary embedding, query-embedding cache). All remaining queries
+        are encoded in a single forward pass, and the whole batch is searched
+        with one (n, d) FAISS matrix.
+
+        Args:
+            queries: Search queries
+            max_results: Maximum number of results per query
+            min_score: Minimum similarity score (0-1)
+
+        Returns:
+            One result list per query, in input order
+
+        """
+        if self.sentence_index is None or not self.corpus or not self.index:
+            logger.warning("Semantic search not initialized - no index")
+            return [[] for _ in queries]
+
+        if self.sentence_embeddings is None or self.sentence_embeddings.size == 0:
+            logger.warning("Semantic search not initialized - no embeddings")
+            return [[] for _ in queries]
+
+        batch: list[list[SearchResult]] = [[] for _ in queries]
+        embeddings: dict[str, np.ndarray] = {}
+        pending: dict[str, list[int]] = {}
+
+        for position, query in enumerate(queries):
+            normalized_query = query.strip() if query else ""
+            if not normalized_query:
+                continue
+
+            cached_results = self._query_cache_manager.get_cached_results(
+                normalized_query, max_results, min_score
+            )
+            if cached_results is not None:
+                batch[position] = cached_results
+                continue
+
+            pending.setdefault(normalized_query, []).append(position)
+            if normalized_query in embeddings:
+                continue
+
+            query_embedding = self._lookup_vocab_embedding(normalized_query)
+            if query_embedding is None:
+                query_embedding = self._query_cache_manager.get_cached_query_embedding(
+                    normalized_query
+                )
+            if query_embedding is not None:
+                embeddings[normalized_query] = query_embedding
+
+        if not pending:
+            return batch
+
+        try:
+            to_encode = [q for q in pending if q not in embeddings]
+            if to_encode:
+                # One forward pass for every cache miss in the batch
+                encoded = await asyncio.to_thread(self._encode_queries, to_encode)
+                for normalized_query, query_embedding in zip(to_encode, encoded, strict=True):
+                    embeddings[normalized_query] = query_embedding
+                    self._query_cache_manager.cache_query_embedding(
+                        normalized_query, query_embedding
+                    )
+
+            ordered_queries = list(pending)
+            query_matrix = np.vstack([embeddings[q] for q in ordered_queries]).astype("float32")
+
+            # One FAISS search over the stacked (n, d) query matrix
+            distances, indices = await asyncio.to_thread(
+                self._search_index,
+                query_matrix,
+                max_results + min(max_results, 10),  # Adaptive buffer for score filtering
+            )
+
+            for row, normalized_query in enumerate(ordered_queries):
+                results = self._map_search_results(
+                    distances[row], indices[row], max_results, min_score
+                )
+                self._query_cache_manager.cache_results(
+                    normalized_query, max_results, min_score, results
+                )
+                for position in pending[normalized_query]:
+                    batch[position] = results
+
+            return batch
+
+        except Exception as e:
+            logger.error(f"Batch semantic search failed: {e}", exc_info=True)
+            raise RuntimeError(
+                f"Semantic search failed for batch of {len(queries)} queries: {e}"
+            ) from e
+
     def model_dump(self) -> dict[str, Any]:
         """Serialize semantic search to dictionary for caching."""
         if not self.index:
@@ -629,4 +813,8 @@ class SemanticSearch:
             "corpus_name": self.index.corpus_name,
             "semantic_metadata_id": f"{self.index.corpus_name}:{self.index.model_name}",
             "batch_size": self.index.batch_size,
+            "query_batching": self._batcher.stats.to_dict(),
+            "embedding_store": store.get_stats()
+            if (store := get_embedding_store(self.index.model_name)) is not None
+            else None,
         }
@@ -0,0 +1,134 @@
+"""Frequency-ranked top-k prefix completion.
+
+In a sorted word list, the completions of a prefix form one contiguous
+range, found with two binary searches. Ranking that range by frequency is
+the expensive part for short prefixes ("a" matches tens of thousands of
+words), so the top ``k`` completions of every prefix whose range is larger
+than ``min_range`` are precomputed. A query then costs two bisects plus
+either a dict lookup and an O(k) slice (heavy prefixes) or a partial sort of
+at most ``min_range`` ranks (light prefixes) — independent of how many
+words the prefix matches.
+
+Heavy prefixes form the top of the trie: each node is ranked once, with one
+``argpartition`` over its range, and only children that are themselves heavy
+are descended into.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Mapping, Sequence
+
+import numpy as np
+
+from ...utils.logging import get_logger
+from ..config import COMPLETION_MIN_RANGE, COMPLETION_TOP_K
+
+logger = get_logger(__name__)
+
+# Sorts after every character a word can contain
+_MAX_CHAR = "\U0010ffff"
+
+
+def _top_k(ranks: np.ndarray, lo: int, hi: int, k: int) -> np.ndarray:
+    """Ids in [lo, hi) of the k best (lowest) ranks, best first."""
+    segment = ranks[lo:hi]
+    if len(segment) > k:
+        candidates = np.argpartition(segment, k - 1)[:k]
+    else:
+        candidates = np.arange(len(segment))
+    candidates = candidates[np.argsort(segment[candidates])]
+    return (candidates + lo).astype(np.int32)
+
+
+class PrefixCompletionIndex:
+    """Top-k frequency-ranked completions over a sorted vocabulary.
+
+    Args:
+        words: Vocabulary (sorted here if it isn't already)
+        frequencies: Word -> frequency; missing words rank as 0
+        k: Completions precomputed per heavy prefix
+        min_range: Prefixes matching more words than this are precomputed
+
+    Examples:
+        >>> index = PrefixCompletionIndex(["cab", "car", "cat"], {"car": 5, "cat": 9})
+        >>> index.complete("ca", 2)
+        ['cat', 'car']
+    """
+
+    def __init__(
+        self,
+        words: Sequence[str],
+        frequencies: Mapping[str, int] | None = None,
+        k: int = COMPLETION_TOP_K,
+        min_range: int = COMPLETION_MIN_RANGE,
+    ) -> None:
+        words = list(words)
+        if any(a > b for a, b in zip(words, words[1:])):
+            words.sort()
+        self.words = words
+        self.k = k
+        self.min_range = max(min_range, k)
+
+        frequencies = frequencies or {}
+        counts = np.fromiter(
+            (frequencies.get(word, 0) for word in words), dtype=np.int64, count=len(words)
+        )
+        # Global rank: frequency descending, ties alphabetical. Unique ranks make
+        # every top-k selection deterministic.
+        order = np.lexsort((np.arange(len(words)), -counts))
+        self.ranks = np.empty(len(words), dtype=np.int64)
+        self.ranks[order] = np.arange(len(words))
+        self._top: dict[str, np.ndarray] = {}
+        self._build()
+
+    def _build(self) -> None:
+        words, ranks = self.words, self.ranks
+        stack = [(0, len(words), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if hi - lo <= self.min_range:
+                continue
+            if depth:
+                self._top[words[lo][:depth]] = _top_k(ranks, lo, hi, self.k)
+
+            # The prefix itself, if it is a word, sorts first and has no children
+            start = lo
+            while start < hi and len(words[start]) == depth:
+                start += 1
+            while start < hi:
+                child = words[start][: depth + 1]
+                end = bisect_left(words, child + _MAX_CHAR, start, hi)
+                stack.append((start, end, depth + 1))
+                start = end
+
+        logger.debug(
+            f"Prefix completion index: {len(self._top):,} heavy prefixes "
+            f"over {len(words):,} words (k={self.k})"
+        )
+
+    def range(self, prefix: str) -> tuple[int, int]:
+        """Half-open id range of the words starting with ``prefix``."""
+        lo = bisect_left(self.words, prefix)
+        return lo, bisect_left(self.words, prefix + _MAX_CHAR, lo)
+
+    def complete(self, prefix: str, max_results: int = 20) -> list[str]:
+        """Up to ``max_results`` words starting with ``prefix``, most frequent first."""
+        if max_results <= 0:
+            return []
+
+        top = self._top.get(prefix)
+        if top is not None and max_results <= len(top):
+            ids = top[:max_results]
+        else:
+            lo, hi = self.range(prefix)
+            if lo == hi:
+                return []
+            ids = _top_k(self.ranks, lo, hi, max_results)
+        return [self.words[i] for i in ids]
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+__all__ = ["PrefixCompletionIndex"]
@@ -7,6 +7,7 @@ PERFORMANCE OPTIMIZATIONS:
 - Bloom filter for fast negative lookups (30-50% speedup for non-existent words)
 - Removed redundant normalization (assumes caller pre-normalizes)
 - Inline hot path code to avoid function call overhead
+- Precomputed top-k completions so prefix search cost doesn't grow with match count
 """
 
 from __future__ import annotations
@@ -14,7 +15,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import marisa_trie
-import numpy as np
 
 from ...caching.models import VersionConfig
 from ...corpus.core import Corpus
@@ -27,6 +27,7 @@ from ..config import (
     BLOOM_MEDIUM_CORPUS,
     BLOOM_SMALL_CORPUS,
 )
+from .completion import PrefixCompletionIndex
 from .index import TrieIndex
 
 if TYPE_CHECKING:
@@ -64,6 +65,9 @@ class TrieSearch:
         # Bloom filter for fast negative lookups (lazy initialized)
         self._bloom_filter: BloomFilter | None = None
 
+        # Frequency-ranked prefix completions (built with the trie)
+        self._completions: PrefixCompletionIndex | None = None
+
         # Load trie from index if provided
         if index:
             self._load_from_index()
@@ -91,6 +95,7 @@ class TrieSearch:
 
         # Build marisa trie from word list
         self._trie = marisa_trie.Trie(self.index.trie_data)
+        self._completions = PrefixCompletionIndex(self.index.trie_data, self.index.word_frequencies)
         logger.debug(f"Loaded trie with {self.index.word_count} words")
 
         from .bloom import BloomFilter
@@ -175,7 +180,10 @@ class TrieSearch:
         return None
 
     def search_prefix(self, prefix: str, max_results: int = 20) -> list[str]:
-        """Find all words that start with the given prefix using optimized marisa-trie.
+        """Find the most frequent words that start with the given prefix.
+
+        Served from the precomputed completion index: cost depends on
+        ``max_results``, not on how many words share the prefix.
 
         Args:
             prefix: Prefix to search for
@@ -185,7 +193,7 @@ class TrieSearch:
             List of words starting with prefix, ranked by frequency
 
         """
-        if not prefix or not self._trie:
+        if not prefix or not self._completions:
             return []
 
         # Normalize prefix using global normalize function
@@ -193,29 +201,9 @@ class TrieSearch:
         if not normalized_prefix:
             return []
 
-        # Use marisa-trie's optimized prefix search
-        matches = list(self._trie.keys(normalized_prefix))
-
-        # Sort by frequency if we have frequency data
-        if self.index and self.index.word_frequencies:
-            if len(matches) <= max_results:
-                # Simple sort for small results
-                frequency_pairs = [
-                    (word, self.index.word_frequencies.get(word, 0)) for word in matches
-                ]
-                frequency_pairs.sort(key=lambda x: x[1], reverse=True)
-                matches = [word for word, _ in frequency_pairs]
-            else:
-                # Use numpy for large results
-                frequencies = np.array(
-                    [self.index.word_frequencies.get(word, 0) for word in matches],
-                )
-                top_indices = np.argsort(-frequencies)[:max_results]
-                matches = [matches[i] for i in top_indices]
-
         # Return normalized words — caller handles mapping to original forms
         # (consistent with search_exact which also returns normalized words)
-        return matches[:max_results]
+        return self._completions.complete(normalized_prefix, max_results)
 
     @classmethod
     async def from_corpus(
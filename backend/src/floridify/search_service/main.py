@@ -5,12 +5,13 @@ Does NOT initialize AI connector, TTS, lookup pipeline, CRUD, or user management
 Same Python package as the main app — just a thinner entry point.
 """
 
+import asyncio
 import os
 import time
 from contextlib import asynccontextmanager
 from typing import Any
 
-from fastapi import APIRouter, FastAPI
+from fastapi import APIRouter, FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from ..api.middleware import CacheHeadersMiddleware, LoggingMiddleware
@@ -18,8 +19,16 @@ from ..api.middleware.rate_limiting import RateLimitMiddleware
 from ..api.routers.search import router as search_router
 from ..caching.core import get_global_cache, shutdown_global_cache
 from ..core.search_pipeline import get_search_engine_manager
+from ..search.semantic.encoder_pool import shutdown_encoder_pool
 from ..storage.mongodb import get_storage
+from ..text.normalize import TEXT_POOL_SHUTDOWN_WAIT, shutdown_text_pool
 from ..utils.logging import get_logger, setup_logging
+from ..utils.metrics import (
+    PROMETHEUS_CONTENT_TYPE,
+    render_metrics,
+    start_metrics_flush_task,
+    stop_metrics_flush_task,
+)
 
 setup_logging(os.getenv("LOG_LEVEL", "INFO"))
 logger = get_logger(__name__)
@@ -42,6 +51,8 @@ async def lifespan(app: FastAPI) -> Any:
         await manager.start_background_init()
         logger.info("Search engine initialization started in background")
 
+        start_metrics_flush_task()
+
     except Exception as e:
         logger.error(f"Search service initialization failed: {e}")
         raise
@@ -55,6 +66,21 @@ async def lifespan(app: FastAPI) -> Any:
     except Exception as e:
         logger.warning(f"Cache shutdown error: {e}")
 
+    try:
+        await asyncio.to_thread(shutdown_text_pool, TEXT_POOL_SHUTDOWN_WAIT)
+    except Exception as e:
+        logger.warning(f"Text worker pool shutdown error: {e}")
+
+    try:
+        await asyncio.to_thread(shutdown_encoder_pool)
+    except Exception as e:
+        logger.warning(f"Encoder pool shutdown error: {e}")
+
+    try:
+        await stop_metrics_flush_task()
+    except Exception as e:
+        logger.warning(f"Metrics flush shutdown error: {e}")
+
 
 app = FastAPI(
     title="Floridify Search Service",
@@ -96,4 +122,10 @@ async def health_check() -> dict[str, Any]:
     }
 
 
+@health_router.get("/metrics", include_in_schema=False)
+async def prometheus_metrics() -> Response:
+    """Latency histograms in Prometheus text format."""
+    return Response(content=render_metrics(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
 app.include_router(health_router, tags=["health"])
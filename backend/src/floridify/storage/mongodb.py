@@ -10,6 +10,7 @@ from urllib.parse import parse_qs, urlparse
 
 from beanie import init_beanie
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import monitoring
 
 from ..caching.models import BaseVersionedData
 from ..models.base import AudioMedia, ImageMedia
@@ -26,6 +27,7 @@ from ..models.relationships import WordRelationship
 from ..models.user import User, UserHistory
 from ..utils.config import Config
 from ..utils.logging import get_logger
+from ..utils.metrics import DB_COMMAND_FAILURES, DB_COMMAND_SECONDS
 from .dictionary import _resolve_word_text, save_entry_versioned
 
 logger = get_logger(__name__)
@@ -34,6 +36,30 @@ logger = get_logger(__name__)
 _storage: MongoDBStorage | None = None
 
 
+class CommandLatencyListener(monitoring.CommandListener):
+    """Records every MongoDB command's server round-trip into the DB latency histogram.
+
+    The collection name is only on the started event, so it is held per
+    request id until the command finishes.
+    """
+
+    def __init__(self) -> None:
+        self._collections: dict[tuple[Any, int], str] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        collection = event.command.get(event.command_name)
+        if isinstance(collection, str):
+            self._collections[(event.connection_id, event.request_id)] = collection
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        collection = self._collections.pop((event.connection_id, event.request_id), "")
+        DB_COMMAND_SECONDS.observe(event.duration_micros / 1e6, event.command_name, collection)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._collections.pop((event.connection_id, event.request_id), None)
+        DB_COMMAND_FAILURES.inc(event.command_name)
+
+
 class MongoDBStorage:
     """MongoDB storage for dictionary entries using Beanie ODM."""
 
@@ -113,6 +139,7 @@ class MongoDBStorage:
         # Optimized connection pool configuration for production performance
         self.client = AsyncIOMotorClient(
             self.connection_string,
+            event_listeners=[CommandLatencyListener()],
             **connection_kwargs,
         )
         database: Any = self.client[self.database_name]
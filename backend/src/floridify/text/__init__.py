@@ -13,6 +13,7 @@ from .normalize import (
     batch_normalize,
     clear_lemma_cache,
     get_lemma_cache_stats,
+    get_text_pool,
     # Validation
     is_valid_word,
     # Lemmatization
@@ -21,8 +22,10 @@ from .normalize import (
     normalize,
     normalize_basic,
     normalize_comprehensive,
+    precompute_lemmas,
     # Diacritics
     remove_diacritics,
+    shutdown_text_pool,
 )
 from .phrase import is_phrase
 
@@ -41,8 +44,12 @@ __all__ = [
     # Lemmatization
     "lemmatize_comprehensive",
     "batch_lemmatize",
+    "precompute_lemmas",
     "clear_lemma_cache",
     "get_lemma_cache_stats",
+    # Worker pool
+    "get_text_pool",
+    "shutdown_text_pool",
     # Phrase
     "is_phrase",
     # Patterns
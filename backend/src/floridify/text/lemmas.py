@@ -0,0 +1,173 @@
+"""Persistent word -> lemma table.
+
+``lemmatize_comprehensive`` costs a POS tag plus a WordNet lookup per word, and
+its ``lru_cache`` is lost on restart, so each corpus build re-lemmatizes its
+whole vocabulary. This module keeps every computed lemma in an on-disk
+``marisa_trie.BytesTrie`` that is memory-mapped on load. ``batch_lemmatize``
+looks words up here first and only sends misses to NLTK.
+
+The table is versioned: bump ``LEMMA_TABLE_VERSION`` whenever the output of
+``lemmatize_comprehensive`` changes, so stale lemmas are never served.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from pathlib import Path
+
+import marisa_trie
+from nltk.corpus import wordnet as wn  # type: ignore[import-untyped]
+
+from ..utils.logging import get_logger
+from ..utils.paths import get_cache_directory
+
+logger = get_logger(__name__)
+
+LEMMA_TABLE_VERSION = 1
+# Consult (and grow) the on-disk lemma table in batch_lemmatize
+LEMMA_TABLE_ENABLED = os.getenv("FLORIDIFY_LEMMA_TABLE", "true").lower() in ("true", "1", "yes")
+# Batches smaller than this (e.g. per-query lemmatization) read the table but don't write it
+LEMMA_TABLE_MIN_PERSIST = int(os.getenv("FLORIDIFY_LEMMA_TABLE_MIN_PERSIST", "1000"))
+
+
+def get_lemma_table_path(language: str = "en") -> Path:
+    """Path of the lemma table file for a language."""
+    return get_cache_directory("lemmas") / f"v{LEMMA_TABLE_VERSION}-{language}.marisa"
+
+
+class LemmaTable:
+    """Memory-mapped word -> lemma table, merged and rewritten on ``update``.
+
+    Writes go to a temp file renamed into place, so concurrent readers always
+    map a complete table. Two processes updating at once can drop each other's
+    new entries; those words are simply lemmatized again later.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._trie = marisa_trie.BytesTrie()
+        self._lock = threading.Lock()
+        if path.exists():
+            try:
+                self._trie.mmap(str(path))
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable lemma table {path}: {e}")
+                self._trie = marisa_trie.BytesTrie()
+
+    def __len__(self) -> int:
+        return len(self._trie)
+
+    def __contains__(self, word: object) -> bool:
+        return isinstance(word, str) and word in self._trie
+
+    def lookup(self, words: Sequence[str]) -> list[str | None]:
+        """Look up lemmas for words (None where the table has no entry)."""
+        trie = self._trie
+        return [values[0].decode("utf-8") if (values := trie.get(word)) else None for word in words]
+
+    def update(self, lemmas: Mapping[str, str]) -> int:
+        """Add word -> lemma entries and persist the merged table.
+
+        Args:
+            lemmas: New entries (existing words are left unchanged)
+
+        Returns:
+            Number of entries added
+
+        """
+        with self._lock:
+            new = {w: lemma for w, lemma in lemmas.items() if w and w not in self._trie}
+            if not new:
+                return 0
+
+            entries = [(word, value) for word, value in self._trie.items()]
+            entries.extend((word, lemma.encode("utf-8")) for word, lemma in new.items())
+            merged = marisa_trie.BytesTrie(entries)
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=".lemmas-", dir=self.path.parent)
+            os.close(fd)
+            try:
+                merged.save(tmp_name)
+                os.replace(tmp_name, self.path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+
+            trie = marisa_trie.BytesTrie()
+            trie.mmap(str(self.path))
+            self._trie = trie
+
+        logger.debug(f"Lemma table {self.path.name}: +{len(new)} entries ({len(trie)} total)")
+        return len(new)
+
+
+_tables: dict[str, LemmaTable] = {}
+_tables_lock = threading.Lock()
+
+
+def get_lemma_table(language: str = "en") -> LemmaTable:
+    """Get the process-wide lemma table for a language, mapping it on first use."""
+    with _tables_lock:
+        table = _tables.get(language)
+        if table is None:
+            table = _tables[language] = LemmaTable(get_lemma_table_path(language))
+        return table
+
+
+def reset_lemma_tables() -> None:
+    """Drop loaded tables so the next access re-maps them from disk."""
+    with _tables_lock:
+        _tables.clear()
+
+
+def wordnet_words() -> list[str]:
+    """Every single-word lemma name in WordNet (empty if WordNet is unavailable)."""
+    try:
+        return sorted(name for name in wn.all_lemma_names() if name.isalpha())
+    except LookupError:
+        logger.warning("WordNet data not found; lemma table seeded from corpora only")
+        return []
+
+
+def build_lemma_table(
+    lemmatizer: Callable[[list[str]], list[str]],
+    words: Iterable[str] = (),
+    language: str = "en",
+    include_wordnet: bool = True,
+) -> LemmaTable:
+    """Precompute lemmas for WordNet plus the given words (e.g. corpus vocabularies).
+
+    Args:
+        lemmatizer: Batch lemmatizer returning one lemma per word
+        words: Extra words to include
+        language: Table language
+        include_wordnet: Seed with WordNet's lemma names
+
+    Returns:
+        The updated table
+
+    """
+    table = get_lemma_table(language)
+    candidates = set(words)
+    if include_wordnet:
+        candidates.update(wordnet_words())
+    missing = sorted(w for w in candidates if w and w not in table)
+    if missing:
+        table.update(dict(zip(missing, lemmatizer(missing), strict=True)))
+    logger.info(f"Lemma table ({language}): {len(table)} entries")
+    return table
+
+
+__all__ = [
+    "LEMMA_TABLE_VERSION",
+    "LemmaTable",
+    "build_lemma_table",
+    "get_lemma_table",
+    "get_lemma_table_path",
+    "reset_lemma_tables",
+    "wordnet_words",
+]
@@ -8,9 +8,12 @@ from __future__ import annotations
 import functools
 import multiprocessing as mp
 import os
+import threading
 import unicodedata
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any
 
 import contractions  # type: ignore[import-untyped]
 import ftfy
@@ -29,6 +32,13 @@ from .constants import (
     SUFFIX_RULES,
     UNICODE_TO_ASCII,
 )
+from .lemmas import (
+    LEMMA_TABLE_ENABLED,
+    LEMMA_TABLE_MIN_PERSIST,
+    LemmaTable,
+    build_lemma_table,
+    get_lemma_table,
+)
 
 logger = get_logger(__name__)
 
@@ -51,6 +61,21 @@ except LookupError:
 # Lazy NLTK lemmatizer initialization
 _nltk_lemmatizer: WordNetLemmatizer | None = None
 
+# Persistent worker pool for batch_normalize / batch_lemmatize (0 = min(cpu_count, 8))
+TEXT_POOL_WORKERS = int(os.getenv("FLORIDIFY_TEXT_POOL_WORKERS", "0"))
+# Chunks queued per worker: more chunks balance uneven words, fewer cut IPC overhead
+TEXT_POOL_CHUNKS_PER_WORKER = 4
+TEXT_POOL_MIN_CHUNK_SIZE = 1000
+# Whether app shutdown blocks until workers exit (false = return while chunks finish)
+TEXT_POOL_SHUTDOWN_WAIT = os.getenv("FLORIDIFY_TEXT_POOL_SHUTDOWN_WAIT", "true").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+
+_text_pool: ProcessPoolExecutor | None = None
+_text_pool_lock = threading.Lock()
+
 
 def _get_lemmatizer() -> WordNetLemmatizer:
     """Get or create the NLTK lemmatizer singleton."""
@@ -63,6 +88,90 @@ def _get_lemmatizer() -> WordNetLemmatizer:
     return _nltk_lemmatizer
 
 
+def _warm_worker() -> None:
+    """Pool initializer: load WordNet and the POS tagger once per worker process."""
+    try:
+        _get_lemmatizer().lemmatize("warming", pos="v")
+        nltk.pos_tag(["warming"])
+    except Exception as e:
+        # Workers fall back to rule-based lemmatization per word if NLTK is unusable
+        logger.debug(f"Text worker warmup failed: {e}")
+
+
+def _text_pool_size() -> int:
+    return TEXT_POOL_WORKERS if TEXT_POOL_WORKERS > 0 else min(os.cpu_count() or 4, 8)
+
+
+def get_text_pool() -> ProcessPoolExecutor:
+    """Get the process-wide text worker pool, starting it on first use.
+
+    Workers are spawned once and kept alive, so WordNet loading and each
+    worker's ``lru_cache`` state carry over between batches.
+    """
+    global _text_pool
+
+    with _text_pool_lock:
+        if _text_pool is None:
+            workers = _text_pool_size()
+            _text_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=mp.get_context("spawn"),
+                initializer=_warm_worker,
+            )
+            logger.info(f"Started text worker pool ({workers} processes)")
+        return _text_pool
+
+
+def shutdown_text_pool(wait: bool = True, cancel_futures: bool = True) -> None:
+    """Stop the text worker pool, if started. The next batch call restarts it.
+
+    Args:
+        wait: Block until worker processes exit
+        cancel_futures: Drop chunks that haven't started yet
+
+    """
+    global _text_pool
+
+    with _text_pool_lock:
+        pool, _text_pool = _text_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+        logger.info("Text worker pool shut down")
+
+
+def _chunk_evenly[T](
+    items: Sequence[T], n_workers: int, chunk_size: int | None = None
+) -> list[Sequence[T]]:
+    """Split items into ordered chunks, several per worker for load balancing."""
+    if chunk_size is None:
+        target = -(-len(items) // (n_workers * TEXT_POOL_CHUNKS_PER_WORKER))
+        chunk_size = max(TEXT_POOL_MIN_CHUNK_SIZE, target)
+    return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def _map_chunks[T](func: Callable[[Any], list[T]], chunks: Sequence[Any]) -> list[T] | None:
+    """Run func over chunks on the text pool, flattening results in order.
+
+    Returns None if the pool broke (a worker died), after discarding it so the
+    next call starts a fresh one; callers then fall back to serial processing.
+    """
+    global _text_pool
+
+    pool = get_text_pool()
+    try:
+        results: list[T] = []
+        for chunk_result in pool.map(func, chunks):
+            results.extend(chunk_result)
+        return results
+    except BrokenProcessPool as e:
+        logger.warning(f"Text worker pool broke ({e}); restarting on next use")
+        with _text_pool_lock:
+            if _text_pool is pool:
+                _text_pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        return None
+
+
 @functools.lru_cache(maxsize=50_000)
 def normalize_comprehensive(
     text: str,
@@ -230,19 +339,11 @@ def batch_normalize(
         # Fall back to serial for small datasets
         return [normalizer(word) for word in valid_words]
 
-    # Split into chunks for parallel processing
-    cpu_count = os.cpu_count() or 4
-    chunk_size = max(1000, len(valid_words) // cpu_count)
-    chunks = [valid_words[i : i + chunk_size] for i in range(0, len(valid_words), chunk_size)]
-
-    # Process chunks in parallel - pass normalizer with each chunk
-    normalized_words = []
-    with ProcessPoolExecutor(max_workers=min(8, cpu_count)) as executor:
-        # Create args tuples for each chunk
-        chunk_args = [(chunk, normalizer) for chunk in chunks]
-        futures = [executor.submit(_normalize_chunk, args) for args in chunk_args]
-        for future in futures:
-            normalized_words.extend(future.result())
+    # Process chunks on the persistent pool - pass normalizer with each chunk
+    chunks = _chunk_evenly(valid_words, _text_pool_size())
+    normalized_words = _map_chunks(_normalize_chunk, [(chunk, normalizer) for chunk in chunks])
+    if normalized_words is None:
+        return [normalizer(word) for word in valid_words]
 
     return normalized_words
 
@@ -411,46 +512,10 @@ def lemmatize(word: str) -> str:
 
 def _lemmatize_chunk(chunk: list[str]) -> list[str]:
     """Lemmatize a chunk of words for multiprocessing.
-    Helper function that reinitializes NLTK in each process.
-    """
-    # Each process needs its own NLTK lemmatizer
-    process_lemmatizer = WordNetLemmatizer()
-
-    lemmas = []
-    for word in chunk:
-        if not word:
-            lemmas.append("")
-            continue
-
-        word_lower = word.lower().strip()
-
-        try:
-            # Get POS tag
-            pos_tag = nltk.pos_tag([word_lower])[0][1]
-
-            # Map to WordNet POS
-            if pos_tag.startswith("J"):
-                pos = "a"
-            elif pos_tag.startswith("V"):
-                pos = "v"
-            elif pos_tag.startswith("N"):
-                pos = "n"
-            elif pos_tag.startswith("R"):
-                pos = "r"
-            else:
-                pos = "n"
-
-            lemma = process_lemmatizer.lemmatize(word_lower, pos=pos)
-
-            # Validate result
-            if not lemma or len(lemma) < 2:
-                lemma = lemmatize_basic(word_lower)
-        except Exception:
-            lemma = lemmatize_basic(word_lower)
 
-        lemmas.append(lemma)
-
-    return lemmas
+    Runs in text pool workers, which keep their lemmatizer and cache across chunks.
+    """
+    return [lemmatize_comprehensive(word) if word else "" for word in chunk]
 
 
 def _build_lemma_indices(
@@ -482,17 +547,42 @@ def _build_lemma_indices(
     return unique_lemmas, word_to_lemma_indices, lemma_to_word_indices
 
 
+def _compute_lemmas(
+    words: list[str],
+    n_processes: int | None = None,
+    chunk_size: int | None = None,
+) -> list[str]:
+    """Lemmatize words with NLTK, on the text worker pool for large inputs."""
+    # For small batches, use serial processing
+    if len(words) < 10000:
+        return _lemmatize_chunk(words)
+
+    if n_processes is None:
+        n_processes = _text_pool_size()
+
+    logger.info(f"🚀 Parallelized lemmatization: {len(words)} words across {n_processes} processes")
+
+    chunks = _chunk_evenly(words, n_processes, chunk_size)
+    lemmas = _map_chunks(_lemmatize_chunk, chunks)
+    return lemmas if lemmas is not None else _lemmatize_chunk(words)
+
+
 def batch_lemmatize(
     words: list[str],
     n_processes: int | None = None,
-    chunk_size: int = 5000,
+    chunk_size: int | None = None,
 ) -> tuple[list[str], list[int], list[int]]:
     """Batch lemmatization with automatic parallelization for large inputs.
 
+    Words are looked up in the persistent lemma table first (see ``text.lemmas``);
+    only misses are lemmatized, on the persistent text worker pool (see
+    ``get_text_pool``) when there are many. Large batches write their misses
+    back to the table.
+
     Args:
         words: List of words to lemmatize
-        n_processes: Number of processes (None for CPU count)
-        chunk_size: Size of chunks for each process
+        n_processes: Workers to spread chunks across (None for the pool size)
+        chunk_size: Size of chunks for each process (None to size from n_processes)
 
     Returns:
         Tuple of (unique_lemmas, word_to_lemma_indices, lemma_to_word_indices)
@@ -501,46 +591,55 @@ def batch_lemmatize(
     if not words:
         return [], [], []
 
-    # For small batches, use serial processing
-    if len(words) < 10000:
-        lemmas = [lemmatize_comprehensive(word) if word else "" for word in words]
-        return _build_lemma_indices(lemmas)
+    table: LemmaTable | None = None
+    if LEMMA_TABLE_ENABLED:
+        try:
+            table = get_lemma_table()
+        except Exception as e:
+            logger.warning(f"Lemma table unavailable: {e}")
+
+    lemmas = table.lookup(words) if table is not None else [None] * len(words)
+    missing = list(dict.fromkeys(w for w, lemma in zip(words, lemmas) if lemma is None and w))
+
+    if missing:
+        computed = dict(zip(missing, _compute_lemmas(missing, n_processes, chunk_size)))
+        if table is not None and len(missing) >= LEMMA_TABLE_MIN_PERSIST:
+            try:
+                table.update(computed)
+            except Exception as e:
+                logger.warning(f"Failed to persist lemma table: {e}")
+    else:
+        computed = {}
+
+    all_lemmas = [
+        lemma if lemma is not None else computed.get(word, "") for word, lemma in zip(words, lemmas)
+    ]
+    unique_lemmas, word_to_lemma_indices, lemma_to_word_indices = _build_lemma_indices(all_lemmas)
 
-    # Determine optimal process count
-    if n_processes is None:
-        n_processes = min(os.cpu_count() or 4, 8)  # Cap at 8 for efficiency
+    if len(words) >= 10000:
+        logger.info(
+            f"✅ Lemmatization complete: {len(unique_lemmas)} unique lemmas from {len(words)} words "
+            f"({len(words) - len(missing)} from lemma table)",
+        )
 
-    logger.info(f"🚀 Parallelized lemmatization: {len(words)} words across {n_processes} processes")
-
-    # Split words into chunks
-    chunks = []
-    for i in range(0, len(words), chunk_size):
-        chunks.append(words[i : i + chunk_size])
+    return unique_lemmas, word_to_lemma_indices, lemma_to_word_indices
 
-    # Use spawn context to avoid fork issues and proper cleanup
-    ctx = mp.get_context("spawn")
 
-    # Process chunks in parallel with proper cleanup
-    chunk_results = []
-    with ctx.Pool(processes=n_processes) as pool:
-        try:
-            chunk_results = pool.map(_lemmatize_chunk, chunks)
-        finally:
-            pool.close()
-            pool.join()
+def precompute_lemmas(words: list[str] | None = None, include_wordnet: bool = True) -> int:
+    """Fill the persistent lemma table from WordNet and/or a word list.
 
-    # Flatten results
-    all_lemmas = []
-    for chunk_lemmas in chunk_results:
-        all_lemmas.extend(chunk_lemmas)
+    Corpus builds grow the table as they go; this front-loads that work.
 
-    unique_lemmas, word_to_lemma_indices, lemma_to_word_indices = _build_lemma_indices(all_lemmas)
+    Args:
+        words: Extra words to include (e.g. a corpus vocabulary)
+        include_wordnet: Seed with WordNet's lemma names
 
-    logger.info(
-        f"✅ Lemmatization complete: {len(unique_lemmas)} unique lemmas from {len(words)} words",
-    )
+    Returns:
+        Number of entries in the table
 
-    return unique_lemmas, word_to_lemma_indices, lemma_to_word_indices
+    """
+    table = build_lemma_table(_compute_lemmas, words or (), include_wordnet=include_wordnet)
+    return len(table)
 
 
 def clear_lemma_cache() -> None:
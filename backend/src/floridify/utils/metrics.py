@@ -0,0 +1,406 @@
+"""Fixed-memory latency histograms with Prometheus text exposition.
+
+Each histogram series is a log-linear bucket array (HDR-style): every power
+of two between ``2^-14`` s (~61µs) and 64s is split into
+``HISTOGRAM_SUB_BUCKETS`` equal-width buckets, plus an underflow and an
+overflow bucket. Recording is an ``frexp`` and one increment, memory per
+series is constant, and quantiles are accurate to about half a sub-bucket
+(~6% with 8 sub-buckets). Prometheus sees the series with one ``le`` bucket
+per power of two.
+
+Multi-process (uvicorn ``--workers``): when ``FLORIDIFY_METRICS_DIR`` is set,
+each process periodically writes its registry snapshot to ``<pid>.json`` in
+that directory and ``/metrics`` merges every process's file, so any worker
+reports for all of them. Point it at a directory that is emptied when the
+deployment starts (e.g. the container's ``/tmp``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+import os
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+HISTOGRAM_SUB_BUCKETS = 8
+_MIN_EXP = -13  # frexp exponent of the lowest octave: [2^-14, 2^-13)
+_MAX_EXP = 6  # frexp exponent of the highest octave: [32, 64)
+_OCTAVES = _MAX_EXP - _MIN_EXP + 1
+_NUM_BUCKETS = _OCTAVES * HISTOGRAM_SUB_BUCKETS + 2  # + underflow + overflow
+_MIN_VALUE = math.ldexp(1.0, _MIN_EXP - 1)
+_MAX_VALUE = math.ldexp(1.0, _MAX_EXP)
+
+METRICS_DIR = os.getenv("FLORIDIFY_METRICS_DIR") or None
+METRICS_FLUSH_INTERVAL_SECONDS = float(os.getenv("FLORIDIFY_METRICS_FLUSH_SECONDS", "5"))
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _bucket_index(value: float) -> int:
+    if not value >= _MIN_VALUE:  # Also catches NaN
+        return 0
+    if value >= _MAX_VALUE:
+        return _NUM_BUCKETS - 1
+    mantissa, exponent = math.frexp(value)  # value = mantissa * 2^exponent, mantissa in [0.5, 1)
+    sub = int((mantissa * 2.0 - 1.0) * HISTOGRAM_SUB_BUCKETS)
+    return (exponent - _MIN_EXP) * HISTOGRAM_SUB_BUCKETS + sub + 1
+
+
+def _bucket_bounds(index: int) -> tuple[float, float]:
+    """[lower, upper) of a bucket; the overflow bucket's upper bound is +inf."""
+    if index == 0:
+        return 0.0, _MIN_VALUE
+    if index == _NUM_BUCKETS - 1:
+        return _MAX_VALUE, math.inf
+    octave, sub = divmod(index - 1, HISTOGRAM_SUB_BUCKETS)
+    base = math.ldexp(1.0, _MIN_EXP - 1 + octave)
+    width = base / HISTOGRAM_SUB_BUCKETS
+    return base + sub * width, base + (sub + 1) * width
+
+
+class HistogramSeries:
+    """One labelled histogram: bucket counts, sum and count."""
+
+    __slots__ = ("counts", "sum", "_lock")
+
+    def __init__(self) -> None:
+        self.counts = [0] * _NUM_BUCKETS
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        index = _bucket_index(seconds)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += seconds
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def merge(self, counts: list[int], total: float) -> None:
+        with self._lock:
+            for i, c in enumerate(counts):
+                self.counts[i] += c
+            self.sum += total
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate the ``q`` quantile (seconds), or None if empty."""
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * (total - 1)
+        seen = 0
+        for index, c in enumerate(self.counts):
+            if c and seen + c > rank:
+                lower, upper = _bucket_bounds(index)
+                if math.isinf(upper):
+                    return lower
+                return lower + (upper - lower) * min(1.0, (rank - seen + 0.5) / c)
+            seen += c
+        return _MAX_VALUE
+
+    def prometheus_buckets(self) -> list[tuple[float, int]]:
+        """Cumulative counts at each power-of-two bound (``le``), ending with +Inf."""
+        buckets: list[tuple[float, int]] = []
+        cumulative = self.counts[0]
+        buckets.append((_MIN_VALUE, cumulative))
+        for octave in range(_OCTAVES):
+            start = 1 + octave * HISTOGRAM_SUB_BUCKETS
+            cumulative += sum(self.counts[start : start + HISTOGRAM_SUB_BUCKETS])
+            buckets.append((math.ldexp(1.0, _MIN_EXP + octave), cumulative))
+        buckets.append((math.inf, cumulative + self.counts[-1]))
+        return buckets
+
+
+class CounterSeries:
+    """One labelled counter."""
+
+    __slots__ = ("value", "_lock")
+
+    def __init__(self) -> None:
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class MetricFamily:
+    """A named metric with fixed label names and one series per label combination."""
+
+    def __init__(self, kind: str, name: str, documentation: str, labelnames: tuple[str, ...]):
+        self.kind = kind
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.series: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str) -> Any:
+        """Series for ``values`` (in ``labelnames`` order), created on first use."""
+        series = self.series.get(values)
+        if series is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+            with self._lock:
+                series = self.series.setdefault(
+                    values, HistogramSeries() if self.kind == "histogram" else CounterSeries()
+                )
+        return series
+
+    def observe(self, seconds: float, *values: str) -> None:
+        self.labels(*values).observe(seconds)
+
+    def inc(self, *values: str, amount: float = 1.0) -> None:
+        self.labels(*values).inc(amount)
+
+
+class MetricsRegistry:
+    """Process-local set of metric families, mergeable across processes."""
+
+    def __init__(self) -> None:
+        self.families: dict[str, MetricFamily] = {}
+        self._lock = threading.Lock()
+
+    def _family(
+        self, kind: str, name: str, documentation: str, labelnames: Iterable[str]
+    ) -> MetricFamily:
+        with self._lock:
+            family = self.families.get(name)
+            if family is None:
+                family = MetricFamily(kind, name, documentation, tuple(labelnames))
+                self.families[name] = family
+            elif family.kind != kind:
+                raise ValueError(f"Metric {name} already registered as a {family.kind}")
+            return family
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> MetricFamily:
+        return self._family("histogram", name, documentation, labelnames)
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Iterable[str] = ()
+    ) -> MetricFamily:
+        return self._family("counter", name, documentation, labelnames)
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-serializable copy of every family's series."""
+        families = {}
+        for name, family in list(self.families.items()):
+            series = []
+            for labels, s in list(family.series.items()):
+                if family.kind == "histogram":
+                    series.append([list(labels), list(s.counts), s.sum])
+                else:
+                    series.append([list(labels), s.value])
+            families[name] = {
+                "kind": family.kind,
+                "help": family.documentation,
+                "labelnames": list(family.labelnames),
+                "series": series,
+            }
+        return families
+
+    def merge_snapshot(self, snapshot: dict[str, Any]) -> None:
+        """Add another registry's snapshot into this one."""
+        for name, data in snapshot.items():
+            family = self._family(data["kind"], name, data["help"], data["labelnames"])
+            for entry in data["series"]:
+                series = family.labels(*entry[0])
+                if family.kind == "histogram":
+                    series.merge(entry[1], entry[2])
+                else:
+                    series.inc(entry[1])
+
+    def reset(self) -> None:
+        for family in self.families.values():
+            family.series.clear()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_float(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value))
+
+
+def render_prometheus(registry: MetricsRegistry) -> str:
+    """Prometheus text exposition format (0.0.4) for ``registry``."""
+    lines: list[str] = []
+    for name, family in sorted(registry.families.items()):
+        lines.append(f"# HELP {name} {family.documentation}")
+        lines.append(f"# TYPE {name} {family.kind}")
+        for labels, series in sorted(family.series.items()):
+            if family.kind == "counter":
+                label_str = _format_labels(family.labelnames, labels)
+                lines.append(f"{name}{label_str} {_format_float(series.value)}")
+                continue
+            for bound, cumulative in series.prometheus_buckets():
+                le = f'le="{_format_float(bound)}"'
+                label_str = _format_labels(family.labelnames, labels, le)
+                lines.append(f"{name}_bucket{label_str} {cumulative}")
+            label_str = _format_labels(family.labelnames, labels)
+            lines.append(f"{name}_sum{label_str} {_format_float(series.sum)}")
+            lines.append(f"{name}_count{label_str} {series.count}")
+    return "\n".join(lines) + "\n"
+
+
+# Global registry and the metrics recorded across the app
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "floridify_http_request_duration_seconds",
+    "HTTP request latency by route template and status code.",
+    ("method", "route", "status"),
+)
+HTTP_ERRORS = REGISTRY.counter(
+    "floridify_http_errors_total",
+    "Errors raised while handling requests, by route and error type.",
+    ("route", "error"),
+)
+CACHE_GET_SECONDS = REGISTRY.histogram(
+    "floridify_cache_get_duration_seconds",
+    "Cache lookup latency by namespace and result (l1_hit, l1_stale, l2_hit, miss).",
+    ("namespace", "result"),
+)
+DB_COMMAND_SECONDS = REGISTRY.histogram(
+    "floridify_db_command_duration_seconds",
+    "MongoDB command latency by command and collection.",
+    ("command", "collection"),
+)
+DB_COMMAND_FAILURES = REGISTRY.counter(
+    "floridify_db_command_failures_total",
+    "Failed MongoDB commands by command name.",
+    ("command",),
+)
+SEARCH_STAGE_SECONDS = REGISTRY.histogram(
+    "floridify_search_stage_duration_seconds",
+    "Search cascade stage latency (exact, prefix, substring, fuzzy, semantic, total).",
+    ("stage",),
+)
+PIPELINE_STAGE_SECONDS = REGISTRY.histogram(
+    "floridify_pipeline_stage_duration_seconds",
+    "StateTracker stage and nested span (provider, AI call) latency by pipeline category.",
+    ("category", "stage"),
+)
+
+
+# ─── Multi-process aggregation ───────────────────────────────────────────
+
+
+def _snapshot_path(directory: str | Path, pid: int) -> Path:
+    return Path(directory) / f"{pid}.json"
+
+
+def flush_metrics(directory: str | Path | None = METRICS_DIR) -> None:
+    """Write this process's snapshot to ``<directory>/<pid>.json`` (atomic replace)."""
+    if directory is None:
+        return
+    path = _snapshot_path(directory, os.getpid())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(REGISTRY.snapshot()))
+    os.replace(tmp, path)
+
+
+def collect_metrics(directory: str | Path | None = METRICS_DIR) -> MetricsRegistry:
+    """This process's live metrics merged with every other process's last snapshot."""
+    if directory is None:
+        return REGISTRY
+
+    merged = MetricsRegistry()
+    merged.merge_snapshot(REGISTRY.snapshot())
+    own = _snapshot_path(directory, os.getpid())
+    for path in Path(directory).glob("*.json"):
+        if path == own:
+            continue
+        try:
+            merged.merge_snapshot(json.loads(path.read_text()))
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Skipping unreadable metrics snapshot {path}: {e}")
+    return merged
+
+
+def render_metrics() -> str:
+    """Prometheus text for all processes sharing ``FLORIDIFY_METRICS_DIR`` (or just this one)."""
+    return render_prometheus(collect_metrics())
+
+
+_flush_task: asyncio.Task[None] | None = None
+
+
+async def _flush_loop(interval: float) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(flush_metrics)
+        except Exception as e:
+            logger.warning(f"Metrics flush failed: {e}")
+
+
+def start_metrics_flush_task(interval: float = METRICS_FLUSH_INTERVAL_SECONDS) -> None:
+    """Periodically publish this process's metrics (no-op without FLORIDIFY_METRICS_DIR)."""
+    global _flush_task
+    if METRICS_DIR is None or _flush_task is not None:
+        return
+    _flush_task = asyncio.create_task(_flush_loop(interval), name="metrics-flush")
+    logger.info(f"Publishing metrics to {METRICS_DIR} every {interval:.0f}s")
+
+
+async def stop_metrics_flush_task() -> None:
+    """Stop the flush loop and publish a final snapshot."""
+    global _flush_task
+    task, _flush_task = _flush_task, None
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    await asyncio.to_thread(flush_metrics)
+
+
+__all__ = [
+    "CACHE_GET_SECONDS",
+    "DB_COMMAND_FAILURES",
+    "DB_COMMAND_SECONDS",
+    "HISTOGRAM_SUB_BUCKETS",
+    "HTTP_ERRORS",
+    "HTTP_REQUEST_SECONDS",
+    "PIPELINE_STAGE_SECONDS",
+    "PROMETHEUS_CONTENT_TYPE",
+    "REGISTRY",
+    "SEARCH_STAGE_SECONDS",
+    "CounterSeries",
+    "HistogramSeries",
+    "MetricFamily",
+    "MetricsRegistry",
+    "collect_metrics",
+    "flush_metrics",
+    "render_metrics",
+    "render_prometheus",
+    "start_metrics_flush_task",
+    "stop_metrics_flush_task",
+]
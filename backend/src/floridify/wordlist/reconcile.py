@@ -14,7 +14,9 @@ from ..api.repositories.wordlist_repository import WordListEntryInput, WordListR
 from ..models import Word
 from ..models.base import Language
 from ..search.constants import SearchMode
+from ..search.engine import Search
 from ..search.language import get_language_search
+from ..search.result import SearchResult
 from ..text import normalize
 from ..utils.logging import get_logger
 from .models import WordListItemDoc
@@ -98,6 +100,21 @@ def _entry_text(entry: str | WordListEntryInput) -> str:
     return str(entry).strip()
 
 
+async def _search_entry(
+    search_engine: Search, text: str, limit: int, min_score: float
+) -> list[SearchResult]:
+    try:
+        return await search_engine.search_with_mode(
+            query=text,
+            mode=SearchMode.SMART,
+            max_results=limit,
+            min_score=min_score,
+        )
+    except Exception as exc:
+        logger.warning(f"Reconcile preview search failed for '{text}': {exc}")
+        return []
+
+
 async def build_reconcile_preview(
     entries: list[str | WordListEntryInput],
     *,
@@ -151,9 +168,39 @@ async def build_reconcile_preview(
     ambiguous_frequency = 0
     unresolved_frequency = 0
 
-    for entry in collapsed:
-        text = _entry_text(entry)
-        normalized = normalize(text)
+    # Resolve every non-exact entry through the search cascade in one batch,
+    # then fetch all candidate Word docs with a single query.
+    search_texts = [
+        _entry_text(entry)
+        for entry, normalized in zip(collapsed, normalized_texts, strict=True)
+        if normalized not in normalized_to_exact_docs
+    ]
+    try:
+        search_batch = await search_engine.search_many(
+            search_texts,
+            mode=SearchMode.SMART,
+            max_results=limit,
+            min_score=min_score,
+        )
+    except Exception as exc:
+        # One bad query must not cost the whole preview: retry each query alone
+        # so only the entries that actually fail come back unresolved.
+        logger.warning(
+            f"Reconcile preview batch search failed for {len(search_texts)} entries, "
+            f"falling back to per-entry search: {exc}"
+        )
+        search_batch = [
+            await _search_entry(search_engine, text, limit, min_score) for text in search_texts
+        ]
+    search_results = iter(search_batch)
+
+    candidate_texts = list({result.word for results in search_batch for result in results})
+    candidate_docs = (
+        await Word.find({"text": {"$in": candidate_texts}}).to_list() if candidate_texts else []
+    )
+    text_to_doc = {doc.text: doc for doc in candidate_docs}
+
+    for entry, normalized in zip(collapsed, normalized_texts, strict=True):
         total_frequency += entry.frequency
 
         exact_candidates = normalized_to_exact_docs.get(normalized, [])
@@ -181,20 +228,7 @@ async def build_reconcile_preview(
             exact_frequency += entry.frequency
             continue
 
-        try:
-            results = await search_engine.search_with_mode(
-                query=text,
-                mode=SearchMode.SMART,
-                max_results=limit,
-                min_score=min_score,
-            )
-        except Exception as exc:
-            logger.warning(f"Reconcile preview search failed for '{text}': {exc}")
-            results = []
-
-        candidate_texts = [result.word for result in results]
-        candidate_docs = await Word.find({"text": {"$in": candidate_texts}}).to_list()
-        text_to_doc = {doc.text: doc for doc in candidate_docs}
+        results = next(search_results)
 
         candidates = [
             ReconcileCandidate(
@@ -0,0 +1,262 @@
+"""Tests for fused multi-component enrichment.
+
+Validates that:
+- The planner packs definitions in order within the definition and token budgets,
+  splitting a definition whose components alone exceed them.
+- Against a local OpenAI-compatible stub model server, fused mode issues far
+  fewer requests (and prompt tokens) than one call per definition per component.
+- A fused response that fails validation, or omits a definition, falls back to
+  per-component calls for exactly what is missing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+from collections import Counter
+from typing import Any
+
+import httpx
+import pytest
+from openai import AsyncOpenAI
+
+from floridify.ai.connector import AIConnector
+from floridify.ai.connector.config import Provider
+from floridify.ai.constants import SynthesisComponent
+from floridify.ai.synthesis import enhance_definitions_parallel
+from floridify.ai.synthesis.fused import FusedItem, estimate_tokens, plan_fused_requests
+from floridify.models.dictionary import Definition, Word
+
+# Components that always need AI (no local-first path), so request counts are deterministic
+AI_COMPONENTS = {
+    SynthesisComponent.EXAMPLES,
+    SynthesisComponent.GRAMMAR_PATTERNS,
+    SynthesisComponent.COLLOCATIONS,
+    SynthesisComponent.USAGE_NOTES,
+}
+
+BANK_SENSES = [
+    "a financial institution that accepts deposits and channels money into lending",
+    "sloping land beside a body of water",
+    "a long pile or heap of a substance such as snow or sand",
+    "a set of similar things grouped together in rows",
+]
+
+
+def _item(index: int, text: str = "a definition", **components: int) -> FusedItem:
+    return FusedItem(
+        index=index,
+        part_of_speech="noun",
+        text=text,
+        components={SynthesisComponent(name): count for name, count in components.items()},
+    )
+
+
+class TestPlanner:
+    def test_packs_in_order_up_to_max_definitions(self):
+        items = [_item(i, examples=3, grammar_patterns=2) for i in range(10)]
+
+        requests = plan_fused_requests(items, max_definitions=4)
+
+        assert [[item.index for item in batch] for batch in requests] == [
+            [0, 1, 2, 3],
+            [4, 5, 6, 7],
+            [8, 9],
+        ]
+
+    def test_respects_completion_budget(self):
+        items = [_item(i, synonyms=10, examples=4) for i in range(6)]
+        per_item = items[0].estimate()[1]
+
+        requests = plan_fused_requests(
+            items, max_definitions=10, max_output_tokens=2 * per_item + 1
+        )
+
+        assert [len(batch) for batch in requests] == [2, 2, 2]
+        assert all(sum(i.estimate()[1] for i in batch) <= 2 * per_item + 1 for batch in requests)
+
+    def test_respects_request_budget_for_long_definitions(self):
+        long_text = "word " * 800  # ~1000 prompt tokens each
+        items = [_item(i, long_text, cefr_level=1) for i in range(4)]
+
+        requests = plan_fused_requests(items, max_definitions=10, max_request_tokens=3000)
+
+        assert len(requests) == 2
+        assert estimate_tokens(long_text) > 900
+
+    def test_splits_oversized_definition(self):
+        item = _item(0, synonyms=12, antonyms=8, examples=4, collocations=10, usage_notes=5)
+
+        requests = plan_fused_requests([item], max_output_tokens=600)
+
+        assert len(requests) > 1
+        assert all(len(batch) == 1 and batch[0].index == 0 for batch in requests)
+        split = [c for batch in requests for c in batch[0].components]
+        assert sorted(c.value for c in split) == sorted(c.value for c in item.components)
+
+
+class StubModelServer:
+    """OpenAI-compatible /chat/completions stub that counts requests and tokens.
+
+    Replies with canned structured output chosen by the response schema name.
+    ``invalid_fused`` makes every fused reply fail validation; ``omit_index``
+    leaves one definition out of fused replies.
+    """
+
+    def __init__(self, invalid_fused: bool = False, omit_index: int | None = None) -> None:
+        self.invalid_fused = invalid_fused
+        self.omit_index = omit_index
+        self.schemas: Counter[str] = Counter()
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    @property
+    def requests(self) -> int:
+        return sum(self.schemas.values())
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        schema = body["response_format"]["json_schema"]["name"]
+        prompt = "\n".join(message["content"] for message in body["messages"])
+        content = json.dumps(self._reply(schema, prompt))
+
+        prompt_tokens, completion_tokens = estimate_tokens(prompt), estimate_tokens(content)
+        self.schemas[schema] += 1
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+
+        return httpx.Response(
+            200,
+            json={
+                "id": f"stub-{self.requests}",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": "stop",
+                        "message": {"role": "assistant", "content": content, "refusal": None},
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                },
+            },
+        )
+
+    def _reply(self, schema: str, prompt: str) -> dict[str, Any]:
+        examples = ["The bank extended its opening hours for small business owners this spring."]
+        patterns, descriptions = ["[C]"], ["countable"]
+        collocations = [{"type": "verb", "phrase": "open an account", "frequency": 0.9}]
+        notes = [{"type": "grammar", "text": "Usually countable."}]
+
+        if schema == "DefinitionEnrichmentResponse":
+            if self.invalid_fused:
+                return {"confidence": 0.9}  # "definitions" missing
+            indices = [int(i) for i in re.findall(r"^### \[(\d+)\]", prompt, re.MULTILINE)]
+            return {
+                "confidence": 0.9,
+                "definitions": [
+                    {
+                        "index": index,
+                        "synonyms": None,
+                        "antonyms": None,
+                        "examples": examples,
+                        "cefr_level": None,
+                        "frequency_band": None,
+                        "register": None,
+                        "domain": None,
+                        "grammar_patterns": patterns,
+                        "grammar_descriptions": descriptions,
+                        "collocations": collocations,
+                        "usage_notes": notes,
+                        "regions": None,
+                    }
+                    for index in indices
+                    if index != self.omit_index
+                ],
+            }
+        return {
+            "ExampleGenerationResponse": {"example_sentences": examples},
+            "GrammarPatternResponse": {"patterns": patterns, "descriptions": descriptions},
+            "CollocationResponse": {"collocations": collocations},
+            "UsageNoteResponse": {"notes": notes},
+        }[schema] | {"confidence": 0.9}
+
+
+def _connector(server: StubModelServer, monkeypatch: pytest.MonkeyPatch) -> AIConnector:
+    client = AsyncOpenAI(
+        api_key="stub",
+        base_url="http://stub-model/v1",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(server)),
+    )
+    ai = AIConnector(
+        provider=Provider.LOCAL, client=client, model="stub", semaphore=asyncio.Semaphore(8)
+    )
+    # Count every request: bypass the L1/L2 response cache
+    monkeypatch.setattr(ai, "_make_structured_request", ai._make_structured_request_impl)
+    return ai
+
+
+async def _enrich(
+    server: StubModelServer, monkeypatch: pytest.MonkeyPatch, fused: bool
+) -> list[Definition]:
+    word = Word(text="bank")
+    await word.save()
+    assert word.id is not None
+    definitions = []
+    for text in BANK_SENSES:
+        definition = Definition(word_id=word.id, part_of_speech="noun", text=text)
+        await definition.save()
+        definitions.append(definition)
+
+    await enhance_definitions_parallel(
+        definitions, word, _connector(server, monkeypatch), components=AI_COMPONENTS, fused=fused
+    )
+    return definitions
+
+
+def _assert_enriched(definitions: list[Definition]) -> None:
+    for definition in definitions:
+        assert definition.example_ids
+        assert [p.pattern for p in definition.grammar_patterns] == ["[C]"]
+        assert [c.text for c in definition.collocations] == ["open an account"]
+        assert [n.type for n in definition.usage_notes] == ["grammar"]
+
+
+class TestFusedEnrichment:
+    async def test_fused_cuts_requests_and_tokens(self, test_db, monkeypatch):
+        per_component, fused = StubModelServer(), StubModelServer()
+
+        _assert_enriched(await _enrich(per_component, monkeypatch, fused=False))
+        _assert_enriched(await _enrich(fused, monkeypatch, fused=True))
+
+        print(
+            f"\nper-component: {per_component.requests} requests, "
+            f"{per_component.prompt_tokens} prompt + {per_component.completion_tokens} "
+            f"completion tokens\nfused: {fused.requests} requests, "
+            f"{fused.prompt_tokens} prompt + {fused.completion_tokens} completion tokens"
+        )
+        assert per_component.requests == len(BANK_SENSES) * len(AI_COMPONENTS)
+        assert fused.schemas == {"DefinitionEnrichmentResponse": 1}
+        assert fused.prompt_tokens < per_component.prompt_tokens
+
+    async def test_validation_failure_falls_back_per_component(self, test_db, monkeypatch):
+        server = StubModelServer(invalid_fused=True)
+
+        _assert_enriched(await _enrich(server, monkeypatch, fused=True))
+
+        assert server.schemas["DefinitionEnrichmentResponse"] == 3  # Connector retries twice
+        assert server.requests - 3 == len(BANK_SENSES) * len(AI_COMPONENTS)
+
+    async def test_missing_definition_falls_back_alone(self, test_db, monkeypatch):
+        server = StubModelServer(omit_index=2)
+
+        _assert_enriched(await _enrich(server, monkeypatch, fused=True))
+
+        assert server.schemas.pop("DefinitionEnrichmentResponse") == 1
+        assert server.requests == len(AI_COMPONENTS)  # Only definition 2, per component
@@ -3,10 +3,14 @@ Tests exact, fuzzy, and basic search functionality without FAISS dependencies.
 """
 
 import asyncio
+from unittest.mock import patch
 
 import pytest
 from httpx import AsyncClient
 
+from floridify.search.constants import SearchMethod, SearchMode
+from floridify.search.result import SearchResult
+
 from ..conftest import assert_response_structure
 
 
@@ -439,3 +443,93 @@ class TestSearchPipelineAPI:
             # Should find the phrasal verb
             result_words = [r["word"] for r in data["results"]]
             assert "break down" in result_words
+
+
+class _FakeBatchEngine:
+    """Language search stand-in that records each search_many call."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.calls: list[list[str]] = []
+
+    async def search_many(
+        self,
+        queries: list[str],
+        mode: SearchMode = SearchMode.SMART,
+        max_results: int = 20,
+        min_score: float | None = None,
+    ) -> list[list[SearchResult]]:
+        self.calls.append(list(queries))
+        if self.fail:
+            raise RuntimeError("index unavailable")
+        return [
+            [SearchResult(word=query.strip().lower(), score=1.0, method=SearchMethod.EXACT)][
+                :max_results
+            ]
+            if query.strip().lower() != "zzz"
+            else []
+            for query in queries
+        ]
+
+
+class _FakeEngineManager:
+    def __init__(self, engine: _FakeBatchEngine) -> None:
+        self.engine = engine
+
+    async def get_engine(self, languages, semantic=False) -> _FakeBatchEngine:
+        return self.engine
+
+
+@pytest.fixture
+def batch_engine():
+    engine = _FakeBatchEngine()
+    with patch(
+        "floridify.api.routers.search.main.get_search_engine_manager",
+        return_value=_FakeEngineManager(engine),
+    ):
+        yield engine
+
+
+class TestBatchSearchAPI:
+    """POST /search/batch: one engine call, one response per query in order."""
+
+    @pytest.mark.asyncio
+    async def test_batch_search_preserves_order(self, async_client: AsyncClient, batch_engine):
+        queries = ["Apple", "zzz", "banana", "apple"]
+
+        response = await async_client.post(
+            "/api/v1/search/batch", json={"queries": queries, "max_results": 5}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert_response_structure(data, ["results", "total_queries", "metadata"])
+        assert data["total_queries"] == len(queries)
+        assert [item["query"] for item in data["results"]] == queries
+        assert [item["total_found"] for item in data["results"]] == [1, 0, 1, 1]
+        assert data["results"][2]["results"][0]["word"] == "banana"
+        assert "elapsed_ms" in data["metadata"]
+        assert batch_engine.calls == [queries]  # Single engine call for the whole batch
+
+    @pytest.mark.asyncio
+    async def test_batch_search_rejects_invalid_queries(
+        self, async_client: AsyncClient, batch_engine
+    ):
+        empty_list = await async_client.post("/api/v1/search/batch", json={"queries": []})
+        blank_query = await async_client.post(
+            "/api/v1/search/batch", json={"queries": ["apple", "  "]}
+        )
+        too_long = await async_client.post("/api/v1/search/batch", json={"queries": ["a" * 201]})
+
+        assert empty_list.status_code == 422
+        assert blank_query.status_code == 422
+        assert too_long.status_code == 422
+        assert batch_engine.calls == []
+
+    @pytest.mark.asyncio
+    async def test_batch_search_engine_failure(self, async_client: AsyncClient, batch_engine):
+        batch_engine.fail = True
+
+        response = await async_client.post("/api/v1/search/batch", json={"queries": ["apple"]})
+
+        assert response.status_code == 500
@@ -1,13 +1,16 @@
 """Tests for version history API endpoints and definition provenance.
 
 Covers: version listing, specific version retrieval, diff, rollback,
-and re-synthesis preserving history.
+re-synthesis preserving history, and deep-history retrieval latency.
 """
 
 from __future__ import annotations
 
+import pytest
 import pytest_asyncio
 
+from floridify.audit import benchmark_async
+from floridify.caching.delta_manager import get_reconstruction_cache
 from floridify.caching.manager import get_version_manager
 from floridify.caching.models import CacheNamespace, ResourceType
 
@@ -212,3 +215,62 @@ class TestDefinitionProvenance:
         assert result is not None
         assert result.version_info.storage_mode == "snapshot"
         assert result.version_info.delta_base_id is None
+
+
+@pytest.mark.performance
+async def test_deep_history_version_reads(async_client, test_db):
+    """Read every version of a 60-version history through the versions router.
+
+    "cold" clears the reconstruction cache before each read, so every request
+    replays its full delta chain; "walk" clears it once per pass, as when a
+    client pages through the history newest to oldest.
+    """
+    manager = get_version_manager()
+    word = "deep_history"
+    contents = []
+    for i in range(60):
+        content = {"word": word, "definitions": [f"sense {j} rev {i}" for j in range(8)]}
+        contents.append(content)
+        await manager.save(
+            resource_id=f"{word}:synthesis",
+            resource_type=ResourceType.DICTIONARY,
+            namespace=CacheNamespace.DICTIONARY,
+            content=content,
+        )
+    versions = [f"1.0.{i}" for i in reversed(range(60))]
+    cache = get_reconstruction_cache()
+
+    async def read(version: str) -> dict:
+        resp = await async_client.get(f"/api/v1/words/{word}/versions/{version}")
+        assert resp.status_code == 200
+        return resp.json()
+
+    async def cold() -> None:
+        for version in versions:
+            cache.clear()
+            await read(version)
+
+    async def walk() -> None:
+        cache.clear()
+        for version in versions:
+            await read(version)
+
+    cold_case, _ = await benchmark_async(
+        "versions-router-deep-cold",
+        "caching",
+        cold,
+        iterations=3,
+        operations_per_iteration=len(versions),
+    )
+    walk_case, _ = await benchmark_async(
+        "versions-router-deep-walk",
+        "caching",
+        walk,
+        iterations=3,
+        operations_per_iteration=len(versions),
+    )
+
+    for i in (1, 9, 37, 58):
+        assert (await read(f"1.0.{i}"))["content"] == contents[i]
+    assert walk_case.stats.mean_ms <= cold_case.stats.mean_ms
+    cache.clear()
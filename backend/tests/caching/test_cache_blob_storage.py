@@ -0,0 +1,298 @@
+"""Tests for raw-bytes L2 blob storage.
+
+Validates that:
+- Raw payloads round-trip through files + sidecars without pickling.
+- Uncompressed payloads come back as mmap-backed memoryviews.
+- Compression is streamed as zstd, and skipped when it doesn't help.
+- Overwrites, discards, and sweeps never leave a sidecar without its data file.
+- Expired and least-recently-used blobs are swept within the cache size limit,
+  and writes only trigger a sweep once they cross it.
+- GlobalCacheManager routes bytes values and binary_data payloads to blobs.
+- Benchmark: 128MB payloads vs. the pickle + whole-buffer compression path.
+"""
+
+import asyncio
+import mmap
+import os
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from floridify.caching.blob import BlobStore
+from floridify.caching.compression import compress_data, decompress_data
+from floridify.caching.core import GlobalCacheManager
+from floridify.caching.filesystem import FilesystemBackend
+from floridify.caching.models import CacheNamespace, CompressionType
+
+_MB = 1024 * 1024
+
+
+def _embeddings(size_bytes: int) -> bytes:
+    """Incompressible payload shaped like float32 embeddings."""
+    rng = np.random.default_rng(7)
+    return rng.standard_normal(size_bytes // 4, dtype=np.float32).tobytes()
+
+
+def _compressible(size_bytes: int) -> bytes:
+    return (b"faiss-index-block " * (size_bytes // 18 + 1))[:size_bytes]
+
+
+class TestBlobStore:
+    def test_raw_payload_is_memory_mapped(self, tmp_path):
+        store = BlobStore(tmp_path)
+        payload = _embeddings(2 * _MB)
+
+        store.put("semantic:key", payload)
+        view = store.get("semantic:key")
+
+        assert view is not None
+        assert isinstance(view.obj, mmap.mmap)
+        assert view.readonly
+        assert view == payload
+
+    def test_compressed_payload_streams_zstd(self, tmp_path):
+        store = BlobStore(tmp_path)
+        payload = _compressible(9 * _MB)  # spans several stream chunks
+
+        stored = store.put("trie:key", payload, compression=CompressionType.ZSTD)
+        view = store.get("trie:key")
+
+        assert stored < len(payload) // 10
+        assert view is not None
+        assert view.readonly
+        assert bytes(view) == payload
+
+    def test_incompressible_payload_stored_raw(self, tmp_path):
+        store = BlobStore(tmp_path)
+        payload = _embeddings(_MB)
+
+        stored = store.put("semantic:key", payload, compression=CompressionType.ZSTD)
+        view = store.get("semantic:key")
+
+        assert stored == len(payload)
+        assert view is not None
+        assert isinstance(view.obj, mmap.mmap)
+
+    def test_expired_payload_is_removed(self, tmp_path):
+        store = BlobStore(tmp_path)
+        store.put("key", b"payload", ttl=timedelta(seconds=-1))
+
+        assert store.get("key") is None
+        assert store.stats()["count"] == 0
+
+    def test_overwrite_keeps_existing_mapping_valid(self, tmp_path):
+        store = BlobStore(tmp_path)
+        store.put("key", b"a" * 4096)
+        old = store.get("key")
+
+        store.put("key", b"b" * 8192)
+
+        assert old == b"a" * 4096
+        assert store.get("key") == b"b" * 8192
+
+    def test_empty_payload(self, tmp_path):
+        store = BlobStore(tmp_path)
+        store.put("key", b"", compression=CompressionType.ZSTD)
+        assert store.get("key") == b""
+
+    def test_overwrite_replaces_data_file(self, tmp_path):
+        store = BlobStore(tmp_path)
+        store.put("key", b"a" * 4096)
+        store.put("key", b"b" * 8192)
+
+        (data_path,) = tmp_path.glob("*.bin")
+        assert store._read_meta(store._meta_path("key"))["file"] == data_path.name
+        assert data_path.read_bytes() == b"b" * 8192
+
+    def test_discard_keeps_blob_from_newer_put(self, tmp_path):
+        store = BlobStore(tmp_path)
+        meta_path = store._meta_path("key")
+        store.put("key", b"a" * 4096)
+        stale = store._read_meta(meta_path)
+
+        store.put("key", b"b" * 8192)
+        store._discard(meta_path, stale)
+
+        assert store.get("key") == b"b" * 8192
+
+    def test_sweep_removes_expired_and_orphaned_files(self, tmp_path):
+        store = BlobStore(tmp_path)
+        store.put("expired", b"payload", ttl=timedelta(seconds=-1))
+        store.put("live", b"payload")
+        orphan = tmp_path / "orphan-0000.bin"
+        orphan.write_bytes(b"x" * 1024)
+        os.utime(orphan, (0, 0))
+
+        store.sweep()
+
+        assert list(store.keys()) == ["live"]
+        assert not orphan.exists()
+        assert store.stats()["count"] == 1
+
+    def test_sweep_evicts_least_recently_used(self, tmp_path):
+        store = BlobStore(tmp_path)
+        for i, key in enumerate(("a", "b", "c")):
+            store.put(key, b"x" * 1024)
+            os.utime(store._meta_path(key), (i, i))
+        store.get("a")  # now the most recently used
+
+        store.sweep(size_limit=2048)
+
+        assert sorted(store.keys()) == ["a", "c"]
+        assert store.stats()["size"] <= 2048
+
+
+class TestFilesystemBackendBlobs:
+    @pytest.mark.asyncio
+    async def test_blob_bytes_count_against_size_limit(self, tmp_path):
+        backend = FilesystemBackend(tmp_path, size_limit=2 * _MB)
+        budget = backend.size_limit - backend.cache.volume()
+
+        for i in range(4):
+            await backend.set_bytes(f"blob-{i}", _embeddings(_MB // 2))
+
+        assert backend.blobs.stats()["size"] <= budget
+        assert await backend.get_bytes("blob-3") is not None
+        assert await backend.get_bytes("blob-0") is None
+
+    @pytest.mark.asyncio
+    async def test_writes_only_sweep_once_over_budget(self, tmp_path, monkeypatch):
+        backend = FilesystemBackend(tmp_path, size_limit=2 * _MB)
+        sweeps = []
+        sweep = backend.blobs.sweep
+        monkeypatch.setattr(
+            backend.blobs, "sweep", lambda size_limit=None: sweeps.append(1) or sweep(size_limit)
+        )
+
+        for i in range(3):
+            await backend.set_bytes(f"blob-{i}", _embeddings(_MB // 2))
+        assert not sweeps
+        assert backend.blobs.stored_bytes == backend.blobs.stats()["size"]
+
+        await backend.set_bytes("blob-3", _embeddings(_MB // 2))
+        await backend.set_bytes("blob-4", b"x" * 1024)
+        assert len(sweeps) == 1
+        assert backend.blobs.stored_bytes == backend.blobs.stats()["size"]
+
+
+class TestManagerBlobRouting:
+    @pytest.mark.asyncio
+    async def test_bytes_value_round_trips_through_l2(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = GlobalCacheManager(FilesystemBackend(Path(tmpdir)))
+            namespace = CacheNamespace.SEMANTIC
+            payload = _embeddings(_MB)
+
+            await manager.set(namespace, "raw", payload)
+            manager.namespaces[namespace].memory_cache.clear()
+
+            cached = await manager.get(namespace, "raw")
+            assert isinstance(cached, memoryview)
+            assert cached == payload
+
+    @pytest.mark.asyncio
+    async def test_binary_data_payloads_stored_as_blobs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FilesystemBackend(Path(tmpdir))
+            manager = GlobalCacheManager(backend)
+            namespace = CacheNamespace.SEMANTIC
+            content = {
+                "model_name": "test-model",
+                "binary_data": {
+                    "embeddings_bytes": _embeddings(_MB),
+                    "index_bytes": _compressible(_MB),
+                },
+            }
+
+            await manager.set(namespace, "index", content)
+            manager.namespaces[namespace].memory_cache.clear()
+
+            cached = await manager.get(namespace, "index")
+            assert cached["model_name"] == "test-model"
+            for name, payload in content["binary_data"].items():
+                assert isinstance(cached["binary_data"][name], memoryview)
+                assert cached["binary_data"][name] == payload
+
+            # The pickled record holds only references
+            record = await backend.get(manager._make_backend_key(namespace, "index"))
+            assert len(record) < 4096
+
+            await manager.delete(namespace, "index")
+            assert backend.blobs.stats()["count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_missing_blob_is_a_miss(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FilesystemBackend(Path(tmpdir))
+            manager = GlobalCacheManager(backend)
+            namespace = CacheNamespace.SEARCH
+            content = {"binary_data": {"ffuzzy": b"x" * 1024, "suffix_array": b"y" * 1024}}
+
+            await manager.set(namespace, "fuzzy", content)
+            manager.namespaces[namespace].memory_cache.clear()
+            backend_key = manager._make_backend_key(namespace, "fuzzy")
+            backend.blobs.delete(manager._blob_key(backend_key, "ffuzzy"))
+
+            assert await manager.get(namespace, "fuzzy") is None
+
+    @pytest.mark.asyncio
+    async def test_clear_namespace_removes_blobs(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FilesystemBackend(Path(tmpdir))
+            manager = GlobalCacheManager(backend)
+
+            await manager.set(CacheNamespace.SEMANTIC, "a", b"payload")
+            await manager.set(CacheNamespace.TRIE, "b", b"payload")
+            await manager.clear_namespace(CacheNamespace.SEMANTIC)
+
+            assert list(backend.blobs.keys()) == [
+                manager._make_backend_key(CacheNamespace.TRIE, "b")
+            ]
+
+
+@pytest.mark.performance
+class TestBlobStoragePerformance:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("label", "make_payload"), [("embeddings", _embeddings), ("compressible", _compressible)]
+    )
+    async def test_large_payload_vs_pickle_path(self, label, make_payload):
+        payload = make_payload(128 * _MB)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            backend = FilesystemBackend(Path(tmpdir))
+            loop = asyncio.get_running_loop()
+
+            # Previous path: pickle + whole-buffer zstd, then diskcache's own pickle
+            t0 = time.perf_counter()
+            compressed = compress_data(
+                {"binary_data": {"index_bytes": payload}}, CompressionType.ZSTD
+            )
+            await backend.set("legacy", compressed)
+            legacy_write = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            raw = await backend.get("legacy")
+            legacy = await loop.run_in_executor(None, decompress_data, raw, CompressionType.ZSTD)
+            assert len(legacy["binary_data"]["index_bytes"]) == len(payload)
+            legacy_read = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            await backend.set_bytes("blob", payload, compression=CompressionType.ZSTD)
+            blob_write = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            view = await backend.get_bytes("blob")
+            assert view is not None and len(view) == len(payload)
+            blob_read = time.perf_counter() - t0
+
+            print(f"\n  [{label} 128MB] pickle+zstd: write {legacy_write * 1000:7.1f}ms")
+            print(f"  [{label} 128MB] pickle+zstd: read  {legacy_read * 1000:7.1f}ms")
+            print(f"  [{label} 128MB] blob:        write {blob_write * 1000:7.1f}ms")
+            print(f"  [{label} 128MB] blob:        read  {blob_read * 1000:7.1f}ms")
+
+            assert blob_read < legacy_read
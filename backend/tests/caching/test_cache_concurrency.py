@@ -4,6 +4,7 @@ Validates that:
 - Concurrent writes to the same resource result in exactly 1 is_latest=True version.
 - The dedup decorator prevents duplicate concurrent calls.
 - L1 cache handles concurrent reads/writes without corruption.
+- Concurrent misses on one key share a single load (single-flight).
 
 Uses asyncio.gather to simulate concurrent operations.
 Mocks MongoDB operations as needed.
@@ -11,6 +12,7 @@ Mocks MongoDB operations as needed.
 
 import asyncio
 import tempfile
+from datetime import timedelta
 from pathlib import Path
 
 import pytest
@@ -462,3 +464,136 @@ class TestLRUEvictionConcurrency:
             assert stats.hits > 0, "Expected some cache hits"
             assert stats.misses > 0, "Expected some cache misses"
             assert total == 20, f"Total requests ({total}) should equal number of gets (20)"
+
+
+class TestSingleFlightLoads:
+    """Test that concurrent misses on one key share a single load."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_run_loader_once(self):
+        """Test that N concurrent misses call the loader once and share its result."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = GlobalCacheManager(FilesystemBackend(Path(tmpdir)))
+            namespace = CacheNamespace.CORPUS
+            calls = 0
+
+            async def loader():
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.05)
+                return {"vocabulary": ["a", "b"]}
+
+            results = await asyncio.gather(
+                *[manager.get(namespace, "hot_key", loader=loader) for _ in range(20)]
+            )
+
+            assert calls == 1
+            assert all(r == {"vocabulary": ["a", "b"]} for r in results)
+            ns = manager.namespaces[namespace]
+            assert ns.stats.coalesced == 19
+            assert ns.stats.misses == 1
+            assert not ns.inflight
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_abort_shared_load(self):
+        """Test that cancelling one waiter leaves the load running for the others."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = GlobalCacheManager(FilesystemBackend(Path(tmpdir)))
+            namespace = CacheNamespace.SEMANTIC
+
+            async def loader():
+                await asyncio.sleep(0.05)
+                return {"index": 1}
+
+            first = asyncio.create_task(manager.get(namespace, "key", loader=loader))
+            second = asyncio.create_task(manager.get(namespace, "key", loader=loader))
+            await asyncio.sleep(0.01)
+            first.cancel()
+
+            assert await second == {"index": 1}
+            assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_failed_load_is_not_cached(self):
+        """Test that a failing loader resolves all waiters to None and is retried later."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = GlobalCacheManager(FilesystemBackend(Path(tmpdir)))
+            namespace = CacheNamespace.DEFAULT
+            calls = 0
+
+            async def flaky_loader():
+                nonlocal calls
+                calls += 1
+                await asyncio.sleep(0.01)
+                if calls == 1:
+                    raise RuntimeError("backend unavailable")
+                return {"ok": True}
+
+            results = await asyncio.gather(
+                *[manager.get(namespace, "flaky", loader=flaky_loader) for _ in range(5)]
+            )
+            assert results == [None] * 5
+            assert calls == 1
+
+            assert await manager.get(namespace, "flaky", loader=flaky_loader) == {"ok": True}
+            assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing(self):
+        """Test stale-while-revalidate returns the expired value and refreshes it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = GlobalCacheManager(FilesystemBackend(Path(tmpdir)))
+            namespace = CacheNamespace.CORPUS
+            ns = manager.namespaces[namespace]
+            ns.memory_ttl = timedelta(seconds=0.05)
+            ns.stale_ttl = timedelta(seconds=60)
+
+            await manager.set(namespace, "swr", {"version": 1})
+            await asyncio.sleep(0.1)
+
+            async def loader():
+                await asyncio.sleep(0.05)
+                return {"version": 2}
+
+            assert await manager.get(namespace, "swr", loader=loader) == {"version": 1}
+            assert ns.stats.stale_hits == 1
+
+            await asyncio.gather(*[task for task, _ in ns.inflight.values()])
+            assert await manager.get(namespace, "swr") == {"version": 2}
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_without_stale_window_reloads(self):
+        """Test that namespaces without stale_ttl block on the reload as before."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = GlobalCacheManager(FilesystemBackend(Path(tmpdir)))
+            namespace = CacheNamespace.SEARCH
+            ns = manager.namespaces[namespace]
+            ns.memory_ttl = timedelta(seconds=0.05)
+            ns.stale_ttl = None
+
+            await manager.set(namespace, "expiring", {"version": 1})
+            await manager.l2_backend.delete(manager._make_backend_key(namespace, "expiring"))
+            await asyncio.sleep(0.1)
+
+            async def loader():
+                return {"version": 2}
+
+            assert await manager.get(namespace, "expiring", loader=loader) == {"version": 2}
+            assert ns.stats.stale_hits == 0
+
+    @pytest.mark.asyncio
+    async def test_loader_caller_does_not_join_plain_lookup(self):
+        """Test that a caller with a loader isn't resolved by an in-flight plain lookup."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = GlobalCacheManager(FilesystemBackend(Path(tmpdir)))
+            namespace = CacheNamespace.DICTIONARY
+
+            async def loader():
+                return {"loaded": True}
+
+            plain, loaded = await asyncio.gather(
+                manager.get(namespace, "key"), manager.get(namespace, "key", loader=loader)
+            )
+
+            assert plain is None
+            assert loaded == {"loaded": True}
@@ -0,0 +1,133 @@
+"""Tests for byte-budgeted L1 caching.
+
+Validates that:
+- Entries are sized and accounted per namespace and globally.
+- Namespace and global byte budgets bound L1 regardless of entry count.
+- Eviction prefers large, rarely hit entries over small, hot ones (GDSF).
+- Oversized entries skip L1 but remain readable from L2.
+"""
+
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from floridify.caching.core import GlobalCacheManager
+from floridify.caching.filesystem import FilesystemBackend
+from floridify.caching.models import CacheNamespace
+from floridify.caching.serialize import estimate_memory_size
+
+_MB = 1024 * 1024
+
+
+def _payload(size_bytes: int) -> dict[str, bytes]:
+    return {"blob": b"x" * size_bytes}
+
+
+class TestEstimateMemorySize:
+    def test_scales_with_content(self):
+        small = estimate_memory_size({"words": ["word"] * 100})
+        large = estimate_memory_size({"words": ["word"] * 100_000})
+        assert large > small * 500
+
+    def test_numpy_arrays_count_buffer(self):
+        array = np.zeros(1_000_000, dtype=np.float32)
+        assert estimate_memory_size({"embeddings": array}) >= array.nbytes
+
+    def test_memmap_arrays_count_header_only(self, tmp_path):
+        path = tmp_path / "array.npy"
+        np.save(path, np.zeros(1_000_000, dtype=np.float32))
+        mapped = np.load(path, mmap_mode="r")
+        assert estimate_memory_size(mapped) < 1024
+
+
+class TestMemoryBudget:
+    @pytest.mark.asyncio
+    async def test_namespace_budget_bounds_bytes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = GlobalCacheManager(FilesystemBackend(Path(tmpdir)))
+            ns = manager.namespaces[CacheNamespace.DEFAULT]
+            ns.memory_budget_bytes = 5 * _MB
+
+            for i in range(20):
+                await manager.set(CacheNamespace.DEFAULT, f"blob_{i}", _payload(_MB))
+
+            assert ns.memory_cache.nbytes <= 5 * _MB
+            assert len(ns.memory_cache) < 20
+            assert ns.stats.evictions > 0
+
+            stats = manager.get_stats(CacheNamespace.DEFAULT)
+            assert stats["memory_bytes"] == ns.memory_cache.nbytes
+            assert stats["memory_budget_bytes"] == 5 * _MB
+
+    @pytest.mark.asyncio
+    async def test_global_budget_spans_namespaces(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = GlobalCacheManager(
+                FilesystemBackend(Path(tmpdir)), memory_budget_bytes=4 * _MB
+            )
+
+            for i in range(4):
+                await manager.set(CacheNamespace.CORPUS, f"corpus_{i}", _payload(_MB))
+                await manager.set(CacheNamespace.SEMANTIC, f"semantic_{i}", _payload(_MB))
+
+            stats = manager.get_stats()
+            assert stats["memory_bytes"] <= 4 * _MB
+            assert stats["memory_budget_bytes"] == 4 * _MB
+            assert stats["evictions"] > 0
+
+    @pytest.mark.asyncio
+    async def test_prefers_evicting_large_cold_entries(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = GlobalCacheManager(FilesystemBackend(Path(tmpdir)))
+            namespace = CacheNamespace.DICTIONARY
+            ns = manager.namespaces[namespace]
+            ns.memory_budget_bytes = 4 * _MB
+
+            await manager.set(namespace, "small_hot", {"definition": "a small entry"})
+            for _ in range(5):
+                await manager.get(namespace, "small_hot")
+            await manager.set(namespace, "large_cold", _payload(3 * _MB))
+
+            # Needs room: the large cold entry goes before the small hot one
+            await manager.set(namespace, "incoming", _payload(2 * _MB))
+
+            assert "small_hot" in ns.memory_cache
+            assert "large_cold" not in ns.memory_cache
+            assert "incoming" in ns.memory_cache
+
+    @pytest.mark.asyncio
+    async def test_oversized_entry_served_from_l2(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = GlobalCacheManager(FilesystemBackend(Path(tmpdir)))
+            namespace = CacheNamespace.DEFAULT
+            ns = manager.namespaces[namespace]
+            ns.memory_budget_bytes = _MB
+
+            await manager.set(namespace, "resident", {"value": 1})
+            await manager.set(namespace, "too_big", _payload(2 * _MB))
+
+            assert "too_big" not in ns.memory_cache
+            assert "resident" in ns.memory_cache
+            assert ns.stats.rejections >= 1
+            assert await manager.get(namespace, "too_big") == _payload(2 * _MB)
+
+    @pytest.mark.asyncio
+    async def test_accounting_follows_removals(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            manager = GlobalCacheManager(FilesystemBackend(Path(tmpdir)))
+            namespace = CacheNamespace.SEARCH
+            ns = manager.namespaces[namespace]
+
+            await manager.set(namespace, "a", _payload(100_000))
+            await manager.set(namespace, "b", _payload(100_000))
+            await manager.set(namespace, "a", _payload(50_000))
+            assert ns.memory_cache.nbytes == sum(e["size"] for e in ns.memory_cache.values())
+
+            await manager.delete(namespace, "a")
+            assert ns.memory_cache.nbytes == ns.memory_cache["b"]["size"]
+
+            await manager.clear_namespace(namespace)
+            assert ns.memory_cache.nbytes == 0
+            assert manager.memory_bytes == 0
@@ -0,0 +1,229 @@
+"""Tests for generation-based validation of versioned cache hits.
+
+Validates that:
+- Hot cache hits in get_latest are served without a MongoDB query.
+- Writes through the manager (save, invalidate, delete) make cached entries stale.
+- Bulk deletes that bypass the manager are covered by type-wide bumps.
+- Trust expires after the TTL, falling back to one validation query.
+- Change-stream events only evict entries they can make stale.
+"""
+
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+from bson import ObjectId
+
+from floridify.caching.generations import CacheGenerations
+from floridify.caching.manager import VersionedDataManager
+from floridify.caching.models import (
+    BaseVersionedData,
+    CacheNamespace,
+    ResourceType,
+    VersionConfig,
+)
+from floridify.corpus.core import Corpus
+
+
+class TestCacheGenerations:
+    def test_untracked_resource_needs_validation(self):
+        generations = CacheGenerations()
+        assert generations.check(ResourceType.CORPUS, "words", ObjectId()) is None
+
+    def test_validated_entry_is_trusted_until_bumped(self):
+        generations = CacheGenerations()
+        doc_id = ObjectId()
+        generations.mark_validated(ResourceType.CORPUS, "words", doc_id)
+
+        assert generations.check(ResourceType.CORPUS, "words", doc_id) is True
+        generations.bump(ResourceType.CORPUS, "words")
+        assert generations.check(ResourceType.CORPUS, "words", doc_id) is False
+
+    def test_type_wide_bump_marks_every_resource_stale(self):
+        generations = CacheGenerations()
+        doc_id = ObjectId()
+        generations.mark_validated(ResourceType.TRIE, "a:trie", doc_id)
+        generations.bump(ResourceType.CORPUS)
+        assert generations.check(ResourceType.TRIE, "a:trie", doc_id) is True
+
+        generations.bump(ResourceType.TRIE)
+        assert generations.check(ResourceType.TRIE, "a:trie", doc_id) is False
+
+    def test_generation_read_before_query_wins(self):
+        generations = CacheGenerations()
+        before = generations.generation(ResourceType.CORPUS, "words")
+        generations.bump(ResourceType.CORPUS, "words")  # Concurrent write during the read
+        generations.mark_validated(ResourceType.CORPUS, "words", ObjectId(), before)
+        assert generations.check(ResourceType.CORPUS, "words", ObjectId()) is False
+
+    def test_trust_expires_without_listener(self):
+        generations = CacheGenerations(trust_ttl=0.01)
+        doc_id = ObjectId()
+        generations.mark_validated(ResourceType.CORPUS, "words", doc_id)
+        time.sleep(0.02)
+        assert generations.check(ResourceType.CORPUS, "words", doc_id) is None
+
+        generations.listening = True
+        assert generations.check(ResourceType.CORPUS, "words", doc_id) is True
+
+    def test_change_relevance(self):
+        generations = CacheGenerations()
+        tracked, other = ObjectId(), ObjectId()
+        key = (ResourceType.CORPUS, "words")
+        generations.mark_validated(*key, tracked)
+
+        def change(operation: str, doc_id: ObjectId) -> dict:
+            return {"operationType": operation, "documentKey": {"_id": doc_id}}
+
+        # Own save: insert of the tracked document
+        assert not generations.is_relevant(change("insert", tracked), key)
+        # Another process saved a newer version
+        assert generations.is_relevant(change("insert", other), key)
+        # Superseded versions being updated or deleted don't matter
+        assert not generations.is_relevant(change("update", other), key)
+        assert generations.is_relevant(change("delete", tracked), key)
+        # Delete events carry only _id; the tracked id resolves to its resource
+        assert generations.resolve(change("delete", tracked)) == key
+
+
+class _FakeChangeStream:
+    """Collection stand-in whose change stream replays a fixed list of events."""
+
+    def __init__(self, changes: list[dict]) -> None:
+        self.changes = changes
+
+    @asynccontextmanager
+    async def watch(self, **kwargs):
+        async def stream():
+            for change in self.changes:
+                yield change
+
+        yield stream()
+
+
+class _RecordingCache:
+    def __init__(self) -> None:
+        self.deleted: list[tuple[CacheNamespace, str]] = []
+
+    async def delete(self, namespace: CacheNamespace, key: str) -> None:
+        self.deleted.append((namespace, key))
+
+
+@pytest.mark.asyncio
+async def test_change_listener_evicts_changed_resource(monkeypatch):
+    manager = VersionedDataManager()
+    manager.cache = _RecordingCache()
+    tracked = ObjectId()
+    manager.generations.mark_validated(ResourceType.CORPUS, "words", tracked)
+    before = manager.generations.generation(ResourceType.CORPUS, "words")
+
+    # Another process saved a newer version of the tracked corpus
+    change = {
+        "operationType": "insert",
+        "documentKey": {"_id": ObjectId()},
+        "fullDocument": {"resource_id": "words", "resource_type": ResourceType.CORPUS.value},
+    }
+    monkeypatch.setattr(
+        BaseVersionedData, "get_pymongo_collection", lambda: _FakeChangeStream([change])
+    )
+    await manager.start_change_listener()
+
+    assert [namespace for namespace, _ in manager.cache.deleted] == [CacheNamespace.CORPUS]
+    assert manager.generations.generation(ResourceType.CORPUS, "words") > before
+    assert manager.generations.check(ResourceType.CORPUS, "words", tracked) is None
+
+
+def _count_find_one(monkeypatch) -> list[object]:
+    calls: list[object] = []
+    original = Corpus.Metadata.find_one
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(Corpus.Metadata, "find_one", counting)
+    return calls
+
+
+@pytest.mark.asyncio
+class TestGetLatestValidation:
+    async def test_hot_hits_skip_database(self, version_manager: VersionedDataManager, monkeypatch):
+        saved = await version_manager.save(
+            resource_id="hot-corpus",
+            resource_type=ResourceType.CORPUS,
+            namespace=CacheNamespace.CORPUS,
+            content={"vocabulary": ["alpha", "beta"]},
+        )
+        calls = _count_find_one(monkeypatch)
+
+        for _ in range(5):
+            latest = await version_manager.get_latest("hot-corpus", ResourceType.CORPUS)
+            assert latest is not None and latest.id == saved.id
+
+        assert calls == []
+        assert version_manager.generations.get_stats()["validations_avoided"] == 5
+
+    async def test_save_replaces_trusted_entry(self, version_manager: VersionedDataManager):
+        await version_manager.save(
+            resource_id="versioned-corpus",
+            resource_type=ResourceType.CORPUS,
+            namespace=CacheNamespace.CORPUS,
+            content={"vocabulary": ["one"]},
+        )
+        v2 = await version_manager.save(
+            resource_id="versioned-corpus",
+            resource_type=ResourceType.CORPUS,
+            namespace=CacheNamespace.CORPUS,
+            content={"vocabulary": ["one", "two"]},
+        )
+
+        latest = await version_manager.get_latest("versioned-corpus", ResourceType.CORPUS)
+        assert latest is not None and latest.id == v2.id
+
+    async def test_delete_version_evicts(self, version_manager: VersionedDataManager):
+        saved = await version_manager.save(
+            resource_id="doomed-corpus",
+            resource_type=ResourceType.CORPUS,
+            namespace=CacheNamespace.CORPUS,
+            content={"vocabulary": ["gone"]},
+        )
+        assert await version_manager.get_latest("doomed-corpus", ResourceType.CORPUS)
+
+        assert await version_manager.delete_version(
+            "doomed-corpus", ResourceType.CORPUS, saved.version_info.version
+        )
+        assert await version_manager.get_latest("doomed-corpus", ResourceType.CORPUS) is None
+
+    async def test_bypassing_delete_caught_after_type_bump(
+        self, version_manager: VersionedDataManager
+    ):
+        await version_manager.save(
+            resource_id="bulk-corpus",
+            resource_type=ResourceType.CORPUS,
+            namespace=CacheNamespace.CORPUS,
+            content={"vocabulary": ["bulk"]},
+        )
+        await Corpus.Metadata.find({"resource_id": "bulk-corpus"}).delete()
+        version_manager.generations.bump(ResourceType.CORPUS)
+
+        assert await version_manager.get_latest("bulk-corpus", ResourceType.CORPUS) is None
+        assert version_manager.generations.stale_evictions == 1
+
+    async def test_expired_trust_validates_once(
+        self, version_manager: VersionedDataManager, monkeypatch
+    ):
+        version_manager.generations.trust_ttl = 0.0
+        await version_manager.save(
+            resource_id="expiring-corpus",
+            resource_type=ResourceType.CORPUS,
+            namespace=CacheNamespace.CORPUS,
+            content={"vocabulary": ["tick"]},
+        )
+        calls = _count_find_one(monkeypatch)
+
+        latest = await version_manager.get_latest(
+            "expiring-corpus", ResourceType.CORPUS, config=VersionConfig()
+        )
+        assert latest is not None
+        assert len(calls) == 1
+        assert version_manager.generations.validation_queries == 1
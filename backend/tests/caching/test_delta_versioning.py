@@ -1,22 +1,28 @@
 """Tests for delta-based version storage.
 
 Covers: pure delta functions (compute/apply/reconstruct), integration with
-VersionedDataManager, snapshot interval enforcement, and backward compatibility.
+VersionedDataManager, snapshot interval enforcement, backward compatibility,
+and paged chain resolution with the reconstruction LRU.
 """
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+
 import pytest
 import pytest_asyncio
+from deepdiff import DeepDiff
 
 from floridify.caching.config import DELTA_CONFIG, DeltaConfig
 from floridify.caching.delta import (
+    DELTA_FORMAT,
     apply_delta,
     compute_delta,
     compute_diff_between,
     reconstruct_version,
     should_keep_as_snapshot,
 )
+from floridify.caching.delta_manager import ReconstructionCache, get_reconstruction_cache
 from floridify.caching.manager import VersionedDataManager
 from floridify.caching.models import (
     DELTA_ELIGIBLE_TYPES,
@@ -87,6 +93,65 @@ class TestComputeDelta:
         assert reconstructed == old
 
 
+class TestStructuralDelta:
+    """Tests for the structural patch format used for stored deltas."""
+
+    def test_format_is_tagged(self):
+        delta = compute_delta({"a": 1}, {"a": 2})
+        assert delta["format"] == DELTA_FORMAT
+
+    def test_id_keyed_list_reuses_moved_elements(self):
+        """Elements with stable ids are referenced, not re-stored, when they move."""
+        senses = [{"id": f"s{i}", "text": f"sense {i} " * 20} for i in range(6)]
+        old = {"senses": senses}
+        new = {"senses": [{"id": "added", "text": "new"}, *reversed(senses)]}
+
+        delta = compute_delta(old, new)
+
+        assert apply_delta(new, delta) == old
+        assert "sense 0" not in str(delta["patch"])
+
+    def test_scalar_list_insertion(self):
+        old = {"ids": [f"id{i}" for i in range(50)]}
+        new = {"ids": old["ids"][:25] + ["inserted"] + old["ids"][25:]}
+
+        delta = compute_delta(old, new)
+
+        assert apply_delta(new, delta) == old
+        assert "id10" not in str(delta["patch"])
+
+    def test_numeric_types_preserved(self):
+        """1, 1.0 and True compare equal but are different stored values."""
+        old = {"a": 1, "b": [1.0, True], "c": {"d": False}}
+        new = {"a": 1.0, "b": [1, 1], "c": {"d": 0}}
+
+        reconstructed = apply_delta(new, compute_delta(old, new))
+
+        assert [type(v) for v in (reconstructed["a"], *reconstructed["b"])] == [int, float, bool]
+        assert type(reconstructed["c"]["d"]) is bool
+
+    def test_result_shares_no_containers_with_snapshot(self):
+        snapshot = {"unchanged": {"list": [1, 2]}, "changed": 1}
+        delta = compute_delta({"unchanged": {"list": [1, 2]}, "changed": 0}, snapshot)
+
+        result = apply_delta(snapshot, delta)
+        result["unchanged"]["list"].append(3)
+
+        assert snapshot["unchanged"]["list"] == [1, 2]
+
+    def test_applies_legacy_deepdiff_delta(self):
+        """Deltas stored by the DeepDiff engine still reconstruct."""
+        old = {"word": "test", "defs": ["a", "b"], "meta": {"v": 1}}
+        new = {"word": "test", "defs": ["a", "c", "d"], "meta": {"v": 2}, "extra": True}
+        legacy = DeepDiff(new, old, verbose_level=2).to_dict()
+
+        assert apply_delta(new, legacy) == old
+
+    def test_malformed_delta_raises(self):
+        with pytest.raises(ValueError):
+            apply_delta({"a": 1}, {"format": DELTA_FORMAT, "patch": ["?"]})
+
+
 class TestReconstructVersion:
     """Tests for chaining multiple deltas."""
 
@@ -388,6 +453,113 @@ class TestDeltaVersioningIntegration:
             assert delta_size < snapshot_size
 
 
+class TestReconstructionCache:
+    """Tests for the (resource_id, version) LRU of reconstructed content."""
+
+    @staticmethod
+    def _version(number: int, doc_id: str | None = None) -> SimpleNamespace:
+        return SimpleNamespace(
+            id=doc_id or f"id-{number}",
+            resource_id="word:synthesis",
+            version_info=SimpleNamespace(version=f"1.0.{number}"),
+        )
+
+    def test_get_returns_private_copy(self):
+        cache = ReconstructionCache(maxsize=4)
+        cache.put(self._version(1), {"defs": ["a"]})
+
+        first = cache.get(self._version(1))
+        assert first == {"defs": ["a"]}
+        first["defs"].append("mutated")
+
+        assert cache.get(self._version(1)) == {"defs": ["a"]}
+        assert (cache.hits, cache.misses) == (2, 0)
+
+    def test_evicts_least_recently_used(self):
+        cache = ReconstructionCache(maxsize=2)
+        cache.put(self._version(1), {"v": 1})
+        cache.put(self._version(2), {"v": 2})
+        cache.get(self._version(1))  # 2 is now least recently used
+        cache.put(self._version(3), {"v": 3})
+
+        assert len(cache) == 2
+        assert cache.get(self._version(2)) is None
+        assert cache.peek_id("id-2") is None
+        assert cache.get(self._version(1)) == {"v": 1}
+        assert cache.peek_id("id-3") == {"v": 3}
+
+    def test_reused_version_string_misses(self):
+        """A recreated resource reusing a version string is not served stale content."""
+        cache = ReconstructionCache(maxsize=2)
+        cache.put(self._version(1), {"v": "old"})
+
+        assert cache.get(self._version(1, doc_id="recreated")) is None
+
+
+class TestDeltaChainResolution:
+    """Chain resolution reads pages of versions and reuses reconstructed neighbours."""
+
+    @pytest_asyncio.fixture
+    async def history(self, test_db):
+        """Save 15 versions (patch 0..14) of one resource; returns (manager, contents)."""
+        get_reconstruction_cache().clear()
+        manager = VersionedDataManager()
+        contents = []
+        for i in range(15):
+            content = {"word": "deep", "definitions": [f"meaning {j}" for j in range(i + 1)]}
+            contents.append(content)
+            await manager.save(
+                resource_id="delta_test:deep",
+                resource_type=ResourceType.DICTIONARY,
+                namespace=CacheNamespace.DICTIONARY,
+                content=content,
+            )
+        yield manager, contents
+        get_reconstruction_cache().clear()
+
+    async def test_every_version_reconstructs(self, history):
+        manager, contents = history
+        for i, content in enumerate(contents):
+            result = await manager.get_by_version(
+                "delta_test:deep", ResourceType.DICTIONARY, f"1.0.{i}", use_cache=False
+            )
+            assert result is not None
+            assert result.content_inline == content
+
+    async def test_chain_read_without_point_lookups(self, history, monkeypatch):
+        """Bases come from the paged range query, not one get() per hop."""
+        manager, contents = history
+        model_class = manager._get_model_class(ResourceType.DICTIONARY)
+
+        async def no_point_reads(*_args, **_kwargs):
+            raise AssertionError("delta base fetched with a point read")
+
+        monkeypatch.setattr(model_class, "get", no_point_reads)
+
+        result = await manager.get_by_version(
+            "delta_test:deep", ResourceType.DICTIONARY, "1.0.1", use_cache=False
+        )
+        assert result is not None
+        assert result.content_inline == contents[1]
+
+    async def test_neighbouring_versions_reuse_reconstruction(self, history):
+        manager, contents = history
+        cache = get_reconstruction_cache()
+
+        await manager.get_by_version(
+            "delta_test:deep", ResourceType.DICTIONARY, "1.0.1", use_cache=False
+        )
+        # 1.0.1 through 1.0.9 were all reconstructed on the way from snapshot 1.0.10
+        assert len(cache) == 9
+
+        result = await manager.get_by_version(
+            "delta_test:deep", ResourceType.DICTIONARY, "1.0.5", use_cache=False
+        )
+        assert result is not None
+        assert result.content_inline == contents[5]
+        assert cache.hits == 1
+
+
 class TestDeltaConfig:
     """Tests for DeltaConfig."""
 
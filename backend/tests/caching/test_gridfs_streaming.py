@@ -0,0 +1,192 @@
+"""Tests for streaming GridFS reads and zero-copy binary payload loading.
+
+Validates that:
+- The binary payload container round-trips metadata and payloads,
+  returning payloads as views into the stored buffer.
+- gridfs_read streams raw and zstd-compressed files into a single buffer,
+  spooling large reads to an mmap'd file; LZ4/GZIP files are decoded whole.
+- Versioned binary payloads survive cache eviction via the streaming path.
+- Semantic loaders consume memoryviews directly (npy embeddings as views,
+  FAISS without temp files) and still read legacy pickled embeddings.
+"""
+
+import gzip
+import hashlib
+import io
+import mmap
+import pickle
+
+import lz4.frame  # type: ignore[import-untyped]
+import numpy as np
+import pytest
+import zstandard as zstd
+
+from floridify.caching import gridfs
+from floridify.caching.core import get_global_cache, get_versioned_content, set_versioned_content
+from floridify.caching.gridfs import gridfs_put, gridfs_read
+from floridify.caching.models import CompressionType, ResourceType, VersionInfo
+from floridify.caching.serialize import pack_binary_payload, unpack_binary_payload
+from floridify.search.semantic.index import SemanticIndex
+from floridify.search.semantic.persistence import (
+    load_embeddings_from_binary_data,
+    load_faiss_index_from_binary_data,
+)
+
+
+class TestBinaryPayloadContainer:
+    def test_round_trip_returns_views(self):
+        payloads = {"a": b"x" * 1001, "b": bytes(range(256)) * 10, "empty": b""}
+        buffer = b"".join(pack_binary_payload({"name": "idx", "count": 3}, payloads))
+
+        unpacked = unpack_binary_payload(memoryview(buffer))
+
+        assert unpacked is not None
+        assert unpacked["name"] == "idx" and unpacked["count"] == 3
+        for name, payload in payloads.items():
+            view = unpacked["binary_data"][name]
+            assert isinstance(view, memoryview) and view.readonly
+            assert bytes(view) == payload
+
+    def test_payloads_are_aligned(self):
+        buffer = b"".join(pack_binary_payload({"k": "v" * 13}, {"a": b"1" * 7, "b": b"2" * 9}))
+        unpacked = unpack_binary_payload(buffer)
+        assert unpacked is not None
+
+        base = np.frombuffer(buffer, dtype=np.uint8)
+        for view in unpacked["binary_data"].values():
+            offset = np.frombuffer(view, dtype=np.uint8).ctypes.data - base.ctypes.data
+            assert offset % 64 == 0
+
+    def test_non_container_is_rejected(self):
+        assert unpack_binary_payload(pickle.dumps({"binary_data": {"a": b"1"}})) is None
+
+    def test_truncated_container_raises(self):
+        buffer = b"".join(pack_binary_payload({}, {"a": b"z" * 500}))
+        with pytest.raises(ValueError):
+            unpack_binary_payload(buffer[:-10])
+
+
+@pytest.mark.asyncio
+class TestGridFSRead:
+    async def test_raw_read_matches_upload(self, test_db):
+        data = np.random.default_rng(0).bytes(3 * 1024 * 1024 + 17)
+        file_id = await gridfs_put("test:raw", [data[:1000], memoryview(data)[1000:]])
+
+        view = await gridfs_read(file_id)
+
+        assert view is not None and view.readonly
+        assert bytes(view) == data
+
+    async def test_zstd_is_decompressed_while_streaming(self, test_db):
+        data = b"floridify " * 1_000_000
+        file_id = await gridfs_put("test:zstd", zstd.ZstdCompressor(level=3).compress(data))
+
+        view = await gridfs_read(file_id, CompressionType.ZSTD)
+
+        assert view is not None
+        assert bytes(view) == data
+
+    @pytest.mark.parametrize(
+        ("compression", "compress"),
+        [
+            (CompressionType.LZ4, lz4.frame.compress),
+            (CompressionType.GZIP, gzip.compress),
+        ],
+    )
+    async def test_other_codecs_are_decompressed(self, test_db, compression, compress):
+        data = b"floridify " * 100_000
+        file_id = await gridfs_put(f"test:{compression.value}", compress(data))
+
+        view = await gridfs_read(file_id, compression)
+
+        assert view is not None and view.readonly
+        assert bytes(view) == data
+
+    async def test_unknown_codec_raises(self):
+        with pytest.raises(ValueError):
+            await gridfs_read("0" * 24, "brotli")  # type: ignore[arg-type]
+
+    async def test_large_reads_spool_to_mmap(self, test_db, monkeypatch, tmp_path):
+        monkeypatch.setattr(gridfs, "SPOOL_THRESHOLD_BYTES", 1024)
+        monkeypatch.setattr(gridfs, "get_cache_directory", lambda _name: tmp_path)
+        data = b"spooled" * 10_000
+        file_id = await gridfs_put("test:spool", data)
+
+        view = await gridfs_read(file_id)
+
+        assert view is not None
+        assert isinstance(view.obj, mmap.mmap)
+        assert bytes(view) == data
+        assert list(tmp_path.iterdir()) == []  # Spool file unlinked once mapped
+
+    async def test_missing_file_returns_none(self, test_db):
+        from bson import ObjectId
+
+        assert await gridfs_read(str(ObjectId())) is None
+
+
+@pytest.mark.asyncio
+async def test_binary_payload_recovered_from_gridfs(test_db):
+    payload = {"embeddings_bytes": b"e" * 200_000, "index_bytes": b"i" * 50_000}
+    metadata = SemanticIndex.Metadata(
+        resource_id="stream-test:semantic",
+        resource_type=ResourceType.SEMANTIC,
+        corpus_uuid="stream-test",
+        model_name="test-model",
+        version_info=VersionInfo(
+            version="1.0.0",
+            data_hash=hashlib.sha256(b"stream-test").hexdigest(),
+            is_latest=True,
+        ),
+    )
+    await set_versioned_content(metadata, {"corpus_name": "stream-test"}, binary_payload=payload)
+
+    cache = await get_global_cache()
+    await cache.clear_all()
+
+    content = await get_versioned_content(metadata)
+    assert content is not None
+    assert content["corpus_name"] == "stream-test"
+    for name, data in payload.items():
+        assert isinstance(content["binary_data"][name], memoryview)
+        assert bytes(content["binary_data"][name]) == data
+
+
+class TestSemanticLoaders:
+    def _npy(self, array: np.ndarray) -> bytes:
+        buffer = io.BytesIO()
+        np.save(buffer, array, allow_pickle=False)
+        return buffer.getvalue()
+
+    def test_npy_embeddings_are_views(self):
+        embeddings = np.random.default_rng(1).standard_normal((50, 8)).astype(np.float32)
+        container = b"".join(pack_binary_payload({}, {"embeddings_bytes": self._npy(embeddings)}))
+        binary_data = unpack_binary_payload(container)["binary_data"]
+
+        loaded = load_embeddings_from_binary_data(binary_data, "views")
+
+        np.testing.assert_array_equal(loaded, embeddings)
+        assert np.shares_memory(loaded, np.frombuffer(container, dtype=np.uint8))
+        assert not loaded.flags.writeable
+
+    def test_legacy_pickled_embeddings(self):
+        embeddings = np.arange(12, dtype=np.float32).reshape(3, 4) + 1
+        loaded = load_embeddings_from_binary_data(
+            {"embeddings_bytes": memoryview(pickle.dumps(embeddings))}, "legacy"
+        )
+        np.testing.assert_array_equal(loaded, embeddings)
+
+    def test_faiss_index_from_memoryview(self):
+        faiss = pytest.importorskip("faiss")
+        vectors = np.random.default_rng(2).standard_normal((20, 8)).astype(np.float32)
+        index = faiss.IndexFlatL2(8)
+        index.add(vectors)
+        index_bytes = faiss.serialize_index(index).tobytes()
+
+        loaded = load_faiss_index_from_binary_data(
+            {"index_bytes": memoryview(index_bytes).toreadonly()}, "faiss"
+        )
+
+        assert loaded.ntotal == 20
+        _, nearest = loaded.search(vectors[:3], 1)
+        assert nearest[:, 0].tolist() == [0, 1, 2]
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import copy
+import json
 from pathlib import Path
 
 import pytest
+from deepdiff import DeepDiff, Delta
 
-from floridify.audit import benchmark_sync, build_multi_version_payloads
+from floridify.audit import benchmark_sync, build_entry_payloads, build_multi_version_payloads
 from floridify.caching.compression import compress_data, decompress_data
 from floridify.caching.core import GlobalCacheManager
 from floridify.caching.delta import (
@@ -156,6 +158,69 @@ def test_deep_delta_chain_round_trip() -> None:
     assert case.stats.p95_ms < 200.0
 
 
+@pytest.mark.performance
+@pytest.mark.versioning
+def test_structural_delta_vs_deepdiff_on_entries() -> None:
+    """Save (compute) and reconstruct latency of the structural engine vs DeepDiff.
+
+    Uses synthesized-entry payloads: ~30 senses with ids, reworded and inserted
+    mid-list between revisions, plus refreshed model/provenance metadata.
+    """
+    payloads = build_entry_payloads(num_versions=10, num_definitions=30)
+    pairs = list(zip(payloads, payloads[1:], strict=False))
+
+    def deepdiff_compute() -> list[dict]:
+        return [DeepDiff(new, old, verbose_level=2).to_dict() for old, new in pairs]
+
+    def deepdiff_reconstruct(deltas: list[dict]) -> dict:
+        result = payloads[-1]
+        for delta in reversed(deltas):
+            result = Delta(delta) + result
+        return result
+
+    save_case, structural = benchmark_sync(
+        "delta-save-structural",
+        "versioning",
+        lambda: [compute_delta(old, new) for old, new in pairs],
+        iterations=12,
+        warmup=1,
+        operations_per_iteration=len(pairs),
+    )
+    legacy_save_case, legacy = benchmark_sync(
+        "delta-save-deepdiff",
+        "versioning",
+        deepdiff_compute,
+        iterations=6,
+        warmup=1,
+        operations_per_iteration=len(pairs),
+    )
+    deltas, legacy_deltas = list(reversed(structural[-1])), legacy[-1]
+    read_case, reconstructed = benchmark_sync(
+        "delta-reconstruct-structural",
+        "versioning",
+        lambda: reconstruct_version(payloads[-1], deltas),
+        iterations=12,
+        warmup=1,
+        operations_per_iteration=len(deltas),
+        metadata={"delta_bytes": sum(len(json.dumps(d)) for d in deltas)},
+    )
+    legacy_read_case, legacy_reconstructed = benchmark_sync(
+        "delta-reconstruct-deepdiff",
+        "versioning",
+        lambda: deepdiff_reconstruct(legacy_deltas),
+        iterations=6,
+        warmup=1,
+        operations_per_iteration=len(legacy_deltas),
+        metadata={"delta_bytes": sum(len(json.dumps(d, default=str)) for d in legacy_deltas)},
+    )
+
+    assert reconstructed[-1] == payloads[0]
+    assert legacy_reconstructed[-1] == payloads[0]
+    assert max(len(json.dumps(d)) for d in deltas) < len(json.dumps(payloads[0])) / 4
+    assert save_case.stats.mean_ms < legacy_save_case.stats.mean_ms
+    assert read_case.stats.mean_ms < legacy_read_case.stats.mean_ms
+
+
 @pytest.mark.performance
 @pytest.mark.versioning
 def test_content_hash_dedup() -> None:
@@ -0,0 +1,160 @@
+"""Tests for the pooled search service client.
+
+Validates that:
+- A lone lookup uses GET /search; concurrent lookups coalesce into one batch POST.
+- Lookups with different modes or languages are batched separately.
+- A slow attempt is hedged by a duplicate, and the first success wins.
+- Failures reach every coalesced caller (so each can fall back locally).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from floridify.core.search_client import SearchServiceClient
+from floridify.models.base import Language
+
+
+def _response(word: str | None) -> dict:
+    results = [{"word": word, "score": 0.9, "method": "exact"}] if word else []
+    return {"query": word or "", "results": results, "total_found": len(results)}
+
+
+class RecordingService:
+    """Fake search service: echoes each query back, upper-cased, as its best match."""
+
+    def __init__(self, delays: list[float] | None = None, status: int = 200) -> None:
+        self.requests: list[httpx.Request] = []
+        self.delays = delays or []
+        self.status = status
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.delays:
+            await asyncio.sleep(self.delays.pop(0))
+        if self.status != 200:
+            return httpx.Response(self.status)
+        if request.method == "GET":
+            return httpx.Response(200, json=_response(request.url.params["q"].upper()))
+        queries = json.loads(request.content)["queries"]
+        return httpx.Response(
+            200, json={"results": [_response(q.upper()) for q in queries], "total_queries": 0}
+        )
+
+
+def _client(service: RecordingService, **kwargs) -> SearchServiceClient:
+    return SearchServiceClient(
+        "http://search:8000", transport=httpx.MockTransport(service), **kwargs
+    )
+
+
+class TestSearchServiceClient:
+    async def test_single_lookup_uses_get(self):
+        service = RecordingService()
+        client = _client(service)
+
+        best = await client.find_best_match("apple", [Language.ENGLISH])
+
+        assert best is not None and best.word == "APPLE"
+        assert [r.method for r in service.requests] == ["GET"]
+        assert service.requests[0].url.params.get_list("languages") == ["en"]
+        await client.aclose()
+
+    async def test_concurrent_lookups_coalesce_into_one_batch(self):
+        service = RecordingService()
+        client = _client(service)
+        words = ["apple", "banana", "cherry", "apple"]
+
+        results = await asyncio.gather(*(client.find_best_match(w) for w in words))
+
+        assert [r.word for r in results] == ["APPLE", "BANANA", "CHERRY", "APPLE"]
+        assert [r.method for r in service.requests] == ["POST"]
+        body = json.loads(service.requests[0].content)
+        assert body["queries"] == ["apple", "banana", "cherry"]
+        assert body["max_results"] == 1
+        await client.aclose()
+
+    async def test_modes_batched_separately(self):
+        service = RecordingService()
+        client = _client(service)
+
+        await asyncio.gather(
+            client.find_best_match("a", semantic=True),
+            client.find_best_match("b", semantic=False),
+        )
+
+        modes = sorted(r.url.params["mode"] for r in service.requests)
+        assert modes == ["exact", "smart"]
+        await client.aclose()
+
+    async def test_full_batch_flushes_immediately(self):
+        service = RecordingService()
+        client = _client(service, window_ms=10_000, max_batch_size=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(client.find_best_match("a"), client.find_best_match("b")),
+            timeout=1.0,
+        )
+
+        assert [r.word for r in results] == ["A", "B"]
+        await client.aclose()
+
+    async def test_slow_attempt_is_hedged(self):
+        service = RecordingService(delays=[2.0, 0.0])
+        client = _client(service, hedge_delay_ms=20)
+
+        best = await asyncio.wait_for(client.find_best_match("apple"), timeout=1.0)
+
+        assert best is not None and best.word == "APPLE"
+        assert len(service.requests) == 2
+        await client.aclose()
+
+    async def test_failure_reaches_every_caller(self):
+        service = RecordingService(status=503)
+        client = _client(service, hedge_delay_ms=0)
+
+        results = await asyncio.gather(
+            client.find_best_match("a"),
+            client.find_best_match("b"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+        await client.aclose()
+
+    async def test_no_match_returns_none(self):
+        class EmptyService(RecordingService):
+            async def __call__(self, request: httpx.Request) -> httpx.Response:
+                return httpx.Response(200, json=_response(None))
+
+        client = _client(EmptyService())
+        assert await client.find_best_match("zzz") is None
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_remote_failure_falls_back_to_local(monkeypatch):
+    from floridify.core import search_pipeline
+    from floridify.search.constants import SearchMethod
+    from floridify.search.result import SearchResult
+
+    local = SearchResult(word="local", score=1.0, method=SearchMethod.EXACT)
+    service = RecordingService(status=500)
+    monkeypatch.setattr(
+        search_pipeline,
+        "get_search_service_client",
+        lambda _url: _client(service, hedge_delay_ms=0),
+    )
+
+    async def fake_pipeline(**_kwargs):
+        return [local]
+
+    monkeypatch.setattr(search_pipeline, "search_word_pipeline", fake_pipeline)
+
+    best = await search_pipeline._find_best_match_remote("word", None, True, "http://search")
+
+    assert best is local
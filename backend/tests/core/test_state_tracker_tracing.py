@@ -0,0 +1,164 @@
+"""Tests for StateTracker stage tracing.
+
+Validates that:
+- Stage changes open top-level spans; repeated updates to a stage do not split it.
+- Nested spans (provider fetches, AI calls) attach to the active stage, also from tasks.
+- finish() feeds the stage histogram once; fast mode records and observes nothing.
+- The internal state queue stays bounded when nobody reads it.
+- Update cost with tracing vs fast mode (benchmark).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from floridify.audit import benchmark_async
+from floridify.core.state_tracker import (
+    STATE_QUEUE_MAXSIZE,
+    Stages,
+    StateTracker,
+    record_span,
+)
+from floridify.utils.metrics import PIPELINE_STAGE_SECONDS
+
+
+def _observed(category: str, stage: str) -> int:
+    return PIPELINE_STAGE_SECONDS.labels(category, stage).count
+
+
+class TestStageSpans:
+    async def test_stage_changes_open_spans(self):
+        tracker = StateTracker(category="lookup")
+
+        await tracker.update_stage(Stages.START)
+        await tracker.update_stage(Stages.PROVIDER_FETCH_START)
+        await tracker.update(stage=Stages.PROVIDER_FETCH_START, message="still fetching")
+        await asyncio.sleep(0.01)
+        await tracker.update_complete()
+
+        trace = tracker.get_trace()
+        assert [span.name for span in trace] == [Stages.START, Stages.PROVIDER_FETCH_START]
+        assert all(span.parent is None for span in trace)
+        assert trace[1].start_ms >= trace[0].start_ms + trace[0].duration_ms
+        assert trace[1].duration_ms >= 10
+
+    async def test_undefined_stages_do_not_split_spans(self):
+        tracker = StateTracker(category="lookup")
+
+        await tracker.update_stage(Stages.PROVIDER_FETCH_START)
+        await tracker.update(stage=Stages.PROVIDER_FETCH_HTTP_DOWNLOADING, progress=40)
+
+        assert [span.name for span in tracker.get_trace()] == [Stages.PROVIDER_FETCH_START]
+
+    async def test_nested_spans_from_tasks(self):
+        tracker = StateTracker(category="lookup")
+        await tracker.update_stage(Stages.PROVIDER_FETCH_START)
+
+        async def fetch(provider: str) -> None:
+            started = time.perf_counter()
+            await asyncio.sleep(0.005)
+            record_span(f"provider:{provider}", started)
+
+        await asyncio.gather(fetch("wiktionary"), fetch("wordnet"))
+        tracker.finish()
+
+        nested = [span for span in tracker.get_trace() if span.parent is not None]
+        assert sorted(span.name for span in nested) == ["provider:wiktionary", "provider:wordnet"]
+        assert all(span.parent == Stages.PROVIDER_FETCH_START for span in nested)
+        assert all(span.duration_ms >= 5 for span in nested)
+
+    async def test_record_span_without_tracker_is_noop(self):
+        record_span("ai:orphan", time.perf_counter())  # No active tracker: nothing raised
+
+    async def test_reset_clears_trace(self):
+        tracker = StateTracker(category="lookup")
+        await tracker.update_stage(Stages.START)
+
+        tracker.reset()
+
+        assert tracker.get_trace() == []
+
+
+class TestHistogramsAndFastMode:
+    async def test_finish_observes_each_span_once(self):
+        category = "trace-test-finish"
+        tracker = StateTracker(category="lookup")
+        tracker._category = category
+        await tracker.update_stage(Stages.SEARCH_START)
+
+        await tracker.update_error("boom")
+        tracker.finish()
+
+        assert _observed(category, Stages.SEARCH_START) == 1
+
+    async def test_fast_mode_skips_histograms(self):
+        category = "trace-test-fast"
+        tracker = StateTracker(category="lookup")
+        tracker._category = category
+        await tracker.update_stage(Stages.SEARCH_START)
+
+        tracker.disable_tracing()
+        record_span("provider:wiktionary", time.perf_counter())
+        await tracker.update_stage(Stages.STORAGE_SAVE)
+        await tracker.update_complete()
+
+        assert [span.name for span in tracker.get_trace()] == [Stages.SEARCH_START]
+        assert tracker.get_trace()[0].duration_ms is not None
+        assert _observed(category, Stages.SEARCH_START) == 0
+
+    async def test_tracing_disabled_from_start(self):
+        tracker = StateTracker(category="lookup", tracing=False)
+
+        await tracker.update_stage(Stages.START)
+        await tracker.update_complete()
+
+        assert tracker.get_trace() == []
+
+
+class TestStateQueue:
+    async def test_unread_queue_is_bounded(self):
+        tracker = StateTracker(category="lookup")
+
+        for i in range(STATE_QUEUE_MAXSIZE * 3):
+            await tracker.update(stage=Stages.AI_SYNTHESIS, message=f"step {i}")
+
+        assert tracker._queue.qsize() == STATE_QUEUE_MAXSIZE
+        await tracker.update_complete()
+        states = [state async for state in tracker.get_states()]
+        assert states[-1].is_complete
+        assert states[0].message == f"step {STATE_QUEUE_MAXSIZE * 2 + 1}"
+
+
+@pytest.mark.performance
+async def test_tracing_overhead() -> None:
+    """Per-update cost of a traced tracker vs fast mode."""
+    stages = [stage.name for stage in StateTracker(category="lookup").get_stage_definitions()]
+
+    async def run(tracing: bool) -> None:
+        tracker = StateTracker(category="lookup", tracing=tracing)
+        for stage in stages:
+            await tracker.update_stage(stage)
+        await tracker.update_complete()
+
+    traced, _ = await benchmark_async(
+        "state-tracker-traced",
+        "tracing",
+        lambda: run(True),
+        iterations=200,
+        warmup=10,
+        operations_per_iteration=len(stages) + 1,
+    )
+    fast, _ = await benchmark_async(
+        "state-tracker-fast-mode",
+        "tracing",
+        lambda: run(False),
+        iterations=200,
+        warmup=10,
+        operations_per_iteration=len(stages) + 1,
+    )
+
+    assert traced.stats.throughput_per_second > 0
+    assert fast.stats.throughput_per_second > 0
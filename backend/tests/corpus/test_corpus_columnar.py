@@ -0,0 +1,147 @@
+"""Tests for memory-mapped columnar corpus storage."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from floridify.caching.models import VersionInfo
+from floridify.corpus import columnar
+from floridify.corpus.columnar import (
+    StringColumn,
+    get_shared_corpus,
+    load_candidate_index,
+    open_columnar,
+    share_corpus,
+    store_candidate_index,
+    write_columnar,
+)
+from floridify.corpus.core import Corpus
+
+VOCABULARY = ["café", "cafe", "Apple", "apple", "running", "runs", "zebra", "naïve", "北京"]
+
+
+@pytest.fixture
+async def corpus() -> Corpus:
+    return await Corpus.create(corpus_name="columnar_test", vocabulary=VOCABULARY)
+
+
+@pytest.mark.asyncio
+async def test_columnar_views_match_plain_fields(corpus: Corpus, tmp_path) -> None:
+    expected = corpus.model_dump(mode="json")
+
+    directory = write_columnar(corpus, tmp_path / "cols")
+    corpus.attach_columnar(directory)
+
+    assert corpus.is_columnar
+    assert isinstance(corpus.vocabulary._offsets, np.memmap)
+    assert corpus.model_dump(mode="json") == expected
+
+    for index, word in enumerate(expected["vocabulary"]):
+        assert corpus.vocabulary[index] == word
+        assert corpus.vocabulary_to_index[word] == index
+        assert corpus.get_original_word_by_index(index) is not None
+    assert corpus.vocabulary_to_index.get("missing") is None
+    assert "missing" not in corpus.vocabulary_to_index
+
+    for lemma, index in corpus.lemma_text_to_index.items():
+        assert corpus.lemmatized_vocabulary[index] == lemma
+    for word_idx, lemma_idx in corpus.word_to_lemma_indices.items():
+        assert word_idx in corpus.lemma_to_word_indices[lemma_idx]
+
+
+@pytest.mark.asyncio
+async def test_columnar_views_pickle_and_mutate_as_plain(corpus: Corpus, tmp_path) -> None:
+    vocabulary = list(corpus.vocabulary)
+    corpus.attach_columnar(write_columnar(corpus, tmp_path / "cols"))
+
+    assert pickle.loads(pickle.dumps(corpus.vocabulary)) == vocabulary
+    assert isinstance(pickle.loads(pickle.dumps(corpus.lemma_to_word_indices)), dict)
+
+    added = await corpus.add_words(["xylophone"])
+
+    assert added == 1
+    assert not corpus.is_columnar
+    assert "xylophone" in corpus.vocabulary_to_index
+
+
+@pytest.mark.asyncio
+async def test_write_columnar_is_idempotent(corpus: Corpus, tmp_path) -> None:
+    directory = tmp_path / "cols"
+    write_columnar(corpus, directory)
+    write_columnar(corpus, directory)
+
+    views = open_columnar(directory)
+    assert list(views["vocabulary"]) == corpus.vocabulary
+    assert [p.name for p in tmp_path.iterdir()] == ["cols"]
+
+
+@pytest.mark.asyncio
+async def test_share_corpus_respects_threshold(
+    corpus: Corpus, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FLORIDIFY_CACHE_DIR", str(tmp_path))
+    corpus.version_info = VersionInfo(version="1.0.0", data_hash="a" * 64, is_latest=True)
+
+    monkeypatch.setattr(columnar, "CORPUS_MMAP_MIN_VOCABULARY", len(corpus.vocabulary) + 1)
+    assert not share_corpus(corpus).is_columnar
+
+    monkeypatch.setattr(columnar, "CORPUS_MMAP_MIN_VOCABULARY", 1)
+    assert share_corpus(corpus).is_columnar
+
+
+@pytest.mark.asyncio
+async def test_shared_corpus_rebuilds_without_content(
+    corpus: Corpus, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FLORIDIFY_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(columnar, "CORPUS_MMAP_MIN_VOCABULARY", 1)
+    data_hash = "b" * 64
+    corpus.version_info = VersionInfo(version="1.0.0", data_hash=data_hash, is_latest=True)
+    expected = corpus.model_dump(mode="json")
+
+    assert get_shared_corpus(data_hash) is None
+    share_corpus(corpus)
+    shared = get_shared_corpus(data_hash)
+    assert shared is not None and get_shared_corpus(data_hash) is shared
+
+    first = shared.to_corpus(corpus_name="renamed")
+    second = shared.to_corpus()
+
+    assert first.corpus_name == "renamed"
+    assert second.model_dump(mode="json") == expected
+    assert first.vocabulary is second.vocabulary  # One set of memmaps per process
+    assert first.vocabulary_hash == corpus.vocabulary_hash
+
+
+def test_string_column_iterates_in_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(columnar, "_ITER_CHUNK", 2)
+    blob, offsets = columnar._encode_strings(VOCABULARY)
+
+    column = StringColumn(blob, offsets)
+
+    assert list(column) == column.tolist() == VOCABULARY
+    assert list(StringColumn(*columnar._encode_strings([]))) == []
+
+
+@pytest.mark.asyncio
+async def test_candidate_index_persisted_and_mapped(
+    corpus: Corpus, tmp_path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("FLORIDIFY_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(columnar, "CORPUS_MMAP_MIN_VOCABULARY", 1)
+    expected = corpus.get_candidates("aple", max_results=10)
+
+    store_candidate_index(corpus.vocabulary, corpus.trigram_index, corpus.length_buckets)
+    loaded = load_candidate_index(corpus.vocabulary)
+    assert loaded is not None
+    assert isinstance(next(iter(loaded[0].values())).base, np.memmap)
+
+    # A fresh load maps the persisted index lazily on first lookup
+    reloaded = Corpus.model_validate(corpus.model_dump())
+    assert not reloaded.trigram_index
+    assert reloaded.get_candidates("aple", max_results=10) == expected
+    assert reloaded.trigram_index.keys() == corpus.trigram_index.keys()
+
+    # Any vocabulary change misses the persisted copy
+    assert load_candidate_index([*corpus.vocabulary, "zzz"]) is None
@@ -367,3 +367,147 @@ class TestCorpusUpdateCombinations:
 
         # Verify no duplicates
         assert len(set(base_corpus.vocabulary)) == len(base_corpus.vocabulary)
+
+
+def _snapshot(corpus: Corpus) -> dict[str, object]:
+    """Index-independent view of a corpus's derived structures."""
+    vocab = corpus.vocabulary
+    lemmas = corpus.lemmatized_vocabulary
+    return {
+        "vocabulary": list(vocab),
+        "vocabulary_to_index": dict(corpus.vocabulary_to_index),
+        "originals": {
+            vocab[k]: sorted(corpus.original_vocabulary[i] for i in v)
+            for k, v in corpus.normalized_to_original_indices.items()
+        },
+        "word_lemmas": {vocab[w]: lemmas[lem] for w, lem in corpus.word_to_lemma_indices.items()},
+        "lemma_words": {
+            lemmas[lem]: sorted(vocab[w] for w in ws)
+            for lem, ws in corpus.lemma_to_word_indices.items()
+        },
+        "lemma_index": {lem: lemmas[i] for lem, i in corpus.lemma_text_to_index.items()},
+        "trigrams": {
+            tg: (p["idx"].tolist(), p["loc"].tolist(), p["nxt"].tolist())
+            for tg, p in corpus.trigram_index.items()
+        },
+        "length_buckets": {k: v.tolist() for k, v in corpus.length_buckets.items()},
+        "vocabulary_hash": corpus.vocabulary_hash,
+    }
+
+
+class TestIncrementalMatchesRebuild:
+    """Delta updates must produce the same structures as building from scratch."""
+
+    BASE = ["apple", "banana", "Café", "cafe", "running", "runs", "zebra", "naïve"]
+
+    @pytest.mark.asyncio
+    async def test_add_matches_fresh_corpus(self) -> None:
+        added = ["Runner", "cafés", "café", "apples", "running", "xylophone", "aardvark"]
+        corpus = await Corpus.create(corpus_name="inc-add", vocabulary=list(self.BASE))
+        await corpus.add_words(added)
+
+        fresh = await Corpus.create(corpus_name="fresh-add", vocabulary=self.BASE + added)
+        assert _snapshot(corpus) == _snapshot(fresh)
+
+    @pytest.mark.asyncio
+    async def test_remove_matches_fresh_corpus(self) -> None:
+        corpus = await Corpus.create(corpus_name="inc-remove", vocabulary=list(self.BASE))
+        await corpus.remove_words(["cafe", "running", "missing"])
+
+        fresh = await Corpus.create(
+            corpus_name="fresh-remove",
+            vocabulary=["apple", "banana", "runs", "zebra", "naïve"],
+        )
+        assert _snapshot(corpus) == _snapshot(fresh)
+        assert sorted(corpus.original_vocabulary) == sorted(fresh.original_vocabulary)
+
+
+class TestConcurrentLookups:
+    """Candidate lookups on other threads must never see a half-applied delta."""
+
+    @pytest.mark.asyncio
+    async def test_substring_lookups_during_deltas(self) -> None:
+        import random
+        import string
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        rng = random.Random(11)
+        stable = sorted(f"zzq{a}{b}" for a in string.ascii_lowercase for b in "ab")
+        filler = [
+            "".join(rng.choices(string.ascii_lowercase[:20], k=rng.randint(4, 9)))
+            for _ in range(5_000)
+        ]
+        corpus = await Corpus.create(corpus_name="concurrent", vocabulary=stable + filler)
+
+        stop = threading.Event()
+        mismatches: list[list[str]] = []
+
+        def lookup_until_stopped() -> int:
+            lookups = 0
+            while not stop.is_set():
+                found = sorted(corpus.get_substring_matches("zzq", max_results=1_000))
+                if found != stable:
+                    mismatches.append(found)
+                lookups += 1
+            return lookups
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            readers = [pool.submit(lookup_until_stopped) for _ in range(2)]
+            try:
+                for _ in range(8):
+                    # Sorted ahead of the stable words, so every edit shifts their indices
+                    edit = ["".join(rng.choices("abcdefghij", k=6)) for _ in range(200)] + [
+                        "zzp" + "".join(rng.choices("abcdefghij", k=4))
+                    ]
+                    await corpus.add_words(edit)
+                    await corpus.remove_words(edit)
+            finally:
+                stop.set()
+            lookups = sum(reader.result() for reader in readers)
+
+        assert lookups > 0
+        assert mismatches == []
+
+
+@pytest.mark.performance
+class TestIncrementalUpdatePerformance:
+    """Delta cost should track the delta size, not the corpus size."""
+
+    @pytest.mark.asyncio
+    async def test_small_delta_much_cheaper_than_rebuild(self) -> None:
+        import random
+        import string
+        import time
+
+        rng = random.Random(7)
+        vocabulary = [
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 12)))
+            for _ in range(50_000)
+        ]
+        corpus = await Corpus.create(corpus_name="inc-perf", vocabulary=vocabulary)
+
+        # Both paths warm: lemma table populated, worker pool up, index maps
+        # already in the form the delta path patches.
+        await corpus._rebuild_indices()
+        t0 = time.perf_counter()
+        await corpus._rebuild_indices()
+        rebuild_ms = (time.perf_counter() - t0) * 1000
+
+        await corpus.add_words(["warmup"])
+        await corpus.remove_words(["warmup"])
+
+        timings: dict[int, float] = {}
+        for size in (10, 100, 1_000):
+            words = [f"{''.join(rng.choices(string.ascii_lowercase, k=8))}q" for _ in range(size)]
+            t0 = time.perf_counter()
+            await corpus.add_words(words)
+            await corpus.remove_words(words)
+            timings[size] = (time.perf_counter() - t0) * 1000
+
+        for size, elapsed_ms in timings.items():
+            print(f"\n  [50K] add+remove {size:>5} words: {elapsed_ms:8.1f}ms")
+        print(f"  [50K] warm full rebuild:         {rebuild_ms:8.1f}ms")
+
+        assert timings[10] < rebuild_ms / 3
+        assert timings[100] < rebuild_ms
@@ -0,0 +1,188 @@
+"""Trigram candidate index construction -- parity with the reference builder + speed.
+
+The reference builder below is the original per-entry Python implementation,
+kept here as the oracle for the vectorized ``build_candidate_index``.
+"""
+
+from __future__ import annotations
+
+import random
+import string
+import time
+
+import numpy as np
+import pytest
+
+from floridify.search.fuzzy.candidates import (
+    POSTING_DTYPE,
+    _next_char_hash,
+    build_candidate_index,
+    pack_candidate_index,
+    unpack_candidate_index,
+)
+
+
+def _reference_build(
+    vocabulary: list[str],
+) -> tuple[dict[str, np.ndarray], dict[int, np.ndarray]]:
+    """Pre-vectorization builder: per-entry tuple appends + Python duplicate merge."""
+    # Phase 1: Collect as Python lists (O(1) amortized append)
+    trigram_lists: dict[str, list[tuple[int, int, int]]] = {}
+    length_lists: dict[int, list[int]] = {}
+
+    for idx, word in enumerate(vocabulary):
+        padded = f"##{word}##"
+        n_trigrams = len(padded) - 2
+
+        for i in range(n_trigrams):
+            tg = padded[i : i + 3]
+
+            # Positional mask: bit (i % 8) records where this trigram appears
+            loc_bit = 1 << (i & 7)
+
+            # Next-char mask: hash of character after trigram for "3.5-gram" precision
+            next_pos = i + 3
+            if next_pos < len(padded):
+                nxt_bit = 1 << _next_char_hash(padded[next_pos])
+            else:
+                nxt_bit = 1 << 7  # sentinel bit for end-of-word
+
+            if tg not in trigram_lists:
+                trigram_lists[tg] = []
+            trigram_lists[tg].append((idx, loc_bit, nxt_bit))
+
+        # Length bucket
+        length = len(word)
+        if length not in length_lists:
+            length_lists[length] = []
+        length_lists[length].append(idx)
+
+    # Phase 2: Convert to numpy arrays for cache-friendly, vectorized access
+    trigram_index: dict[str, np.ndarray] = {}
+    for tg, entries in trigram_lists.items():
+        arr = np.empty(len(entries), dtype=POSTING_DTYPE)
+        for j, (idx, loc, nxt) in enumerate(entries):
+            arr[j] = (idx, loc, nxt)
+        # Sort by vocabulary index for consistent ordering
+        arr.sort(order="idx")
+        # Merge masks for duplicate (trigram, word_idx) pairs. A word can have
+        # the same trigram at multiple positions — we OR the masks together.
+        if len(arr) > 1:
+            unique_mask = np.empty(len(arr), dtype=bool)
+            unique_mask[0] = True
+            unique_mask[1:] = arr["idx"][1:] != arr["idx"][:-1]
+            if not unique_mask.all():
+                # Merge duplicate entries by OR-ing masks
+                merged: list[tuple[int, int, int]] = []
+                cur_idx, cur_loc, cur_nxt = (
+                    int(arr[0]["idx"]),
+                    int(arr[0]["loc"]),
+                    int(arr[0]["nxt"]),
+                )
+                for k in range(1, len(arr)):
+                    if arr[k]["idx"] == cur_idx:
+                        cur_loc |= int(arr[k]["loc"])
+                        cur_nxt |= int(arr[k]["nxt"])
+                    else:
+                        merged.append((cur_idx, cur_loc, cur_nxt))
+                        cur_idx, cur_loc, cur_nxt = (
+                            int(arr[k]["idx"]),
+                            int(arr[k]["loc"]),
+                            int(arr[k]["nxt"]),
+                        )
+                merged.append((cur_idx, cur_loc, cur_nxt))
+                arr = np.array(merged, dtype=POSTING_DTYPE)
+        trigram_index[tg] = arr
+
+    length_buckets: dict[int, np.ndarray] = {}
+    for length, indices in length_lists.items():
+        bucket = np.array(sorted(indices), dtype=np.int32)
+        length_buckets[length] = bucket
+
+    return trigram_index, length_buckets
+
+
+def _vocabulary(size: int, seed: int = 11) -> list[str]:
+    rng = random.Random(seed)
+    alphabet = string.ascii_lowercase + "éüñç '-"
+    words = {"".join(rng.choices(alphabet, k=rng.randint(1, 16))).strip() for _ in range(size)}
+    return sorted(words | {"", "a", "aaaaaaaaaaaaaaaaaaaa", "北京", "😀"})
+
+
+def _assert_same_index(vocabulary: list[str]) -> None:
+    expected_index, expected_buckets = _reference_build(vocabulary)
+    actual_index, actual_buckets = build_candidate_index(vocabulary)
+
+    assert actual_index.keys() == expected_index.keys()
+    for tg, expected in expected_index.items():
+        actual = actual_index[tg]
+        assert actual.dtype == POSTING_DTYPE
+        np.testing.assert_array_equal(actual, expected, err_msg=f"posting mismatch for {tg!r}")
+
+    assert actual_buckets.keys() == expected_buckets.keys()
+    for length, expected in expected_buckets.items():
+        np.testing.assert_array_equal(actual_buckets[length], expected)
+        assert actual_buckets[length].dtype == np.int32
+
+
+class TestVectorizedBuild:
+    def test_matches_reference_small(self):
+        _assert_same_index(sorted(["apple", "banana", "cherry", "aaaa", "abab", "café"]))
+
+    def test_matches_reference_random(self):
+        _assert_same_index(_vocabulary(5_000))
+
+    def test_repeated_trigram_masks_are_merged(self):
+        # "aaaaaaaaaa" hits "aaa" at eight positions -> one posting, OR-ed masks
+        trigram_index, _ = build_candidate_index(["aaaaaaaaaa"])
+        posting = trigram_index["aaa"]
+        assert len(posting) == 1
+        assert posting["loc"][0] == 0xFF
+
+    def test_empty_vocabulary(self):
+        assert build_candidate_index([]) == ({}, {})
+
+
+class TestPackedIndex:
+    def test_round_trip(self):
+        vocabulary = _vocabulary(2_000)
+        trigram_index, length_buckets = build_candidate_index(vocabulary)
+
+        restored_index, restored_buckets = unpack_candidate_index(
+            pack_candidate_index(trigram_index, length_buckets)
+        )
+
+        assert restored_index.keys() == trigram_index.keys()
+        for tg, posting in trigram_index.items():
+            np.testing.assert_array_equal(restored_index[tg], posting)
+        assert restored_buckets.keys() == length_buckets.keys()
+        for length, bucket in length_buckets.items():
+            np.testing.assert_array_equal(restored_buckets[length], bucket)
+
+    def test_round_trip_empty(self):
+        assert unpack_candidate_index(pack_candidate_index({}, {})) == ({}, {})
+
+    def test_next_char_hash_is_pinned(self):
+        # Persisted nxt masks must not depend on per-process string hashing, and
+        # changing the hash would silently invalidate every stored index.
+        assert [_next_char_hash(c) for c in "az#é"] == [7, 3, 5, 0]
+        assert {_next_char_hash(c) for c in string.ascii_lowercase} == set(range(8))
+
+
+@pytest.mark.performance
+class TestVectorizedBuildPerformance:
+    def test_faster_than_reference(self):
+        vocabulary = _vocabulary(100_000)
+
+        t0 = time.perf_counter()
+        _reference_build(vocabulary)
+        reference_ms = (time.perf_counter() - t0) * 1000
+
+        t0 = time.perf_counter()
+        build_candidate_index(vocabulary)
+        vectorized_ms = (time.perf_counter() - t0) * 1000
+
+        print(f"\n  [{len(vocabulary) // 1000}K] reference:  {reference_ms:8.1f}ms")
+        print(f"  [{len(vocabulary) // 1000}K] vectorized: {vectorized_ms:8.1f}ms")
+
+        assert vectorized_ms < reference_ms / 2
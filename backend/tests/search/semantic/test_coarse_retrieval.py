@@ -0,0 +1,122 @@
+"""Tests for two-stage coarse-to-fine semantic retrieval.
+
+Validates that:
+- With enough candidates the re-rank reproduces exact IndexFlatL2 results.
+- Results are padded FAISS-style when fewer than k vectors exist.
+- Recall@10 vs p95 latency against the single-stage index tiers (benchmark).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+
+from floridify.audit import benchmark_sync  # noqa: E402
+from floridify.search.semantic.coarse import CoarseToFineIndex  # noqa: E402
+
+MODES = ["matryoshka", "binary"]
+
+
+def _mrl_like_embeddings(n: int, dim: int, seed: int = 0, clusters: int = 500) -> np.ndarray:
+    """Clustered unit vectors whose variance decays with dimension, like MRL embeddings."""
+    rng = np.random.default_rng(seed)
+    scale = 1.0 / np.sqrt(1.0 + np.arange(dim) / 8.0)
+    centers = rng.standard_normal((clusters, dim)) * scale
+    noise = 0.5 * rng.standard_normal((n, dim)) * scale
+    vectors = (centers[rng.integers(0, clusters, n)] + noise).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def _exact(embeddings: np.ndarray, queries: np.ndarray, k: int):
+    index = faiss.IndexFlatL2(embeddings.shape[1])
+    index.add(embeddings)
+    return index.search(queries, k)
+
+
+class TestCoarseToFineIndex:
+    @pytest.mark.parametrize("mode", MODES)
+    def test_full_candidates_match_exact_search(self, mode: str):
+        embeddings = _mrl_like_embeddings(300, 128)
+        queries = _mrl_like_embeddings(5, 128, seed=1)
+        index = CoarseToFineIndex(embeddings, mode, candidates=300)
+
+        distances, ids = index.search(queries, 10)
+        exact_distances, exact_ids = _exact(embeddings, queries, 10)
+
+        np.testing.assert_array_equal(ids, exact_ids)
+        np.testing.assert_allclose(distances, exact_distances, atol=1e-4)
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_pads_when_fewer_than_k(self, mode: str):
+        embeddings = _mrl_like_embeddings(3, 128)
+        index = CoarseToFineIndex(embeddings, mode)
+
+        distances, ids = index.search(embeddings[:1], 5)
+
+        assert ids[0, 0] == 0
+        assert sorted(ids[0, :3].tolist()) == [0, 1, 2]
+        assert ids[0, 3:].tolist() == [-1, -1]
+        assert np.isinf(distances[0, 3:]).all()
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            CoarseToFineIndex(_mrl_like_embeddings(4, 16), "pq")
+
+
+@pytest.mark.performance
+@pytest.mark.semantic
+def test_coarse_recall_vs_latency() -> None:
+    """Recall@10 and p95 latency of each index against exact Flat search."""
+    from floridify.search.semantic.constants import HNSW_EF_SEARCH, HNSW_M
+
+    n, dim, k = 50_000, 512, 10
+    # Queries come from the same clusters as the corpus, as query words do
+    vectors = _mrl_like_embeddings(n + 64, dim)
+    embeddings, queries = vectors[:n], vectors[n:]
+    _, truth = _exact(embeddings, queries, k)
+
+    quantizer = faiss.IndexFlatL2(dim)
+    ivf = faiss.IndexIVFFlat(quantizer, dim, 224)
+    ivf.train(embeddings)
+    ivf.add(embeddings)
+    ivf.nprobe = 16
+    sq8 = faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_8bit)
+    sq8.train(embeddings)
+    sq8.add(embeddings)
+    hnsw = faiss.IndexHNSWFlat(dim, HNSW_M)
+    hnsw.add(embeddings)
+    hnsw.hnsw.efSearch = HNSW_EF_SEARCH
+    flat = faiss.IndexFlatL2(dim)
+    flat.add(embeddings)
+
+    indices = {
+        "flat": flat,
+        "ivf-flat": ivf,
+        "sq8": sq8,
+        "hnsw": hnsw,
+        "coarse-matryoshka": CoarseToFineIndex(embeddings, "matryoshka"),
+        "coarse-binary": CoarseToFineIndex(embeddings, "binary"),
+    }
+
+    results = {}
+    for name, index in indices.items():
+        case, outputs = benchmark_sync(
+            f"semantic-index-{name}",
+            "semantic",
+            lambda index=index: index.search(queries, k),
+            iterations=10,
+            warmup=1,
+            operations_per_iteration=len(queries),
+            metadata={"corpus_size": n, "dimension": dim},
+        )
+        _, ids = outputs[-1]
+        recall = np.mean(
+            [len(set(row) & set(true_row)) / k for row, true_row in zip(ids, truth, strict=True)]
+        )
+        results[name] = (recall, case.stats.p95_ms)
+
+    assert results["flat"][0] == pytest.approx(1.0)
+    assert results["coarse-matryoshka"][0] >= 0.9
+    assert results["coarse-binary"][0] >= 0.9
@@ -0,0 +1,146 @@
+"""Tests for the persistent content-addressed embedding store.
+
+Validates that:
+- Stored embeddings round-trip within float16/int8 precision, keyed by text.
+- Only texts the store has not seen are sent to the encoder.
+- Segments persist across store instances and are compacted past the limit.
+- Vectors of the wrong width are never stored.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from floridify.search.semantic import embedding_store
+from floridify.search.semantic.embedding_store import EmbeddingStore, encode_with_store
+
+DIM = 16
+
+
+def _unit_vectors(texts: list[str]) -> np.ndarray:
+    """Deterministic per-text unit vectors (stand-in for a model)."""
+    rows = []
+    for text in texts:
+        rng = np.random.default_rng(abs(hash(text)) % 2**32)
+        row = rng.standard_normal(DIM).astype(np.float32)
+        rows.append(row / np.linalg.norm(row))
+    return np.vstack(rows) if rows else np.empty((0, DIM), dtype=np.float32)
+
+
+class CountingEncoder:
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def __call__(self, texts: list[str]) -> np.ndarray:
+        self.encoded.extend(texts)
+        return _unit_vectors(texts)
+
+
+class TestEmbeddingStore:
+    @pytest.mark.parametrize(("dtype", "atol"), [("float16", 1e-3), ("int8", 1e-2)])
+    def test_round_trip(self, tmp_path, dtype: str, atol: float):
+        store = EmbeddingStore(tmp_path, DIM, dtype=dtype)
+        texts = ["apple", "banana", "cherry"]
+        vectors = _unit_vectors(texts)
+
+        assert store.add(texts, vectors) == 3
+        embeddings, found = store.lookup(["cherry", "durian", "apple"])
+
+        assert found.tolist() == [True, False, True]
+        np.testing.assert_allclose(embeddings[[0, 2]], vectors[[2, 0]], atol=atol)
+        assert not embeddings[1].any()
+
+    def test_persists_across_instances(self, tmp_path):
+        texts = ["alpha", "beta"]
+        EmbeddingStore(tmp_path, DIM).add(texts, _unit_vectors(texts))
+
+        reopened = EmbeddingStore(tmp_path, DIM)
+        _, found = reopened.lookup(texts)
+
+        assert len(reopened) == 2
+        assert found.all()
+
+    def test_existing_and_duplicate_texts_not_rewritten(self, tmp_path):
+        store = EmbeddingStore(tmp_path, DIM)
+        store.add(["one"], _unit_vectors(["one"]))
+
+        added = store.add(["one", "two", "two"], _unit_vectors(["one", "two", "two"]))
+
+        assert added == 1
+        assert len(store) == 2
+
+    def test_wrong_width_rejected(self, tmp_path):
+        store = EmbeddingStore(tmp_path, DIM)
+        assert store.add(["wide"], np.ones((1, DIM * 2), dtype=np.float32)) == 0
+        assert len(store) == 0
+
+    def test_segments_compacted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(embedding_store, "EMBEDDING_STORE_MAX_SEGMENTS", 3)
+        store = EmbeddingStore(tmp_path, DIM)
+        words = [f"word{i}" for i in range(5)]
+        for word in words:
+            store.add([word], _unit_vectors([word]))
+
+        assert store.get_stats()["segments"] <= 3
+        reopened = EmbeddingStore(tmp_path, DIM)
+        embeddings, found = reopened.lookup(words)
+        assert found.all()
+        np.testing.assert_allclose(embeddings, _unit_vectors(words), atol=1e-3)
+
+    @pytest.mark.parametrize(("dtype", "atol"), [("float16", 1e-3), ("int8", 1e-2)])
+    def test_compaction_streams_segments(self, tmp_path, monkeypatch, dtype: str, atol: float):
+        monkeypatch.setattr(embedding_store, "_COMPACT_CHUNK_ROWS", 2)
+        store = EmbeddingStore(tmp_path, DIM, dtype=dtype)
+        batches = [[f"w{i}" for i in range(start, start + 5)] for start in (0, 5, 10)]
+        for batch in batches:
+            store.add(batch, _unit_vectors(batch))
+        # A duplicate segment, as left by a concurrent writer
+        dup = store._segments[1]
+        store._segments.append(store._write_segment(dup.keys, dup.vectors, dup.scales))
+
+        store._compact()
+
+        words = [word for batch in batches for word in batch]
+        assert store.get_stats()["segments"] == 1
+        assert len(store) == len(words)
+        embeddings, found = EmbeddingStore(tmp_path, DIM, dtype=dtype).lookup(words)
+        assert found.all()
+        np.testing.assert_allclose(embeddings, _unit_vectors(words), atol=atol)
+
+
+class TestEncodeWithStore:
+    @pytest.fixture
+    def store(self, tmp_path, monkeypatch) -> EmbeddingStore:
+        store = EmbeddingStore(tmp_path, DIM)
+        monkeypatch.setattr(embedding_store, "get_embedding_store", lambda _model: store)
+        return store
+
+    def test_only_unseen_texts_encoded(self, store: EmbeddingStore):
+        master = CountingEncoder()
+        encode_with_store(["cat", "dog", "emu"], "model", master)
+
+        child = CountingEncoder()
+        embeddings = encode_with_store(["dog", "fox", "cat"], "model", child)
+
+        assert master.encoded == ["cat", "dog", "emu"]
+        assert child.encoded == ["fox"]
+        np.testing.assert_allclose(embeddings, _unit_vectors(["dog", "fox", "cat"]), atol=1e-3)
+        stats = store.get_stats()
+        assert stats["hits"] == 2 and stats["misses"] == 4
+        assert stats["hit_rate"] == pytest.approx(2 / 6)
+
+    def test_fully_cached_vocabulary_skips_encoder(self, store: EmbeddingStore):
+        words = ["red", "green", "blue"]
+        encode_with_store(words, "model", CountingEncoder())
+
+        rebuild = CountingEncoder()
+        encode_with_store(list(reversed(words)), "model", rebuild)
+
+        assert rebuild.encoded == []
+
+    def test_disabled_store_encodes_everything(self, monkeypatch):
+        monkeypatch.setattr(embedding_store, "get_embedding_store", lambda _model: None)
+        encoder = CountingEncoder()
+        encode_with_store(["a", "b"], "model", encoder)
+        assert encoder.encoded == ["a", "b"]
@@ -0,0 +1,110 @@
+"""Tests for the persistent shared-memory encoder pool.
+
+Validates that:
+- Pooled embeddings match single-process encoding row for row.
+- The pool is reused across calls and encodes in windows when /dev/shm is small.
+- A broken pool returns None (and is discarded) so callers fall back.
+- Pool vs single-process throughput (benchmark).
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from floridify.audit import (
+    benchmark_sync,
+    fake_encode_texts,
+    load_fake_sentence_model,
+)
+from floridify.search.semantic import encoder_pool
+from floridify.search.semantic.encoder import SemanticEncoder
+from floridify.search.semantic.encoder_pool import (
+    encode_with_pool,
+    get_encoder_pool,
+    shutdown_encoder_pool,
+)
+
+MODEL = "audit-fake"
+
+
+@pytest.fixture(autouse=True)
+def _stop_pool():
+    yield
+    shutdown_encoder_pool()
+
+
+class TestEncoderPool:
+    def test_matches_single_process(self):
+        texts = [f"word{i}" for i in range(1200)]
+
+        embeddings = encode_with_pool(texts, MODEL, 64, load_model=load_fake_sentence_model)
+
+        assert embeddings is not None
+        np.testing.assert_array_equal(embeddings, fake_encode_texts(texts))
+
+    def test_pool_reused_across_calls(self):
+        encode_with_pool(["a", "b"], MODEL, 8, load_model=load_fake_sentence_model)
+        pool, dimension = get_encoder_pool(MODEL, load_fake_sentence_model)
+
+        encode_with_pool(["c", "d"], MODEL, 8, load_model=load_fake_sentence_model)
+
+        assert get_encoder_pool(MODEL, load_fake_sentence_model) == (pool, dimension)
+        assert dimension == 32
+
+    def test_encodes_in_windows_when_shm_is_small(self, monkeypatch):
+        monkeypatch.setattr(encoder_pool, "_window_rows", lambda _n, _row_bytes: 300)
+        texts = [f"word{i}" for i in range(1000)]
+
+        embeddings = encode_with_pool(texts, MODEL, 64, load_model=load_fake_sentence_model)
+
+        assert embeddings is not None
+        np.testing.assert_array_equal(embeddings, fake_encode_texts(texts))
+
+    def test_broken_pool_returns_none(self):
+        # int("audit-fake") raises in the worker initializer, breaking the pool
+        assert encode_with_pool(["a"], MODEL, 8, load_model=int) is None
+        assert encoder_pool._encoder_pool is None
+
+    def test_encoder_falls_back_to_single_process(self, monkeypatch):
+        monkeypatch.setattr("floridify.search.semantic.encoder.ENCODER_POOL_MIN_TEXTS", 1)
+        monkeypatch.setattr(
+            "floridify.search.semantic.encoder.encode_with_pool", lambda *_args: None
+        )
+        encoder = SemanticEncoder()
+        encoder.sentence_model = load_fake_sentence_model(MODEL)
+
+        embeddings = encoder.encode(["x", "y"], MODEL, batch_size=8)
+
+        np.testing.assert_array_equal(embeddings, fake_encode_texts(["x", "y"]))
+
+
+@pytest.mark.performance
+@pytest.mark.semantic
+def test_encoder_pool_throughput() -> None:
+    """Texts/sec of the pooled path vs single-process encoding."""
+    texts = [f"word{i}" for i in range(20_000)]
+    model = load_fake_sentence_model(MODEL)
+    get_encoder_pool(MODEL, load_fake_sentence_model)  # Exclude worker startup
+
+    single, _ = benchmark_sync(
+        "encoder-single-process",
+        "semantic",
+        lambda: model.encode(texts),
+        iterations=3,
+        warmup=1,
+        operations_per_iteration=len(texts),
+    )
+    pooled, outputs = benchmark_sync(
+        "encoder-pool",
+        "semantic",
+        lambda: encode_with_pool(texts, MODEL, 128, load_model=load_fake_sentence_model),
+        iterations=3,
+        warmup=1,
+        operations_per_iteration=len(texts),
+        metadata={"workers": encoder_pool.encoder_pool_size()},
+    )
+
+    assert outputs[-1] is not None
+    assert single.stats.throughput_per_second > 0
+    assert pooled.stats.throughput_per_second > 0
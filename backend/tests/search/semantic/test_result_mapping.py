@@ -0,0 +1,174 @@
+"""Tests for vectorized semantic result mapping and the batched lexical gate.
+
+Validates that:
+- Fancy-indexed mapping matches the per-result dict-lookup mapping exactly.
+- The precomputed map is rebuilt when the corpus or embeddings change.
+- The lexical gate keeps exact/close or high-scoring matches and drops the rest.
+- Mapping + gate cost on top-100 result sets (benchmark).
+"""
+
+from __future__ import annotations
+
+from difflib import SequenceMatcher
+
+import numpy as np
+import pytest
+
+from floridify.audit import (
+    CORPUS_SIZES,
+    benchmark_sync,
+    build_semantic_fixture,
+    fake_encode_texts,
+)
+from floridify.search.config import LEXICAL_GATE_SCORE_MARGIN, LEXICAL_SANITY_THRESHOLD
+from floridify.search.constants import SearchMethod
+from floridify.search.engine import Search
+from floridify.search.result import SearchResult
+from floridify.text import normalize
+
+
+def _reference_map(semantic_search, distances, indices, max_results, min_score):
+    """Per-result mapping as done before vectorization."""
+    corpus = semantic_search.corpus
+    similarities = 1 - distances / 2
+    results = []
+    for embedding_idx, similarity in zip(indices, similarities, strict=True):
+        if embedding_idx < 0 or similarity < min_score:
+            continue
+        if embedding_idx >= len(semantic_search.sentence_embeddings):
+            continue
+        lemma_idx = semantic_search.index.variant_mapping.get(embedding_idx, embedding_idx)
+        if lemma_idx >= len(corpus.lemmatized_vocabulary):
+            continue
+        lemma = corpus.lemmatized_vocabulary[lemma_idx]
+        word_indices = corpus.lemma_to_word_indices.get(lemma_idx)
+        word = corpus.get_original_word_by_index(word_indices[0]) if word_indices else lemma
+        if word:
+            results.append((word, lemma, float(similarity)))
+        if len(results) >= max_results:
+            break
+    return results
+
+
+def _reference_gate(query, results, floor):
+    return [
+        result
+        for result in results
+        if SequenceMatcher(None, query, normalize(result.word)).ratio() >= LEXICAL_SANITY_THRESHOLD
+        or result.score >= floor + LEXICAL_GATE_SCORE_MARGIN
+    ]
+
+
+async def _semantic_search(name: str, size: int):
+    _, _, semantic_search = await build_semantic_fixture(name, size)
+    semantic_search.sentence_embeddings = fake_encode_texts(
+        semantic_search.corpus.lemmatized_vocabulary
+    )
+    return semantic_search
+
+
+def _faiss_row(num_embeddings: int, k: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    indices = rng.choice(num_embeddings, size=k, replace=False).astype(np.int64)
+    distances = np.sort(rng.uniform(0.0, 0.8, size=k)).astype(np.float32)
+    indices[-3:] = -1  # FAISS padding
+    return distances, indices
+
+
+@pytest.mark.asyncio
+class TestResultMapping:
+    async def test_matches_reference_mapping(self):
+        semantic_search = await _semantic_search("mapping-reference", CORPUS_SIZES["small"])
+        num_embeddings = len(semantic_search.sentence_embeddings)
+
+        for seed in range(5):
+            distances, indices = _faiss_row(num_embeddings, 110, seed)
+            results = semantic_search._map_search_results(distances, indices, 100, 0.7)
+
+            expected = _reference_map(semantic_search, distances, indices, 100, 0.7)
+            assert [(r.word, r.lemmatized_word, r.score) for r in results] == expected
+            assert all(r.method == SearchMethod.SEMANTIC for r in results)
+
+    async def test_map_rebuilt_when_embeddings_change(self):
+        semantic_search = await _semantic_search("mapping-rebuild", CORPUS_SIZES["tiny"])
+        first = semantic_search._get_result_map()
+        assert semantic_search._get_result_map() is first
+
+        semantic_search.sentence_embeddings = semantic_search.sentence_embeddings[:10]
+
+        has_word, _, _ = semantic_search._get_result_map()
+        assert len(has_word) == 10
+
+
+class TestLexicalGate:
+    def test_keeps_close_or_confident_matches(self):
+        results = [
+            SearchResult(word="happy", score=0.80, method=SearchMethod.SEMANTIC),
+            SearchResult(word="happily", score=0.80, method=SearchMethod.SEMANTIC),
+            SearchResult(word="joyful", score=0.80, method=SearchMethod.SEMANTIC),
+            SearchResult(word="cheerful", score=0.90, method=SearchMethod.SEMANTIC),
+        ]
+
+        kept = Search._lexical_gate("happy", results, 0.78)
+
+        assert [result.word for result in kept] == ["happy", "happily", "cheerful"]
+
+    def test_empty_results(self):
+        assert Search._lexical_gate("happy", [], 0.78) == []
+
+    @pytest.mark.asyncio
+    async def test_agrees_with_sequence_matcher_on_vocabulary(self):
+        semantic_search = await _semantic_search("gate-reference", CORPUS_SIZES["small"])
+        words = semantic_search.corpus.vocabulary[:200]
+        results = [
+            SearchResult(word=word, score=0.80, method=SearchMethod.SEMANTIC) for word in words
+        ]
+
+        kept = {result.word for result in Search._lexical_gate(words[0], results, 0.78)}
+        expected = {result.word for result in _reference_gate(words[0], results, 0.78)}
+
+        # Indel ratio is an LCS bound on difflib's block matching: never stricter
+        assert expected <= kept
+
+
+@pytest.mark.performance
+@pytest.mark.semantic
+@pytest.mark.asyncio
+async def test_result_mapping_and_gate_top100() -> None:
+    """Vectorized vs per-result mapping + lexical gate on top-100 result sets."""
+    semantic_search = await _semantic_search("mapping-bench", CORPUS_SIZES["large"])
+    num_embeddings = len(semantic_search.sentence_embeddings)
+    rows = [_faiss_row(num_embeddings, 110, seed) for seed in range(20)]
+    query = semantic_search.corpus.vocabulary[0]
+    semantic_search._get_result_map()  # Exclude the one-time map build
+
+    def vectorized():
+        for distances, indices in rows:
+            results = semantic_search._map_search_results(distances, indices, 100, 0.0)
+            Search._lexical_gate(query, results, 0.78)
+
+    def per_result():
+        for distances, indices in rows:
+            mapped = _reference_map(semantic_search, distances, indices, 100, 0.0)
+            results = [
+                SearchResult(word=w, lemmatized_word=lemma, score=s, method=SearchMethod.SEMANTIC)
+                for w, lemma, s in mapped
+            ]
+            _reference_gate(query, results, 0.78)
+
+    fast, _ = benchmark_sync(
+        "semantic-map-vectorized",
+        "semantic",
+        vectorized,
+        iterations=10,
+        operations_per_iteration=len(rows),
+    )
+    slow, _ = benchmark_sync(
+        "semantic-map-per-result",
+        "semantic",
+        per_result,
+        iterations=10,
+        operations_per_iteration=len(rows),
+    )
+
+    assert fast.stats.mean_ms <= slow.stats.mean_ms
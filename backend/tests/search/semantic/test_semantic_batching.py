@@ -0,0 +1,184 @@
+"""Semantic query micro-batching -- coalescing, parity, and failure handling.
+
+Tests QueryBatcher and SemanticSearch.search under concurrency:
+- Concurrent queries share one forward pass and one FAISS search
+- Each caller gets the same rows a solo search would return
+- Precomputed embeddings skip encoding; full batches flush early
+- Queries that queue up behind a running batch go out as one batch
+- Errors reach every caller; cancelled callers don't block the batch
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+
+import faiss
+import numpy as np
+import pytest
+
+from floridify.search.semantic.batcher import QueryBatcher
+
+_DIM = 16
+
+
+def _vector(text: str) -> np.ndarray:
+    seed = int.from_bytes(hashlib.blake2b(text.encode(), digest_size=4).digest(), "little")
+    vector = np.random.default_rng(seed).standard_normal(_DIM).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+class _RecordingModel:
+    """Deterministic text -> vector encoder plus a flat FAISS index, recording calls."""
+
+    def __init__(self, vocabulary: list[str]) -> None:
+        self.index = faiss.IndexFlatL2(_DIM)
+        self.index.add(np.vstack([_vector(w) for w in vocabulary]))
+        self.encode_calls: list[list[str]] = []
+        self.search_calls: list[int] = []
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        self.encode_calls.append(list(texts))
+        return np.vstack([_vector(t) for t in texts])
+
+    def search(self, matrix: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        self.search_calls.append(len(matrix))
+        return self.index.search(matrix, k)
+
+
+_VOCABULARY = [f"word{i}" for i in range(200)]
+
+
+@pytest.mark.asyncio
+class TestQueryBatcher:
+    async def test_concurrent_queries_share_one_batch(self):
+        model = _RecordingModel(_VOCABULARY)
+        batcher = QueryBatcher(model.encode, model.search, window_ms=20)
+        queries = [f"query {i}" for i in range(8)]
+
+        results = await asyncio.gather(*(batcher.submit(q, None, 5) for q in queries))
+
+        assert model.encode_calls == [queries]
+        assert model.search_calls == [8]
+        for query, (embedding, distances, indices) in zip(queries, results, strict=True):
+            solo_distances, solo_indices = model.index.search(_vector(query)[None, :], 5)
+            np.testing.assert_allclose(embedding, _vector(query))
+            np.testing.assert_array_equal(indices, solo_indices[0])
+            np.testing.assert_allclose(distances, solo_distances[0], rtol=1e-5)
+
+        stats = batcher.stats.to_dict()
+        assert stats["batches"] == 1
+        assert stats["max_batch_size"] == 8
+        assert stats["batch_sizes"] == {8: 1}
+        assert stats["max_queue_ms"] >= 0
+
+    async def test_mixed_k_and_precomputed_embeddings(self):
+        model = _RecordingModel(_VOCABULARY)
+        batcher = QueryBatcher(model.encode, model.search, window_ms=20)
+
+        (_, _, few), (_, _, many), _ = await asyncio.gather(
+            batcher.submit("needs encoding", None, 3),
+            batcher.submit("word7", _vector("word7"), 10),
+            batcher.submit("needs encoding", None, 3),
+        )
+
+        assert model.encode_calls == [["needs encoding"]]
+        assert len(few) == 3
+        assert len(many) == 10
+        assert many[0] == 7
+
+    async def test_full_batch_flushes_before_window(self):
+        model = _RecordingModel(_VOCABULARY)
+        batcher = QueryBatcher(model.encode, model.search, window_ms=10_000, max_batch_size=4)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(batcher.submit(f"q{i}", None, 2) for i in range(4))), timeout=5
+        )
+
+        assert len(results) == 4
+        assert model.search_calls == [4]
+
+    async def test_batches_run_one_at_a_time(self):
+        model = _RecordingModel(_VOCABULARY)
+        batcher = QueryBatcher(model.encode, model.search, window_ms=1, max_batch_size=2)
+
+        await asyncio.gather(*(batcher.submit(f"q{i}", None, 2) for i in range(6)))
+
+        assert model.search_calls == [2, 2, 2]
+        assert batcher.stats.queries == 6
+
+    async def test_queries_queued_behind_a_batch_coalesce(self):
+        model = _RecordingModel(_VOCABULARY)
+
+        def slow_encode(texts: list[str]) -> np.ndarray:
+            time.sleep(0.2)
+            return model.encode(texts)
+
+        batcher = QueryBatcher(slow_encode, model.search, window_ms=1)
+
+        async def submit_later(i: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+            # Each arrives after the previous window closed, while the first batch runs
+            await asyncio.sleep(0.02 + 0.01 * i)
+            return await batcher.submit(f"late {i}", None, 2)
+
+        await asyncio.gather(batcher.submit("first", None, 2), *(submit_later(i) for i in range(6)))
+
+        assert model.search_calls == [1, 6]
+        assert model.encode_calls[1] == [f"late {i}" for i in range(6)]
+
+    async def test_error_reaches_every_caller(self):
+        def failing_encode(texts: list[str]) -> np.ndarray:
+            raise ValueError("model unavailable")
+
+        model = _RecordingModel(_VOCABULARY)
+        batcher = QueryBatcher(failing_encode, model.search, window_ms=5)
+
+        results = await asyncio.gather(
+            batcher.submit("a", None, 3), batcher.submit("b", None, 3), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert batcher.stats.batches == 0
+
+    async def test_cancelled_caller_is_skipped(self):
+        model = _RecordingModel(_VOCABULARY)
+        batcher = QueryBatcher(model.encode, model.search, window_ms=20)
+
+        cancelled = asyncio.create_task(batcher.submit("gone", None, 3))
+        kept = asyncio.create_task(batcher.submit("kept", None, 3))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+
+        _, _, indices = await kept
+        assert len(indices) == 3
+        assert model.encode_calls == [["kept"]]
+
+
+@pytest.mark.asyncio
+class TestSemanticSearchBatching:
+    async def test_concurrent_searches_match_solo_searches(self):
+        from floridify.corpus.core import Corpus
+        from floridify.search.semantic.search import SemanticSearch
+
+        corpus = await Corpus.create(corpus_name="sem-batching", vocabulary=_VOCABULARY)
+        lemmas = list(corpus.lemmatized_vocabulary)
+        model = _RecordingModel(lemmas)
+
+        search = SemanticSearch(corpus=corpus)
+        search.sentence_embeddings = np.vstack([_vector(w) for w in lemmas])
+        search.sentence_index = model.index
+        search._encoder.encode = lambda texts, *_: model.encode(texts)  # type: ignore[method-assign]
+
+        queries = [f"out of vocabulary {i}" for i in range(6)]
+        batched = await asyncio.gather(*(search.search(q, max_results=5) for q in queries))
+
+        assert len(model.encode_calls) == 1
+        assert search.get_stats()["initialized"] is False  # no SemanticIndex attached
+        assert search._batcher.stats.max_batch_size == 6
+
+        # Solo searches hit the result cache; clear it to recompute one at a time
+        search._query_cache_manager.clear_result_cache()
+        for query, results in zip(queries, batched, strict=True):
+            solo = await search.search(query, max_results=5)
+            assert [r.word for r in results] == [r.word for r in solo]
@@ -0,0 +1,77 @@
+"""Batched search -- parity with per-query search + throughput.
+
+Tests Search.search_many including:
+- Result parity with search_with_mode for every mode
+- Input order, duplicates, and empty queries preserved positionally
+- One batch call amortizing per-query overhead at 278K
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from floridify.search.constants import SearchMode
+from tests.search.conftest import (
+    SMART_QUERIES,
+    _fmt,
+    _label,
+    _run_timed_async,
+)
+
+_BATCH_QUERIES = ["apple", "elefant", "aple", "hapy", "mountian", "computer", "xyz"]
+
+
+def _words(results) -> list[str]:
+    return [r.word for r in results]
+
+
+@pytest.mark.asyncio
+class TestSearchMany:
+    # ── Correctness: parity with per-query search ─────────────────
+
+    @pytest.mark.parametrize("mode", [SearchMode.SMART, SearchMode.EXACT, SearchMode.FUZZY])
+    async def test_matches_per_query(self, small_engine, mode):
+        batch = await small_engine.search_many(_BATCH_QUERIES, mode=mode, max_results=10)
+        assert len(batch) == len(_BATCH_QUERIES)
+        for query, results in zip(_BATCH_QUERIES, batch):
+            single = await small_engine.search_with_mode(query, mode=mode, max_results=10)
+            assert _words(results) == _words(single), f"{mode.value} mismatch for {query!r}"
+
+    async def test_preserves_order_and_duplicates(self, small_engine):
+        queries = ["elefant", "apple", "elefant", "", "apple"]
+        batch = await small_engine.search_many(queries, max_results=5)
+
+        assert len(batch) == len(queries)
+        assert batch[3] == []
+        assert _words(batch[0]) == _words(batch[2])
+        assert _words(batch[1]) == _words(batch[4])
+        assert "elephant" in [w.lower() for w in _words(batch[0])]
+        assert batch[1][0].word.lower() == "apple"
+
+    async def test_empty_batch(self, small_engine):
+        assert await small_engine.search_many([]) == []
+
+    # ── Performance: one batch vs. N sequential calls ─────────────
+
+    @pytest.mark.performance
+    async def test_batch_vs_sequential(self, large_engine, large_corpus):
+        queries = list(SMART_QUERIES) * 4
+
+        async def sequential():
+            return [
+                await large_engine.search_with_mode(q, mode=SearchMode.SMART, max_results=10)
+                for q in queries
+            ]
+
+        async def batched():
+            return await large_engine.search_many(queries, max_results=10)
+
+        seq_stats, seq_results = await _run_timed_async(sequential, iterations=5, warmup=1)
+        batch_stats, batch_results = await _run_timed_async(batched, iterations=5, warmup=1)
+
+        label = _label(large_corpus)
+        print(f"\n  [{label}] sequential x{len(queries)}: {_fmt(seq_stats)}")
+        print(f"  [{label}] search_many x{len(queries)}: {_fmt(batch_stats)}")
+
+        assert len(batch_results) == len(seq_results)
+        assert batch_stats["median_ms"] <= seq_stats["median_ms"] * 1.5
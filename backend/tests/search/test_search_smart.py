@@ -4,16 +4,19 @@ Tests the _smart_search_cascade including:
 - Exact match early exit (skips fuzzy/semantic when word IS in dictionary)
 - Typo correction via fuzzy (misspellings found at all corpus scales)
 - Pathological query performance (short nonsense, very long words, common prefixes)
-- Cascade time budget enforcement
+- Cascade time budget enforcement (stage cancellation, event loop never blocked)
 - BK-tree node visit cap effectiveness
 """
 
 from __future__ import annotations
 
+import asyncio
 import time
 
 import pytest
 
+from floridify.search import engine as engine_module
+from floridify.search.config import CASCADE_MAX_ABANDONED_STAGES
 from floridify.search.constants import SearchMethod, SearchMode
 
 from tests.search.conftest import (
@@ -266,6 +269,66 @@ class TestSmartSearch:
                 f"Cascade for '{q}' took {elapsed_ms:.1f}ms — exceeds 100ms ceiling"
             )
 
+    async def test_stage_timings_reported(self, small_engine):
+        timings: dict = {}
+        await small_engine.search_with_mode(
+            "elefant", mode=SearchMode.SMART, max_results=10, stage_timings=timings
+        )
+
+        for stage in ("exact", "prefix", "substring", "fuzzy", "total"):
+            assert stage in timings, f"missing {stage} timing: {timings}"
+        assert "cancelled" not in timings
+        assert timings["total"] >= timings["fuzzy"]
+
+    async def test_slow_stage_cancelled_at_budget(self, small_engine, monkeypatch):
+        """A stage still running at the deadline is abandoned, and the event
+        loop keeps serving other work while stages run."""
+        monkeypatch.setattr(small_engine, "search_fuzzy", lambda *args: time.sleep(0.3) or [])
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.005)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        timings: dict = {}
+        t0 = time.perf_counter()
+        results = await small_engine.search_with_mode(
+            "elefant", mode=SearchMode.SMART, max_results=10, stage_timings=timings
+        )
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        ticker_task.cancel()
+
+        assert elapsed_ms < 150, f"Cascade waited {elapsed_ms:.0f}ms for a cancelled stage"
+        assert timings["cancelled"] == ["fuzzy"]
+        assert "substring" in timings  # Ran concurrently and finished
+        assert all(r.method != SearchMethod.FUZZY for r in results)
+        assert ticks >= 3, "Event loop was blocked while cascade stages ran"
+
+    async def test_abandoned_fuzzy_stages_are_bounded(self, small_engine, monkeypatch):
+        """Fuzzy calls still running past the deadline hold cascade workers, so
+        once too many are in flight the cascade stops queueing more."""
+        while engine_module._abandoned_stages:  # Left over from an earlier test
+            await asyncio.sleep(0.01)
+        monkeypatch.setattr(small_engine, "search_fuzzy", lambda *args: time.sleep(0.3) or [])
+
+        cancelled = []
+        for query in ("elefant", "elephnt", "elepant", "elefent"):
+            timings: dict = {}
+            await small_engine.search_with_mode(
+                query, mode=SearchMode.SMART, max_results=10, stage_timings=timings
+            )
+            cancelled.append(timings["cancelled"])
+
+        assert cancelled == [["fuzzy"]] * 4
+        assert len(engine_module._abandoned_stages) == CASCADE_MAX_ABANDONED_STAGES
+
+        await asyncio.sleep(0.35)
+        assert not engine_module._abandoned_stages
+
     # --- Performance ---
 
     async def test_smart_perf_small(self, small_engine, small_corpus):
@@ -0,0 +1,86 @@
+"""Prefix completion index tests -- ranking parity and short-prefix latency."""
+
+from __future__ import annotations
+
+import random
+import string
+
+import pytest
+
+from floridify.audit import benchmark_sync
+from floridify.search.trie.completion import PrefixCompletionIndex
+
+
+def _vocabulary(size: int, seed: int = 7) -> tuple[list[str], dict[str, int]]:
+    rng = random.Random(seed)
+    letters = string.ascii_lowercase[:8]  # Few letters -> many heavy short prefixes
+    words = {"".join(rng.choice(letters) for _ in range(rng.randint(1, 9))) for _ in range(size)}
+    frequencies = {word: rng.randint(0, 50) for word in words if rng.random() < 0.8}
+    return sorted(words), frequencies
+
+
+def _brute_force(
+    words: list[str], frequencies: dict[str, int], prefix: str, limit: int
+) -> list[str]:
+    matches = [word for word in words if word.startswith(prefix)]
+    matches.sort(key=lambda word: (-frequencies.get(word, 0), word))
+    return matches[:limit]
+
+
+class TestPrefixCompletionIndex:
+    @pytest.mark.parametrize(("k", "min_range"), [(8, 8), (16, 64), (64, 256)])
+    def test_matches_brute_force(self, k: int, min_range: int):
+        words, frequencies = _vocabulary(5_000)
+        index = PrefixCompletionIndex(words, frequencies, k=k, min_range=min_range)
+
+        prefixes = sorted({word[:n] for word in words[::37] for n in range(1, 5)})
+        for prefix in prefixes + ["zz", "a" * 12]:
+            for limit in (1, 5, k, k + 3):
+                assert index.complete(prefix, limit) == _brute_force(
+                    words, frequencies, prefix, limit
+                ), (prefix, limit)
+
+    def test_exact_word_that_is_also_a_prefix(self):
+        words = ["cat", "catch", "catfish", "cats"]
+        index = PrefixCompletionIndex(words, {"cats": 3, "cat": 2}, k=2, min_range=2)
+
+        assert index.complete("cat", 3) == ["cats", "cat", "catch"]
+        assert index.complete("cats", 5) == ["cats"]
+
+    def test_unsorted_input_and_missing_frequencies(self):
+        index = PrefixCompletionIndex(["dog", "dodge", "dogma", "do"])
+
+        # No frequency data: alphabetical
+        assert index.complete("do", 10) == ["do", "dodge", "dog", "dogma"]
+        assert index.complete("", 2) == ["do", "dodge"]
+        assert index.complete("x", 10) == []
+        assert index.complete("do", 0) == []
+
+    def test_heavy_prefixes_are_precomputed(self):
+        words, frequencies = _vocabulary(5_000)
+        index = PrefixCompletionIndex(words, frequencies, k=16, min_range=64)
+
+        for letter in "abcdefgh":
+            lo, hi = index.range(letter)
+            assert hi - lo > 64
+            assert letter in index._top
+
+
+@pytest.mark.performance
+def test_short_prefix_latency():
+    """Short prefixes match most of the vocabulary; lookups must not scale with that."""
+    words, frequencies = _vocabulary(200_000, seed=11)
+    index = PrefixCompletionIndex(words, frequencies)
+
+    case, results = benchmark_sync(
+        "prefix-completion-short",
+        "search",
+        lambda: [index.complete(prefix, 20) for prefix in ("a", "b", "ab", "ca", "dfe")],
+        iterations=50,
+        warmup=5,
+        operations_per_iteration=5,
+        metadata={"vocabulary": len(words)},
+    )
+
+    assert all(len(completions) == 20 for completions in results[0])
+    assert case.stats.p95_ms < 5.0, f"p95 {case.stats.p95_ms:.2f}ms for 5 short prefixes"
@@ -0,0 +1,112 @@
+"""Tests for the persistent word -> lemma table.
+
+Validates that:
+- Tables round-trip through disk and are memory-mapped on reload.
+- batch_lemmatize serves table hits and only lemmatizes misses.
+- Large batches persist their misses; small (per-query) batches don't.
+- Results are identical with and without the table.
+"""
+
+import importlib
+
+import pytest
+
+from floridify.text.lemmas import (
+    LemmaTable,
+    build_lemma_table,
+    get_lemma_table,
+    get_lemma_table_path,
+    reset_lemma_tables,
+)
+from floridify.text.normalize import batch_lemmatize, lemmatize_comprehensive
+
+# floridify.text re-exports a normalize() function that shadows the submodule
+text_normalize = importlib.import_module("floridify.text.normalize")
+
+_WORDS = ["running", "geese", "studies", "better", "walked", "mice", "ice cream", "a"]
+
+
+@pytest.fixture
+def lemma_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("FLORIDIFY_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(text_normalize, "LEMMA_TABLE_MIN_PERSIST", 4)
+    reset_lemma_tables()
+    yield tmp_path
+    reset_lemma_tables()
+
+
+def _count_computed(monkeypatch) -> list[int]:
+    calls: list[int] = []
+    compute = text_normalize._compute_lemmas
+
+    def counting(words, *args, **kwargs):
+        calls.append(len(words))
+        return compute(words, *args, **kwargs)
+
+    monkeypatch.setattr(text_normalize, "_compute_lemmas", counting)
+    return calls
+
+
+class TestLemmaTable:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "lemmas.marisa"
+        table = LemmaTable(path)
+        assert table.lookup(["geese"]) == [None]
+
+        assert table.update({"geese": "goose", "ran": "run", "": "x"}) == 2
+        assert table.update({"geese": "other"}) == 0
+
+        reloaded = LemmaTable(path)
+        assert len(reloaded) == 2
+        assert reloaded.lookup(["geese", "ran", "unknown"]) == ["goose", "run", None]
+
+    def test_unicode_entries(self, tmp_path):
+        table = LemmaTable(tmp_path / "lemmas.marisa")
+        table.update({"cafés": "café"})
+        assert LemmaTable(table.path).lookup(["cafés"]) == ["café"]
+
+    def test_build_from_words(self, lemma_cache):
+        table = build_lemma_table(
+            lambda words: [w.upper() for w in words], words=["b", "a"], include_wordnet=False
+        )
+        assert table.lookup(["a", "b"]) == ["A", "B"]
+        assert get_lemma_table_path().exists()
+
+
+class TestBatchLemmatizeWithTable:
+    def test_matches_untabled_results(self, lemma_cache, monkeypatch):
+        with_table = batch_lemmatize(_WORDS)
+        cached = batch_lemmatize(_WORDS)
+        monkeypatch.setattr(text_normalize, "LEMMA_TABLE_ENABLED", False)
+        without_table = batch_lemmatize(_WORDS)
+
+        assert with_table == cached == without_table
+        unique, word_to_lemma, _ = with_table
+        assert [unique[i] for i in word_to_lemma] == [lemmatize_comprehensive(w) for w in _WORDS]
+
+    def test_only_misses_are_lemmatized(self, lemma_cache, monkeypatch):
+        calls = _count_computed(monkeypatch)
+
+        batch_lemmatize(_WORDS)
+        batch_lemmatize(_WORDS + ["children", "running"])
+
+        assert calls == [len(_WORDS), 1]
+        assert len(get_lemma_table()) == len(_WORDS)  # one miss is below the persist minimum
+
+    def test_small_batches_not_persisted(self, lemma_cache, monkeypatch):
+        calls = _count_computed(monkeypatch)
+
+        batch_lemmatize(["geese"])
+        batch_lemmatize(["geese"])
+
+        assert calls == [1, 1]
+        assert len(get_lemma_table()) == 0
+
+    def test_table_survives_restart(self, lemma_cache, monkeypatch):
+        batch_lemmatize(_WORDS)
+        reset_lemma_tables()
+        calls = _count_computed(monkeypatch)
+
+        batch_lemmatize(_WORDS)
+
+        assert calls == []
@@ -0,0 +1,93 @@
+"""Tests for the persistent text worker pool.
+
+Validates that:
+- batch_normalize / batch_lemmatize reuse one long-lived pool across calls.
+- Parallel results match the serial paths, in input order.
+- Chunking spreads work across workers and respects explicit sizes.
+- Shutdown releases the pool and the next batch restarts it.
+"""
+
+import importlib
+
+import pytest
+
+from floridify.text.normalize import (
+    _chunk_evenly,
+    _lemmatize_chunk,
+    batch_lemmatize,
+    batch_normalize,
+    get_text_pool,
+    normalize_comprehensive,
+    shutdown_text_pool,
+)
+
+# floridify.text re-exports a normalize() function that shadows the submodule
+text_normalize = importlib.import_module("floridify.text.normalize")
+
+_WORDS = ["running", "Café", "geese", "better", "don't", "Well-known", "studies", "ran"]
+
+
+def _vocabulary(size: int) -> list[str]:
+    return [f"{_WORDS[i % len(_WORDS)]}{i // len(_WORDS)}" for i in range(size)]
+
+
+@pytest.fixture
+def text_pool(monkeypatch):
+    monkeypatch.setattr(text_normalize, "TEXT_POOL_WORKERS", 2)
+    # Exercise the pool rather than the persistent lemma table
+    monkeypatch.setattr(text_normalize, "LEMMA_TABLE_ENABLED", False)
+    shutdown_text_pool()
+    yield
+    shutdown_text_pool()
+
+
+class TestChunking:
+    def test_several_chunks_per_worker(self):
+        chunks = _chunk_evenly(list(range(80_000)), n_workers=4)
+        assert len(chunks) == 16
+        assert [x for chunk in chunks for x in chunk] == list(range(80_000))
+
+    def test_minimum_chunk_size(self):
+        chunks = _chunk_evenly(list(range(5000)), n_workers=8)
+        assert all(len(chunk) >= 1000 for chunk in chunks[:-1])
+
+    def test_explicit_chunk_size(self):
+        chunks = _chunk_evenly(list(range(10)), n_workers=2, chunk_size=3)
+        assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+
+
+class TestTextWorkerPool:
+    def test_pool_reused_across_batches(self, text_pool):
+        vocabulary = _vocabulary(6000)
+
+        batch_normalize(vocabulary, min_parallel_size=5000)
+        pool = get_text_pool()
+        pids = set(pool._processes)
+
+        batch_normalize(vocabulary, min_parallel_size=5000)
+        batch_lemmatize(_vocabulary(12_000))
+
+        assert get_text_pool() is pool
+        assert set(pool._processes) == pids
+
+    def test_batch_normalize_matches_serial(self, text_pool):
+        vocabulary = _vocabulary(6000) + [""]
+        parallel = batch_normalize(vocabulary, min_parallel_size=5000)
+        assert parallel == [normalize_comprehensive(w) for w in vocabulary if w]
+
+    def test_batch_lemmatize_matches_serial(self, text_pool):
+        words = _vocabulary(12_000)
+        unique, word_to_lemma, _ = batch_lemmatize(words)
+
+        expected = _lemmatize_chunk(words)
+        assert [unique[i] for i in word_to_lemma] == expected
+
+    def test_shutdown_restarts_on_next_use(self, text_pool):
+        batch_normalize(_vocabulary(6000), min_parallel_size=5000)
+        first = get_text_pool()
+
+        shutdown_text_pool()
+        assert text_normalize._text_pool is None
+
+        batch_normalize(_vocabulary(6000), min_parallel_size=5000)
+        assert get_text_pool() is not first
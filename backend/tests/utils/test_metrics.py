@@ -0,0 +1,152 @@
+"""Tests for the log-linear latency histograms and Prometheus exposition.
+
+Validates that:
+- Quantiles stay within one sub-bucket of the exact value across decades.
+- Prometheus buckets are cumulative, power-of-two bounded, and end at +Inf.
+- Snapshots from other processes merge into /metrics output.
+- Recording overhead per observation (benchmark).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+
+import pytest
+
+from floridify.audit import benchmark_sync
+from floridify.utils import metrics
+from floridify.utils.metrics import (
+    HISTOGRAM_SUB_BUCKETS,
+    HistogramSeries,
+    MetricsRegistry,
+    collect_metrics,
+    flush_metrics,
+    render_prometheus,
+)
+
+
+def _exact_quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[round(q * (len(ordered) - 1))]
+
+
+class TestHistogramSeries:
+    def test_quantiles_within_one_sub_bucket(self):
+        rng = random.Random(7)
+        values = [rng.lognormvariate(-5.0, 1.5) for _ in range(20_000)]  # ~0.1ms..1s
+        series = HistogramSeries()
+        for value in values:
+            series.observe(value)
+
+        for q in (0.5, 0.9, 0.99):
+            exact = _exact_quantile(values, q)
+            estimate = series.quantile(q)
+            assert estimate is not None
+            assert abs(estimate - exact) / exact <= 1 / HISTOGRAM_SUB_BUCKETS
+
+    def test_empty_and_out_of_range(self):
+        series = HistogramSeries()
+        assert series.quantile(0.5) is None
+
+        series.observe(0.0)
+        series.observe(10_000.0)
+
+        assert series.count == 2
+        assert series.counts[0] == 1 and series.counts[-1] == 1
+
+    def test_prometheus_buckets_are_cumulative(self):
+        series = HistogramSeries()
+        for value in (0.001, 0.002, 0.01, 0.5, 100.0):
+            series.observe(value)
+
+        buckets = series.prometheus_buckets()
+        bounds = [bound for bound, _ in buckets]
+        counts = [count for _, count in buckets]
+
+        assert bounds == sorted(bounds) and bounds[-1] == float("inf")
+        assert counts == sorted(counts) and counts[-1] == 5
+        assert dict(buckets)[0.5] == 3  # 0.5 itself falls in the [0.5, 1) octave
+
+
+class TestRegistry:
+    def test_render_prometheus_text(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("demo_seconds", "Demo latency", ("route",))
+        errors = registry.counter("demo_errors_total", "Demo errors", ("route",))
+        latency.observe(0.003, '/a"b')
+        errors.inc("/a")
+
+        text = render_prometheus(registry)
+
+        assert "# TYPE demo_seconds histogram" in text
+        assert 'demo_seconds_bucket{route="/a\\"b",le="+Inf"} 1' in text
+        assert 'demo_seconds_count{route="/a\\"b"} 1' in text
+        assert 'demo_errors_total{route="/a"} 1.0' in text
+
+    def test_label_arity_checked(self):
+        registry = MetricsRegistry()
+        family = registry.histogram("demo_seconds", "Demo latency", ("route",))
+        with pytest.raises(ValueError):
+            family.observe(0.1, "/a", "extra")
+
+    def test_merge_snapshot(self):
+        first, second = MetricsRegistry(), MetricsRegistry()
+        for registry, value in ((first, 0.01), (second, 0.02)):
+            registry.histogram("demo_seconds", "Demo latency", ("route",)).observe(value, "/a")
+
+        first.merge_snapshot(second.snapshot())
+
+        series = first.families["demo_seconds"].labels("/a")
+        assert series.count == 2
+        assert series.sum == pytest.approx(0.03)
+
+
+class TestMultiProcess:
+    def test_collect_merges_other_process_snapshots(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(metrics, "REGISTRY", MetricsRegistry())
+        metrics.REGISTRY.histogram("demo_seconds", "Demo latency").observe(0.01)
+
+        other = MetricsRegistry()
+        other.histogram("demo_seconds", "Demo latency").observe(0.02)
+        (tmp_path / f"{os.getpid() + 1}.json").write_text(json.dumps(other.snapshot()))
+        (tmp_path / "broken.json").write_text("{")
+
+        merged = collect_metrics(tmp_path)
+
+        assert merged.families["demo_seconds"].labels().count == 2
+
+    def test_own_snapshot_not_double_counted(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(metrics, "REGISTRY", MetricsRegistry())
+        metrics.REGISTRY.histogram("demo_seconds", "Demo latency").observe(0.01)
+
+        flush_metrics(tmp_path)
+        merged = collect_metrics(tmp_path)
+
+        assert (tmp_path / f"{os.getpid()}.json").exists()
+        assert merged.families["demo_seconds"].labels().count == 1
+
+
+@pytest.mark.performance
+def test_histogram_observe_overhead() -> None:
+    """Per-observation cost of a labelled histogram."""
+    registry = MetricsRegistry()
+    family = registry.histogram("bench_seconds", "Bench latency", ("route",))
+    rng = random.Random(0)
+    values = [rng.lognormvariate(-5.0, 1.5) for _ in range(10_000)]
+
+    def observe_all():
+        for value in values:
+            family.observe(value, "/api/v1/lookup/{word}")
+
+    case, _ = benchmark_sync(
+        "histogram-observe",
+        "metrics",
+        observe_all,
+        iterations=5,
+        warmup=1,
+        operations_per_iteration=len(values),
+    )
+
+    assert case.stats.throughput_per_second > 0
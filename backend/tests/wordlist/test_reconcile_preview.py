@@ -4,10 +4,10 @@ from types import SimpleNamespace
 
 import pytest
 
+from floridify.api.repositories.wordlist_repository import WordListEntryInput
 from floridify.models.base import Language
 from floridify.search.constants import SearchMethod, SearchMode
 from floridify.search.result import SearchResult
-from floridify.api.repositories.wordlist_repository import WordListEntryInput
 from floridify.wordlist.reconcile import build_reconcile_preview
 
 
@@ -34,9 +34,22 @@ class _FakeLanguageSearch:
             ][:max_results]
         return []
 
+    async def search_many(
+        self,
+        queries: list[str],
+        mode: SearchMode = SearchMode.SMART,
+        max_results: int = 20,
+        min_score: float | None = None,
+    ) -> list[list[SearchResult]]:
+        return [
+            await self.search_with_mode(query, mode, max_results, min_score) for query in queries
+        ]
+
 
 @pytest.mark.asyncio
-async def test_reconcile_preview_classifies_exact_and_ambiguous(monkeypatch: pytest.MonkeyPatch) -> None:
+async def test_reconcile_preview_classifies_exact_and_ambiguous(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
     from floridify.wordlist import reconcile as reconcile_module
 
     exact_doc = SimpleNamespace(id="word-1", text="apple", normalized="apple")
@@ -83,3 +96,40 @@ async def test_reconcile_preview_classifies_exact_and_ambiguous(monkeypatch: pyt
     assert response.exact[0].resolved_text == "apple"
     assert response.ambiguous[0].resolved_text == "the"
     assert response.ambiguous[0].candidates[0].word == "the"
+
+
+class _FailingBatchSearch(_FakeLanguageSearch):
+    """Batch call fails; per-query search fails only for ``boom``."""
+
+    async def search_with_mode(self, query: str, *args, **kwargs) -> list[SearchResult]:
+        if query == "boom":
+            raise RuntimeError("encoder crashed")
+        return await super().search_with_mode(query, *args, **kwargs)
+
+    async def search_many(self, queries: list[str], *args, **kwargs) -> list[list[SearchResult]]:
+        raise RuntimeError("encoder crashed")
+
+
+@pytest.mark.asyncio
+async def test_reconcile_preview_falls_back_per_query(monkeypatch: pytest.MonkeyPatch) -> None:
+    from floridify.wordlist import reconcile as reconcile_module
+
+    fuzzy_doc = SimpleNamespace(id="word-2", text="the", normalized="the")
+
+    async def fake_get_language_search(languages: list[Language], semantic: bool = False):
+        return _FailingBatchSearch()
+
+    def fake_word_find(query: dict[str, object]) -> _FakeQuery:
+        if "text" in query:
+            return _FakeQuery([fuzzy_doc])
+        return _FakeQuery([])
+
+    monkeypatch.setattr(reconcile_module, "get_language_search", fake_get_language_search)
+    monkeypatch.setattr(reconcile_module.Word, "find", fake_word_find)
+
+    response = await build_reconcile_preview(["teh", "boom"], limit=3)
+
+    assert response.summary.ambiguous_entries == 1
+    assert response.summary.unresolved_entries == 1
+    assert response.ambiguous[0].resolved_text == "the"
+    assert response.unresolved[0].source_text == "boom"
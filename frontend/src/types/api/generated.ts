@@ -2776,7 +2776,7 @@ export interface paths {
         patch: operations["update_user_role_api_v1_users__clerk_id__role_patch"];
         trace?: never;
     };
-    "/metrics": {
+    "/api/v1/metrics": {
         parameters: {
             query?: never;
             header?: never;
@@ -2791,7 +2791,7 @@ export interface paths {
          *     This is a lightweight endpoint suitable for monitoring dashboards
          *     and alerting systems.
          */
-        get: operations["get_metrics_metrics_get"];
+        get: operations["get_metrics_api_v1_metrics_get"];
         put?: never;
         post?: never;
         delete?: never;
@@ -3866,6 +3866,11 @@ export interface components {
              * @description Entry richness score (0.0–1.0)
              */
             richness_score?: number | null;
+            /**
+             * Trace
+             * @description Pipeline stage spans (debug only)
+             */
+            trace?: components["schemas"]["TraceSpan"][] | null;
         };
         /**
          * DictionaryProvider
@@ -5394,6 +5399,32 @@ export interface components {
          * @enum {string}
          */
         Temperature: "hot" | "cold";
+        /**
+         * TraceSpan
+         * @description Timed pipeline stage, or a nested call made during one.
+         */
+        TraceSpan: {
+            /**
+             * Name
+             * @description Stage name, or nested span (e.g. provider:wiktionary)
+             */
+            name: string;
+            /**
+             * Parent
+             * @description Enclosing stage; None for top-level stages
+             */
+            parent?: string | null;
+            /**
+             * Start Ms
+             * @description Start offset from the beginning of the trace
+             */
+            start_ms: number;
+            /**
+             * Duration Ms
+             * @description Elapsed time; None while still open
+             */
+            duration_ms?: number | null;
+        };
         /**
          * UpdatePreferencesRequest
          * @description Full replacement of user preferences.
@@ -6368,6 +6399,8 @@ export interface operations {
     lookup_word_api_v1_lookup__word__get: {
         parameters: {
             query?: {
+                /** @description Include pipeline stage timings (bypasses the response cache) */
+                debug?: boolean;
                 /** @description Force refresh of cached data */
                 force_refresh?: boolean;
                 /** @description Dictionary providers */
@@ -10807,7 +10840,7 @@ export interface operations {
             };
         };
     };
-    get_metrics_metrics_get: {
+    get_metrics_api_v1_metrics_get: {
         parameters: {
             query?: never;
             header?: never;